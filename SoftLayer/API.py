@@ -5,10 +5,12 @@
 
     :license: MIT, see LICENSE for more details.
 """
-# pylint: disable=invalid-name
+# pylint: disable=invalid-name,too-many-lines
 import time
 
+import collections
 import concurrent.futures as cf
+import itertools
 import json
 import logging
 import math
@@ -34,7 +36,9 @@
     'API_PUBLIC_ENDPOINT',
     'API_PRIVATE_ENDPOINT',
     'IAMClient',
-    'CertificateClient'
+    'CertificateClient',
+    'AsyncClient',
+    'create_async_client_from_env',
 ]
 
 VALID_CALL_ARGS = set((
@@ -46,11 +50,13 @@
     'raw_headers',
     'limit',
     'offset',
-    'verify'
+    'verify',
+    'stream',
+    'parent_id',
 ))
 
 
-def _build_transport(url, proxy, timeout, user_agent, verify):
+def _build_transport(url, proxy, timeout, user_agent, verify, use_async=False, session_options=None):
     """Construct the appropriate transport based on the endpoint URL.
 
     Selects RestTransport when the URL contains '/rest', otherwise falls back
@@ -62,23 +68,39 @@ def _build_transport(url, proxy, timeout, user_agent, verify):
     :param timeout: Request timeout in seconds (``None`` means no timeout).
     :param str user_agent: Optional User-Agent string override.
     :param verify: SSL verification — ``True``, ``False``, or a path to a CA bundle.
+    :param bool use_async: build the asyncio version of the transport, for ``AsyncClient``.
+    :param dict session_options: connection pool settings, see :func:`~SoftLayer.transports.transport.get_session`.
+        Async transports only use pool_maxsize, as their max_connections.
     :returns: A :class:`~SoftLayer.transports.RestTransport` or
               :class:`~SoftLayer.transports.XmlRpcTransport` instance.
     """
+    session_options = session_options or {}
+    rest_transport = transports.RestTransport
+    xmlrpc_transport = transports.XmlRpcTransport
+    extra_options = {'session_options': session_options}
+    if use_async:
+        rest_transport = transports.AsyncRestTransport
+        xmlrpc_transport = transports.AsyncXmlRpcTransport
+        extra_options = {}
+        if session_options.get('pool_maxsize'):
+            extra_options['max_connections'] = session_options['pool_maxsize']
+
     if url is not None and '/rest' in url:
-        return transports.RestTransport(
+        return rest_transport(
             endpoint_url=url,
             proxy=proxy,
             timeout=timeout,
             user_agent=user_agent,
             verify=verify,
+            **extra_options
         )
-    return transports.XmlRpcTransport(
+    return xmlrpc_transport(
         endpoint_url=url,
         proxy=proxy,
         timeout=timeout,
         user_agent=user_agent,
         verify=verify,
+        **extra_options
     )
 
 
@@ -91,7 +113,8 @@ def create_client_from_env(username=None,
                            proxy=None,
                            user_agent=None,
                            transport=None,
-                           verify=True):
+                           verify=True,
+                           session_options=None):
     """Creates a SoftLayer API client using your environment.
 
     Settings are loaded via keyword arguments, environmental variables and
@@ -115,6 +138,9 @@ def create_client_from_env(username=None,
                       transport(SoftLayer.transports.Request)
     :param bool verify: decide to verify the server's SSL/TLS cert. DO NOT SET
                         TO FALSE WITHOUT UNDERSTANDING THE IMPLICATIONS.
+    :param dict session_options: connection pool settings (pool_connections, pool_maxsize, pool_block,
+        retries, backoff_factor, keep_alive, share_session), see
+        :func:`~SoftLayer.transports.transport.get_session`. These override the same options in the config file.
 
     Usage:
 
@@ -125,6 +151,49 @@ def create_client_from_env(username=None,
         'Your Company'
 
     """
+    return _create_client(BaseClient, username=username, api_key=api_key, endpoint_url=endpoint_url,
+                          timeout=timeout, auth=auth, config_file=config_file, proxy=proxy,
+                          user_agent=user_agent, transport=transport, verify=verify,
+                          session_options=session_options)
+
+
+def create_async_client_from_env(username=None,
+                                 api_key=None,
+                                 endpoint_url=None,
+                                 timeout=None,
+                                 auth=None,
+                                 config_file=None,
+                                 proxy=None,
+                                 user_agent=None,
+                                 transport=None,
+                                 verify=True,
+                                 session_options=None):
+    """Creates a SoftLayer AsyncClient using your environment.
+
+    Takes the same arguments as :func:`create_client_from_env`, but the transport
+    will be an asyncio transport (which requires aiohttp).
+
+    Usage:
+
+        >>> import asyncio
+        >>> import SoftLayer
+        >>> async def main():
+        ...     async with SoftLayer.create_async_client_from_env() as client:
+        ...         return await client.call('Account', 'getObject')
+        >>> asyncio.run(main())['companyName']
+        'Your Company'
+
+    """
+    return _create_client(AsyncClient, username=username, api_key=api_key, endpoint_url=endpoint_url,
+                          timeout=timeout, auth=auth, config_file=config_file, proxy=proxy,
+                          user_agent=user_agent, transport=transport, verify=verify,
+                          session_options=session_options)
+
+
+def _create_client(client_class, username=None, api_key=None, endpoint_url=None, timeout=None, auth=None,
+                   config_file=None, proxy=None, user_agent=None, transport=None, verify=True,
+                   session_options=None):
+    """Builds client_class from keyword arguments, environmental variables and config file."""
     if config_file is None:
         config_file = CONFIG_FILE
     settings = config.get_client_settings(username=username,
@@ -142,6 +211,8 @@ def create_client_from_env(username=None,
             timeout=settings.get('timeout'),
             user_agent=user_agent,
             verify=verify,
+            use_async=client_class is AsyncClient,
+            session_options=dict(settings.get('session_options') or {}, **(session_options or {})),
         )
 
     # If we have enough information to make an auth driver, let's do it
@@ -162,7 +233,7 @@ def create_client_from_env(username=None,
                 settings.get('api_key'),
             )
 
-    return BaseClient(auth=auth, transport=transport, config_file=config_file)
+    return client_class(auth=auth, transport=transport, config_file=config_file)
 
 
 def employee_client(username=None,
@@ -221,6 +292,7 @@ def employee_client(username=None,
             timeout=settings.get('timeout'),
             user_agent=user_agent,
             verify=verify,
+            session_options=settings.get('session_options'),
         )
 
     # Resolve all settings-derived credentials together before auth selection.
@@ -243,6 +315,56 @@ def employee_client(username=None,
     return EmployeeClient(auth=auth, transport=transport, config_file=config_file)
 
 
+def _build_request(client, service, method, args, kwargs):
+    """Builds the transports.Request for a call, shared by BaseClient and AsyncClient.
+
+    :param client: the client making the call, for its prefix, settings and auth
+    :param service: the name of the SoftLayer API service
+    :param method: the method to call on the service
+    :param tuple args: arguments for the remote call
+    :param dict kwargs: the keyword arguments ``BaseClient.call`` takes
+    """
+    invalid_kwargs = set(kwargs.keys()) - VALID_CALL_ARGS
+    if invalid_kwargs:
+        raise TypeError('Invalid keyword arguments: %s' % ','.join(invalid_kwargs))
+
+    prefix = client._prefix  # pylint: disable=protected-access
+    prefixes = (prefix, 'BluePages_Search', 'IntegratedOfferingTeam_Region')
+    if prefix and not service.startswith(prefixes):
+        service = prefix + service
+
+    http_headers = {'Accept': '*/*'}
+
+    if kwargs.get('compress', True):
+        http_headers['Accept-Encoding'] = 'gzip, deflate, compress'
+    else:
+        http_headers['Accept-Encoding'] = None
+
+    if kwargs.get('raw_headers'):
+        http_headers.update(kwargs.get('raw_headers'))
+
+    request = transports.Request()
+    request.service = service
+    request.method = method
+    request.args = args
+    request.transport_headers = http_headers
+    request.identifier = kwargs.get('id')
+    request.mask = kwargs.get('mask')
+    request.filter = kwargs.get('filter')
+    request.limit = kwargs.get('limit')
+    request.offset = kwargs.get('offset')
+    request.url = client.settings['softlayer'].get('endpoint_url')
+    request.stream = kwargs.get('stream', False)
+    request.parent_id = kwargs.get('parent_id')
+    if kwargs.get('verify') is not None:
+        request.verify = kwargs.get('verify')
+    if client.auth:
+        request = client.auth.get_request(request)
+
+    request.headers.update(kwargs.get('headers', {}))
+    return request
+
+
 def Client(**kwargs):
     """Get a SoftLayer API Client using environmental settings."""
     return create_client_from_env(**kwargs)
@@ -287,6 +409,7 @@ def __setTransport(self, transport=None):
                     timeout=int(self.settings['softlayer'].getfloat('timeout', 0)),
                     user_agent=consts.USER_AGENT,
                     verify=verify,
+                    session_options=config.get_session_options(self.settings),
                 )
             else:
                 # Default the transport to use XMLRPC
@@ -296,6 +419,7 @@ def __setTransport(self, transport=None):
                     timeout=int(self.settings['softlayer'].getfloat('timeout', 0)),
                     user_agent=consts.USER_AGENT,
                     verify=verify,
+                    session_options=config.get_session_options(self.settings),
                 )
 
         self.transport = transport
@@ -348,6 +472,10 @@ def call(self, service, method, *args, **kwargs):
         :param boolean iter: (optional) if True, returns a generator with the results
         :param bool verify: verify SSL cert
         :param cert: client certificate path
+        :param bool stream: (optional) list results may be a StreamingListResult, which is decoded while it
+            is iterated over, if the transport supports it. See RestTransport(stream=True)
+        :param parent_id: (optional) span id of what this call is part of, iter_call() sets this for every page.
+            See MetricsTransport
 
         Usage:
             >>> import SoftLayer
@@ -361,41 +489,7 @@ def call(self, service, method, *args, **kwargs):
             # keeps those sections working
             return list(self.iter_call(service, method, *args, **kwargs))
 
-        invalid_kwargs = set(kwargs.keys()) - VALID_CALL_ARGS
-        if invalid_kwargs:
-            raise TypeError('Invalid keyword arguments: %s' % ','.join(invalid_kwargs))
-
-        prefixes = (self._prefix, 'BluePages_Search', 'IntegratedOfferingTeam_Region')
-        if self._prefix and not service.startswith(prefixes):
-            service = self._prefix + service
-
-        http_headers = {'Accept': '*/*'}
-
-        if kwargs.get('compress', True):
-            http_headers['Accept-Encoding'] = 'gzip, deflate, compress'
-        else:
-            http_headers['Accept-Encoding'] = None
-
-        if kwargs.get('raw_headers'):
-            http_headers.update(kwargs.get('raw_headers'))
-
-        request = transports.Request()
-        request.service = service
-        request.method = method
-        request.args = args
-        request.transport_headers = http_headers
-        request.identifier = kwargs.get('id')
-        request.mask = kwargs.get('mask')
-        request.filter = kwargs.get('filter')
-        request.limit = kwargs.get('limit')
-        request.offset = kwargs.get('offset')
-        request.url = self.settings['softlayer'].get('endpoint_url')
-        if kwargs.get('verify') is not None:
-            request.verify = kwargs.get('verify')
-        if self.auth:
-            request = self.auth.get_request(request)
-
-        request.headers.update(kwargs.get('headers', {}))
+        request = _build_request(self, service, method, args, kwargs)
         return self.transport(request)
 
     __call__ = call
@@ -419,6 +513,10 @@ def iter_call(self, service, method, *args, **kwargs):
 
         # Set to make unit tests, which call this function directly, play nice.
         kwargs['iter'] = False
+        # Each item is used as soon as it is decoded, so there is no need to wait for the whole page
+        kwargs.setdefault('stream', True)
+        # Every page is part of the same iteration
+        kwargs.setdefault('parent_id', transports.transport.new_span_id())
         result_count = 0
         keep_looping = True
         kwargs['filter'] = utils.fix_filter(kwargs.get('filter'))
@@ -429,7 +527,7 @@ def iter_call(self, service, method, *args, **kwargs):
 
             # Apparently this method doesn't return a list.
             # Why are you even iterating over this?
-            if not isinstance(results, transports.SoftLayerListResult):
+            if not isinstance(results, (transports.SoftLayerListResult, transports.StreamingListResult)):
                 if isinstance(results, list):
                     # Close enough, this makes testing a lot easier
                     results = transports.SoftLayerListResult(results, len(results))
@@ -456,11 +554,13 @@ def cf_call(self, service, method, *args, **kwargs):
         :param service: the name of the SoftLayer API service
         :param method: the method to call on the service
         :param integer limit: result size for each API call (defaults to 100)
+        :param integer max_workers: how many API calls to make at once (defaults to 10)
         :param \\*args: same optional arguments that ``Service.call`` takes
         :param \\*\\*kwargs: same optional keyword arguments that ``Service.call`` takes
         """
         limit = kwargs.pop('limit', 100)
         offset = kwargs.pop('offset', 0)
+        max_workers = kwargs.pop('max_workers', 10)
 
         if limit <= 0:
             raise AttributeError("Limit size should be greater than zero.")
@@ -478,15 +578,105 @@ def this_api(offset):
             """Used to easily call executor.map() on this fuction"""
             return self.call(service, method, offset=offset, limit=limit, *args, **kwargs)
 
-        with cf.ThreadPoolExecutor(max_workers=10) as executor:
+        with cf.ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_results = {}
             offset_map = [x * limit for x in range(1, api_calls)]
             future_results = list(executor.map(this_api, offset_map))
         # Append the results in the order they were called
         for call_result in future_results:
-            first_call = first_call + call_result
+            first_call.extend(call_result)
         return first_call
 
+    def cf_iter_call(self, service, method, *args, **kwargs):
+        """A generator that paginates through results, fetching pages in parallel.
+
+        The first page is fetched to find the total number of items (softlayer-total-items), then
+        the rest of the pages are fetched by a pool of threads. Items are yielded in order as soon as
+        their page arrives, and at most ``max_pages`` pages are ever held in memory (or in flight) at once.
+        If you stop iterating early, pages that haven't been requested yet are cancelled.
+
+        :param service: the name of the SoftLayer API service
+        :param method: the method to call on the service
+        :param integer limit: result size for each API call (defaults to 100)
+        :param integer max_workers: how many API calls to make at once (defaults to 10)
+        :param integer max_pages: how many pages can be fetched ahead of the one being iterated over
+            (defaults to 2 * max_workers)
+        :param \\*args: same optional arguments that ``Service.call`` takes
+        :param \\*\\*kwargs: same optional keyword arguments that ``Service.call`` takes
+
+        Usage:
+            >>> import SoftLayer
+            >>> client = SoftLayer.create_client_from_env()
+            >>> for guest in client.cf_iter_call('Account', 'getVirtualGuests', mask="id", max_workers=5):
+            ...     guest['id']
+            1234
+            4321
+
+        """
+        limit = kwargs.pop('limit', 100)
+        offset = kwargs.pop('offset', 0)
+        max_workers = kwargs.pop('max_workers', 10)
+        max_pages = kwargs.pop('max_pages', max_workers * 2)
+
+        if limit <= 0:
+            raise AttributeError("Limit size should be greater than zero.")
+        if max_workers <= 0 or max_pages <= 0:
+            raise AttributeError("max_workers and max_pages should be greater than zero.")
+
+        kwargs['iter'] = False
+        kwargs['filter'] = utils.fix_filter(kwargs.get('filter'))
+        kwargs.setdefault('parent_id', transports.transport.new_span_id())
+
+        def this_api(page_offset):
+            """Gets a single page of results"""
+            return self.call(service, method, offset=page_offset, limit=limit, *args, **kwargs)
+
+        first_page = this_api(offset)
+        if not isinstance(first_page, transports.SoftLayerListResult):
+            if isinstance(first_page, list):
+                first_page = transports.SoftLayerListResult(first_page, len(first_page))
+            else:
+                yield first_page
+                return
+
+        if len(first_page) < limit:
+            yield from first_page
+            return
+
+        # The first page tells us how many items there are, so every other page can be requested right away.
+        offsets = iter(range(offset + limit, first_page.total_count, limit))
+        executor = cf.ThreadPoolExecutor(max_workers=max_workers)
+        pending = collections.deque()
+        try:
+            for page_offset in itertools.islice(offsets, max_pages):
+                pending.append(executor.submit(this_api, page_offset))
+            yield from first_page
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(this_api, next_offset))
+                yield from page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def batch(self, max_workers=10):
+        """Returns a Batch, which collects API calls and makes them all at once.
+
+        :param integer max_workers: how many API calls to make at once (defaults to 10)
+
+        Usage:
+            >>> import SoftLayer
+            >>> client = SoftLayer.create_client_from_env()
+            >>> with client.batch() as batch:
+            ...     for guest_id in (1234, 4321):
+            ...         batch['Virtual_Guest'].setTags('tag1,tag2', id=guest_id)
+            >>> batch.results()
+            [True, True]
+
+        """
+        return Batch(self, max_workers=max_workers)
+
     def __repr__(self):
         return "Client(transport=%r, auth=%r)" % (self.transport, self.auth)
 
@@ -848,6 +1038,15 @@ def iter_call(self, name, *args, **kwargs):
         """
         return self.client.iter_call(self.name, name, *args, **kwargs)
 
+    def cf_iter_call(self, name, *args, **kwargs):
+        """A generator that paginates through results, fetching pages in parallel.
+
+        :param method: the method to call on the service
+        :param \\*args: same optional arguments that ``BaseClient.cf_iter_call`` takes
+        :param \\*\\*kwargs: same optional keyword arguments that ``BaseClient.cf_iter_call`` takes
+        """
+        return self.client.cf_iter_call(self.name, name, *args, **kwargs)
+
     def __getattr__(self, name):
         if name in ["__name__", "__bases__"]:
             raise AttributeError("'Obj' object has no attribute '%s'" % name)
@@ -861,3 +1060,268 @@ def __repr__(self):
         return "<Service: %s>" % (self.name,)
 
     __str__ = __repr__
+
+
+class Batch(object):
+    """Collects API calls, then makes them all at once with a pool of threads.
+
+    Every call returns a ``concurrent.futures.Future`` right away. The calls are made when the ``with`` block
+    ends (or when ``dispatch()`` is called), over the client's transport, so they share its connection pool.
+    A call that fails only fails its own future, the rest of the batch still runs.
+
+        :param client: A SoftLayer.API.Client instance
+        :param integer max_workers: how many API calls to make at once
+
+    """
+
+    def __init__(self, client, max_workers=10):
+        if max_workers <= 0:
+            raise AttributeError("max_workers should be greater than zero.")
+        self.client = client
+        self.max_workers = max_workers
+        self.futures = []
+        self._pending = []
+
+    def call(self, service, method, *args, **kwargs):
+        """Adds an API call to the batch, returns a Future for its result.
+
+        :param service: the name of the SoftLayer API service
+        :param method: the method to call on the service
+        :param \\*args: same optional arguments that ``BaseClient.call`` takes
+        :param \\*\\*kwargs: same optional keyword arguments that ``BaseClient.call`` takes
+        """
+        future = cf.Future()
+        self._pending.append((future, service, method, args, kwargs))
+        self.futures.append(future)
+        return future
+
+    __call__ = call
+
+    def __getitem__(self, name):
+        """Returns a Service, whose calls are added to this batch."""
+        return Service(self, name)
+
+    def dispatch(self):
+        """Makes every API call added since the last dispatch, and waits for them to finish.
+
+        :returns: the Future of every call in this batch, in the order they were added
+        """
+        pending, self._pending = self._pending, []
+        if pending:
+            with cf.ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                for future, service, method, args, kwargs in pending:
+                    if future.set_running_or_notify_cancel():
+                        executor.submit(self._run, future, service, method, args, kwargs)
+        return self.futures
+
+    def results(self):
+        """Dispatches anything pending, then returns the result of every call in the order they were added.
+
+        A call that failed has its exception (usually a SoftLayerAPIError) in place of its result.
+        """
+        results = []
+        for future in self.dispatch():
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        return results
+
+    def _run(self, future, service, method, args, kwargs):
+        """Makes a single API call, and puts the result or exception into its Future."""
+        try:
+            future.set_result(self.client.call(service, method, *args, **kwargs))
+        except Exception as ex:  # pylint: disable=broad-except
+            future.set_exception(ex)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.dispatch()
+        else:
+            for future, _, _, _, _ in self._pending:
+                future.cancel()
+            self._pending = []
+
+    def __len__(self):
+        return len(self.futures)
+
+    def __repr__(self):
+        return "<Batch: %s calls>" % len(self.futures)
+
+    __str__ = __repr__
+
+
+class AsyncClient(object):
+    """SoftLayer API client for asyncio.
+
+    Works like BaseClient, except ``call`` is a coroutine and ``iter_call`` is an async generator.
+    Many calls can be in flight at once from a single event loop, limited by the
+    transport's max_connections.
+
+    :param auth: auth driver that looks like SoftLayer.auth.AuthenticationBase
+    :param transport: An object that's awaitable with this signature: transport(SoftLayer.transports.Request)
+
+    Usage:
+
+        >>> import asyncio
+        >>> import SoftLayer
+        >>> async def main():
+        ...     async with SoftLayer.create_async_client_from_env() as client:
+        ...         calls = [client.call('Virtual_Guest', 'getObject', id=guest_id) for guest_id in (1234, 4321)]
+        ...         return await asyncio.gather(*calls)
+        >>> guests = asyncio.run(main())
+
+    """
+    _prefix = "SoftLayer_"
+
+    def __init__(self, auth=None, transport=None, config_file=None):
+        if config_file is None:
+            config_file = CONFIG_FILE
+        self.config_file = config_file
+        self.settings = config.get_config(self.config_file)
+        self.auth = auth
+        if transport is None:
+            verify = self.settings['softlayer'].get('verify')
+            if verify == "False":
+                verify = False
+            elif verify == "True":
+                verify = True
+            transport = _build_transport(
+                url=self.settings['softlayer'].get('endpoint_url'),
+                proxy=self.settings['softlayer'].get('proxy'),
+                timeout=int(self.settings['softlayer'].getfloat('timeout', 0)),
+                user_agent=consts.USER_AGENT,
+                verify=verify,
+                use_async=True,
+                session_options=config.get_session_options(self.settings),
+            )
+        self.transport = transport
+
+    def __getitem__(self, name):
+        """Get a SoftLayer Service.
+
+        :param name: The name of the service. E.G. Account
+        """
+        return AsyncService(self, name)
+
+    async def call(self, service, method, *args, **kwargs):
+        """Make a SoftLayer API call.
+
+        Takes the same arguments as ``BaseClient.call``.
+
+        Usage:
+            >>> await client.call('Account', 'getVirtualGuests', mask="id", limit=10)
+            [...]
+        """
+        if kwargs.pop('iter', False):
+            return [item async for item in self.iter_call(service, method, *args, **kwargs)]
+
+        request = _build_request(self, service, method, args, kwargs)
+        return await self.transport(request)
+
+    __call__ = call
+
+    async def iter_call(self, service, method, *args, **kwargs):
+        """An async generator that deals with paginating through results.
+
+        :param service: the name of the SoftLayer API service
+        :param method: the method to call on the service
+        :param integer limit: result size for each API call (defaults to 100)
+        :param \\*args: same optional arguments that ``BaseClient.call`` takes
+        :param \\*\\*kwargs: same optional keyword arguments that ``BaseClient.call`` takes
+
+        Usage:
+            >>> async for guest in client.iter_call('Account', 'getVirtualGuests'):
+            ...     guest['id']
+        """
+        limit = kwargs.pop('limit', 100)
+        offset = kwargs.pop('offset', 0)
+
+        if limit <= 0:
+            raise AttributeError("Limit size should be greater than zero.")
+
+        result_count = 0
+        keep_looping = True
+        kwargs['filter'] = utils.fix_filter(kwargs.get('filter'))
+        kwargs.setdefault('parent_id', transports.transport.new_span_id())
+
+        while keep_looping:
+            results = await self.call(service, method, offset=offset, limit=limit, *args, **kwargs)
+
+            if not isinstance(results, transports.SoftLayerListResult):
+                if isinstance(results, list):
+                    results = transports.SoftLayerListResult(results, len(results))
+                else:
+                    yield results
+                    return
+
+            for item in results:
+                yield item
+                result_count += 1
+
+            # Got less results than requested, we are at the end
+            if len(results) < limit:
+                keep_looping = False
+            # Got all the needed items
+            if result_count >= results.total_count:
+                keep_looping = False
+
+            offset += limit
+
+    async def close(self):
+        """Closes the transport's HTTP session."""
+        close = getattr(self.transport, 'close', None)
+        if close is not None:
+            await close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __repr__(self):
+        return "AsyncClient(transport=%r, auth=%r)" % (self.transport, self.auth)
+
+    __str__ = __repr__
+
+
+class AsyncService(object):
+    """A SoftLayer Service for an AsyncClient.
+
+        :param client: A SoftLayer.API.AsyncClient instance
+        :param name str: The service name
+
+    Usage:
+        >>> await client['Account'].getVirtualGuests(mask="id", limit=10)
+        [...]
+    """
+
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    async def call(self, name, *args, **kwargs):
+        """Make a SoftLayer API call, see ``AsyncClient.call``"""
+        return await self.client.call(self.name, name, *args, **kwargs)
+
+    __call__ = call
+
+    def iter_call(self, name, *args, **kwargs):
+        """An async generator that deals with paginating through results, see ``AsyncClient.iter_call``"""
+        return self.client.iter_call(self.name, name, *args, **kwargs)
+
+    def __getattr__(self, name):
+        if name in ["__name__", "__bases__"]:
+            raise AttributeError("'Obj' object has no attribute '%s'" % name)
+
+        async def call_handler(*args, **kwargs):
+            " Handler that actually makes the API call "
+            return await self(name, *args, **kwargs)
+        return call_handler
+
+    def __repr__(self):
+        return "<AsyncService: %s>" % (self.name,)
+
+    __str__ = __repr__
@@ -6,6 +6,7 @@
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import formatting
 from SoftLayer.managers.account import AccountManager as AccountManager
+from SoftLayer.managers.inventory import InventoryManager
 from SoftLayer import utils
 
 
@@ -13,15 +14,24 @@
 @click.option('--create', '-c', help='The date the billing item was created.')
 @click.option('--ordered', '-o', help='Name that ordered the item')
 @click.option('--category', '-C', help='Category name')
+@click.option('--inventory', 'max_age', type=click.IntRange(min=0),
+              help="Answer from the local inventory snapshot, refreshed first if it is older than this many seconds")
 @environment.pass_env
-def cli(env, create, category, ordered):
+def cli(env, create, category, ordered, max_age):
     """Lists billing items with some other useful information.
 
     Similiar to https://cloud.ibm.com/billing/billing-items
     """
 
-    manager = AccountManager(env.client)
-    items = manager.get_account_billing_items(create, category)
+    if max_age is None:
+        manager = AccountManager(env.client)
+        items = manager.get_account_billing_items(create, category)
+    else:
+        inventory = InventoryManager(env.client)
+        inventory.ensure_fresh(max_age, ['billing'])
+        items = [item for item in inventory.find('billing')
+                 if (not category or item.get('categoryCode') == category)
+                 and (not create or create in (item.get('createDate') or ''))]
     table = item_table(items, ordered)
 
     env.fout(table)
@@ -0,0 +1,197 @@
+"""
+    SoftLayer.CLI.bulk
+    ~~~~~~~~~~~~~~~~~~
+    Helpers for commands that work on many servers at once, like `slcli vs bulk` and `slcli hw bulk`
+
+    :license: MIT, see LICENSE for more details.
+"""
+import concurrent.futures as cf
+import contextlib
+import time
+
+import click
+
+from SoftLayer.CLI import exceptions
+from SoftLayer.CLI import formatting
+from SoftLayer.CLI import helpers
+from SoftLayer.exceptions import SoftLayerAPIError
+from SoftLayer.transports.ratelimit import TokenBucket
+
+#: Actions that can't be undone, confirm() asks for them to be typed
+DESTRUCTIVE_ACTIONS = ('reload', 'cancel')
+
+
+def target_options(func):
+    """Arguments and options that pick the servers a bulk action runs on, and how fast it runs."""
+    options = [
+        click.argument('identifiers', nargs=-1),
+        helpers.multi_option('--tag', '-t', help="Servers with this tag"),
+        click.option('--file', 'id_file', type=click.File('r'),
+                     help="File with an id, hostname or IP address on each line, - for stdin"),
+        click.option('--workers', type=click.IntRange(1, 50), default=10, show_default=True,
+                     help="How many servers to work on at once"),
+        click.option('--rate', type=click.FLOAT, default=5, show_default=True,
+                     help="Most API calls to start each second, 0 for no limit"),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def get_targets(resolve_many, list_tagged, identifiers=(), id_file=None, tags=(), name='server'):
+    """Ids of the servers picked by identifiers, a file of identifiers and tags, without duplicates.
+
+    Every identifier has to match exactly one server, otherwise nothing is done.
+
+    :param resolve_many: the manager's resolve_ids_many()
+    :param list_tagged: function(tags) that returns the servers with any of tags
+    :param list identifiers: ids, hostnames or IP addresses
+    :param id_file: file with an identifier on each line. Blank lines and lines starting with # are skipped
+    :param list tags: tag names
+    :param string name: what the servers are called in error messages
+    """
+    identifiers = list(identifiers)
+    if id_file is not None:
+        identifiers.extend(line.strip() for line in id_file if line.strip() and not line.startswith('#'))
+
+    resolved = resolve_many(identifiers) if identifiers else {}
+    errors = []
+    missing = [str(identifier) for identifier, ids in resolved.items() if not ids]
+    if missing:
+        errors.append("Unable to find %s: %s" % (name, ', '.join(missing)))
+    for identifier, ids in resolved.items():
+        if len(ids) > 1:
+            errors.append("Multiple %s found for '%s': %s" % (name, identifier, ', '.join(str(_id) for _id in ids)))
+    if errors:
+        raise exceptions.CLIAbort('\n'.join(errors))
+
+    ids = [ids[0] for ids in resolved.values()]
+    if tags:
+        ids.extend(server['id'] for server in list_tagged(list(tags)))
+    if not ids:
+        raise exceptions.CLIAbort("No %s to work on, give their ids or hostnames, --tag or --file" % name)
+    return list(dict.fromkeys(ids))
+
+
+def confirm(env, action, ids, name='servers'):
+    """Asks before running an action on many servers, unless -y was given.
+
+    Reload and cancel can't be undone. Like the commands for one server, they need the answer typed: the
+    action and how many servers, "cancel 25".
+    """
+    if env.skip_confirmations:
+        return
+    summary = "This will %s %d %s: %s." % (action, len(ids), name, ', '.join(str(_id) for _id in ids))
+    if action in DESTRUCTIVE_ACTIONS:
+        env.err(summary)
+        confirmed = formatting.no_going_back("%s %d" % (action, len(ids)))
+    else:
+        confirmed = formatting.confirm(summary + " Continue?")
+    if not confirmed:
+        raise exceptions.CLIAbort('Aborted.')
+
+
+def run(env, ids, action, workers=10, rate=5, label='Working'):
+    """Runs action(id) for every id with a pool of threads, and shows progress on a terminal.
+
+    An action that fails only fails for its own server, the others still run.
+
+    :param list ids: server ids
+    :param action: function that takes a server id
+    :param int workers: how many actions run at once
+    :param float rate: most actions to start each second, 0 or None for no limit
+    :param string label: shown next to the progress bar
+    :returns list: a dict for each id, in the same order: id, status ('ok' or 'failed'), seconds and error
+    """
+    bucket = TokenBucket(rate or None)
+
+    def run_one(server_id):
+        """Runs the action for one server once the rate allows."""
+        wait = bucket.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        started = time.monotonic()
+        try:
+            action(server_id)
+        except Exception as ex:  # pylint: disable=broad-except
+            return {'id': server_id, 'status': 'failed', 'seconds': round(time.monotonic() - started, 3),
+                    'error': str(ex)}
+        return {'id': server_id, 'status': 'ok', 'seconds': round(time.monotonic() - started, 3), 'error': None}
+
+    results = {}
+    with _progress(env, len(ids), label) as advance:
+        executor = cf.ThreadPoolExecutor(max_workers=max(1, min(workers, len(ids))))
+        try:
+            futures = {executor.submit(run_one, server_id): server_id for server_id in ids}
+            for future in cf.as_completed(futures):
+                results[futures[future]] = future.result()
+                advance(results[futures[future]])
+        finally:
+            # On Ctrl-C, servers that haven't started are left alone
+            executor.shutdown(wait=True, cancel_futures=True)
+    return [results[server_id] for server_id in ids]
+
+
+@contextlib.contextmanager
+def _progress(env, total, label):
+    """A live progress bar on stderr, if it is a terminal. Yields a function to call with each result."""
+    if not env.err_console.is_terminal:
+        yield lambda result: None
+        return
+
+    # pylint: disable=import-outside-toplevel
+    from rich.progress import BarColumn
+    from rich.progress import MofNCompleteColumn
+    from rich.progress import Progress
+    from rich.progress import TextColumn
+    from rich.progress import TimeElapsedColumn
+
+    with Progress(TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(),
+                  TextColumn("{task.fields[failed]} failed"), TimeElapsedColumn(),
+                  console=env.err_console, transient=True) as progress:
+        task = progress.add_task(label, total=total, failed=0)
+        failed = []
+
+        def advance(result):
+            if result['status'] != 'ok':
+                failed.append(result['id'])
+            progress.update(task, advance=1, failed=len(failed))
+
+        yield advance
+
+
+def report(env, results):
+    """Prints the result for each server and a summary. Exits with 1 if any failed."""
+    table = formatting.Table(['id', 'status', 'seconds', 'error'])
+    table.align['error'] = 'l'
+    for result in results:
+        table.add_row([result['id'], result['status'], result['seconds'], result['error'] or formatting.blank()])
+    env.fout(table)
+
+    failed = len([result for result in results if result['status'] != 'ok'])
+    env.err("%d succeeded, %d failed" % (len(results) - failed, failed))
+    if failed:
+        raise exceptions.CLIHalt(code=1)
+
+
+def print_ready(env, ids, instances):
+    """Prints each server as it becomes ready, then aborts listing the ones that didn't.
+
+    :param list ids: the server ids waited for
+    :param instances: the servers as they become ready, from a manager's wait_for_ready_many()
+    """
+    waiting = list(ids)
+    errors = []
+
+    def rows():
+        try:
+            for instance in instances:
+                waiting.remove(instance['id'])
+                yield [instance['id'], instance.get('hostname') or formatting.blank(), 'READY']
+        except SoftLayerAPIError as error:
+            errors.append(error.faultString)
+
+    env.fout(formatting.StreamingTable(['id', 'hostname', 'status'], rows(), chunk_size=1))
+    if waiting:
+        raise exceptions.CLIAbort("Not ready: %s%s" % (', '.join(str(_id) for _id in waiting),
+                                                       ''.join(' (%s)' % error for error in errors)))
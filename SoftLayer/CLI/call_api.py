@@ -124,9 +124,12 @@ def _validate_parameters(ctx, param, value):  # pylint: disable=unused-argument
               help="A JSON string to be passed in as the object filter to the API call. "
                    "Remember to use double quotes (\") for variable names. Can NOT be used with --filter. "
                    "Dont use whitespace outside of strings, or the slcli might have trouble parsing it.")
+@click.option('--stream', is_flag=True,
+              help="Fetch every page of results, --limit at a time, and print them as they come in. "
+                   "Table and csv columns come from the first page.")
 @environment.pass_env
 def cli(env, service, method, parameters, _id, _filters, mask, limit, offset, orderby=None,
-        output_python=False, json_filter=None):
+        output_python=False, json_filter=None, stream=False):
     """Call arbitrary API endpoints with the given SERVICE and METHOD.
 
     For parameters that require a datatype, use a JSON string for that parameter.
@@ -152,6 +155,7 @@ def cli(env, service, method, parameters, _id, _filters, mask, limit, offset, or
         slcli call-api SoftLayer_Notification_Occurrence_Event getAllObjects \\
             --json-filter='{"endDate": {"operation": "greaterThanDate", \\
             "options": [{"name":"date", "value": ["10/14/2022"]}]}}' --limit=50
+        slcli --format=jsonl call-api Account getVirtualGuests --stream --limit=500 --mask=id,hostname
     """
 
     if _filters and json_filter:
@@ -175,6 +179,11 @@ def cli(env, service, method, parameters, _id, _filters, mask, limit, offset, or
 
     if output_python:
         env.python_output(_build_python_example(args, kwargs))
+    elif stream:
+        kwargs['limit'] = limit or 100
+        kwargs['offset'] = offset or 0
+        result = env.client.iter_call(*args, **kwargs)
+        env.fout(formatting.iter_to_streaming_table(result, chunk_size=kwargs['limit']))
     else:
         result = env.client.call(*args, **kwargs)
         env.fout(formatting.iter_to_table(result))
@@ -10,18 +10,14 @@
 
 import click
 
-from rich import box
-from rich.highlighter import RegexHighlighter
-from rich.table import Table
-from rich.text import Text
-
 from SoftLayer.CLI import environment
 
 
-class OptionHighlighter(RegexHighlighter):
+class OptionHighlighter(object):
     """Provides highlighter regex for the Command help.
 
     Defined in SoftLayer\\utils.py console_color_themes()
+    The rich RegexHighlighter is only built when help is shown, since rich is slow to import.
     """
     highlights = [
         r"(?P<switch>^\-\w)",  # single options like -v
@@ -34,6 +30,15 @@ class OptionHighlighter(RegexHighlighter):
         r"(?P<deprecated>\(Deprecated\) .*$)"
     ]
 
+    def __init__(self):
+        self._highlighter = None
+
+    def __call__(self, text):
+        if self._highlighter is None:
+            from rich.highlighter import RegexHighlighter  # pylint: disable=import-outside-toplevel
+            self._highlighter = type('RegexOptionHighlighter', (RegexHighlighter,), {'highlights': self.highlights})()
+        return self._highlighter(text)
+
 
 class CommandLoader(click.MultiCommand):
     """Loads module for click."""
@@ -109,6 +114,10 @@ def format_epilog(self, ctx: click.Context, formatter: click.formatting.HelpForm
     # pylint: disable=unused-argument
     def format_options(self, ctx, formatter):
         """Prints out the options in a table format"""
+        # pylint: disable=import-outside-toplevel
+        from rich import box
+        from rich.table import Table
+        from rich.text import Text
 
         options_table = Table(highlight=True, box=box.SQUARE, show_header=False)
 
@@ -142,6 +151,10 @@ def format_options(self, ctx, formatter):
     # pylint: disable=unused-argument
     def format_commands(self, ctx, formatter):
         """Formats the command list for click"""
+        # pylint: disable=import-outside-toplevel
+        from rich.table import Table
+        from rich.text import Text
+
         commands = []
         for subcommand in self.list_commands(ctx):
             cmd = self.get_command(ctx, subcommand)
@@ -213,6 +226,10 @@ def format_epilog(self, ctx: click.Context, formatter: click.formatting.HelpForm
 
     def format_options(self, ctx, formatter):
         """Prints out the options in a table format"""
+        # pylint: disable=import-outside-toplevel
+        from rich import box
+        from rich.table import Table
+        from rich.text import Text
 
         options_table = Table(highlight=True, box=box.SQUARE, show_header=False)
 
@@ -12,8 +12,6 @@
 import traceback
 
 import click
-import requests
-from rich.markup import escape
 
 import SoftLayer
 from SoftLayer.CLI.command import CommandLoader
@@ -34,15 +32,19 @@
 }
 
 PROG_NAME = "slcli (SoftLayer Command-line)"
-VALID_FORMATS = ['table', 'raw', 'json', 'jsonraw', 'csv']
+VALID_FORMATS = ['table', 'raw', 'json', 'jsonraw', 'jsonl', 'csv']
 DEFAULT_FORMAT = 'raw'
 
 if sys.stdout.isatty():
     DEFAULT_FORMAT = 'table'
 
+#: Where --cache-ttl saves API results between slcli commands.
+CACHE_DIR = click.get_app_dir('slcli-cache', force_posix=True)
+
 
 def get_latest_version():
     """Gets the latest version of the Softlayer library."""
+    import requests  # pylint: disable=import-outside-toplevel
     try:
         result = requests.get('https://pypi.org/pypi/SoftLayer/json',  timeout=60)
         json_result = result.json()
@@ -96,6 +98,17 @@ def get_version_message(ctx, param, value):
 @click.option('--account', '-a', help="Account Id, only needed for some API calls.")
 @click.option('--internal', '-i', is_flag=True, required=False,
               help="Use the Employee Client instead of the Customer Client.")
+@click.option('--cache-ttl', type=click.IntRange(min=0), default=0,
+              help="Cache the results of read-only API calls for this many seconds, "
+                   "so the next slcli commands can reuse them. A command that changes something clears it, "
+                   "when it is also run with --cache-ttl.")
+@click.option('--record', type=click.Path(dir_okay=False, resolve_path=True),
+              help="Save every API call and its result to this file, to replay later with --replay.")
+@click.option('--replay', type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+              help="Answer API calls from a file saved with --record, instead of actually making them.")
+@click.option('--summary', is_flag=True, required=False,
+              help="With -v, show API calls grouped by method (calls, errors and latency) instead of every "
+                   "single call. Uses a lot less memory for commands that make many API calls.")
 @environment.pass_env
 def cli(env,
         format='table',
@@ -106,6 +119,10 @@ def cli(env,
         demo=False,
         account=None,
         internal=False,
+        cache_ttl=0,
+        record=None,
+        replay=None,
+        summary=False,
         **kwargs):
     """Main click CLI entry-point."""
 
@@ -114,10 +131,11 @@ def cli(env,
     env.config_file = config
     env.format = format
     env.set_env_theme(config_file=config)
+    # A replayed command doesn't need credentials, same as --demo
     if internal:
-        env.ensure_emp_client(config_file=config, is_demo=demo, proxy=proxy)
+        env.ensure_emp_client(config_file=config, is_demo=demo or bool(replay), proxy=proxy)
     else:
-        env.ensure_client(config_file=config, is_demo=demo, proxy=proxy)
+        env.ensure_client(config_file=config, is_demo=demo or bool(replay), proxy=proxy)
     env.vars['_start'] = time.time()
     logger = logging.getLogger()
 
@@ -129,9 +147,19 @@ def cli(env,
         logger.addHandler(logging.NullHandler())
 
     logger.setLevel(DEBUG_LOGGING_MAP.get(verbose, logging.DEBUG))
-    env.vars['_timings'] = SoftLayer.DebugTransport(env.client.transport)
+    if replay:
+        env.client.transport = SoftLayer.ReplayTransport(replay)
+    if record:
+        env.client.transport = SoftLayer.RecordingTransport(env.client.transport, record)
+    if cache_ttl:
+        env.client.transport = SoftLayer.CachingTransport(env.client.transport, ttl=cache_ttl, cache_dir=CACHE_DIR)
+    if summary:
+        env.vars['_metrics'] = SoftLayer.MetricsTransport(env.client.transport)
+        env.client.transport = env.vars['_metrics']
+    else:
+        env.vars['_timings'] = SoftLayer.DebugTransport(env.client.transport)
+        env.client.transport = env.vars['_timings']
     env.vars['verbose'] = verbose
-    env.client.transport = env.vars['_timings']
     env.client.account_id = account
 
 
@@ -144,9 +172,13 @@ def output_diagnostics(env, result, verbose=0, **kwargs):
         diagnostic_table = formatting.Table(['name', 'value'])
         diagnostic_table.add_row(['execution_time', '%fs' % (time.time() - START_TIME)])
 
-        api_call_value = formatting.Table(['API Calls'], title=None, align="left")
-        for call in env.client.transport.get_last_calls():
-            api_call_value.add_row(["%s::%s (%fs)" % (call.service, call.method, call.end_time - call.start_time)])
+        if env.vars.get('_metrics'):
+            api_call_value = api_call_summary(env.vars['_metrics'])
+        else:
+            api_call_value = formatting.Table(['API Calls'], title=None, align="left")
+            for call in env.client.transport.get_last_calls():
+                api_call_value.add_row(["%s::%s (%fs)" % (call.service, call.method,
+                                                          call.end_time - call.start_time)])
 
         diagnostic_table.add_row(['api_calls', api_call_value])
         diagnostic_table.add_row(['version', consts.USER_AGENT])
@@ -155,7 +187,12 @@ def output_diagnostics(env, result, verbose=0, **kwargs):
 
         env.err(env.fmt(diagnostic_table))
 
+    # With --summary the calls themselves aren't kept
+    if env.vars.get('_metrics'):
+        return
+
     if verbose > 1:
+        from rich.markup import escape  # pylint: disable=import-outside-toplevel
         for call in env.client.transport.get_last_calls():
             call_table = formatting.Table(['', f'{call.service}::{call.method}'], align="left")
             nice_mask = ''
@@ -174,6 +211,18 @@ def output_diagnostics(env, result, verbose=0, **kwargs):
             env.err(env.client.transport.print_reproduceable(call))
 
 
+def api_call_summary(metrics):
+    """Table of the API calls a MetricsTransport saw, one row per method.
+
+    :param metrics: SoftLayer.MetricsTransport
+    """
+    table = formatting.Table(['API Call', 'Calls', 'Errors', 'p50', 'p99', 'Total'], title=None, align="left")
+    for row in metrics.get_summary():
+        table.add_row(["%s::%s" % (row['service'], row['method']), row['calls'], row['errors'],
+                       '%fs' % row['p50'], '%fs' % row['p99'], '%fs' % row['total']])
+    return table
+
+
 def main(reraise_exceptions=False, **kwargs):
     """Main program. Catches several common errors and displays them nicely."""
     exit_status = 0
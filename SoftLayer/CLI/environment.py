@@ -5,6 +5,7 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import bisect
 import configparser
 import os
 
@@ -13,9 +14,6 @@
 
 import click
 
-from rich.console import Console
-from rich.syntax import Syntax
-
 import SoftLayer
 from SoftLayer.CLI import formatting
 from SoftLayer.CLI import routes
@@ -31,20 +29,45 @@ def __init__(self):
         # {'path:to:command': ModuleLoader()}
         # {'vs:list': ModuleLoader()}
         self.commands = {}
+        # {'vs': ['cancel', 'create', ...]}, sorted names of the commands under each path, '' for the root
+        self.command_index = {}
         self.aliases = {}
 
         self.vars = {}
 
         self.client = None
         self.theme = self.set_env_theme()
-        self.console = utils.console_color_themes(self.theme)
-        self.err_console = Console(stderr=True)
+        self._console = None
+        self._err_console = None
         self.format = 'table'
         self.skip_confirmations = False
         self.config_file = None
 
         self._modules_loaded = False
 
+    @property
+    def console(self):
+        """rich Console for stdout, created the first time it is used since rich is slow to import."""
+        if self._console is None:
+            self._console = utils.console_color_themes(self.theme)
+        return self._console
+
+    @console.setter
+    def console(self, console):
+        self._console = console
+
+    @property
+    def err_console(self):
+        """rich Console for stderr, created the first time it is used."""
+        if self._err_console is None:
+            from rich.console import Console  # pylint: disable=import-outside-toplevel
+            self._err_console = Console(stderr=True)
+        return self._err_console
+
+    @err_console.setter
+    def err_console(self, console):
+        self._err_console = console
+
     def out(self, output):
         """Outputs a string to the console (stdout)."""
 
@@ -57,7 +80,7 @@ def out(self, output):
             # Tried to print not-json, so just print it out normally...
             except JSONDecodeError:
                 click.echo(output)
-        elif self.format == 'jsonraw':
+        elif self.format in ('jsonraw', 'jsonl'):
             #  Using Rich here is problematic because in the unit tests it thinks the terminal is 80 characters wide
             #  and only prints out that many characters.
             click.echo(output)
@@ -86,15 +109,28 @@ def format_output_is_json(self):
 
     def fout(self, output):
         """Format the input and output to the console (stdout)."""
-        if output is not None:
+        if isinstance(output, formatting.StreamingTable):
+            self.stream_out(output)
+        elif output is not None:
             try:
                 self.out(self.fmt(output))
             except UnicodeEncodeError:
                 # If we hit an undecodeable entry, just try outputting as json.
                 self.out(self.fmt(output, 'json'))
 
+    def stream_out(self, table):
+        """Prints a StreamingTable a chunk of rows at a time, as they come in."""
+        for chunk in formatting.format_streaming(table, self.format, self.theme):
+            if isinstance(chunk, str):
+                click.echo(chunk, nl=False)
+            else:
+                if not self.console.is_terminal:
+                    self.console.width = 1000000
+                self.console.print(chunk, overflow='ignore')
+
     def python_output(self, output):
         """Prints out python code"""
+        from rich.syntax import Syntax  # pylint: disable=import-outside-toplevel
         self.console.print(Syntax(output, "python"))
 
     def input(self, prompt, default=None, show_default=True):
@@ -128,21 +164,16 @@ def getpass(self, prompt, default=None):
     # Command loading methods
     def list_commands(self, *path):
         """Command listing."""
-        path_str = ':'.join(path)
-
-        commands = []
-        for command in self.commands:
+        return list(self.command_index.get(':'.join(path), []))
 
-            # Filter based on prefix and the segment length
-            if all([command.startswith(path_str),
-                    len(path) == command.count(":")]):
-
-                # offset is used to exclude the path that the caller requested.
-                offset = len(path_str) + 1 if path_str else 0
-                if ':' not in command[offset:]:
-                    commands.append(command[offset:])
-
-        return sorted(commands)
+    def complete_command(self, prefix, *path):
+        """Names of the commands under path that start with prefix."""
+        names = self.command_index.get(':'.join(path), [])
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
 
     def get_command(self, *path):
         """Return command at the given path or raise error."""
@@ -175,7 +206,18 @@ def load_modules_from_python(self, route_list):
                 path, attr = modpath.split(':', 1)
             else:
                 path, attr = modpath, None
-            self.commands[name] = ModuleLoader(path, attr=attr)
+            self.add_command(name, ModuleLoader(path, attr=attr))
+
+    def add_command(self, name, loader):
+        """Adds a command, and indexes it under its parent path.
+
+        :param string name: command path, like 'vs:list'
+        :param loader: a ModuleLoader for the command
+        """
+        if name not in self.commands:
+            parent, _, child = name.rpartition(':')
+            bisect.insort(self.command_index.setdefault(parent, []), child)
+        self.commands[name] = loader
 
     def ensure_client(self, config_file=None, is_demo=False, proxy=None):
         """Create a new SLAPI client to the environment.
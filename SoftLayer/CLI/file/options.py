@@ -36,7 +36,7 @@ def cli(env, prices, location=None):
     pods = network.get_closed_pods()
 
     if datacenters != []:
-        datacenter_table = formatting.Table(['Id', 'Description', 'KeyName'], title='Datacenter')
+        datacenter_table = formatting.Table(['Id', 'Description', 'KeyName', 'Notes'], title='Datacenter')
 
         for datacenter in datacenters:
             closure = []
@@ -8,35 +8,53 @@
 import collections
 import csv
 import io
+import itertools
 import json
+import operator
 import os
+import re
 import sys
+import textwrap
 
 import click
-from rich import box
-from rich.errors import NotRenderableError
-from rich.table import Table as rTable
 
 from SoftLayer.CLI import exceptions
 from SoftLayer import utils
 
 FALSE_VALUES = ['0', 'false', 'FALSE', 'no', 'False']
 
+#: Strings that sort and filter as numbers
+NUMBER_RE = re.compile(r'^-?\d+(\.\d+)?$')
+
+#: Table.filter() expressions, like 'memory>=4096'
+FILTER_RE = re.compile(r'^\s*(?P<column>[^=!<>~]+?)\s*(?P<op>!=|<=|>=|=|<|>|~)\s*(?P<value>.*?)\s*$')
+
+#: How many rows of a StreamingTable are formatted and printed at once
+STREAM_CHUNK_SIZE = 100
+
+#: Longest a StreamingTable column can be in table format, longer values are cut short
+STREAM_MAX_WIDTH = 60
+
 
 def format_output(data, fmt='table', theme=None):  # pylint: disable=R0911,R0912
     """Given some data, will format it for console output.
 
     :param data: One of: String, Table, FormattedItem, List, Tuple, SequentialOutput
-    :param string fmt (optional): One of: table, raw, json, python
+    :param string fmt (optional): One of: table, raw, json, jsonraw, jsonl, csv, python
     """
+    if isinstance(data, StreamingTable):
+        data = data.to_table()
+
     if fmt == 'json':
         return json.dumps(data, indent=4, cls=CLIJSONEncoder)
     elif fmt == 'jsonraw':
         return json.dumps(data, cls=CLIJSONEncoder)
+    elif fmt == 'jsonl':
+        return format_json_lines(data)
     if fmt == 'csv':
         return csv_output_format(data)
 
-    if isinstance(data, str) or isinstance(data, rTable):
+    if isinstance(data, str) or _is_rich_table(data):
         return data
 
     # responds to .prettytable()
@@ -73,18 +91,32 @@ def format_output(data, fmt='table', theme=None):  # pylint: disable=R0911,R0912
     return str(data)
 
 
+def format_json_lines(data):
+    """Formats a list as newline-delimited JSON, one item per line. Anything else is a single line."""
+    data = _format_python_value(data)
+    if isinstance(data, (list, tuple)):
+        return "\n".join(json.dumps(item, cls=CLIJSONEncoder) for item in data)
+    return json.dumps(data, cls=CLIJSONEncoder)
+
+
+def _is_rich_table(data):
+    """If data is a rich Table. rich is imported lazily, so if it hasn't been imported there can't be one."""
+    rich_table = sys.modules.get('rich.table')
+    return rich_table is not None and isinstance(data, rich_table.Table)
+
+
 def format_prettytable(table, fmt='table', theme=None):
     """Converts SoftLayer.CLI.formatting.Table instance to a prettytable."""
-    for i, row in enumerate(table.rows):
-        for j, item in enumerate(row):
-            # Issue when adding items that evaulate to None (like empty lists) for Rich Tables
-            # so we just cast those to a str
-            if item:
-                table.rows[i][j] = format_output(item)
-            else:
-                table.rows[i][j] = str(item)
-    ptable = table.prettytable(fmt, theme)
-    return ptable
+    return table.prettytable(fmt, theme)
+
+
+def _format_cell(value):
+    """Formats a value for a rich table cell."""
+    # Issue when adding items that evaulate to None (like empty lists) for Rich Tables
+    # so we just cast those to a str
+    if value:
+        return format_output(value)
+    return str(value)
 
 
 def mb_to_gb(megabytes):
@@ -306,10 +338,14 @@ def default(self, o):
 class Table(object):
     """A Table structure used for output.
 
+    Values are stored a column at a time, as they were added. Sorting and filtering work on the raw values
+    (FormattedItem.original), and values are only formatted for display when the table is printed.
+
     :param list columns: a list of column names
+    :param dict formatters: {column: function}, formats the values of a column for display in table format
     """
 
-    def __init__(self, columns, title=None, align=None):
+    def __init__(self, columns, title=None, align=None, formatters=None):
         duplicated_cols = [col for col, count
                            in collections.Counter(columns).items()
                            if count > 1]
@@ -318,8 +354,9 @@ def __init__(self, columns, title=None, align=None):
                                       % ','.join(duplicated_cols))
 
         self.columns = columns
-        self.rows = []
+        self.values = [[] for _ in columns]
         self.align = align or {}
+        self.formatters = formatters or {}
         self.sortby = None
         self.title = title
         # Used to print a message if the table is empty
@@ -327,12 +364,27 @@ def __init__(self, columns, title=None, align=None):
 
     def __bool__(self):
         """Useful for seeing if the table has any rows"""
-        return len(self.rows) > 0
+        return len(self) > 0
+
+    def __len__(self):
+        """Number of rows."""
+        return len(self.values[0]) if self.values else 0
 
     def __str__(self):
         """A Table should only be cast to a string if its empty"""
         return self.empty_message
 
+    @property
+    def rows(self):
+        """The rows of the table, each a list of values. Changing them doesn't change the table."""
+        return [list(row) for row in zip(*self.values)]
+
+    @rows.setter
+    def rows(self, rows):
+        self.values = [[] for _ in self.columns]
+        for row in rows:
+            self.add_row(row)
+
     def set_empty_message(self, message):
         """Sets the empty message for this table for env.fout
 
@@ -346,21 +398,94 @@ def set_empty_message(self, message):
     def add_row(self, row):
         """Add a row to the table.
 
+        Missing values at the end of a short row are blank. A row with more values than there are columns
+        raises a ValueError, instead of losing the values that don't fit.
+
         :param list row: the row of string to be added
         """
-        self.rows.append(row)
+        row = list(row)
+        _check_row(row, self.columns)
+        if len(row) < len(self.columns):
+            row.extend(blank() for _ in range(len(self.columns) - len(row)))
+        for column, value in zip(self.values, row):
+            column.append(value)
+
+    def column(self, name):
+        """The values in a column.
+
+        :param string name: column name
+        """
+        try:
+            return self.values[self.columns.index(name)]
+        except ValueError as ex:
+            raise exceptions.CLIAbort("Column (%s) doesn't exist" % name) from ex
+
+    def sort(self, *keys):
+        """Sorts the rows by one or more columns.
+
+        Numbers sort as numbers, even when they are strings like '10', text sorts as text and blank values
+        come first.
+
+        :param keys: column names, '-name' sorts that column in descending order. A single string of
+                     comma separated columns works too, like 'datacenter,-memory'.
+        """
+        if len(keys) == 1 and isinstance(keys[0], str) and ',' in keys[0] and keys[0] not in self.columns:
+            keys = [key.strip() for key in keys[0].split(',')]
+        order = list(range(len(self)))
+        # Sorts are stable, so sorting by the last key first leaves rows ordered by all of them
+        for key in reversed(keys):
+            name = key[1:] if key.startswith('-') and key not in self.columns else key
+            try:
+                values = self.values[self.columns.index(name)]
+            except ValueError as ex:
+                raise exceptions.CLIAbort("Column (%s) doesn't exist to sort by" % name) from ex
+            sort_keys = [_sort_key(value) for value in values]
+            order.sort(key=sort_keys.__getitem__, reverse=name != key)
+        self.values = [[column[index] for index in order] for column in self.values]
+
+    def filter(self, *expressions):
+        """Removes the rows that don't match every expression.
+
+        An expression is a column name, an operator and a value, like 'memory>=4096' or 'hostname~web'.
+        The operators are = != < <= > >= and ~ (contains, ignoring case). Numbers compare as numbers, and
+        rows without a value only match !=.
+
+        :param expressions: filter expressions
+        """
+        keep = [True] * len(self)
+        for expression in expressions:
+            column, matches = _matcher(expression, self.columns)
+            for index, value in enumerate(self.values[column]):
+                if keep[index]:
+                    keep[index] = matches(_native(value))
+        self.values = [list(itertools.compress(column, keep)) for column in self.values]
+
+    def select(self, columns):
+        """A new table with only some of the columns, in the given order.
+
+        :param list columns: column names
+        """
+        table = self.__class__(list(columns), self.title, dict(self.align), dict(self.formatters))
+        table.values = [list(self.column(name)) for name in columns]
+        table.sortby = self.sortby
+        table.empty_message = self.empty_message
+        return table
 
     def to_python(self):
         """Decode this Table object to standard Python types."""
         # Adding rows
         items = []
-        for row in self.rows:
+        for row in zip(*self.values):
             formatted_row = [_format_python_value(v) for v in row]
             items.append(dict(zip(self.columns, formatted_row)))
         return items
 
     def prettytable(self, fmt='table', theme=None):
         """Returns a RICH table instance."""
+        # pylint: disable=import-outside-toplevel
+        from rich import box
+        from rich.errors import NotRenderableError
+        from rich.table import Table as rTable
 
         # Used to print a message instead of a bad looking empty table
         if not self and self.empty_message:
@@ -371,36 +496,18 @@ def prettytable(self, fmt='table', theme=None):
         color_table = utils.table_color_theme(theme)
         table = rTable(title=self.title, box=box_style, header_style=color_table['header'])
         if self.sortby:
-            try:
-                # https://docs.python.org/3/howto/sorting.html#key-functions
-                sort_index = self.columns.index(self.sortby)
-                # All the values in `rows` are strings, so we need to cast to int for sorting purposes.
-                self.rows.sort(key=lambda the_row: the_row[sort_index] if not the_row[sort_index].isdigit()
-                               else int(the_row[sort_index]))
-            except ValueError as ex:
-                msg = "Column (%s) doesn't exist to sort by" % self.sortby
-                raise exceptions.CLIAbort(msg) from ex
+            self.sort(self.sortby)
 
         for col in self.columns:
-            justify = "center"
             style = None
-            # This case aligns all columns in a table
-            if isinstance(self.align, str):
-                justify = self.align
-            # This case alings a specific column
-            elif isinstance(self.align, dict) and self.align.get(col, False):
-                justify = self.align.get(col)
-            # Backwards compatibility with PrettyTable style alignments
-            if justify == 'r':
-                justify = 'right'
-            if justify == 'l':
-                justify = 'left'
             # Special coloring for some columns
             if col in ('id', 'Id', 'ID'):
                 style = color_table['id_columns']
-            table.add_column(col, justify=justify, style=style)
+            table.add_column(col, justify=_justify(self.align, col), style=style)
 
-        for row in self.rows:
+        # Only formatted now, after sorting and filtering, and only for the rows that are printed
+        columns = [self._display_values(index) for index in range(len(self.columns))]
+        for row in zip(*columns):
             try:
                 table.add_row(*row)
             # Generally you will see this if one of the columns in the row is a list or dict
@@ -412,6 +519,14 @@ def prettytable(self, fmt='table', theme=None):
 
         return table
 
+    def _display_values(self, index):
+        """Formats the values in a column for display."""
+        formatter = self.formatters.get(self.columns[index])
+        values = self.values[index]
+        if formatter is not None:
+            values = [formatter(value) for value in values]
+        return [_format_cell(value) for value in values]
+
 
 class KeyValueTable(Table):
     """A table that is oriented towards key-value pairs."""
@@ -424,6 +539,183 @@ def to_python(self):
         return mapping
 
 
+class StreamingTable(object):
+    """A Table whose rows come from an iterable, like client.iter_call(), and are printed as they come in.
+
+    env.fout() prints csv and json a chunk of rows at a time, and tables in chunks that all use the column widths
+    of the first chunk, so memory use doesn't grow with the number of rows. Rows are printed in the order they
+    come in, they can't be sorted.
+
+    :param list columns: a list of column names
+    :param rows: an iterable of rows, each a list of values
+    :param int chunk_size: how many rows to format and print at once
+    """
+
+    def __init__(self, columns, rows, title=None, align=None, chunk_size=STREAM_CHUNK_SIZE):
+        # Checks the columns, and holds the settings for to_table()
+        self.table = Table(columns, title, align)
+        self.rows = rows
+        self.chunk_size = chunk_size
+
+    @property
+    def columns(self):
+        """Column names."""
+        return self.table.columns
+
+    @property
+    def align(self):
+        """Column alignments, like Table.align."""
+        return self.table.align
+
+    def filter(self, *expressions):
+        """Only prints the rows that match every expression, see Table.filter()."""
+        matchers = [_matcher(expression, self.columns) for expression in expressions]
+        self.rows = (row for row in self.rows if all(matches(_native(row[column])) for column, matches in matchers))
+
+    def set_empty_message(self, message):
+        """Sets the message printed instead of a table if there are no rows."""
+        self.table.set_empty_message(message)
+
+    def chunks(self):
+        """Yields lists of up to chunk_size rows."""
+        rows = iter(self.rows)
+        chunk = list(itertools.islice(rows, self.chunk_size))
+        while chunk:
+            for row in chunk:
+                _check_row(row, self.columns)
+            yield chunk
+            chunk = list(itertools.islice(rows, self.chunk_size))
+
+    def to_table(self):
+        """Reads all the rows into a regular Table."""
+        for row in self.rows:
+            self.table.add_row(list(row))
+        return self.table
+
+    def to_python(self):
+        """Decode this StreamingTable to standard Python types, this reads all the rows."""
+        return self.to_table().to_python()
+
+
+def _check_row(row, columns):
+    """Raises a ValueError if a row has more values than there are columns."""
+    if len(row) > len(columns):
+        raise ValueError("Row has %d values, the table only has %d columns: %s"
+                         % (len(row), len(columns), ', '.join(str(column) for column in columns)))
+
+
+def format_streaming(table, fmt='table', theme=None):
+    """Formats a StreamingTable a chunk of rows at a time.
+
+    Yields strings, or rich tables for the table and raw formats.
+
+    :param StreamingTable table: the table to format
+    :param string fmt: One of: table, raw, json, jsonraw, jsonl, csv
+    """
+    if fmt == 'csv':
+        yield from _stream_csv(table)
+    elif fmt in ('json', 'jsonraw'):
+        yield from _stream_json(table, indent=4 if fmt == 'json' else None)
+    elif fmt == 'jsonl':
+        for chunk in table.chunks():
+            yield "".join(json.dumps(_row_to_python(table.columns, row), cls=CLIJSONEncoder) + "\n"
+                          for row in chunk)
+    else:
+        yield from _stream_rich(table, fmt, theme)
+
+
+def _row_to_python(columns, row):
+    """A row as a dict, like each item of Table.to_python()."""
+    return dict(zip(columns, [_format_python_value(value) for value in row]))
+
+
+def _stream_csv(table):
+    """CSV for a StreamingTable, the header and then a chunk of rows at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+    writer.writerow(table.columns)
+    for chunk in table.chunks():
+        for row in chunk:
+            writer.writerow([_csv_value(value) for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _csv_value(value):
+    """A value for a CSV cell, NULL is '-' and nested tables are JSON."""
+    if str(value) == 'NULL':
+        return '-'
+    if isinstance(value, Table):
+        return json.dumps(value.to_python(), cls=CLIJSONEncoder)
+    return value
+
+
+def _stream_json(table, indent=None):
+    """The same JSON list json.dumps() would make of table.to_python(), a chunk of rows at a time."""
+    separator = ",\n" if indent else ", "
+    start = "[\n" if indent else "["
+    end = "\n]\n" if indent else "]\n"
+    empty = True
+    for chunk in table.chunks():
+        items = []
+        for row in chunk:
+            item = json.dumps(_row_to_python(table.columns, row), indent=indent, cls=CLIJSONEncoder)
+            items.append(textwrap.indent(item, " " * indent) if indent else item)
+        yield (start if empty else separator) + separator.join(items)
+        empty = False
+    yield "[]\n" if empty else end
+
+
+def _stream_rich(table, fmt='table', theme=None):
+    """Rich tables for a StreamingTable, one per chunk.
+
+    They all have the same column widths and only the first one has a header, so they look like one table.
+    """
+    # pylint: disable=import-outside-toplevel
+    from rich import box
+    from rich.table import Table as rTable
+
+    color_table = utils.table_color_theme(theme)
+    widths = None
+    for chunk in table.chunks():
+        rows = [[_format_cell(value) for value in row] for row in chunk]
+        first = widths is None
+        if first:
+            widths = [min(STREAM_MAX_WIDTH, max([len(col)] + [len(str(row[index])) for row in rows]))
+                      for index, col in enumerate(table.columns)]
+        rich_table = rTable(title=table.table.title if first else None, box=None if fmt == 'raw' else box.SQUARE,
+                            show_edge=False, show_header=first, header_style=color_table['header'])
+        for col, width in zip(table.columns, widths):
+            style = color_table['id_columns'] if col in ('id', 'Id', 'ID') else None
+            rich_table.add_column(col, justify=_justify(table.align, col), style=style, width=width,
+                                  no_wrap=True, overflow='ellipsis')
+        for row in rows:
+            rich_table.add_row(*row)
+        yield rich_table
+    if widths is None:
+        yield table.table.empty_message + "\n"
+
+
+def _justify(align, col):
+    """How a column is aligned in a rich table, from a Table.align setting."""
+    justify = "center"
+    # This case aligns all columns in a table
+    if isinstance(align, str):
+        justify = align
+    # This case alings a specific column
+    elif isinstance(align, dict) and align.get(col, False):
+        justify = align.get(col)
+    # Backwards compatibility with PrettyTable style alignments
+    if justify == 'r':
+        justify = 'right'
+    if justify == 'l':
+        justify = 'left'
+    return justify
+
+
 class FormattedItem(object):
     """This is an object that can be displayed as a human readable and raw.
 
@@ -488,6 +780,73 @@ def _format_python_value(value):
     return value
 
 
+def _native(value):
+    """The raw value of a FormattedItem, anything else as it is."""
+    while isinstance(value, FormattedItem):
+        value = value.original
+    return value
+
+
+def _to_number(value):
+    """value if it is a number, or the number in a string like '10', otherwise None."""
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and NUMBER_RE.match(value):
+        return float(value) if '.' in value else int(value)
+    return None
+
+
+def _sort_key(value):
+    """Sort key for a table value, blank values come first, then numbers, then everything else as text."""
+    value = _native(value)
+    if value is None:
+        return (0, 0)
+    number = _to_number(value)
+    if number is not None:
+        return (1, number)
+    return (2, value if isinstance(value, str) else str(value))
+
+
+_FILTERS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '~': lambda value, expected: expected.lower() in value.lower(),
+}
+
+
+def _parse_filter(expression):
+    """Splits a Table.filter() expression into (column, operator, value)."""
+    match = FILTER_RE.match(expression)
+    if match is None:
+        raise exceptions.CLIAbort("Invalid filter (%s), use column=value, or one of %s instead of ="
+                                  % (expression, ' '.join(op for op in _FILTERS if op != '=')))
+    return match.group('column'), match.group('op'), match.group('value')
+
+
+def _matcher(expression, columns):
+    """Parses a Table.filter() expression, returns (column index, function that checks a raw value)."""
+    name, op, expected = _parse_filter(expression)
+    if name not in columns:
+        raise exceptions.CLIAbort("Column (%s) doesn't exist to filter by" % name)
+    compare = _FILTERS[op]
+    expected_number = _to_number(expected) if op != '~' else None
+
+    def matches(value):
+        if value is None:
+            return op == '!='
+        if expected_number is not None:
+            number = _to_number(value)
+            if number is not None:
+                return compare(number, expected_number)
+        return compare(str(value), expected)
+
+    return columns.index(name), matches
+
+
 def iter_to_table(value):
     """Convert raw API responses to response tables."""
     if isinstance(value, list):
@@ -497,6 +856,22 @@ def iter_to_table(value):
     return value
 
 
+def iter_to_streaming_table(items, chunk_size=STREAM_CHUNK_SIZE):
+    """Convert an iterable of API results, like client.iter_call(), to a StreamingTable.
+
+    The columns are the keys of the objects in the first chunk_size items, keys that only show up later are left out.
+    """
+    items = iter(items)
+    first = [item for item in itertools.islice(items, chunk_size) if item]
+    if first and all(isinstance(item, dict) for item in first):
+        columns = sorted(set().union(*first))
+        rows = ([iter_to_table(item.get(key)) for key in columns] for item in itertools.chain(first, items) if item)
+    else:
+        columns = ['value']
+        rows = ([iter_to_table(item)] for item in itertools.chain(first, items) if item)
+    return StreamingTable(columns, rows, chunk_size=chunk_size)
+
+
 def _format_dict(result):
     """Format dictionary responses into key-value table."""
 
@@ -555,13 +930,12 @@ def _format_list_objects(result):
 
 def csv_output_format(data, delimiter=','):
     """Formating a table to csv format and show it."""
-    data = clean_table(data, delimiter)
-    write_csv_format(sys.stdout, data, delimiter)
+    write_csv_format(sys.stdout, data, delimiter, rows=clean_table(data, delimiter))
     return ''
 
 
 def clean_table(data, delimiter):
-    """Delete Null fields by '-' and fix nested table in table"""
+    """Rows of a table for csv, with Null fields replaced by '-' and nested tables flattened"""
     new_data_row = []
     for row in data.rows:
         new_value = []
@@ -588,12 +962,11 @@ def clean_table(data, delimiter):
 
         if len(new_value) != 0:
             new_data_row.append(new_value)
-    data.rows = new_data_row
-    return data
+    return new_data_row
 
 
-def write_csv_format(support_output, data, delimiter, quoting=csv.QUOTE_NONNUMERIC):
+def write_csv_format(support_output, data, delimiter, quoting=csv.QUOTE_NONNUMERIC, rows=None):
     """Write csv format to supported output"""
     writer = csv.writer(support_output, delimiter=delimiter, quoting=quoting)
     writer.writerow(data.columns)
-    writer.writerows(data.rows)
+    writer.writerows(data.rows if rows is None else rows)
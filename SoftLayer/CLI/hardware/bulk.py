@@ -0,0 +1,75 @@
+"""Run a power, reload, cancel or tag action on many servers at once."""
+# :license: MIT, see LICENSE for more details.
+
+import click
+
+import SoftLayer
+from SoftLayer.CLI import bulk
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import exceptions
+
+ACTIONS = ['power-on', 'power-off', 'power-cycle', 'reboot', 'reload', 'cancel', 'tag']
+
+
+@click.command(cls=SoftLayer.CLI.command.SLCommand, )
+@click.argument('action', type=click.Choice(ACTIONS))
+@bulk.target_options
+@click.option('--hard/--soft', default=None, help="Hard or soft reboot")
+@click.option('--immediate', is_flag=True, default=False,
+              help="Cancel immediately instead of at the end of the billing cycle")
+@click.option('--set-tags', help="Comma separated tags the servers get with the tag action")
+@environment.pass_env
+def cli(env, action, identifiers, tag, id_file, workers, rate, hard, immediate, set_tags):
+    """Run an action on many servers at once.
+
+    ACTION is one of power-on, power-off, power-cycle, reboot, reload, cancel or tag. The servers are
+    given by id, hostname or IP address, with --tag and with --file. Every server is worked on even if
+    some fail, the results are shown at the end and the exit code is 1 if any failed.
+
+    Example::
+
+        slcli hw bulk power-cycle db1 db2 10.0.0.5
+
+        slcli hw bulk reload --tag rebuild
+
+        slcli hw bulk tag --set-tags "db,prod" --file servers.txt
+    """
+    if action == 'tag' and set_tags is None:
+        raise exceptions.ArgumentError("--set-tags is required with the tag action")
+
+    mgr = SoftLayer.HardwareManager(env.client)
+    server = env.client['Hardware_Server']
+    ids = bulk.get_targets(mgr.resolve_ids_many, lambda tags: mgr.list_hardware(tags=tags, mask='id'),
+                           identifiers, id_file, tag, name='hardware')
+
+    if action in ('power-off', 'power-cycle', 'reboot', 'reload', 'cancel'):
+        bulk.confirm(env, action, ids)
+
+    if action == 'power-on':
+        def run(hw_id):
+            server.powerOn(id=hw_id)
+    elif action == 'power-off':
+        def run(hw_id):
+            server.powerOff(id=hw_id)
+    elif action == 'power-cycle':
+        def run(hw_id):
+            server.powerCycle(id=hw_id)
+    elif action == 'reboot':
+        def run(hw_id):
+            if hard is True:
+                server.rebootHard(id=hw_id)
+            elif hard is False:
+                server.rebootSoft(id=hw_id)
+            else:
+                server.rebootDefault(id=hw_id)
+    elif action == 'reload':
+        def run(hw_id):
+            mgr.reload(hw_id)
+    elif action == 'cancel':
+        def run(hw_id):
+            mgr.cancel_hardware(hw_id, immediate=immediate)
+    else:
+        def run(hw_id):
+            mgr.set_tags(set_tags, hw_id)
+
+    bulk.report(env, bulk.run(env, ids, run, workers, rate, action))
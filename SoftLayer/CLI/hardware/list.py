@@ -57,7 +57,9 @@
               help="Use the more flexible Search API to list instances. See `slcli search --types` for list " +
                    "of searchable fields.")
 @helpers.multi_option('--tag', help='Filter by tags')
-@click.option('--sortby', help='Column to sort by', default='hostname', show_default=True)
+@click.option('--sortby', default='hostname', show_default=True,
+              help='Column to sort by, or columns separated by commas. Put - in front of a column to sort it '
+                   'in descending order')
 @click.option('--columns',
               callback=column_helper.get_formatter(COLUMNS),
               help='Columns to display. [options: %s]' % ', '.join(column.name for column in COLUMNS),
@@ -67,9 +69,14 @@
               help='How many results to get in one api call, default is 100',
               default=100,
               show_default=True)
+@click.option('--where', multiple=True,
+              help="Only show rows that match, like 'memory>=4096' or 'hostname~web'. The operators are "
+                   "= != < <= > >= and ~ (contains). Can be used more than once.")
+@click.option('--stream', is_flag=True,
+              help='Print servers as they are fetched instead of all at the end. They are not sorted.')
 @environment.pass_env
 def cli(env, sortby, cpu, domain, datacenter, hostname, memory, network, owner, primary_ip, backend_ip,
-        search, tag, columns, limit):
+        search, tag, columns, limit, where, stream):
     """List hardware servers."""
 
     if search is not None:
@@ -97,7 +104,16 @@ def cli(env, sortby, cpu, domain, datacenter, hostname, memory, network, owner,
             public_ip=primary_ip,
             private_ip=backend_ip,
             mask="mask(SoftLayer_Hardware_Server)[%s]" % columns.mask(),
-            limit=limit)
+            limit=limit,
+            iterator=stream)
+
+    if stream:
+        rows = ([value or formatting.blank() for value in columns.row(server)] for server in servers)
+        table = formatting.StreamingTable(columns.columns, rows, align={'created_by': 'l', 'tags': 'l'},
+                                          chunk_size=limit)
+        table.filter(*where)
+        env.fout(table)
+        return
 
     table = formatting.Table(columns.columns)
     table.sortby = sortby
@@ -107,5 +123,6 @@ def cli(env, sortby, cpu, domain, datacenter, hostname, memory, network, owner,
     for server in servers:
         table.add_row([value or formatting.blank()
                        for value in columns.row(server)])
+    table.filter(*where)
 
     env.fout(table)
@@ -23,12 +23,14 @@ def cli(env, identifier, users):
     table.align['Id'] = 'r'
     table.align['Username'] = 'l'
 
-    for user in users:
-        notification = hardware.add_notification(identifier, user)
-        if notification:
+    failed = []
+    for user, notification in zip(users, hardware.add_notifications(identifier, users)):
+        if notification and not isinstance(notification, SoftLayer.SoftLayerAPIError):
             table.add_row([notification['id'], notification['hardware']['fullyQualifiedDomainName'],
                            notification['user']['username'], notification['user']['email'],
                            notification['user']['firstName'], notification['user']['lastName']])
         else:
-            raise exceptions.CLIAbort(f"User not found: {user}.")
+            failed.append(user)
+    if failed:
+        raise exceptions.CLIAbort(f"User not found: {', '.join(failed)}.")
     env.fout(table)
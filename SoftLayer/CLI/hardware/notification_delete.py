@@ -8,14 +8,14 @@
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
-@click.argument('identifier')
+@click.argument('identifiers', nargs=-1, required=True)
 @environment.pass_env
-def cli(env, identifier):
-    """Remove a user hardware notification entry."""
+def cli(env, identifiers):
+    """Remove user hardware notification entries."""
 
     hardware = SoftLayer.HardwareManager(env.client)
 
-    result = hardware.remove_notification(identifier)
+    result = hardware.remove_notifications(identifiers)
 
     if result:
-        env.fout(f"The hardware notification instance: {identifier} was deleted.")
+        env.fout(f"The hardware notification instance: {', '.join(identifiers)} was deleted.")
@@ -4,24 +4,34 @@
 import click
 
 import SoftLayer
+from SoftLayer.CLI import bulk
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import exceptions
 from SoftLayer.CLI import helpers
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
-@click.argument('identifier')
+@click.argument('identifiers', nargs=-1, required=True)
 @click.option('--wait', default=0, show_default=True, type=click.INT,
               help="Seconds to wait")
 @environment.pass_env
-def cli(env, identifier, wait):
-    """Check if a server is ready."""
+def cli(env, identifiers, wait):
+    """Check if servers are ready.
+
+    With more than one server, all of them are checked together, and the ones that are ready are listed
+    as soon as they are.
+    """
 
     compute = SoftLayer.HardwareManager(env.client)
-    compute_id = helpers.resolve_id(compute.resolve_ids, identifier,
-                                    'hardware')
-    ready = compute.wait_for_ready(compute_id, wait)
-    if ready:
-        env.fout("READY")
-    else:
-        raise exceptions.CLIAbort("Server %s not ready" % compute_id)
+    if len(identifiers) == 1:
+        compute_id = helpers.resolve_id(compute.resolve_ids, identifiers[0],
+                                        'hardware')
+        ready = compute.wait_for_ready(compute_id, wait)
+        if ready:
+            env.fout("READY")
+        else:
+            raise exceptions.CLIAbort("Server %s not ready" % compute_id)
+        return
+
+    compute_ids = bulk.get_targets(compute.resolve_ids_many, None, identifiers, name='hardware')
+    bulk.print_ready(env, compute_ids, compute.wait_for_ready_many(compute_ids, wait))
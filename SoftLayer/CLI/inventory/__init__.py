@@ -0,0 +1 @@
+"""Local snapshot of the account."""
@@ -0,0 +1,43 @@
+"""Find servers, VLANs, subnets, storage and billing items in the local inventory snapshot."""
+# :license: MIT, see LICENSE for more details.
+
+import click
+
+from SoftLayer.CLI.command import SLCommand as SLCommand
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import formatting
+from SoftLayer.managers import inventory
+
+
+@click.command(cls=SLCommand)
+@click.option('--kind', '-k', type=click.Choice(list(inventory.KINDS)), help="Only this kind")
+@click.option('--hostname', '-H', help="Hostname or fully qualified domain name")
+@click.option('--ip', help="IP address, or subnet network address")
+@click.option('--datacenter', '-d', help="Datacenter short name")
+@click.option('--tag', '-t', help="Tag name")
+@click.option('--vlan', type=click.INT, help="VLAN id")
+@click.option('--max-age', type=click.IntRange(min=0), default=3600, show_default=True,
+              help="Refresh the snapshot first if it is older than this many seconds")
+@environment.pass_env
+def cli(env, kind, hostname, ip, datacenter, tag, vlan, max_age):
+    """Find servers, VLANs, subnets, storage and billing items in the local inventory snapshot.
+
+    Matches are exact and ignore case. Nothing is fetched from the API unless the snapshot is older
+    than --max-age, see slcli inventory refresh.
+
+    Example::
+
+        slcli inventory find --datacenter dal13 --tag web
+
+        slcli inventory find --ip 10.45.19.37 --max-age 86400
+    """
+    mgr = inventory.InventoryManager(env.client)
+    kinds = [kind] if kind else list(inventory.KINDS)
+    mgr.ensure_fresh(max_age, kinds)
+
+    table = formatting.Table(['kind', 'id', 'name', 'datacenter'])
+    for kind_name in kinds:
+        for item in mgr.find(kind_name, hostname=hostname, ip=ip, datacenter=datacenter, tag=tag, vlan=vlan):
+            table.add_row([kind_name, item['id'], inventory.get_name(item) or formatting.blank(),
+                           inventory.get_datacenter(item) or formatting.blank()])
+    env.fout(table)
@@ -0,0 +1,37 @@
+"""Bring the local inventory snapshot up to date."""
+# :license: MIT, see LICENSE for more details.
+
+import click
+
+from SoftLayer.CLI.command import SLCommand as SLCommand
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import formatting
+from SoftLayer.CLI import helpers
+from SoftLayer.managers import inventory
+
+
+@click.command(cls=SLCommand)
+@helpers.multi_option('--kind', '-k', type=click.Choice(list(inventory.KINDS)), help="Only refresh this kind")
+@click.option('--full', is_flag=True, default=False, help="Get everything again, not only what changed")
+@environment.pass_env
+def cli(env, kind, full):
+    """Bring the local inventory snapshot up to date.
+
+    The first refresh gets every virtual server, hardware server, VLAN, subnet, storage volume and billing
+    item on the account. After that only what changed is fetched, unless --full is given or the last full
+    refresh was a day ago.
+
+    Example::
+
+        slcli inventory refresh
+
+        slcli inventory refresh --kind virtual --kind vlan
+    """
+    mgr = inventory.InventoryManager(env.client)
+    results = mgr.refresh(list(kind) or None, full=full)
+
+    table = formatting.Table(['kind', 'refresh', 'updated', 'removed', 'total'])
+    for name, result in results.items():
+        table.add_row([name, 'full' if result['full'] else 'changes', result['updated'], result['removed'],
+                       result['total']])
+    env.fout(table)
@@ -0,0 +1,30 @@
+"""Show what is in the local inventory snapshot."""
+# :license: MIT, see LICENSE for more details.
+
+import datetime
+
+import click
+
+from SoftLayer.CLI.command import SLCommand as SLCommand
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import formatting
+from SoftLayer.managers import inventory
+
+
+@click.command(cls=SLCommand)
+@environment.pass_env
+def cli(env):
+    """Show what is in the local inventory snapshot, and when it was refreshed."""
+    mgr = inventory.InventoryManager(env.client)
+
+    table = formatting.Table(['kind', 'count', 'refreshed', 'full refresh'], title=mgr.path)
+    for kind, status in mgr.get_status().items():
+        table.add_row([kind, status['count'], _when(status['refreshed']), _when(status['full_refreshed'])])
+    env.fout(table)
+
+
+def _when(timestamp):
+    """A refresh time, or blank if it never happened."""
+    if timestamp is None:
+        return formatting.blank()
+    return datetime.datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
@@ -0,0 +1,47 @@
+"""Compare the prices of presets and items across datacenters."""
+# :license: MIT, see LICENSE for more details.
+
+import click
+
+from SoftLayer.CLI.command import SLCommand as SLCommand
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import formatting
+from SoftLayer.managers import ordering
+
+COLUMNS = ['Name', 'Datacenter', 'Hourly', 'Monthly']
+
+
+@click.command(cls=SLCommand)
+@click.argument('package_keyname')
+@click.option('--preset', '-p', multiple=True,
+              help="Preset keyName to price. All the package's presets if neither --preset nor --items is used.")
+@click.option('--items', '-i', multiple=True,
+              help="Comma separated item keyNames to price together, like GUEST_CORE_2,RAM_4_GB")
+@click.option('--datacenter', '-d', multiple=True,
+              help="Datacenter short name, like dal13. Every datacenter the package can be ordered in by default.")
+@environment.pass_env
+def cli(env, package_keyname, preset, items, datacenter):
+    """Price presets and items in many datacenters at once.
+
+    The package's items, presets and datacenter price groups are each downloaded once,
+    however many datacenters there are. Use --format csv or --format json to save the matrix.
+
+    Example::
+
+        slcli --format csv order price-matrix PUBLIC_CLOUD_SERVER -p B1_2X8X100 -p B1_4X16X100
+        -i GUEST_CORE_2,RAM_4_GB,GUEST_DISK_100_GB_SAN -d dal13 -d fra02 -d tok02
+    """
+    manager = ordering.OrderingManager(env.client)
+    item_sets = {item_set: [keyname.strip() for keyname in item_set.split(',') if keyname.strip()]
+                 for item_set in items}
+    matrix = manager.get_price_matrix(package_keyname, presets=list(preset), item_sets=item_sets,
+                                      datacenters=list(datacenter))
+
+    table = formatting.Table(COLUMNS)
+    table.align['Name'] = 'l'
+    table.align['Hourly'] = 'r'
+    table.align['Monthly'] = 'r'
+    for row in matrix:
+        table.add_row([row['name'], row['datacenter'], formatting.blank() if row['hourly'] is None else row['hourly'],
+                       row['monthly']])
+    env.fout(table)
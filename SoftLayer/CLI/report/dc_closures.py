@@ -4,6 +4,7 @@
 from SoftLayer.CLI.command import SLCommand as SLCommand
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import formatting
+from SoftLayer.managers.search import SearchManager
 from SoftLayer import utils
 
 
@@ -46,15 +47,15 @@ def cli(env):
     resource_table = formatting.Table(["Id", "Name", "Public VLAN", "Private VLAN", "Type", "Datacenter",
                                        "POD", "Cancellation Date"], title=table_title)
     resource_table.align = 'l'
-    for pod in closing_pods:
-        resources = {'hardware': {}, 'virtual': {}, 'firewall': {}, 'gateway': {}}
-        vlans = env.client.call('SoftLayer_Search', 'advancedSearch',
-                                search.format(pod.get('backendRouterName'), pod.get('frontendRouterName')),
-                                iter=True, mask=resource_mask)
+    # Every closing POD is searched at once, the VLANs of each one are sorted out by the query that found them
+    queries = [search.format(pod.get('backendRouterName'), pod.get('frontendRouterName')) for pod in closing_pods]
+    pod_resources = {query: {'hardware': {}, 'virtual': {}, 'firewall': {}, 'gateway': {}} for query in queries}
+    for query, vlan in SearchManager(env.client).advanced_many(queries, mask=resource_mask):
         # Go through the vlans and coalate the resources into a data structure that is easy to print out
-        for vlan in vlans:
-            resources = process_vlan(vlan.get('resource', {}), resources)
+        process_vlan(vlan.get('resource', {}), pod_resources[query])
 
+    for pod, query in zip(closing_pods, queries):
+        resources = pod_resources[query]
         # Go through each resource and add it to the table
         for resource_type, resource_values in resources.items():
             for resource_id, resource_object in resource_values.items():
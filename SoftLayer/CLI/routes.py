@@ -8,6 +8,7 @@
 
 ALL_ROUTES = [
     ('shell', 'SoftLayer.shell.core:cli'),
+    ('daemon', 'SoftLayer.daemon.core:cli'),
     ('emplogin', 'SoftLayer.CLI.login:cli'),
 
     ('call-api', 'SoftLayer.CLI.call_api:cli'),
@@ -32,6 +33,7 @@
     ('virtual', 'SoftLayer.CLI.virt'),
     ('virtual:bandwidth', 'SoftLayer.CLI.virt.bandwidth:cli'),
     ('virtual:billing', 'SoftLayer.CLI.virt.billing:cli'),
+    ('virtual:bulk', 'SoftLayer.CLI.virt.bulk:cli'),
     ('virtual:cancel', 'SoftLayer.CLI.virt.cancel:cli'),
     ('virtual:capture', 'SoftLayer.CLI.virt.capture:cli'),
     ('virtual:create', 'SoftLayer.CLI.virt.create:cli'),
@@ -206,6 +208,11 @@
     ('globalip:list', 'SoftLayer.CLI.globalip.list:cli'),
     ('globalip:unassign', 'SoftLayer.CLI.globalip.unassign:cli'),
 
+    ('inventory', 'SoftLayer.CLI.inventory'),
+    ('inventory:find', 'SoftLayer.CLI.inventory.find:cli'),
+    ('inventory:refresh', 'SoftLayer.CLI.inventory.refresh:cli'),
+    ('inventory:status', 'SoftLayer.CLI.inventory.status:cli'),
+
     ('image', 'SoftLayer.CLI.image'),
     ('image:delete', 'SoftLayer.CLI.image.delete:cli'),
     ('image:detail', 'SoftLayer.CLI.image.detail:cli'),
@@ -262,6 +269,7 @@
     ('order:package-list', 'SoftLayer.CLI.order.package_list:cli'),
     ('order:place', 'SoftLayer.CLI.order.place:cli'),
     ('order:preset-list', 'SoftLayer.CLI.order.preset_list:cli'),
+    ('order:price-matrix', 'SoftLayer.CLI.order.price_matrix:cli'),
     ('order:package-locations', 'SoftLayer.CLI.order.package_locations:cli'),
     ('order:place-quote', 'SoftLayer.CLI.order.place_quote:cli'),
     ('order:quote-list', 'SoftLayer.CLI.order.quote_list:cli'),
@@ -274,6 +282,7 @@
 
     ('hardware', 'SoftLayer.CLI.hardware'),
     ('hardware:bandwidth', 'SoftLayer.CLI.hardware.bandwidth:cli'),
+    ('hardware:bulk', 'SoftLayer.CLI.hardware.bulk:cli'),
     ('hardware:cancel', 'SoftLayer.CLI.hardware.cancel:cli'),
     ('hardware:cancel-reasons', 'SoftLayer.CLI.hardware.cancel_reasons:cli'),
     ('hardware:create', 'SoftLayer.CLI.hardware.create:cli'),
@@ -7,6 +7,7 @@
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import exceptions
 from SoftLayer.CLI import formatting
+from SoftLayer.exceptions import SoftLayerAPIError
 
 COLUMNS = ['id',
            'remoteIp',
@@ -19,7 +20,7 @@
            'createDate',
            'modifyDate']
 
-REQUEST_BOOL_COLUMNS = ['requestId', 'response']
+REQUEST_BOOL_COLUMNS = ['requestId']
 REQUEST_RULES_COLUMNS = ['requestId', 'rules']
 
 
@@ -63,7 +64,7 @@ def rule_list(env, securitygroup_id, sortby):
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
-@click.argument('securitygroup_id')
+@click.argument('securitygroup_id', nargs=-1, required=True)
 @click.option('--remote-ip', '-r',
               help='The remote IP/CIDR to enforce')
 @click.option('--remote-group', '-s', type=click.INT,
@@ -84,7 +85,7 @@ def rule_list(env, securitygroup_id, sortby):
 @environment.pass_env
 def add(env, securitygroup_id, remote_ip, remote_group,
         direction, ethertype, port_max, port_min, protocol):
-    """Add a security group rule to a security group.
+    """Add a security group rule to one or more security groups.
 
     \b
     Examples:
@@ -102,10 +103,19 @@ def add(env, securitygroup_id, remote_ip, remote_group,
             --protocol icmp \\
             --port-min 8 \\
             --port-max 0
+
+    \b
+        # Add the same rule to several security groups at once
+        slcli sg rule-add 384727 384728 --direction ingress --protocol tcp --port-min 22 --port-max 22
     """
     mgr = SoftLayer.NetworkManager(env.client)
 
-    ret = mgr.add_securitygroup_rule(securitygroup_id, remote_ip, remote_group,
+    if len(securitygroup_id) > 1:
+        rule = mgr.securitygroup_rule(remote_ip, remote_group, direction, ethertype, port_max, port_min, protocol)
+        _add_many(env, mgr, securitygroup_id, rule)
+        return
+
+    ret = mgr.add_securitygroup_rule(securitygroup_id[0], remote_ip, remote_group,
                                      direction, ethertype, port_max,
                                      port_min, protocol)
 
@@ -118,6 +128,24 @@ def add(env, securitygroup_id, remote_ip, remote_group,
     env.fout(table)
 
 
+def _add_many(env, mgr, securitygroup_ids, rule):
+    """Adds the rule to every security group with one batch of addRules calls."""
+    results = mgr.add_securitygroup_rules_many(securitygroup_ids, [rule])
+
+    table = formatting.Table(['securitygroupId'] + REQUEST_RULES_COLUMNS)
+    failed = []
+    for group_id, ret in zip(securitygroup_ids, results):
+        if not ret or isinstance(ret, SoftLayerAPIError):
+            failed.append(group_id)
+            table.add_row([group_id, formatting.blank(), str(ret or "Failed")])
+        else:
+            table.add_row([group_id, ret['requestId'], str(ret['rules'])])
+
+    env.fout(table)
+    if failed:
+        raise exceptions.CLIAbort("Failed to add security group rule to " + ", ".join(failed))
+
+
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
 @click.argument('securitygroup_id')
 @click.argument('rule_id')
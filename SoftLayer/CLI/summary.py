@@ -6,6 +6,7 @@
 import SoftLayer
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import formatting
+from SoftLayer.managers.inventory import InventoryManager
 
 
 COLUMNS = ['datacenter',
@@ -21,12 +22,18 @@
               help='Column to sort by',
               default='datacenter',
               type=click.Choice(COLUMNS))
+@click.option('--inventory', 'max_age', type=click.IntRange(min=0),
+              help="Answer from the local inventory snapshot, refreshed first if it is older than this many seconds")
 @environment.pass_env
-def cli(env, sortby):
+def cli(env, sortby, max_age):
     """Account summary."""
 
-    mgr = SoftLayer.NetworkManager(env.client)
-    datacenters = mgr.summary_by_datacenter()
+    if max_age is None:
+        datacenters = SoftLayer.NetworkManager(env.client).summary_by_datacenter()
+    else:
+        inventory = InventoryManager(env.client)
+        inventory.ensure_fresh(max_age, ['vlan'])
+        datacenters = inventory.summary_by_datacenter()
 
     table = formatting.Table(COLUMNS)
     table.sortby = sortby
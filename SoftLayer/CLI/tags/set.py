@@ -5,6 +5,7 @@
 
 from SoftLayer.CLI.command import SLCommand as SLCommand
 from SoftLayer.CLI import environment
+from SoftLayer.exceptions import SoftLayerAPIError
 from SoftLayer.managers.tags import TagManager
 
 
@@ -13,15 +14,23 @@
               help='Comma seperated list of tags, enclosed in quotes. "tag1, tag2"')
 @click.option('--key-name', '-k', type=click.STRING, required=True,
               help="Key name of a tag type e.g. GUEST, HARDWARE. See slcli tags taggable output.")
-@click.option('--resource-id', '-r', type=click.INT, required=True, help="ID of the object being tagged")
+@click.option('--resource-id', '-r', type=click.INT, required=True, multiple=True,
+              help="ID of the object being tagged. Can be used multiple times")
 @environment.pass_env
 def cli(env, tags, key_name, resource_id):
     """Set Tags."""
 
     tag_manager = TagManager(env.client)
-    tags = tag_manager.set_tags(tags, key_name, resource_id)
+    if len(resource_id) == 1:
+        results = [tag_manager.set_tags(tags, key_name, resource_id[0])]
+    else:
+        results = tag_manager.set_tags_many(tags, key_name, resource_id)
 
-    if tags:
+    failed = [str(identifier) for identifier, result in zip(resource_id, results)
+              if not result or isinstance(result, SoftLayerAPIError)]
+    if not failed:
         click.secho("Set tags successfully", fg='green')
-    else:
+    elif len(resource_id) == 1:
         click.secho("Failed to set tags", fg='red')
+    else:
+        click.secho("Failed to set tags on " + ", ".join(failed), fg='red')
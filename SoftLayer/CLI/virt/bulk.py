@@ -0,0 +1,80 @@
+"""Run a power, reload, cancel or tag action on many virtual servers at once."""
+# :license: MIT, see LICENSE for more details.
+
+import click
+
+import SoftLayer
+from SoftLayer.CLI import bulk
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import exceptions
+
+ACTIONS = ['power-on', 'power-off', 'reboot', 'pause', 'resume', 'reload', 'cancel', 'tag']
+
+
+@click.command(cls=SoftLayer.CLI.command.SLCommand, )
+@click.argument('action', type=click.Choice(ACTIONS))
+@bulk.target_options
+@click.option('--hard/--soft', default=None, help="Hard or soft power-off and reboot")
+@click.option('--image', help="Image ID to reload the servers with, instead of their current image")
+@click.option('--set-tags', help="Comma separated tags the servers get with the tag action")
+@environment.pass_env
+def cli(env, action, identifiers, tag, id_file, workers, rate, hard, image, set_tags):
+    """Run an action on many virtual servers at once.
+
+    ACTION is one of power-on, power-off, reboot, pause, resume, reload, cancel or tag. The servers are
+    given by id, hostname or IP address, with --tag and with --file. Every server is worked on even if
+    some fail, the results are shown at the end and the exit code is 1 if any failed.
+
+    Example::
+
+        slcli vs bulk reboot --soft web1 web2 10.0.0.5
+
+        slcli vs bulk power-off --tag staging
+
+        slcli vs bulk tag --set-tags "web,prod" --file servers.txt
+    """
+    if action == 'tag' and set_tags is None:
+        raise exceptions.ArgumentError("--set-tags is required with the tag action")
+
+    mgr = SoftLayer.VSManager(env.client)
+    guest = env.client['Virtual_Guest']
+    ids = bulk.get_targets(mgr.resolve_ids_many, lambda tags: mgr.list_instances(tags=tags, mask='id'),
+                           identifiers, id_file, tag, name='virtual server')
+
+    if action in ('power-off', 'reboot', 'reload', 'cancel'):
+        bulk.confirm(env, action, ids, 'virtual servers')
+
+    if action == 'power-on':
+        def run(vs_id):
+            guest.powerOn(id=vs_id)
+    elif action == 'power-off':
+        def run(vs_id):
+            if hard:
+                guest.powerOff(id=vs_id)
+            else:
+                guest.powerOffSoft(id=vs_id)
+    elif action == 'reboot':
+        def run(vs_id):
+            if hard is True:
+                guest.rebootHard(id=vs_id)
+            elif hard is False:
+                guest.rebootSoft(id=vs_id)
+            else:
+                guest.rebootDefault(id=vs_id)
+    elif action == 'pause':
+        def run(vs_id):
+            guest.pause(id=vs_id)
+    elif action == 'resume':
+        def run(vs_id):
+            guest.resume(id=vs_id)
+    elif action == 'reload':
+        def run(vs_id):
+            mgr.reload_instance(vs_id, image_id=image)
+    elif action == 'cancel':
+        def run(vs_id):
+            mgr.cancel_instance(vs_id)
+    else:
+        def run(vs_id):
+            mgr.set_tags(set_tags, vs_id)
+
+    bulk.report(env, bulk.run(env, ids, run, workers, rate, action))
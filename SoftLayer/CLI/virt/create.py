@@ -1,9 +1,12 @@
 """Manage, delete, order compute instances."""
 # :license: MIT, see LICENSE for more details.
 
+import json
+
 import click
 
 import SoftLayer
+from SoftLayer.CLI import bulk
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import exceptions
 from SoftLayer.CLI import formatting
@@ -12,6 +15,9 @@
 from SoftLayer.CLI import virt
 from SoftLayer import utils
 
+# Options that only make sense on the command line, not for each server in a --from-file file
+COMMAND_ONLY = ['from_file', 'export', 'template', 'like', 'wait', 'test', 'workers', 'rate']
+
 
 def _update_with_like_args(ctx, _, value):
     """Update arguments with options taken from a currently running VS."""
@@ -152,12 +158,12 @@ def _parse_create_args(client, args):
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, epilog="See 'slcli vs create-options' for valid options")
-@click.option('--hostname', '-H', required=True, prompt=True, help="Host portion of the FQDN")
-@click.option('--domain', '-D', required=True, prompt=True, help="Domain portion of the FQDN")
+@click.option('--hostname', '-H', help="Host portion of the FQDN  [required unless --from-file]")
+@click.option('--domain', '-D', help="Domain portion of the FQDN  [required unless --from-file]")
 @click.option('--cpu', '-c', type=click.INT, help="Number of CPU cores (not available with flavors)")
 @click.option('--memory', '-m', type=virt.MEM_TYPE, help="Memory in mebibytes (not available with flavors)")
 @click.option('--flavor', '-f', type=click.STRING, help="Public Virtual Server flavor key name")
-@click.option('--datacenter', '-d', required=True, prompt=True, help="Datacenter shortname")
+@click.option('--datacenter', '-d', help="Datacenter shortname  [required unless --from-file]")
 @click.option('--os', '-o', help="OS install code. Tip: you can specify <OS>_LATEST")
 @click.option('--image', help="Image ID. See: 'slcli image list' for reference")
 @click.option('--boot-mode', type=click.STRING,
@@ -209,11 +215,30 @@ def _parse_create_args(client, args):
 @click.option('--ipv6', is_flag=True, help="Adds an IPv6 address to this guest")
 @click.option('--transient', is_flag=True,
               help="Create a transient virtual server")
+@click.option('--from-file', type=click.File('r'),
+              help="JSON file with a list of servers to order at once, each a dict of these options. "
+                   "The options given on the command line are defaults for every server")
+@click.option('--workers', type=click.IntRange(1, 50), default=10, show_default=True,
+              help="With --from-file, how many API calls to make at once")
+@click.option('--rate', type=click.FLOAT, default=5, show_default=True,
+              help="With --from-file, most orders to place each second, 0 for no limit")
 @environment.pass_env
 def cli(env, **args):
-    """Order/create virtual servers."""
+    """Order/create virtual servers.
+
+    With --from-file, every server in the file is ordered at once. Servers that only differ in their
+    hostname, domain and tags are verified together, then each is ordered on its own.
+    """
 
     vsi = SoftLayer.VSManager(env.client)
+    if args.get('from_file'):
+        _create_from_file(env, vsi, args)
+        return
+
+    # Asked for here rather than by click, a --from-file file can have them instead
+    for name in ('hostname', 'domain', 'datacenter'):
+        if not args.get(name):
+            args[name] = env.input(name.capitalize())
     _validate_args(env, args)
     create_args = _parse_create_args(env.client, args)
     test = args.get('test', False)
@@ -232,7 +257,7 @@ def cli(env, **args):
 
     if args.get('export'):
         export_file = args.pop('export')
-        template.export_to_template(export_file, args, exclude=['wait', 'test'])
+        template.export_to_template(export_file, args, exclude=['wait', 'test', 'from_file', 'workers', 'rate'])
         env.fout('Successfully exported options to a template file.')
 
     else:
@@ -253,6 +278,88 @@ def cli(env, **args):
                 raise exceptions.CLIHalt(code=1)
 
 
+def _create_from_file(env, vsi, args):
+    """Orders every server in a --from-file file, see VSManager.order_guests."""
+    if args.get('export'):
+        raise exceptions.ArgumentError('[--export] not allowed with [--from-file]')
+
+    servers = _read_servers(env, args)
+    # Each SSH key is looked up once, instead of once for every server
+    labels = {key for server in servers for key in server.get('key') or ()}
+    resolver = SoftLayer.SshKeyManager(env.client).resolve_ids
+    key_ids = {label: str(helpers.resolve_id(resolver, label, 'SshKey')) for label in labels}
+    for server in servers:
+        server['key'] = [key_ids[label] for label in server.get('key') or ()]
+    guests = [_parse_create_args(env.client, server) for server in servers]
+
+    test = args.get('test', False)
+    if not test:
+        datacenters = {server['datacenter'] for server in servers}
+        for pod in SoftLayer.NetworkManager(env.client).get_closed_pods():
+            if any(datacenter in str(pod['name']) for datacenter in datacenters):
+                click.secho(f"Warning: Closed soon: {pod['name']}", fg='yellow')
+        if not (env.skip_confirmations or formatting.confirm(
+                f"This action will order {len(guests)} virtual servers and incur charges on your account. Continue?")):
+            raise exceptions.CLIAbort('Aborting virtual server order.')
+
+    results = vsi.order_guests(guests, test, max_workers=args['workers'], rate=args['rate'])
+
+    table = formatting.Table(['hostname', 'domain', 'status', 'order_id', 'ids', 'seconds', 'error'])
+    table.align['error'] = 'l'
+    for result in results:
+        table.add_row([result['hostname'], result['domain'], result['status'],
+                       result['order_id'] or formatting.blank(),
+                       formatting.listing(result['ids'], separator=',') if result['ids'] else formatting.blank(),
+                       result['seconds'] if result['seconds'] is not None else formatting.blank(),
+                       result['error'] or formatting.blank()])
+    env.fout(table)
+
+    failed = len([result for result in results if result['status'] == 'failed'])
+    env.err("%d %s, %d failed" % (len(results) - failed, 'verified' if test else 'ordered', failed))
+
+    ids = [guest_id for result in results for guest_id in result['ids']]
+    if args.get('wait') and ids:
+        bulk.print_ready(env, ids, vsi.wait_for_ready_many(ids, args['wait']))
+    if failed:
+        raise exceptions.CLIHalt(code=1)
+
+
+def _read_servers(env, args):
+    """The arguments for each server in a --from-file file, on top of the ones from the command line."""
+    ctx = click.get_current_context()
+    params = {param.name: param for param in ctx.command.params if param.name not in COMMAND_ONLY}
+    from_file = args['from_file']
+    try:
+        servers = json.load(from_file)
+    except ValueError as ex:
+        raise exceptions.ArgumentError(f"{from_file.name} is not valid JSON: {ex}")
+    if not isinstance(servers, list) or not servers or not all(isinstance(server, dict) for server in servers):
+        raise exceptions.ArgumentError(f"{from_file.name} has to be a JSON list of servers, each a dict of options")
+
+    merged = []
+    for number, server in enumerate(servers, start=1):
+        server_args = dict(args)
+        for name, value in server.items():
+            param = params.get(name.replace('-', '_'))
+            if param is None:
+                raise exceptions.ArgumentError(f"Server {number} has an unknown option: {name}")
+            if param.multiple and not isinstance(value, list):
+                value = [value]
+            try:
+                server_args[param.name] = param.type_cast_value(ctx, value)
+            except click.BadParameter as ex:
+                raise exceptions.ArgumentError(f"Server {number}: {name}: {ex.message}")
+
+        missing = [name for name in ('hostname', 'domain', 'datacenter') if not server_args.get(name)]
+        if not (server_args.get('os') or server_args.get('image')):
+            missing.append('os or image')
+        if missing:
+            raise exceptions.ArgumentError(f"Server {number} is missing: {', '.join(missing)}")
+        _validate_args(env, server_args)
+        merged.append(server_args)
+    return merged
+
+
 def _build_receipt_table(result, billing="hourly", test=False):
     """Retrieve the total recurring fee of the items prices"""
     title = f"OrderId: {result.get('orderId', 'No order placed')}"
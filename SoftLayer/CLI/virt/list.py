@@ -60,7 +60,9 @@
               help="Use the more flexible Search API to list instances. See `slcli search --types` for list " +
               "of searchable fields.")
 @helpers.multi_option('--tag', help='Filter by tags')
-@click.option('--sortby', default='hostname', show_default=True, help='Column to sort by')
+@click.option('--sortby', default='hostname', show_default=True,
+              help='Column to sort by, or columns separated by commas. Put - in front of a column to sort it '
+                   'in descending order')
 @click.option('--columns',
               callback=column_helper.get_formatter(COLUMNS),
               help=f"Columns to display. [options: {', '.join(column.name for column in COLUMNS)}]",
@@ -68,9 +70,14 @@
               show_default=True)
 @click.option('--limit', '-l', default=100, show_default=True,
               help='How many results to get in one api call, default is 100')
+@click.option('--where', multiple=True,
+              help="Only show rows that match, like 'memory>=4096' or 'hostname~web'. The operators are "
+                   "= != < <= > >= and ~ (contains). Can be used more than once.")
+@click.option('--stream', is_flag=True,
+              help='Print servers as they are fetched instead of all at the end. They are not sorted.')
 @environment.pass_env
 def cli(env, sortby, cpu, domain, datacenter, hostname, memory, network,
-        hourly, monthly, tag, columns, limit, transient, search):
+        hourly, monthly, tag, columns, limit, transient, search, where, stream):
     """List virtual servers."""
 
     guests = []
@@ -83,7 +90,15 @@ def cli(env, sortby, cpu, domain, datacenter, hostname, memory, network,
         vsi = SoftLayer.VSManager(env.client)
         guests = vsi.list_instances(hourly=hourly, monthly=monthly, hostname=hostname, domain=domain,
                                     cpus=cpu, memory=memory, datacenter=datacenter, nic_speed=network,
-                                    transient=transient, tags=tag, mask=columns.mask(), limit=limit)
+                                    transient=transient, tags=tag, mask=columns.mask(), limit=limit,
+                                    iterator=stream)
+
+    if stream:
+        rows = ([value or formatting.blank() for value in columns.row(guest)] for guest in guests)
+        table = formatting.StreamingTable(columns.columns, rows, chunk_size=limit)
+        table.filter(*where)
+        env.fout(table)
+        return
 
     table = formatting.Table(columns.columns)
     table.sortby = sortby
@@ -91,5 +106,6 @@ def cli(env, sortby, cpu, domain, datacenter, hostname, memory, network,
     for guest in guests:
         table.add_row([value or formatting.blank()
                        for value in columns.row(guest)])
+    table.filter(*where)
 
     env.fout(table)
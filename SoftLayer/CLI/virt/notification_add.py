@@ -5,6 +5,7 @@
 
 import SoftLayer
 from SoftLayer.CLI import environment
+from SoftLayer.CLI import exceptions
 from SoftLayer.CLI import formatting
 
 
@@ -22,10 +23,15 @@ def cli(env, identifier, users):
     table.align['Id'] = 'r'
     table.align['Username'] = 'l'
 
-    for user in users:
-        notification = virtual.add_notification(identifier, user)
+    failed = []
+    for user, notification in zip(users, virtual.add_notifications(identifier, users)):
+        if isinstance(notification, SoftLayer.SoftLayerAPIError):
+            failed.append(f"{user}: {notification.faultString}")
+            continue
         table.add_row([notification['id'], notification['guest']['fullyQualifiedDomainName'],
                        notification['user']['username'], notification['user']['email'],
                        notification['user']['lastName'], notification['user']['firstName']])
 
     env.fout(table)
+    if failed:
+        raise exceptions.CLIAbort("Unable to add notifications for " + ", ".join(failed))
@@ -8,14 +8,14 @@
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
-@click.argument('identifier')
+@click.argument('identifiers', nargs=-1, required=True)
 @environment.pass_env
-def cli(env, identifier):
-    """Remove a user VS notification entry."""
+def cli(env, identifiers):
+    """Remove user VS notification entries."""
 
     virtual = SoftLayer.VSManager(env.client)
 
-    result = virtual.remove_notification(identifier)
+    result = virtual.remove_notifications(identifiers)
 
     if result:
-        env.fout(f"The virtual server notification instance: {identifier} was deleted.")
+        env.fout(f"The virtual server notification instance: {', '.join(identifiers)} was deleted.")
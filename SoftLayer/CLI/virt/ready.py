@@ -4,22 +4,32 @@
 import click
 
 import SoftLayer
+from SoftLayer.CLI import bulk
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import exceptions
 from SoftLayer.CLI import helpers
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
-@click.argument('identifier')
+@click.argument('identifiers', nargs=-1, required=True)
 @click.option('--wait', default=0, show_default=True, type=click.INT, help="Seconds to wait")
 @environment.pass_env
-def cli(env, identifier, wait):
-    """Check if a virtual server is ready."""
+def cli(env, identifiers, wait):
+    """Check if virtual servers are ready.
+
+    With more than one server, all of them are checked together, and the ones that are ready are listed
+    as soon as they are.
+    """
 
     vsi = SoftLayer.VSManager(env.client)
-    vs_id = helpers.resolve_id(vsi.resolve_ids, identifier, 'VS')
-    ready = vsi.wait_for_ready(vs_id, wait)
-    if ready:
-        env.fout("READY")
-    else:
-        raise exceptions.CLIAbort(f"Instance {vs_id} not ready")
+    if len(identifiers) == 1:
+        vs_id = helpers.resolve_id(vsi.resolve_ids, identifiers[0], 'VS')
+        ready = vsi.wait_for_ready(vs_id, wait)
+        if ready:
+            env.fout("READY")
+        else:
+            raise exceptions.CLIAbort(f"Instance {vs_id} not ready")
+        return
+
+    vs_ids = bulk.get_targets(vsi.resolve_ids_many, None, identifiers, name='virtual server')
+    bulk.print_ready(env, vs_ids, vsi.wait_for_ready_many(vs_ids, wait))
@@ -16,13 +16,65 @@
 """
 # pylint: disable=r0401,invalid-name,wildcard-import
 # NOQA appears to no longer be working. The code might have been upgraded.
+import importlib
+import typing
+
 from SoftLayer import consts
 
-from SoftLayer.API import *  # NOQA
-from SoftLayer.managers import *  # NOQA
 from SoftLayer.exceptions import *  # NOQA
-from SoftLayer.auth import *  # NOQA
-from SoftLayer.transports import *  # NOQA
+
+if typing.TYPE_CHECKING:
+    # For linters and IDEs, these aren't imported at runtime
+    from SoftLayer.API import *  # NOQA
+    from SoftLayer.managers import *  # NOQA
+    from SoftLayer.auth import *  # NOQA
+    from SoftLayer.transports import *  # NOQA
+
+# The clients, managers and transports are only imported when they are first used, which keeps
+# `import SoftLayer` (and every slcli command) fast. name -> module it comes from.
+_LAZY_ATTRIBUTES = {}
+_LAZY_ATTRIBUTES.update(dict.fromkeys([
+    'create_client_from_env', 'employee_client', 'Client', 'BaseClient', 'API_PUBLIC_ENDPOINT',
+    'API_PRIVATE_ENDPOINT', 'IAMClient', 'CertificateClient', 'AsyncClient', 'create_async_client_from_env',
+], 'SoftLayer.API'))
+_LAZY_ATTRIBUTES.update(dict.fromkeys([
+    'BasicAuthentication', 'TokenAuthentication', 'BasicHTTPAuthentication', 'AuthenticationBase',
+    'X509Authentication', 'EmployeeAuthentication',
+], 'SoftLayer.auth'))
+_LAZY_ATTRIBUTES.update(dict.fromkeys([
+    'AccountManager', 'BandwidthManager', 'BlockStorageManager', 'CapacityManager', 'DedicatedHostManager',
+    'DNSManager', 'EventLogManager', 'FileStorageManager', 'FirewallManager', 'HardwareManager', 'ImageManager',
+    'InventoryManager', 'LicensesManager', 'LoadBalancerManager', 'MetadataManager',
+    'NetworkManager', 'ObjectStorageManager', 'OrderingManager', 'PlacementManager', 'SearchManager',
+    'SshKeyManager', 'SSLManager', 'TagManager', 'TicketManager', 'UserManager', 'VSManager',
+], 'SoftLayer.managers'))
+_LAZY_ATTRIBUTES.update(dict.fromkeys([
+    'Request', 'XmlRpcTransport', 'RestTransport', 'AsyncXmlRpcTransport', 'AsyncRestTransport',
+    'TimingTransport', 'CachingTransport', 'RateLimitingTransport', 'MetricsTransport', 'DebugTransport',
+    'FixtureTransport', 'RecordingTransport', 'ReplayTransport', 'SoftLayerListResult', 'StreamingListResult',
+], 'SoftLayer.transports'))
+
+
+def __getattr__(name):
+    """Imports clients, managers, transports and submodules (SoftLayer.API, SoftLayer.utils...) when first used."""
+    if name.startswith('__'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as ex:
+            if ex.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __title__ = 'SoftLayer'
 __version__ = consts.VERSION
@@ -31,8 +83,10 @@
 __copyright__ = 'Copyright 2016 SoftLayer Technologies, Inc.'
 __all__ = [   # noqa: F405
     'BaseClient',
+    'AsyncClient',
     'IAMClient',
     'create_client_from_env',
+    'create_async_client_from_env',
     'Client',
     'BasicAuthentication',
     'SoftLayerError',
@@ -12,6 +12,35 @@
 
 LOGGER = logging.getLogger(__name__)
 
+#: Config file options that are passed to transports.transport.get_session, and how to read them.
+SESSION_OPTIONS = {
+    'pool_connections': 'getint',
+    'pool_maxsize': 'getint',
+    'pool_block': 'getboolean',
+    'retries': 'getint',
+    'backoff_factor': 'getfloat',
+    'keep_alive': 'getboolean',
+    'share_session': 'getboolean',
+}
+
+
+def get_session_options(config, section='softlayer'):
+    """Reads the connection pool settings out of a config file.
+
+    Only options that are actually set in the config file are returned, so
+    get_session's defaults are used for the rest.
+
+        :param config: a ConfigParser
+        :param section: the section to read
+    """
+    options = {}
+    if not config.has_section(section):
+        return options
+    for option, getter in SESSION_OPTIONS.items():
+        if config.has_option(section, option) and config.get(section, option) != '':
+            options[option] = getattr(config, getter)(section, option)
+    return options
+
 
 def get_client_settings_args(**kwargs):
     """Retrieve client settings from user-supplied arguments.
@@ -76,7 +105,8 @@ def get_client_settings_config_file(**kwargs):  # pylint: disable=inconsistent-r
             'userid': config.get('softlayer', 'userid'),
             'access_token': config.get('softlayer', 'access_token'),
             'verify':   config.get('softlayer', 'verify'),
-            'auth_cert': config.get('softlayer', 'auth_cert')
+            'auth_cert': config.get('softlayer', 'auth_cert'),
+            'session_options': get_session_options(config),
         }
         if r_config["verify"].lower() == "true":
             r_config["verify"] = True
@@ -0,0 +1,228 @@
+"""
+    SoftLayer.daemon.client
+    ~~~~~~~~~~~~~~~~~~~~~~~
+    Thin client that runs slcli commands in a running slcli daemon, and the messages they send each other
+
+    This is the `slclid` entry point, so it only imports what it needs to talk to the daemon.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+
+from SoftLayer import consts
+
+#: Environment variable that sets where the daemon listens
+SOCKET_ENV = 'SLCLI_SOCKET'
+
+#: Size of the header in front of every message, the length of the JSON body
+HEADER = struct.Struct('!I')
+
+#: Largest message, anything bigger is a broken client
+MAX_MESSAGE = 16 * 1024 * 1024
+
+
+class DaemonError(Exception):
+    """The daemon didn't run a command, or answered with something unexpected."""
+
+
+class DaemonNotRunning(DaemonError):
+    """Nothing is listening on the daemon's socket."""
+
+
+def socket_path():
+    """Where the daemon listens, $SLCLI_SOCKET or daemon.sock in socket_directory()."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    return os.path.join(socket_directory(), 'daemon.sock')
+
+
+def socket_directory():
+    """The default socket's directory, slcli-<uid> in $XDG_RUNTIME_DIR or the temp dir, only this user can use it."""
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(directory, 'slcli-%d' % os.getuid())
+
+
+def make_private_directory(directory):
+    """Creates directory with 0700 permissions if it doesn't exist.
+
+    :raises DaemonError: if it is a symlink, isn't owned by this user, or others can get into it
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise DaemonError("%s has to be a directory only you can use" % directory)
+
+
+def check_socket(path):
+    """Makes sure path is a socket owned by this user, so nobody else can pretend to be the daemon.
+
+    :raises DaemonNotRunning: if there is nothing at path
+    :raises DaemonError: if it isn't a socket, or another user owns it
+    """
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError as ex:
+        raise DaemonNotRunning("The slcli daemon isn't running: %s" % ex) from ex
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise DaemonError("%s isn't a socket owned by you, not using it" % path)
+
+
+def check_peer(sock):
+    """Makes sure the process at the other end of a connected socket runs as this user, where the OS can tell.
+
+    :raises DaemonError: if it is another user
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', creds)
+    if uid != os.getuid():
+        raise DaemonError("The other end of the socket is user %d, not you" % uid)
+
+
+def send_message(sock, message, fds=None):
+    """Sends a dict as a length prefixed JSON message, along with open file descriptors."""
+    body = json.dumps(message).encode('utf-8')
+    header = HEADER.pack(len(body))
+    if fds:
+        socket.send_fds(sock, [header], fds)
+    else:
+        sock.sendall(header)
+    sock.sendall(body)
+
+
+def recv_message(sock, max_fds=0):
+    """Receives a message sent with send_message(), returns (message, fds). message is None if the socket closed."""
+    fds = []
+    if max_fds:
+        header, fds, _, _ = socket.recv_fds(sock, HEADER.size, max_fds)
+    else:
+        header = sock.recv(HEADER.size)
+    if not header:
+        return None, fds
+    header += _recv_exactly(sock, HEADER.size - len(header))
+    (length,) = HEADER.unpack(header)
+    if length > MAX_MESSAGE:
+        raise DaemonError("Message of %d bytes is too big" % length)
+    return json.loads(_recv_exactly(sock, length).decode('utf-8')), fds
+
+
+def _recv_exactly(sock, size):
+    """Reads size bytes from sock."""
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise DaemonError("Connection closed in the middle of a message")
+        data += chunk
+    return data
+
+
+def connect(path=None, timeout=None):
+    """Connects to the daemon, raises DaemonNotRunning if it isn't running.
+
+    :raises DaemonError: if the socket, or the process listening on it, belongs to another user
+    """
+    path = path or socket_path()
+    check_socket(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError as ex:
+        sock.close()
+        raise DaemonNotRunning("The slcli daemon isn't running: %s" % ex) from ex
+    try:
+        check_peer(sock)
+    except DaemonError:
+        sock.close()
+        raise
+    return sock
+
+
+def request(message, path=None, timeout=5):
+    """Sends a control message (ping, stop) to the daemon and returns its answer."""
+    with connect(path, timeout) as sock:
+        send_message(sock, message)
+        answer, _ = recv_message(sock)
+    if answer is None:
+        raise DaemonError("The slcli daemon closed the connection")
+    return answer
+
+
+def run(args, path=None):
+    """Runs an slcli command in the daemon, with this process' stdin, stdout, stderr, environment and directory.
+
+    Output goes straight to this process' stdout and stderr, the daemon writes to them directly.
+    Ctrl-C interrupts the command in the daemon.
+
+    :param list args: arguments to slcli
+    :returns: the command's exit code
+    :raises DaemonError: if the daemon didn't run the command
+    """
+    environ = dict(os.environ)
+    # The daemon can't see this terminal's size, rich reads it from here instead
+    if 'COLUMNS' not in environ and os.isatty(1):
+        size = os.get_terminal_size(1)
+        environ['COLUMNS'], environ['LINES'] = str(size.columns), str(size.lines)
+    # The only way to read the umask is to set it
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    with connect(path) as sock:
+        send_message(sock, {'command': 'run', 'version': consts.VERSION, 'args': list(args), 'env': environ,
+                            'cwd': os.getcwd(), 'umask': umask}, fds=_std_fds())
+        while True:
+            try:
+                answer, _ = recv_message(sock)
+                break
+            except KeyboardInterrupt:
+                send_message(sock, {'command': 'interrupt'})
+            except DaemonError:
+                answer = None
+                break
+
+    if answer is None:
+        # The command might have done something already, so it can't be run again
+        print("The slcli daemon stopped while running the command", file=sys.stderr)
+        return 1
+    if 'error' in answer:
+        raise DaemonError(answer['error'])
+    return answer['exit_code']
+
+
+def _std_fds():
+    """stdin, stdout and stderr file descriptors, /dev/null for any of them that is closed."""
+    fds = []
+    for fd in (0, 1, 2):
+        try:
+            os.fstat(fd)
+        except OSError:
+            fd = os.open(os.devnull, os.O_RDWR)
+        fds.append(fd)
+    return fds
+
+
+def main():
+    """slclid, runs an slcli command in the daemon, or right here if the daemon isn't running."""
+    # `slcli daemon stop` can't be run by the daemon it stops
+    if 'daemon' not in sys.argv[1:]:
+        try:
+            sys.exit(run(sys.argv[1:]))
+        except DaemonNotRunning:
+            pass
+        except DaemonError as ex:
+            print("%s, running the command without the daemon." % ex, file=sys.stderr)
+
+    from SoftLayer.CLI import core  # pylint: disable=import-outside-toplevel
+    core.main()
@@ -0,0 +1,95 @@
+"""
+    SoftLayer.daemon.core
+    ~~~~~~~~~~~~~~~~~~~~~
+    Commands to start, stop and check on the slcli daemon
+
+    :license: MIT, see LICENSE for more details.
+"""
+import datetime
+import os
+
+import click
+
+from SoftLayer.CLI.command import SLCommand as SLCommand
+from SoftLayer.CLI import environment
+from SoftLayer.CLI import exceptions
+from SoftLayer.CLI import formatting
+from SoftLayer.daemon import client
+from SoftLayer.daemon import server
+
+
+@click.group()
+def cli():
+    """Keeps slcli running in the background, so commands run with slclid start faster.
+
+    Commands run with slclid instead of slcli are sent to the daemon, which has everything imported and its
+    API connections open already. slclid works like slcli when the daemon isn't running.
+    """
+
+
+@cli.command(cls=SLCommand)
+@click.option('--socket', 'path', help="Unix socket to listen on [default: $SLCLI_SOCKET, or slcli-<uid>.sock "
+                                       "in $XDG_RUNTIME_DIR or the temp directory]")
+@click.option('--idle-timeout', type=click.INT, default=3600, show_default=True,
+              help="Stop after this many seconds without a command, 0 to never stop")
+@click.option('--foreground', is_flag=True, default=False, help="Don't go into the background")
+@environment.pass_env
+def start(env, path, idle_timeout, foreground):
+    """Start the slcli daemon."""
+    daemon = server.DaemonServer(path, idle_timeout)
+    try:
+        daemon.bind()
+    except client.DaemonError as ex:
+        raise exceptions.CLIAbort(str(ex))
+    daemon.warm_up()
+
+    if foreground:
+        env.fout("slcli daemon listening on %s" % daemon.path)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if server.daemonize():
+        try:
+            daemon.serve_forever()
+        finally:
+            os._exit(0)  # pylint: disable=protected-access
+    # The background process has its own copy of the socket
+    daemon.sock.close()
+    env.fout("slcli daemon listening on %s" % daemon.path)
+
+
+@cli.command(cls=SLCommand)
+@click.option('--socket', 'path', help="Unix socket the daemon listens on")
+@environment.pass_env
+def stop(env, path):
+    """Stop the slcli daemon."""
+    try:
+        client.request({'command': 'stop'}, path)
+    except client.DaemonError as ex:
+        raise exceptions.CLIAbort(str(ex))
+    env.fout("slcli daemon stopped")
+
+
+@cli.command(cls=SLCommand)
+@click.option('--socket', 'path', help="Unix socket the daemon listens on")
+@environment.pass_env
+def status(env, path):
+    """Show whether the slcli daemon is running."""
+    try:
+        answer = client.request({'command': 'ping'}, path)
+    except client.DaemonError as ex:
+        raise exceptions.CLIAbort(str(ex))
+
+    table = formatting.KeyValueTable(['name', 'value'])
+    table.align['name'] = 'r'
+    table.align['value'] = 'l'
+    table.add_row(['PID', answer.get('pid')])
+    table.add_row(['Version', answer.get('version')])
+    table.add_row(['Socket', answer.get('path')])
+    table.add_row(['Uptime', str(datetime.timedelta(seconds=int(answer.get('uptime', 0))))])
+    table.add_row(['Commands Run', answer.get('commands_run')])
+    table.add_row(['Idle Timeout', answer.get('idle_timeout')])
+    env.fout(table)
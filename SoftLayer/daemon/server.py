@@ -0,0 +1,308 @@
+"""
+    SoftLayer.daemon.server
+    ~~~~~~~~~~~~~~~~~~~~~~~
+    Background server that runs slcli commands sent by slclid, so they don't each pay for starting python,
+    importing slcli and connecting to the API
+
+    :license: MIT, see LICENSE for more details.
+"""
+import io
+import logging
+import os
+import signal
+import socket
+import stat
+import sys
+import threading
+import time
+
+from SoftLayer import consts
+from SoftLayer.daemon import client
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DaemonServer(object):  # pylint: disable=too-many-instance-attributes
+    """Runs the slcli commands slclid sends it, one at a time, in this process.
+
+    Commands get the stdin, stdout and stderr of the slclid that sent them (the file descriptors are passed
+    over the socket), along with its arguments, environment variables, working directory and umask, and run
+    through SoftLayer.CLI.core.main like they would in slcli. What stays around between commands is what is
+    slow to set up: imported modules, and API connections, since sessions are shared per endpoint.
+
+    :param string path: Unix socket to listen on, see client.socket_path()
+    :param int idle_timeout: stop after this many seconds without a command, 0 to never stop
+    """
+
+    def __init__(self, path=None, idle_timeout=3600):
+        self.path = path or client.socket_path()
+        self.idle_timeout = idle_timeout
+        self.sock = None
+        self.running = False
+        self.started = None
+        self.commands_run = 0
+        self._lock = threading.Lock()
+        self._in_command = False
+        self._interrupting = False
+        self._interruptible = False
+
+    def bind(self):
+        """Starts listening on the socket, only this user can connect to it.
+
+        The default socket is in a directory only this user can get into, see client.socket_directory().
+
+        :raises DaemonError: if another daemon is listening there already, or something that isn't
+            this user's socket is in the way
+        """
+        if self.path == os.path.join(client.socket_directory(), 'daemon.sock'):
+            client.make_private_directory(os.path.dirname(self.path))
+        try:
+            client.request({'command': 'ping'}, self.path, timeout=1)
+        except client.DaemonNotRunning:
+            pass
+        else:
+            raise client.DaemonError("An slcli daemon is already listening on %s" % self.path)
+
+        # Left over from a daemon that didn't stop cleanly, anything else is left alone
+        if os.path.lexists(self.path):
+            info = os.lstat(self.path)
+            if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+                raise client.DaemonError("%s is in the way, and isn't a socket owned by you" % self.path)
+            os.unlink(self.path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            self.sock.bind(self.path)
+        finally:
+            os.umask(umask)
+        self.sock.listen(16)
+
+    def warm_up(self):
+        """Imports every command, so the first run of each one is as fast as the next."""
+        from SoftLayer.CLI import environment  # pylint: disable=import-outside-toplevel
+        env = environment.Environment()
+        env.load()
+        for name, loader in env.commands.items():
+            try:
+                loader.load()
+            except Exception as ex:  # pylint: disable=broad-except
+                LOGGER.warning("Could not import %s: %s", name, ex)
+
+    def serve_forever(self):
+        """Runs commands until stopped, or idle for idle_timeout seconds."""
+        if self.sock is None:
+            self.bind()
+        # Commands can only be interrupted when they run in the main thread
+        self._interruptible = threading.current_thread() is threading.main_thread()
+        if self._interruptible:
+            signal.signal(signal.SIGINT, self._on_interrupt)
+        self.started = time.time()
+        self.running = True
+        self.sock.settimeout(self.idle_timeout or None)
+        try:
+            while self.running:
+                try:
+                    conn, _ = self.sock.accept()
+                except socket.timeout:
+                    LOGGER.info("Idle for %ss, stopping", self.idle_timeout)
+                    break
+                with conn:
+                    try:
+                        client.check_peer(conn)
+                    except client.DaemonError as ex:
+                        LOGGER.warning("Refused a connection: %s", ex)
+                        continue
+                    conn.settimeout(None)
+                    self.handle(conn)
+        finally:
+            self.close()
+
+    def close(self):
+        """Stops listening and removes the socket."""
+        self.running = False
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def handle(self, conn):
+        """Answers one message from a client."""
+        message, fds = client.recv_message(conn, max_fds=3)
+        try:
+            if message is None:
+                return
+            command = message.get('command')
+            if command == 'ping':
+                answer = self.status()
+            elif command == 'stop':
+                self.running = False
+                answer = {'stopping': True}
+            elif command != 'run':
+                answer = {'error': "Unknown daemon command %r" % command}
+            elif message.get('version') != consts.VERSION:
+                answer = {'error': "The slcli daemon is running %s, not %s. Restart it with "
+                                   "'slcli daemon stop; slcli daemon start'" % (consts.VERSION, message.get('version'))}
+            elif len(fds) != 3:
+                answer = {'error': "Commands need stdin, stdout and stderr"}
+            else:
+                # run_command() closes them
+                command_fds, fds = fds, []
+                answer = {'exit_code': self.run_command(conn, message, command_fds)}
+            client.send_message(conn, answer)
+        except OSError as ex:
+            LOGGER.warning("Lost the connection to a client: %s", ex)
+        except Exception:  # pylint: disable=broad-except
+            # A broken message shouldn't stop the daemon
+            LOGGER.exception("Could not answer %r", message)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def status(self):
+        """What ping answers with."""
+        return {'pid': os.getpid(), 'version': consts.VERSION, 'path': self.path,
+                'uptime': time.time() - self.started if self.started else 0,
+                'commands_run': self.commands_run, 'idle_timeout': self.idle_timeout}
+
+    def run_command(self, conn, message, fds):
+        """Runs an slcli command with a client's stdin, stdout, stderr and environment, returns its exit code.
+
+        This process' stdin, stdout, stderr, environment, working directory, umask and logging handlers
+        are swapped for the command's, and put back after.
+        """
+        streams = _open_streams(fds)
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr, sys.argv)
+        saved_environ = dict(os.environ)
+        saved_cwd = os.getcwd()
+        saved_umask = os.umask(message.get('umask', 0o022))
+        root_logger = logging.getLogger()
+        saved_logging = (list(root_logger.handlers), root_logger.level)
+
+        watcher = threading.Thread(target=self._watch, args=(conn,), daemon=True)
+        exit_code = 130
+        try:
+            os.environ.clear()
+            os.environ.update(message.get('env', {}))
+            os.chdir(message.get('cwd') or saved_cwd)
+            sys.stdin, sys.stdout, sys.stderr = streams  # pylint: disable=unbalanced-tuple-unpacking
+            sys.argv = ['slcli'] + message['args']
+            with self._lock:
+                self._in_command = True
+            if self._interruptible:
+                watcher.start()
+            try:
+                exit_code = self._main(message['args'])
+            finally:
+                self._end_command()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for stream in streams:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+            sys.stdin, sys.stdout, sys.stderr, sys.argv = saved_streams
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            os.chdir(saved_cwd)
+            os.umask(saved_umask)
+            root_logger.handlers[:] = saved_logging[0]
+            root_logger.setLevel(saved_logging[1])
+            self.commands_run += 1
+        return exit_code
+
+    @staticmethod
+    def _main(args):
+        """Runs slcli, returns the exit code."""
+        from SoftLayer.CLI import core  # pylint: disable=import-outside-toplevel
+        from SoftLayer.CLI import environment  # pylint: disable=import-outside-toplevel
+
+        # For the execution_time -v shows
+        core.START_TIME = time.time()
+        try:
+            core.main(args=args, obj=environment.Environment(), prog_name='slcli')
+        except SystemExit as ex:
+            if ex.code is None or isinstance(ex.code, int):
+                return ex.code or 0
+            # Like python does with sys.exit("message")
+            print(ex.code, file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            return 130
+        return 0
+
+    def _watch(self, conn):
+        """Interrupts the command if the client presses Ctrl-C or goes away."""
+        try:
+            while True:
+                message, _ = client.recv_message(conn)
+                if message is None or message.get('command') == 'interrupt':
+                    with self._lock:
+                        if self._in_command and not self._interrupting:
+                            self._interrupting = True
+                            # A real signal, so it interrupts a command blocked reading stdin too
+                            signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+                if message is None:
+                    return
+        except (OSError, ValueError, client.DaemonError):
+            return
+
+    def _on_interrupt(self, signum, frame):  # pylint: disable=unused-argument
+        """SIGINT handler, the same as python's but it notes that an interrupt from _watch() arrived."""
+        self._interrupting = False
+        raise KeyboardInterrupt
+
+    def _end_command(self):
+        """Marks the command as finished, so clients can't interrupt anymore.
+
+        An interrupt that was sent just before can still be on its way, it is waited for here so it doesn't
+        hit anything after this.
+        """
+        while self._in_command:
+            try:
+                with self._lock:
+                    self._in_command = False
+            except KeyboardInterrupt:
+                pass
+        while self._interrupting:
+            try:
+                time.sleep(0.01)
+            except KeyboardInterrupt:
+                pass
+
+
+def _open_streams(fds):
+    """Text files for the stdin, stdout and stderr file descriptors a client sent, like python's own."""
+    modes = [('r', 'surrogateescape', -1),
+             ('w', 'strict', 1 if os.isatty(fds[1]) else -1),
+             ('w', 'backslashreplace', 1)]
+    streams = []
+    try:
+        for fd, (mode, errors, buffering) in zip(fds, modes):
+            # pylint: disable-next=consider-using-with
+            streams.append(io.open(fd, mode, buffering=buffering, encoding='utf-8', errors=errors))
+    except Exception:
+        for stream in streams:
+            stream.close()
+        for fd in fds[len(streams):]:
+            os.close(fd)
+        raise
+    return streams
+
+
+def daemonize():
+    """Forks into the background, detached from the terminal. Returns True in the background process."""
+    if os.fork() > 0:
+        return False
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)  # pylint: disable=protected-access
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
+    return True
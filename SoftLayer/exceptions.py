@@ -38,6 +38,9 @@ class SoftLayerAPIError(SoftLayerError):
     Provides faultCode and faultString properties.
     """
 
+    #: Seconds the API asked us to wait before trying again (the Retry-After header), if it did.
+    retry_after = None
+
     def __init__(self, fault_code, fault_string, *args):
         SoftLayerError.__init__(self, fault_string, *args)
         self.faultCode = fault_code
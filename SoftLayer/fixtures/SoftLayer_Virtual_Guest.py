@@ -716,6 +716,14 @@
 setUserMetadata = ['meta']
 reloadOperatingSystem = 'OK'
 setTags = True
+powerOn = True
+powerOff = True
+powerOffSoft = True
+pause = True
+resume = True
+rebootSoft = True
+rebootDefault = True
+rebootHard = True
 createArchiveTemplate = {
     'createDate': '2018-12-10T17:29:18-06:00',
     'elapsedSeconds': 0,
@@ -7,31 +7,89 @@
 
     :license: MIT, see LICENSE for more details.
 """
-from SoftLayer.managers.account import AccountManager
-from SoftLayer.managers.bandwidth import BandwidthManager
-from SoftLayer.managers.block import BlockStorageManager
-from SoftLayer.managers.dedicated_host import DedicatedHostManager
-from SoftLayer.managers.dns import DNSManager
-from SoftLayer.managers.event_log import EventLogManager
-from SoftLayer.managers.file import FileStorageManager
-from SoftLayer.managers.firewall import FirewallManager
-from SoftLayer.managers.hardware import HardwareManager
-from SoftLayer.managers.image import ImageManager
-from SoftLayer.managers.license import LicensesManager
-from SoftLayer.managers.load_balancer import LoadBalancerManager
-from SoftLayer.managers.metadata import MetadataManager
-from SoftLayer.managers.network import NetworkManager
-from SoftLayer.managers.object_storage import ObjectStorageManager
-from SoftLayer.managers.ordering import OrderingManager
-from SoftLayer.managers.search import SearchManager
-from SoftLayer.managers.sshkey import SshKeyManager
-from SoftLayer.managers.ssl import SSLManager
-from SoftLayer.managers.tags import TagManager
-from SoftLayer.managers.ticket import TicketManager
-from SoftLayer.managers.user import UserManager
-from SoftLayer.managers.vs import VSManager
-from SoftLayer.managers.vs_capacity import CapacityManager
-from SoftLayer.managers.vs_placement import PlacementManager
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    # For linters and IDEs, these aren't imported at runtime
+    from SoftLayer.managers.account import AccountManager
+    from SoftLayer.managers.bandwidth import BandwidthManager
+    from SoftLayer.managers.block import BlockStorageManager
+    from SoftLayer.managers.dedicated_host import DedicatedHostManager
+    from SoftLayer.managers.dns import DNSManager
+    from SoftLayer.managers.event_log import EventLogManager
+    from SoftLayer.managers.file import FileStorageManager
+    from SoftLayer.managers.firewall import FirewallManager
+    from SoftLayer.managers.hardware import HardwareManager
+    from SoftLayer.managers.image import ImageManager
+    from SoftLayer.managers.inventory import InventoryManager
+    from SoftLayer.managers.license import LicensesManager
+    from SoftLayer.managers.load_balancer import LoadBalancerManager
+    from SoftLayer.managers.metadata import MetadataManager
+    from SoftLayer.managers.network import NetworkManager
+    from SoftLayer.managers.object_storage import ObjectStorageManager
+    from SoftLayer.managers.ordering import OrderingManager
+    from SoftLayer.managers.search import SearchManager
+    from SoftLayer.managers.sshkey import SshKeyManager
+    from SoftLayer.managers.ssl import SSLManager
+    from SoftLayer.managers.tags import TagManager
+    from SoftLayer.managers.ticket import TicketManager
+    from SoftLayer.managers.user import UserManager
+    from SoftLayer.managers.vs import VSManager
+    from SoftLayer.managers.vs_capacity import CapacityManager
+    from SoftLayer.managers.vs_placement import PlacementManager
+
+# Managers are only imported when they are first used, name -> module.
+_MANAGERS = {
+    'AccountManager': 'account',
+    'BandwidthManager': 'bandwidth',
+    'BlockStorageManager': 'block',
+    'DedicatedHostManager': 'dedicated_host',
+    'DNSManager': 'dns',
+    'EventLogManager': 'event_log',
+    'FileStorageManager': 'file',
+    'FirewallManager': 'firewall',
+    'HardwareManager': 'hardware',
+    'ImageManager': 'image',
+    'InventoryManager': 'inventory',
+    'LicensesManager': 'license',
+    'LoadBalancerManager': 'load_balancer',
+    'MetadataManager': 'metadata',
+    'NetworkManager': 'network',
+    'ObjectStorageManager': 'object_storage',
+    'OrderingManager': 'ordering',
+    'SearchManager': 'search',
+    'SshKeyManager': 'sshkey',
+    'SSLManager': 'ssl',
+    'TagManager': 'tags',
+    'TicketManager': 'ticket',
+    'UserManager': 'user',
+    'VSManager': 'vs',
+    'CapacityManager': 'vs_capacity',
+    'PlacementManager': 'vs_placement',
+}
+
+
+def __getattr__(name):
+    """Imports a manager, or a manager module (managers.storage...), the first time it is used."""
+    if name.startswith('__'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _MANAGERS:
+        value = getattr(importlib.import_module(f"{__name__}.{_MANAGERS[name]}"), name)
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as ex:
+            if ex.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MANAGERS))
+
 
 __all__ = [
     'AccountManager',
@@ -45,6 +103,7 @@
     'FirewallManager',
     'HardwareManager',
     'ImageManager',
+    'InventoryManager',
     'LicensesManager',
     'LoadBalancerManager',
     'MetadataManager',
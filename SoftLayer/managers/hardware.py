@@ -122,7 +122,7 @@ def cancel_hardware(self, hardware_id, reason='unneeded', comment='', immediate=
     @retry(logger=LOGGER)
     def list_hardware(self, tags=None, cpus=None, memory=None, hostname=None,
                       domain=None, datacenter=None, nic_speed=None, owner=None,
-                      public_ip=None, private_ip=None, **kwargs):
+                      public_ip=None, private_ip=None, iterator=False, **kwargs):
         """List all hardware (servers and bare metal computing instances).
 
         :param list tags: filter based on tags
@@ -134,6 +134,7 @@ def list_hardware(self, tags=None, cpus=None, memory=None, hostname=None,
         :param integer nic_speed: filter based on network speed (in MBPS)
         :param string public_ip: filter based on public ip address
         :param string private_ip: filter based on private ip address
+        :param bool iterator: return a generator that fetches a page at a time, instead of a list
         :param dict \\*\\*kwargs: response-level options (mask, limit, etc.)
         :returns: Returns a list of dictionaries representing the matching
                   hardware. This list will contain both dedicated servers and
@@ -205,6 +206,9 @@ def list_hardware(self, tags=None, cpus=None, memory=None, hostname=None,
                 utils.query_filter(owner))
 
         kwargs['filter'] = _filter.to_dict()
+        if iterator:
+            # A generator, so callers can use each page as soon as it is fetched
+            return self.client.iter_call('Account', 'getHardware', **kwargs)
         kwargs['iter'] = True
         return self.client.call('Account', 'getHardware', **kwargs)
 
@@ -450,6 +454,27 @@ def place_order(self, **kwargs):
         return self.ordering_manager.place_order(**create_options)
         # return self.client['Product_Order'].placeOrder(create_options)
 
+    def place_orders(self, orders, test=False, max_workers=10, rate=5):
+        """Orders many servers at once, each one like place_order().
+
+        Servers that only differ in their hostname and domain share an order, which is made and verified once.
+        Then each server is ordered on its own, several at once. A server that fails doesn't stop the others.
+        See ordering.bulk_order for how it goes.
+
+        :param list orders: a dict of place_order() arguments for each server
+        :param bool test: only verify the orders
+        :param int max_workers: how many API calls to make at once
+        :param float rate: most orders to place each second, 0 or None for no limit
+        :returns list: a dict for each server, in the same order: hostname, domain, status ('verified', 'ordered'
+            or 'failed'), order_id, ids, seconds, error and the receipt
+        """
+        return ordering.bulk_order(self.client, orders, self._order_template, 'hardware', test=test,
+                                   max_workers=max_workers, rate=rate)
+
+    def _order_template(self, order):
+        """The Product_Order container for place_order() arguments."""
+        return self.ordering_manager.generate_order(**self._generate_create_dict(**order))
+
     def verify_order(self, **kwargs):
         """Verifies an order for a piece of hardware.
 
@@ -510,19 +535,21 @@ def get_create_options(self, datacenter=None):
                     'key': region['location']['location']['name'],
                 })
         # Sizes
+        catalog = ordering.Catalog(package['items'], package.get('keyName'))
         sizes = []
         for preset in package['activePresets'] + package['accountRestrictedActivePresets']:
             sizes.append({
                 'name': preset['description'],
                 'key': preset['keyName'],
-                'hourlyRecurringFee': _get_preset_cost(preset, package['items'], 'hourly', location_group_id),
-                'recurringFee': _get_preset_cost(preset, package['items'], 'monthly', location_group_id)
+                'hourlyRecurringFee': _get_preset_cost(preset, catalog, 'hourly', location_group_id),
+                'recurringFee': _get_preset_cost(preset, catalog, 'monthly', location_group_id)
             })
 
         operating_systems = []
         port_speeds = []
         extras = []
         for item in package['items']:
+            prices = catalog.get_item_prices(item, location_group_id)
             category = item['itemCategory']['categoryCode']
             # Operating systems
             if category == 'os':
@@ -530,7 +557,7 @@ def get_create_options(self, datacenter=None):
                     'name': item['softwareDescription']['longDescription'],
                     'key': item['keyName'],
                     'referenceCode': item['softwareDescription']['referenceCode'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
             # Port speeds
             elif category == 'port_speed':
@@ -538,14 +565,14 @@ def get_create_options(self, datacenter=None):
                     'name': item['description'],
                     'speed': item['capacity'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
             # Extras
             elif category in EXTRA_CATEGORIES:
                 extras.append({
                     'name': item['description'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
 
         return {
@@ -658,6 +685,20 @@ def _generate_create_dict(self,
         }
         return order
 
+    def resolve_ids_many(self, identifiers):
+        """Resolves many ids, hostnames and IP addresses with a few API calls, instead of a few for each one.
+
+        :param list identifiers: ids, hostnames or IP addresses
+        :returns dict: {identifier: list of matching ids}, the list is empty when nothing matched
+        """
+        return utils.resolve_ids_many(identifiers, self._list_by_field)
+
+    def _list_by_field(self, field, values, mask=None):
+        """Servers with `field` set to any of `values`. The mask defaults to their id and that field."""
+        _filter = {'hardware': {field: {'operation': 'in', 'options': [{'name': 'data', 'value': list(values)}]}}}
+        return self.client.call('Account', 'getHardware', mask=mask or "mask[id,%s]" % field, filter=_filter,
+                                iter=True)
+
     def _get_ids_from_hostname(self, hostname):
         """Returns list of matching hardware IDs for a given hostname."""
         results = self.list_hardware(hostname=hostname, mask="id")
@@ -680,6 +721,14 @@ def _get_ids_from_ip(self, ip):  # pylint: disable=inconsistent-return-statement
         if results:
             return [result['id'] for result in results]
 
+    @retry(logger=LOGGER)
+    def set_tags(self, tags, hardware_id):
+        """Sets tags on a hardware server with a retry decorator
+
+        Just calls hardware.setTags, but if it fails from an APIError will retry
+        """
+        self.hardware.setTags(tags, id=hardware_id)
+
     def edit(self, hardware_id, userdata=None, hostname=None, domain=None,
              notes=None, tags=None):
         """Edit hostname, domain name, notes, user data of the hardware.
@@ -802,6 +851,31 @@ def wait_for_ready(self, instance_id, limit=14400, delay=10, pending=False):
         LOGGER.info("Waiting for %d expired.", instance_id)
         return False
 
+    def wait_for_ready_many(self, instance_ids, limit=14400, delay=10, pending=False, max_delay=60):
+        """Waits for many servers at once, yielding each one as soon as it is ready.
+
+        Rather than polling each instance, every check is one account call for all the instances
+        still waiting. Checks get further apart while nothing changes, see utils.wait_for_ready_many().
+
+        :param list instance_ids: The instance IDs to wait for
+        :param int limit: The maximum amount of seconds to wait.
+        :param int delay: The number of seconds to sleep between the first checks. Defaults to 10.
+        :param bool pending: Wait for pending transactions not related to
+                             provisioning or reloads such as monitoring.
+        :param int max_delay: The most seconds to sleep between checks. Defaults to 60.
+        :returns: generator of instances as they become ready. Instances that weren't ready in time are left out.
+
+        Example::
+
+            waiting = {12345, 12346, 12347}
+            for instance in mgr.wait_for_ready_many(waiting, limit=1800):
+                waiting.discard(instance['id'])
+            # waiting now has the ones that weren't ready in 30 minutes
+        """
+        mask = "mask[id, hostname, lastOperatingSystemReload[id], activeTransaction, provisionDate]"
+        return utils.wait_for_ready_many(instance_ids, lambda ids: self._list_by_field('id', ids, mask=mask),
+                                         limit, delay, pending, max_delay)
+
     def get_tracking_id(self, instance_id):
         """Returns the Metric Tracking Object Id for a hardware server
 
@@ -1254,12 +1328,29 @@ def create_credential(self, template):
         """Create a password for a software component"""
         return self.client.call('SoftLayer_Software_Component_Password', 'createObject', template)
 
+    def add_notifications(self, hardware_id, user_ids):
+        """Create a user hardware notification entry for each user, all at once.
+
+        :returns: the new notification, or the SoftLayerAPIError creating it raised, for each user.
+        """
+        with self.client.batch() as batch:
+            for user_id in user_ids:
+                template = {"hardwareId": hardware_id, "userId": user_id}
+                batch.call('SoftLayer_User_Customer_Notification_Hardware', 'createObject', template)
+        return batch.results()
+
     def remove_notification(self, identifier):
         """Remove a user hardware notification entry"""
 
         template = [{'id': identifier}]
         return self.client.call('SoftLayer_User_Customer_Notification_Hardware', 'deleteObjects', template)
 
+    def remove_notifications(self, identifiers):
+        """Remove many user hardware notification entries with a single call"""
+
+        template = [{'id': identifier} for identifier in identifiers]
+        return self.client.call('SoftLayer_User_Customer_Notification_Hardware', 'deleteObjects', template)
+
 
 def _get_bandwidth_key(items, hourly=True, no_public=False, location=None):
     """Picks a valid Bandwidth Item, returns the KeyName"""
@@ -1361,7 +1452,7 @@ def _get_preset_cost(preset, items, type_cost, location_group_id=None):
     """Get the preset cost.
 
     :param preset list: SoftLayer_Product_Package_Preset[]
-    :param items list: SoftLayer_Product_Item[]
+    :param items list: SoftLayer_Product_Item[], or an ordering.Catalog of them
     :param type_cost string: 'hourly' or 'monthly'
     :param location_group_id int: locationGroupId's to get price for.
     """
@@ -1372,6 +1463,8 @@ def _get_preset_cost(preset, items, type_cost, location_group_id=None):
     # 3. find the package item, THEN find that items prices
     # 4. from those item prices, find the one that matches your locationGroupId
 
+    if location_group_id and not isinstance(items, ordering.Catalog):
+        items = ordering.Catalog(items)
     item_cost = 0.00
     if type_cost == 'hourly':
         cost_key = 'hourlyRecurringFee'
@@ -1393,18 +1486,15 @@ def find_item_in_package(cost_key, items, location_group_id, price):
     Will return the item cost.
 
     :param string cost_key: item cost key hourlyRecurringFee or recurringFee.
-    :param list items: items list.
+    :param list items: items list, or an ordering.Catalog of them.
     :param int location_group_id: locationGroupId's to get price for.
     :param price: price data.
     """
+    if not isinstance(items, ordering.Catalog):
+        items = ordering.Catalog(items)
     item_cost = 0.00
-    for item in items:
-        # Same item as the price's item
-        if item.get('id') == price.get('itemId'):
-            # Find the items location specific price.
-            for location_price in item.get('prices', []):
-                if location_price.get('locationGroupId', 0) == location_group_id:
-                    item_cost += float(location_price.get(cost_key))
+    for location_price in items.get_group_prices({'id': price.get('itemId')}, location_group_id):
+        item_cost += float(location_price.get(cost_key))
     return item_cost
 
 
@@ -1412,24 +1502,9 @@ def get_item_price(prices, location_group_id=None):
     """Get item prices, optionally for a specific location.
 
     Will return the default pricing information if there isn't any location specific pricing.
+    With a whole package, ordering.Catalog.get_item_prices() does this without going through every price again.
 
     :param prices list: SoftLayer_Product_Item_Price[]
     :param location_group_id int: locationGroupId's to get price for.
     """
-    prices_list = []
-    location_price = []
-    for price in prices:
-        # Only look up location prices if we need to
-        if location_group_id:
-            if price['locationGroupId'] == location_group_id:
-                location_price.append(price)
-        # Always keep track of default prices
-        if not price['locationGroupId']:
-            prices_list.append(price)
-
-    # If this item has location specific pricing, return that
-    if location_price:
-        return location_price
-
-    # Otherwise reutrn the default price list.
-    return prices_list
+    return ordering.Catalog([{'prices': prices}]).get_item_prices({}, location_group_id)
@@ -0,0 +1,344 @@
+"""
+    SoftLayer.inventory
+    ~~~~~~~~~~~~~~~~~~~
+    A local snapshot of the account, kept in SQLite
+
+    :license: MIT, see LICENSE for more details.
+"""
+import datetime
+import os
+import sqlite3
+import time
+
+import click
+
+from SoftLayer.managers.network import NetworkManager
+from SoftLayer.transports.cache import get_endpoint
+from SoftLayer.transports import codec
+from SoftLayer import utils
+
+#: Where the snapshot is kept by default, next to the slcli-cache directory of --cache-ttl
+DEFAULT_PATH = os.path.join(click.get_app_dir('slcli-inventory', force_posix=True), 'inventory.db')
+
+# Bumped when the tables change, an older snapshot is thrown away
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    kind TEXT NOT NULL, id INTEGER NOT NULL, name TEXT, datacenter TEXT, data TEXT NOT NULL,
+    PRIMARY KEY (kind, id));
+CREATE TABLE IF NOT EXISTS lookups (kind TEXT NOT NULL, id INTEGER NOT NULL, field TEXT NOT NULL, value TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS lookups_value ON lookups (field, value);
+CREATE INDEX IF NOT EXISTS lookups_resource ON lookups (kind, id);
+CREATE TABLE IF NOT EXISTS refreshes (
+    kind TEXT PRIMARY KEY, refreshed REAL NOT NULL, full_refreshed REAL NOT NULL, high_water TEXT);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_SERVER_MASK = """mask[id, hostname, domain, fullyQualifiedDomainName, primaryIpAddress, primaryBackendIpAddress,
+datacenter[name], tagReferences[tag[name]], networkVlans[id, vlanNumber, networkSpace], %s]"""
+
+#: What the snapshot holds. Each kind is an SoftLayer_Account list method, and the date property used to only
+#: get what changed since the last refresh. Kinds whose date doesn't change when the data in the snapshot does
+#: (a provisionDate or createDate, or the counts of a VLAN) aren't incremental, every refresh gets everything.
+KINDS = {
+    'virtual': {
+        'method': 'getVirtualGuests',
+        'property': 'virtualGuests',
+        'mask': _SERVER_MASK % "maxCpu, maxMemory, status[keyName], powerState[keyName], createDate, modifyDate",
+        'date': 'modifyDate',
+    },
+    'hardware': {
+        'method': 'getHardware',
+        'property': 'hardware',
+        'mask': _SERVER_MASK % "processorPhysicalCoreAmount, memoryCapacity, hardwareStatus[status], provisionDate",
+        'date': 'provisionDate',
+        'incremental': False,
+    },
+    'vlan': {
+        'method': 'getNetworkVlans',
+        'property': 'networkVlans',
+        'mask': """mask[id, vlanNumber, name, fullyQualifiedName, networkSpace, primaryRouter[hostname,
+            datacenter[name]], hardwareCount, virtualGuestCount, subnetCount, totalPrimaryIpAddressCount,
+            tagReferences[tag[name]], modifyDate]""",
+        'date': 'modifyDate',
+        # Adding a server to a VLAN changes its counts, not its modifyDate
+        'incremental': False,
+    },
+    'subnet': {
+        'method': 'getSubnets',
+        'property': 'subnets',
+        'mask': """mask[id, networkIdentifier, cidr, subnetType, version, ipAddressCount, networkVlanId,
+            datacenter[name], tagReferences[tag[name]], modifyDate]""",
+        'date': 'modifyDate',
+    },
+    'storage': {
+        'method': 'getNetworkStorage',
+        'property': 'networkStorage',
+        'mask': """mask[id, username, nasType, capacityGb, storageType[keyName], serviceResourceBackendIpAddress,
+            serviceResource[datacenter[name]], notes, createDate]""",
+        'date': 'createDate',
+        'incremental': False,
+    },
+    'billing': {
+        'method': 'getAllTopLevelBillingItems',
+        'property': 'allTopLevelBillingItems',
+        'mask': """mask[id, description, hostName, domainName, categoryCode, createDate, modifyDate, notes,
+            nextInvoiceTotalRecurringAmount, hourlyFlag, location[name],
+            orderItem[id, order[id, userRecord[id, email, displayName, userStatus]]]]""",
+        'date': 'modifyDate',
+        # Cancelled items leave the snapshot
+        'filter': {'cancellationDate': {'operation': 'is null'}},
+    },
+}
+
+#: Fields that can be searched with find()
+LOOKUPS = ['hostname', 'ip', 'datacenter', 'tag', 'vlan']
+
+
+class InventoryManager(object):
+    """Keeps the account's servers, VLANs, subnets, storage volumes and billing items in a local SQLite file.
+
+    The first refresh of each kind gets everything. Later refreshes of the incremental kinds only get what was
+    modified since (with a date object filter), and the ids of everything, to drop what was deleted. The other
+    kinds, and every kind every `full_refresh_age` seconds, get everything again. Lookups by hostname, IP address,
+    datacenter, tag and VLAN are answered from indexes, without any API calls.
+
+    The snapshot belongs to one user of one endpoint, it is thrown away when another one refreshes it. It holds
+    billing items and user emails, so only its owner can read the file.
+
+    :param SoftLayer.API.BaseClient client: the client instance
+    :param string path: the SQLite file, DEFAULT_PATH by default. ':memory:' keeps it in memory
+    :param int full_refresh_age: seconds between full refreshes
+    """
+
+    def __init__(self, client, path=None, full_refresh_age=86400):
+        self.client = client
+        self.path = path or DEFAULT_PATH
+        self.full_refresh_age = full_refresh_age
+        self._db = None
+
+    @property
+    def db(self):
+        """The SQLite connection, the tables are made the first time."""
+        if self._db is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+                # SQLite gives its journal files the same permissions
+                os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600))
+                os.chmod(self.path, 0o600)
+            self._db = sqlite3.connect(self.path)
+            if self._db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                for table in ('resources', 'lookups', 'refreshes', 'meta'):
+                    self._db.execute('DROP TABLE IF EXISTS %s' % table)
+                self._db.execute('PRAGMA user_version = %d' % SCHEMA_VERSION)
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def close(self):
+        """Closes the SQLite file."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def refresh(self, kinds=None, full=False):
+        """Brings the snapshot up to date with the account.
+
+        :param list kinds: names from KINDS, all of them by default
+        :param bool full: get everything, instead of only what changed
+        :returns: a dict for each kind with full, updated, removed and total
+        """
+        self._check_user()
+        return {kind: self._refresh_kind(kind, full) for kind in kinds or KINDS}
+
+    def ensure_fresh(self, max_age, kinds=None):
+        """Refreshes the kinds that were last refreshed more than max_age seconds ago, or never.
+
+        :returns: the refresh() result of the kinds that were refreshed
+        """
+        stale = [kind for kind in kinds or KINDS if self.get_age(kind) is None or self.get_age(kind) > max_age]
+        if not stale:
+            return {}
+        return self.refresh(stale)
+
+    def get_age(self, kind):
+        """Seconds since a kind was refreshed, None if it never was."""
+        row = self.db.execute('SELECT refreshed FROM refreshes WHERE kind = ?', (kind,)).fetchone()
+        return None if row is None else max(0, time.time() - row[0])
+
+    def get_status(self):
+        """A dict for each kind with count, refreshed and full_refreshed (timestamps, None if never)."""
+        counts = dict(self.db.execute('SELECT kind, COUNT(*) FROM resources GROUP BY kind'))
+        refreshes = {row[0]: row[1:] for row in self.db.execute(
+            'SELECT kind, refreshed, full_refreshed FROM refreshes')}
+        return {kind: {'count': counts.get(kind, 0),
+                       'refreshed': refreshes.get(kind, (None, None))[0],
+                       'full_refreshed': refreshes.get(kind, (None, None))[1]} for kind in KINDS}
+
+    def get(self, kind, identifier):
+        """An item from the snapshot by its id, None if it isn't there."""
+        row = self.db.execute('SELECT data FROM resources WHERE kind = ? AND id = ?',
+                              (kind, int(identifier))).fetchone()
+        return None if row is None else codec.loads(row[0])
+
+    def find(self, kind=None, **lookups):
+        """Items in the snapshot that match every lookup, by kind then id.
+
+        Example::
+
+            # Virtual servers in dal13 tagged web
+            inventory.find('virtual', datacenter='dal13', tag='web')
+
+        :param string kind: only items of this kind, a name from KINDS
+        :param \\*\\*lookups: any of hostname (or fully qualified domain name), ip, datacenter, tag and vlan (id).
+            Matches are exact, without regard to case.
+        """
+        sql = 'SELECT data FROM resources r WHERE 1 = 1'
+        params = []
+        if kind:
+            sql += ' AND r.kind = ?'
+            params.append(kind)
+        for field, value in lookups.items():
+            if field not in LOOKUPS:
+                raise ValueError("Unknown lookup %s, use one of %s" % (field, ', '.join(LOOKUPS)))
+            if value is None:
+                continue
+            sql += (' AND EXISTS (SELECT 1 FROM lookups l WHERE l.kind = r.kind AND l.id = r.id'
+                    ' AND l.field = ? AND l.value = ?)')
+            params.extend([field, str(value).lower()])
+        sql += ' ORDER BY r.kind, r.id'
+        return [codec.loads(row[0]) for row in self.db.execute(sql, params)]
+
+    def summary_by_datacenter(self):
+        """NetworkManager.summary_by_datacenter(), from the VLANs in the snapshot."""
+        return NetworkManager(self.client).summary_by_datacenter(vlans=self.find('vlan'))
+
+    def clear(self):
+        """Empties the snapshot, the next refresh gets everything."""
+        with self.db:
+            for table in ('resources', 'lookups', 'refreshes', 'meta'):
+                self.db.execute('DELETE FROM %s' % table)
+
+    def _check_user(self):
+        """Throws the snapshot away if it was made by a different user, or for a different endpoint."""
+        endpoint = get_endpoint(self.client.transport)
+        if endpoint is None and getattr(self.client, 'settings', None) is not None:
+            endpoint = self.client.settings['softlayer'].get('endpoint_url')
+        user = '%s@%s' % (getattr(self.client.auth, 'username', None) or '', endpoint or '')
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'user'").fetchone()
+        if row is not None and row[0] == user:
+            return
+        self.clear()
+        with self.db:
+            self.db.execute("INSERT INTO meta (key, value) VALUES ('user', ?)", (user,))
+
+    def _refresh_kind(self, kind, full):
+        """Refreshes one kind, everything if it is due a full refresh."""
+        spec = KINDS[kind]
+        state = self.db.execute('SELECT full_refreshed, high_water FROM refreshes WHERE kind = ?',
+                                (kind,)).fetchone()
+        now = time.time()
+        full = (full or not spec.get('incremental', True) or state is None or not state[1]
+                or now - state[0] > self.full_refresh_age)
+        known = {row[0] for row in self.db.execute('SELECT id FROM resources WHERE kind = ?', (kind,))}
+
+        if full:
+            items = self._fetch(spec)
+            ids = {int(item['id']) for item in items}
+        else:
+            ids = {int(item['id']) for item in self._fetch(spec, mask='mask[id]')}
+            date_filter = {spec['date']: {'operation': 'greaterThanDate',
+                                          'options': [{'name': 'date', 'value': [state[1]]}]}}
+            items = self._fetch(spec, object_filter=date_filter)
+            # New items without a date newer than the last refresh
+            missing = sorted(ids - known - {int(item['id']) for item in items})
+            for start in range(0, len(missing), 100):
+                id_filter = {'id': {'operation': 'in',
+                                    'options': [{'name': 'data', 'value': missing[start:start + 100]}]}}
+                items.extend(self._fetch(spec, object_filter=id_filter))
+
+        removed = known - ids
+        high_water = _latest([item.get(spec['date']) for item in items] + [None if full or not state else state[1]])
+        with self.db:
+            for resource_id in removed:
+                self._delete(kind, resource_id)
+            for item in items:
+                self._delete(kind, int(item['id']))
+                self._insert(kind, item)
+            self.db.execute('INSERT OR REPLACE INTO refreshes (kind, refreshed, full_refreshed, high_water) '
+                            'VALUES (?, ?, ?, ?)', (kind, now, now if full else state[0], high_water))
+        total = self.db.execute('SELECT COUNT(*) FROM resources WHERE kind = ?', (kind,)).fetchone()[0]
+        return {'full': full, 'updated': len(items), 'removed': len(removed), 'total': total}
+
+    def _fetch(self, spec, mask=None, object_filter=None):
+        """Every item of a kind that matches a filter."""
+        _filter = utils.dict_merge(spec.get('filter', {}), object_filter or {})
+        return list(self.client.call('Account', spec['method'], mask=mask or spec['mask'],
+                                     filter={spec['property']: _filter}, iter=True))
+
+    def _delete(self, kind, resource_id):
+        """Removes an item and its lookups."""
+        self.db.execute('DELETE FROM resources WHERE kind = ? AND id = ?', (kind, resource_id))
+        self.db.execute('DELETE FROM lookups WHERE kind = ? AND id = ?', (kind, resource_id))
+
+    def _insert(self, kind, item):
+        """Adds an item and its lookups."""
+        values = _lookup_values(kind, item)
+        self.db.execute('INSERT INTO resources (kind, id, name, datacenter, data) VALUES (?, ?, ?, ?, ?)',
+                        (kind, int(item['id']), get_name(item), get_datacenter(item), codec.dumps(item)))
+        self.db.executemany('INSERT INTO lookups (kind, id, field, value) VALUES (?, ?, ?, ?)',
+                            [(kind, int(item['id']), field, str(value).lower())
+                             for field, field_values in values.items() for value in field_values])
+
+
+def get_name(item):
+    """What an item from the snapshot is called."""
+    for key in ('fullyQualifiedDomainName', 'fullyQualifiedName', 'username', 'networkIdentifier', 'description'):
+        if item.get(key):
+            return item[key]
+    return item.get('name')
+
+
+def get_datacenter(item):
+    """The datacenter name of an item from the snapshot."""
+    return (utils.lookup(item, 'datacenter', 'name') or utils.lookup(item, 'primaryRouter', 'datacenter', 'name')
+            or utils.lookup(item, 'serviceResource', 'datacenter', 'name') or utils.lookup(item, 'location', 'name'))
+
+
+def _lookup_values(kind, item):
+    """The values of every lookup for an item, {field: [values]}."""
+    values = {field: [] for field in LOOKUPS}
+    for key in ('hostname', 'fullyQualifiedDomainName', 'hostName'):
+        if item.get(key):
+            values['hostname'].append(item[key])
+    for key in ('primaryIpAddress', 'primaryBackendIpAddress', 'networkIdentifier',
+                'serviceResourceBackendIpAddress'):
+        if item.get(key):
+            values['ip'].append(item[key])
+
+    if get_datacenter(item):
+        values['datacenter'].append(get_datacenter(item))
+
+    for reference in item.get('tagReferences') or []:
+        if utils.lookup(reference, 'tag', 'name'):
+            values['tag'].append(reference['tag']['name'])
+
+    if kind == 'vlan':
+        values['vlan'].append(item['id'])
+    elif item.get('networkVlanId'):
+        values['vlan'].append(item['networkVlanId'])
+    for vlan in item.get('networkVlans') or []:
+        values['vlan'].append(vlan['id'])
+    return {field: list(dict.fromkeys(field_values)) for field, field_values in values.items()}
+
+
+def _latest(dates):
+    """The latest of some API dates, as it was given. None if there aren't any."""
+    def parsed(date):
+        try:
+            return datetime.datetime.fromisoformat(date).astimezone(datetime.timezone.utc)
+        except (TypeError, ValueError):
+            return None
+
+    dates = [date for date in dates if parsed(date) is not None]
+    return max(dates, key=parsed) if dates else None
@@ -101,6 +101,16 @@ def add_securitygroup_rule(self, group_id, remote_ip=None,
                              (icmp type if the protocol is icmp)
         :param str protocol: The protocol to enforce (icmp, udp, tcp)
         """
+        rule = self.securitygroup_rule(remote_ip, remote_group, direction, ethertype, port_max, port_min, protocol)
+        return self.add_securitygroup_rules(group_id, [rule])
+
+    @staticmethod
+    def securitygroup_rule(remote_ip=None, remote_group=None, direction=None, ethertype=None,
+                           port_max=None, port_min=None, protocol=None):
+        """Builds a security group rule, see add_securitygroup_rule for the parameters
+
+        :returns: the rule dictionary for addRules
+        """
         rule = {'direction': direction}
         if ethertype is not None:
             rule['ethertype'] = ethertype
@@ -114,7 +124,7 @@ def add_securitygroup_rule(self, group_id, remote_ip=None,
             rule['remoteIp'] = remote_ip
         if remote_group is not None:
             rule['remoteGroupId'] = remote_group
-        return self.add_securitygroup_rules(group_id, [rule])
+        return rule
 
     def add_securitygroup_rules(self, group_id, rules):
         """Add rules to a security group
@@ -126,6 +136,20 @@ def add_securitygroup_rules(self, group_id, rules):
             raise TypeError("The rules provided must be a list of dictionaries")
         return self.security_group.addRules(rules, id=group_id)
 
+    def add_securitygroup_rules_many(self, group_ids, rules):
+        """Add the same rules to many security groups, all at once
+
+        :param list group_ids: The IDs of the security groups to add the rules to
+        :param list rules: The list of rule dictionaries to add
+        :returns: the result of each addRules call, or the SoftLayerAPIError it raised, in the order of group_ids
+        """
+        if not isinstance(rules, list):
+            raise TypeError("The rules provided must be a list of dictionaries")
+        with self.client.batch() as batch:
+            for group_id in group_ids:
+                batch['Network_SecurityGroup'].addRules(rules, id=group_id)
+        return batch.results()
+
     def add_subnet(self, subnet_type, quantity=None, endpoint_id=None, version=4,
                    test_order=False):
         """Orders a new subnet
@@ -623,13 +647,15 @@ def resolve_vlan_ids(self, identifier):
         """Resolve VLAN ids."""
         return utils.resolve_ids(identifier, [self._list_vlans_by_name])
 
-    def summary_by_datacenter(self):
+    def summary_by_datacenter(self, vlans=None):
         """Summary of the networks on the account, grouped by data center.
 
         The resultant dictionary is primarily useful for statistical purposes.
         It contains count information rather than raw data. If you want raw
         information, see the :func:`list_vlans` method instead.
 
+        :param list vlans: VLANs to count, like the ones in an InventoryManager.
+                           Defaults to :func:`list_vlans`.
         :returns: A dictionary keyed by data center with the data containing a
                   set of counts for subnets, hardware, virtual servers, and
                   other objects residing within that data center.
@@ -643,7 +669,7 @@ def summary_by_datacenter(self):
             'vlan_count': 0,
         })
 
-        for vlan in self.list_vlans():
+        for vlan in self.list_vlans() if vlans is None else vlans:
             name = utils.lookup(vlan, 'primaryRouter', 'datacenter', 'name')
 
             datacenters[name]['vlan_count'] += 1
@@ -5,13 +5,20 @@
 
     :license: MIT, see LICENSE for more details.
 """
-
+import collections
+import concurrent.futures as cf
+import copy
+import json
 from re import match
+import time
 
 from SoftLayer import exceptions
+from SoftLayer.transports.ratelimit import TokenBucket
 
 from SoftLayer import utils
 
+# pylint: disable=too-many-lines
+
 CATEGORY_MASK = '''id, isRequired, itemCategory[id, name, categoryCode]'''
 
 ITEM_MASK = '''id, keyName, description, itemCategory, categories, prices'''
@@ -20,6 +27,179 @@
 
 PRESET_MASK = '''id, name, keyName, description, prices[id, hourlyRecurringFee, recurringFee], locations'''
 
+PRESET_PRICE_MASK = '''id, keyName, description, prices[id, itemId, hourlyRecurringFee, recurringFee]'''
+
+REGION_PRICE_MASK = '''keyname, location[location[id, name, longName, priceGroups]]'''
+
+
+def _term_length(price):
+    """A price's termLength, None when the price is for any term."""
+    term = price.get('termLength', 0)
+    return None if term in ('', None) else term
+
+
+def _restriction(price):
+    """A price's capacity restriction as (type, minimum, maximum), None if it doesn't have one."""
+    if not price.get('capacityRestrictionType'):
+        return None
+    return (price['capacityRestrictionType'], str(price.get('capacityRestrictionMinimum')),
+            str(price.get('capacityRestrictionMaximum')))
+
+
+def _item_key(item):
+    """What the price indexes key an item by, its id. keyName stands in for items without one."""
+    return item.get('id', item.get('keyName'))
+
+
+class Catalog(object):  # pylint: disable=too-many-instance-attributes
+    """The items and prices of a package, indexed so that looking up an item or price doesn't scan the catalog.
+
+    Where two items share a keyName or referenceCode, the first one in the catalog is used.
+
+    :param list items: SoftLayer_Product_Item, with their prices[categories] and softwareDescription
+    :param str package_keyname: the package the items are from, used in error messages
+    """
+
+    def __init__(self, items, package_keyname=None):
+        self.items = items
+        self.package_keyname = package_keyname
+        self.by_key = {}
+        self.by_reference_code = {}
+        # keyName or referenceCode -> item
+        self.by_name = {}
+        self.by_category = collections.defaultdict(list)
+        self.by_id = {}
+        # (item id, locationGroupId, termLength) -> [(position in the item's prices, price)]
+        self.prices = collections.defaultdict(list)
+        # (item id, price categoryCode) -> id of the first price without a location group
+        self.category_prices = {}
+        # price id -> price
+        self.by_price_id = {}
+        # (item id, locationGroupId, termLength, capacity restriction) -> price
+        self.by_restriction = {}
+        # (item id, locationGroupId) -> prices, for any term
+        self.group_prices = collections.defaultdict(list)
+        # (item id, core, term) -> price id, from get_price_id
+        self._price_ids = {}
+
+        indexed = set()
+        for item in items:
+            reference_code = utils.lookup(item, 'softwareDescription', 'referenceCode')
+            self.by_key.setdefault(item.get('keyName'), item)
+            self.by_name.setdefault(item.get('keyName'), item)
+            if reference_code:
+                self.by_reference_code.setdefault(reference_code, item)
+                self.by_name.setdefault(reference_code, item)
+            self.by_category[utils.lookup(item, 'itemCategory', 'categoryCode')].append(item)
+            for price in item.get('prices') or []:
+                self.by_price_id.setdefault(price.get('id'), price)
+            item_key = _item_key(item)
+            if item_key in indexed:
+                continue
+            indexed.add(item_key)
+            self.by_id.setdefault(item.get('id'), item)
+            for position, price in enumerate(item.get('prices') or []):
+                location_group = price.get('locationGroupId') or None
+                term = _term_length(price)
+                self.prices[(item_key, location_group, term)].append((position, price))
+                self.group_prices[(item_key, location_group)].append(price)
+                self.by_restriction.setdefault((item_key, location_group, term, _restriction(price)), price)
+                if location_group is None and price.get('categories'):
+                    key = (item_key, price['categories'][0].get('categoryCode'))
+                    self.category_prices.setdefault(key, price['id'])
+
+    def get_item(self, keyname):
+        """Gets the item with a keyName or softwareDescription.referenceCode of keyname.
+
+        :param str keyname: the item's keyName or referenceCode
+        """
+        item = self.by_name.get(keyname)
+        if item is None:
+            raise exceptions.SoftLayerError(f"Item {keyname} does not exist for package {self.package_keyname}")
+        return item
+
+    def get_prices(self, item, location_group=None, term=0):
+        """Prices of an item for a location group and term, in the order the item lists them.
+
+        Prices with an empty termLength are for any term, and are included.
+
+        :param dict item: an item of this catalog
+        :param location_group: a locationGroupId, None for the prices that can be used in any location
+        :param int term: the termLength to match
+        """
+        prices = list(self.prices.get((_item_key(item), location_group, None), []))
+        if term not in ('', None):
+            prices.extend(self.prices.get((_item_key(item), location_group, term), []))
+        return [price for _, price in sorted(prices, key=lambda entry: entry[0])]
+
+    def get_group_prices(self, item, location_group=None):
+        """Prices of an item for one location group and any term, in the order the item lists them.
+
+        :param dict item: an item of this catalog
+        :param location_group: a locationGroupId, None for the prices that can be used in any location
+        """
+        return self.group_prices.get((_item_key(item), location_group or None), [])
+
+    def get_item_prices(self, item, location_group=None):
+        """Prices of an item in a location group, the prices for any location if it has none there.
+
+        :param dict item: an item of this catalog
+        :param location_group: a locationGroupId, None for the prices that can be used in any location
+        """
+        return list(self.get_group_prices(item, location_group) or self.get_group_prices(item))
+
+    def get_price_id(self, item, core=None, term=0):
+        """The id of an item's price without a location group, see OrderingManager.get_item_price_id.
+
+        :param dict item: an item of this catalog
+        :param core: None or a number to match against capacityRestrictionType
+        :param int term: the termLength to match
+        """
+        key = (_item_key(item), core, term)
+        if key not in self._price_ids:
+            self._price_ids[key] = OrderingManager.get_item_price_id(core, self.get_prices(item, term=term), term)
+        return self._price_ids[key]
+
+    def get_category_price_id(self, item, category_code):
+        """The id of an item's first price without a location group for the category_code category."""
+        try:
+            return self.category_prices[(_item_key(item), category_code)]
+        except KeyError as ex:
+            raise exceptions.SoftLayerError(
+                f"Item {item.get('keyName')} has no {category_code} price in package {self.package_keyname}") from ex
+
+    def get_location_price(self, price, item_id, location_group_ids):
+        """The price an item has instead of price in a datacenter, price itself if there isn't one.
+
+        Location prices have the same term and capacity restriction as the price they replace.
+
+        :param dict price: a price without a location group
+        :param item_id: the id of the price's item
+        :param list location_group_ids: ids of the datacenter's price groups
+        """
+        restriction = _restriction(price)
+        for location_group_id in location_group_ids:
+            for term in (_term_length(price), None):
+                location_price = self.by_restriction.get((item_id, location_group_id, term, restriction))
+                if location_price is not None:
+                    return location_price
+        return price
+
+    def get_item_capacity(self, item_keynames):
+        """The capacity of the last core, tier or processor item in item_keynames, None if there isn't one."""
+        item_capacity = None
+        for item_keyname in item_keynames:
+            item = self.by_key.get(item_keyname)
+            if item is None:
+                continue
+            if "CORE" in item_keyname or "TIER" in item_keyname:
+                item_capacity = item['capacity']
+            elif "INTEL" in item_keyname:
+                item_split = item['description'].split("(")
+                item_core = item_split[1].split(" ")
+                item_capacity = item_core[0]
+        return item_capacity
+
 
 # pylint: disable=R0904
 class OrderingManager(object):
@@ -36,6 +216,8 @@ def __init__(self, client):
         self.package_preset = client['Product_Package_Preset']
         self.package_mask = 'id, description, capacity, itemCategory, keyName, prices[categories], ' \
             'softwareDescription[id,referenceCode,longDescription]'
+        # package keyname -> Catalog
+        self.catalogs = {}
 
     def get_packages_of_type(self, package_types, mask=None):
         """Get packages that match a certain type.
@@ -364,6 +546,83 @@ def get_price_id_list(self, package_keyname, item_keynames, core=None):
         prices = self.get_ordering_prices(package_keyname, item_keynames, core)
         return [price.get('id') for price in prices]
 
+    def get_catalog(self, package_keyname, refresh=False):
+        """Gets the items of a package as a Catalog, only downloading them the first time.
+
+        :param str package_keyname: The package to get the catalog of
+        :param bool refresh: Download the items again, even if the package's catalog was already loaded
+        :returns: A Catalog of the package's items
+        """
+        if refresh or package_keyname not in self.catalogs:
+            items = self.list_items(package_keyname, mask=self.package_mask)
+            self.catalogs[package_keyname] = Catalog(items, package_keyname)
+        return self.catalogs[package_keyname]
+
+    def get_price_matrix(self, package_keyname, presets=None, item_sets=None, datacenters=None):
+        """Prices presets and sets of items in each datacenter a package can be ordered in.
+
+        The package's items, its presets and the price groups of its datacenters are each downloaded once,
+        however many datacenters there are. An item costs its location group price in a datacenter that has one,
+        and its standard price everywhere else.
+
+        :param str package_keyname: The package to price
+        :param list presets: Keynames of the presets to price. All of the package's presets when neither
+                             presets nor item_sets are given.
+        :param dict item_sets: Lists of item keynames to price together, by the name to show for them
+        :param list datacenters: Short names of the datacenters to price in, like dal13. All of the package's
+                                 datacenters by default.
+        :returns: A list of dicts with name, datacenter, hourly and monthly, for each configuration in each
+                  datacenter. hourly is None when an item doesn't have an hourly price.
+        """
+        catalog = self.get_catalog(package_keyname)
+
+        # configuration name -> [(standard price, item id)]
+        configurations = {}
+        if presets or not item_sets:
+            wanted = set(presets or [])
+            for preset in self.list_presets(package_keyname, mask=PRESET_PRICE_MASK):
+                if not wanted or preset['keyName'] in wanted:
+                    configurations[preset['keyName']] = [(catalog.by_price_id.get(price['id'], price),
+                                                          price.get('itemId')) for price in preset['prices']]
+            missing = wanted - set(configurations)
+            if missing:
+                raise exceptions.SoftLayerError(
+                    f"Preset {', '.join(sorted(missing))} does not exist in package {package_keyname}")
+        for name, item_keynames in (item_sets or {}).items():
+            configurations[name] = []
+            for ordering_price in self.get_ordering_prices(package_keyname, item_keynames):
+                item = catalog.get_item(ordering_price['item']['keyName'])
+                price = catalog.by_price_id.get(ordering_price['id'])
+                if price is None:
+                    raise exceptions.SoftLayerError(
+                        f"Item {item['keyName']} has no standard price in package {package_keyname}")
+                configurations[name].append((price, _item_key(item)))
+
+        package = self.get_package_by_key(package_keyname, mask='id')
+        locations = {}
+        for region in self.package_svc.getRegions(id=package['id'], mask=REGION_PRICE_MASK):
+            location = utils.lookup(region, 'location', 'location') or {}
+            if location.get('name'):
+                locations[location['name']] = [group['id'] for group in location.get('priceGroups', [])]
+        for datacenter in datacenters or []:
+            if datacenter not in locations:
+                raise exceptions.SoftLayerError(f"Package {package_keyname} can not be ordered in {datacenter}")
+
+        matrix = []
+        for name, prices in configurations.items():
+            for datacenter in datacenters or sorted(locations):
+                hourly, monthly = 0.0, 0.0
+                for price, item_id in prices:
+                    price = catalog.get_location_price(price, item_id, locations[datacenter])
+                    if hourly is not None and price.get('hourlyRecurringFee') not in ('', None):
+                        hourly += float(price['hourlyRecurringFee'])
+                    else:
+                        hourly = None
+                    monthly += float(price.get('recurringFee') or 0)
+                matrix.append({'name': name, 'datacenter': datacenter,
+                               'hourly': None if hourly is None else round(hourly, 6), 'monthly': round(monthly, 6)})
+        return matrix
+
     def get_ordering_prices(self, package_keyname: str, item_keynames: list, core=None) -> list:
         """Converts a list of item keynames to a list of price IDs.
 
@@ -377,28 +636,15 @@ def get_ordering_prices(self, package_keyname: str, item_keynames: list, core=No
         :returns: A list of price IDs associated with the given item keynames in the given package
 
         """
-        mask = 'id, description, capacity, itemCategory, keyName, prices[categories], ' \
-            'softwareDescription[id,referenceCode,longDescription]'
-        items = self.list_items(package_keyname, mask=mask)
-        item_capacity = self.get_item_capacity(items, item_keynames)
+        catalog = self.get_catalog(package_keyname)
+        item_capacity = catalog.get_item_capacity(item_keynames)
 
         prices = []
         # start at -1 so we can increment before we use it. 0 is a valid value here
         category_dict = {"gpu0": -1, "pcie_slot0": -1, "disk_controller": -1}
 
         for item_keyname in item_keynames:
-            matching_item = []
-            # Need to find the item in the package that has a matching
-            # keyName with the current item we are searching for
-            for i in items:
-                reference_code = utils.lookup(i, 'softwareDescription', 'referenceCode')
-                if i['keyName'] == item_keyname or reference_code == item_keyname:
-                    matching_item.append(i)
-
-            if len(matching_item) == 0:
-                message = f"Item {item_keyname} does not exist for package {package_keyname}"
-                raise exceptions.SoftLayerError(message)
-            matching_item = matching_item[0]
+            matching_item = catalog.get_item(item_keyname)
 
             # we want to get the price ID that has no location attached to it,
             # because that is the most generic price. verifyOrder/placeOrder
@@ -406,19 +652,13 @@ def get_ordering_prices(self, package_keyname: str, item_keynames: list, core=No
             # in which the order is made
             item_category = matching_item['itemCategory']['categoryCode']
             if item_category not in category_dict:
-                if core is None:
-                    price_id = self.get_item_price_id(item_capacity, matching_item['prices'])
-                else:
-                    price_id = self.get_item_price_id(core, matching_item['prices'])
+                price_id = catalog.get_price_id(matching_item, item_capacity if core is None else core)
             else:
                 # GPU and PCIe items has two generic prices and they are added to the list
                 # according to the number of items in the order.
                 category_dict[item_category] += 1
                 item_category = self.get_special_category(category_dict[item_category], item_category)
-
-                price_id = [p['id'] for p in matching_item['prices']
-                            if not p['locationGroupId']
-                            and p['categories'][0]['categoryCode'] == item_category][0]
+                price_id = catalog.get_category_price_id(matching_item, item_category)
 
             prices.append({
                 "id": price_id,
@@ -472,23 +712,14 @@ def get_item_price_id(core, prices, term=0):
         return price_id
 
     def get_item_capacity(self, items, item_keynames):
-        """Get item capacity."""
-        item_capacity = None
-        for item_keyname in item_keynames:
-            for item in items:
-                if item['keyName'] == item_keyname:
-                    if "CORE" in item["keyName"]:
-                        item_capacity = item['capacity']
-                        break
-                    if "TIER" in item["keyName"]:
-                        item_capacity = item['capacity']
-                        break
-                    if "INTEL" in item["keyName"]:
-                        item_split = item['description'].split("(")
-                        item_core = item_split[1].split(" ")
-                        item_capacity = item_core[0]
-                        break
-        return item_capacity
+        """Get item capacity.
+
+        :param items: a list of items, or the Catalog of a package
+        :param list item_keynames: keynames of the items being ordered
+        """
+        if not isinstance(items, Catalog):
+            items = Catalog(items)
+        return items.get_item_capacity(item_keynames)
 
     def get_preset_prices(self, preset):
         """Get preset item prices.
@@ -785,3 +1016,103 @@ def get_all_cancelation(self, limit=50):
                'serviceProviderResourceId],status[name,id],user[id,firstName,lastName]]'
         return self.client.call('SoftLayer_Billing_Item_Cancellation_Request', 'getAllCancellationRequests',
                                 mask=mask, limit=limit)
+
+
+def bulk_order(client, configs, build, key, test=False, tag_service=None, max_workers=10, rate=5):
+    """Verifies, then places, an order for each of many server configurations.
+
+    Configurations that only differ in their hostname, domain and tags share one order template, which is
+    built and checked with verifyOrder once, at the same time as the other groups'. As soon as a group verifies,
+    each of its configurations is ordered with its own placeOrder call, several at once and at most `rate`
+    each second. Verifications and placements have their own workers, so placements waiting for the rate
+    don't hold up the groups still to verify. Then the ordered servers get their tags, all in one batch.
+    A failure only fails the configurations it belongs to, the others still go ahead.
+
+    :param client: the SoftLayer client
+    :param list configs: options for `build`, each with a hostname and domain, and tags if tag_service is given
+    :param build: function(config) that returns the order template for a configuration
+    :param string key: where orders and receipts keep their servers, virtualGuests or hardware
+    :param bool test: only verify the orders, nothing is placed
+    :param string tag_service: service to call setTags on for the ordered servers, None to leave tags to `build`
+    :param int max_workers: how many verifyOrder calls, and how many placeOrder calls, to make at once
+    :param float rate: most orders to place each second, 0 or None for no limit
+    :returns list: a dict for each configuration, in the same order: hostname, domain, status ('verified',
+        'ordered' or 'failed'), order_id, ids of the ordered servers, seconds, error and the receipt
+    """
+    configs = [dict(config) for config in configs]
+    tags = [config.pop('tags', None) if tag_service else None for config in configs]
+    results = [{'hostname': config.get('hostname'), 'domain': config.get('domain'), 'status': None,
+                'order_id': None, 'ids': [], 'seconds': None, 'error': None, 'receipt': None} for config in configs]
+    if not configs:
+        return results
+
+    groups = collections.defaultdict(list)
+    for position, config in enumerate(configs):
+        shared = {name: value for name, value in config.items() if name not in ('hostname', 'domain')}
+        groups[json.dumps(shared, sort_keys=True, default=str)].append(position)
+    bucket = TokenBucket(rate or None)
+
+    def verify(config):
+        """Builds and verifies the order template for one group."""
+        started = time.monotonic()
+        template = build(dict(config))
+        verified = client.call('Product_Order', 'verifyOrder', template)
+        return template, verified, round(time.monotonic() - started, 3)
+
+    def place(position, template):
+        """Places the order for one configuration, once the rate allows."""
+        order = copy.deepcopy(template)
+        _order_servers(order, key)[0].update(hostname=configs[position].get('hostname'),
+                                             domain=configs[position].get('domain'))
+        wait = bucket.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        started = time.monotonic()
+        receipt = client.call('Product_Order', 'placeOrder', order)
+        return receipt, round(time.monotonic() - started, 3)
+
+    verifier = cf.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups))))
+    placer = cf.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(configs))))
+    with verifier, placer:
+        verifying = {verifier.submit(verify, configs[positions[0]]): positions for positions in groups.values()}
+        placing = {}
+        for future in cf.as_completed(verifying):
+            positions = verifying[future]
+            try:
+                template, verified, seconds = future.result()
+            except Exception as ex:  # pylint: disable=broad-except
+                for position in positions:
+                    results[position].update(status='failed', error=str(ex))
+                continue
+            for position in positions:
+                if test:
+                    results[position].update(status='verified', seconds=seconds, receipt=verified)
+                else:
+                    placing[placer.submit(place, position, template)] = position
+
+        for future in cf.as_completed(placing):
+            result = results[placing[future]]
+            try:
+                receipt, seconds = future.result()
+            except Exception as ex:  # pylint: disable=broad-except
+                result.update(status='failed', error=str(ex))
+                continue
+            servers = utils.lookup(receipt, 'orderDetails', key) or []
+            result.update(status='ordered', order_id=receipt.get('orderId'), seconds=seconds, receipt=receipt,
+                          ids=[server['id'] for server in servers if server.get('id')])
+
+    to_tag = [(position, server_id) for position, result in enumerate(results) if tags[position]
+              for server_id in result['ids']]
+    if to_tag:
+        with client.batch(max_workers=max_workers) as batch:
+            for position, server_id in to_tag:
+                batch[tag_service].setTags(tags[position], id=server_id)
+        for (position, server_id), tagged in zip(to_tag, batch.results()):
+            if isinstance(tagged, Exception):
+                results[position]['error'] = "Unable to tag %s: %s" % (server_id, tagged)
+    return results
+
+
+def _order_servers(order, key):
+    """The servers (hostname and domain) in an order, which can be a single order or a container of them."""
+    return order.get('orderContainers', [order])[0][key]
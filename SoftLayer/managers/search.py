@@ -5,6 +5,12 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import concurrent.futures as cf
+import queue
+import threading
+
+# Put on the results queue by a query when it has no more results
+_DONE = object()
 
 
 class SearchManager(object):
@@ -25,9 +31,77 @@ def search(self, search_string):
         """allows for searching for SoftLayer resources by simple phrase."""
         return self.search_manager.search(search_string)
 
-    def advanced(self, search_string):
-        """Uses the SoftLayer_Search::advancedSearch API. Allows for more complicated search phrases."""
-        return self.search_manager.advancedSearch(search_string)
+    def advanced(self, search_string, mask=None, limit=100):
+        """Uses the SoftLayer_Search::advancedSearch API. Allows for more complicated search phrases.
+
+        Every page of results is fetched, `limit` results at a time.
+        """
+        return list(self.client.iter_call('SoftLayer_Search', 'advancedSearch', search_string, mask=mask,
+                                          limit=limit))
+
+    def advanced_many(self, search_strings, mask=None, limit=100, max_workers=5):
+        """Runs many advancedSearch queries at once, and yields their results as they arrive.
+
+        Each query is paginated on its own thread. A resource found by more than one query is only yielded
+        the first time, resources are the same if they have the same resourceType and id. If you stop
+        iterating early, the queries still running stop after their current page.
+
+        :param list search_strings: advancedSearch queries
+        :param string mask: mask for the results, like "mask[resource(SoftLayer_Hardware)[id,hostname]]"
+        :param int limit: results in each page
+        :param int max_workers: how many queries run at once
+        :returns: a generator of (search_string, result) tuples, result is a SoftLayer_Container_Search_Result
+        """
+        search_strings = list(dict.fromkeys(search_strings))
+        if not search_strings:
+            return
+        results = queue.Queue(maxsize=limit * max_workers)
+        stop = threading.Event()
+
+        def put(item):
+            """Waits for room on the queue, gives up if the caller stopped iterating."""
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(search_string):
+            """Puts every result of a query on the queue."""
+            try:
+                for result in self.client.iter_call('SoftLayer_Search', 'advancedSearch', search_string,
+                                                    mask=mask, limit=limit):
+                    if not put((search_string, result)):
+                        return
+            except Exception as ex:  # pylint: disable=broad-except
+                put((search_string, ex))
+            put((search_string, _DONE))
+
+        executor = cf.ThreadPoolExecutor(max_workers=min(max_workers, len(search_strings)))
+        seen = set()
+        running = len(search_strings)
+        try:
+            for search_string in search_strings:
+                executor.submit(run, search_string)
+            while running:
+                search_string, result = results.get()
+                if result is _DONE:
+                    running -= 1
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                resource = result.get('resource') or {}
+                if resource.get('id') is not None:
+                    key = (result.get('resourceType'), resource['id'])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield search_string, result
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def search_instances(self, search_string, mask=None, **kwargs):
         """Lists VSIs based in the search_string.
@@ -49,12 +123,7 @@ def search_instances(self, search_string, mask=None, **kwargs):
         if kwargs.get('tags'):
             tags = " ".join(f"tagReferences.tag.name: \"{t}\"" for t in kwargs.get("tags", []))
             search_string = f"{search_string} {tags}"
-        result = self.search_manager.advancedSearch(search_string, mask=mask)
-        guests = []
-        for resource in result:
-            guests.append(resource.get('resource'))
-
-        return guests
+        return [result.get('resource') for result in self.advanced(search_string, mask=mask)]
 
     def search_hadrware_instances(self, search_string, mask=None, **kwargs):
         """Lists hardwares based in the search_string.
@@ -82,9 +151,4 @@ def search_hadrware_instances(self, search_string, mask=None, **kwargs):
         if kwargs.get('tags'):
             tags = " ".join(kwargs.get("tags", []))
             search_string = f"{search_string} internalTagReferences.tag.name: {tags}"
-        result = self.search_manager.advancedSearch(search_string, mask=mask)
-        servers = []
-        for resource in result:
-            servers.append(resource.get('resource'))
-
-        return servers
+        return [result.get('resource') for result in self.advanced(search_string, mask=mask)]
@@ -24,6 +24,8 @@ class StorageManager(utils.IdentifierMixin, object):
     def __init__(self, client):
         self.configuration = {}
         self.client = client
+        # category code -> storage_utils.StoragePackageIndex, see storage_utils.get_package_index
+        self.package_cache = {}
         self.resolvers = [self._get_ids_from_username]
 
     def _get_ids_from_username(self, username):  # pylint: disable=unused-argument
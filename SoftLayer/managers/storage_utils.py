@@ -5,6 +5,9 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import bisect
+import collections
+
 from SoftLayer import exceptions
 from SoftLayer import utils
 
@@ -65,11 +68,31 @@ def populate_host_templates(hardware_ids=None,
 def get_package(manager, category_code):
     """Returns a product package based on type of storage.
 
+    Packages are only downloaded once for each manager.
+
     :param manager: The storage manager which calls this function.
     :param category_code: Category code of product package.
     :return: Returns a packaged based on type of storage.
     """
+    return get_package_index(manager, category_code).package
+
+
+def get_package_index(manager, category_code):
+    """Returns the StoragePackageIndex of a product package based on type of storage.
+
+    The package is downloaded and indexed the first time, and the manager keeps the index for the next orders.
+
+    :param manager: The storage manager which calls this function.
+    :param category_code: Category code of product package.
+    :return: Returns a StoragePackageIndex of the package.
+    """
+    if category_code not in manager.package_cache:
+        manager.package_cache[category_code] = StoragePackageIndex(_get_package(manager, category_code))
+    return manager.package_cache[category_code]
 
+
+def _get_package(manager, category_code):
+    """Downloads the product package of a type of storage."""
     _filter = utils.NestedDict({})
     _filter['categories']['categoryCode'] = (
         utils.query_filter(category_code))
@@ -89,6 +112,131 @@ def get_package(manager, category_code):
     return packages[0]
 
 
+def _int(value):
+    """value as an int, None if it isn't one."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StoragePackageIndex(object):  # pylint: disable=too-many-instance-attributes
+    """The items and prices of a storage package, indexed for the find_*_price functions.
+
+    Each item's capacities and each price's categories and capacity restriction are read once, when the index
+    is built, instead of on every search through the package. Items are found by category code, capacity, keyName,
+    attribute value (the tier level) and capacity range, and prices by category code. Searches keep the order
+    of the package, so they find the same price a scan of package['items'] would.
+
+    :param dict package: a package from get_package(), with items[prices[categories],attributes]
+    """
+
+    def __init__(self, package):
+        self.package = package
+        self.items = package.get('items', [])
+        # Item lookups, to positions in items
+        self.by_category = collections.defaultdict(set)
+        self.by_capacity = collections.defaultdict(set)
+        self.by_key_name = collections.defaultdict(set)
+        self.by_attribute = collections.defaultdict(set)
+        # (capacityMinimum, capacityMaximum, position) of the items with a capacity range
+        self.ranges = []
+        # price category code -> [(position, price id, restriction type, minimum, maximum)], in package order.
+        # Only prices without a location group are indexed.
+        self.prices = collections.defaultdict(list)
+        # (position, price category code) -> the same entries, for one item
+        self.item_prices = collections.defaultdict(list)
+
+        for position, item in enumerate(self.items):
+            self.by_category[utils.lookup(item, 'itemCategory', 'categoryCode')].add(position)
+            self.by_key_name[item.get('keyName')].add(position)
+            if _int(item.get('capacity')) is not None:
+                self.by_capacity[_int(item.get('capacity'))].add(position)
+            for attribute in item.get('attributes') or []:
+                if _int(attribute.get('value')) is not None:
+                    self.by_attribute[_int(attribute.get('value'))].add(position)
+            minimum, maximum = _int(item.get('capacityMinimum')), _int(item.get('capacityMaximum'))
+            # An item without a range, or with one that doesn't parse, is never in range
+            if minimum is not None and maximum is not None:
+                self.ranges.append((minimum, maximum, position))
+
+            for price in item.get('prices') or []:
+                if price.get('locationGroupId'):
+                    continue
+                entry = (position, price['id'], price.get('capacityRestrictionType'),
+                         _int(price.get('capacityRestrictionMinimum')), _int(price.get('capacityRestrictionMaximum')))
+                for category in price.get('categories') or []:
+                    self.prices[category['categoryCode']].append(entry)
+                    self.item_prices[(position, category['categoryCode'])].append(entry)
+
+        # The interval index. The range ends cut the numbers into stops (the ends themselves) and the gaps
+        # between them, every value in a gap is in the same ranges. So the items in range of a value are
+        # found with one bisect: at_stop[i] for stops[i], in_gap[i] for the gap just below stops[i].
+        self._stops = sorted({end for minimum, maximum, _ in self.ranges for end in (minimum, maximum)})
+        self._at_stop = [frozenset(position for minimum, maximum, position in self.ranges
+                                   if minimum <= stop <= maximum) for stop in self._stops]
+        self._in_gap = [frozenset(position for minimum, maximum, position in self.ranges
+                                  if minimum <= low and high <= maximum)
+                        for low, high in zip(self._stops, self._stops[1:])]
+
+    def in_range(self, value):
+        """Positions of the items with a capacityMinimum to capacityMaximum range that holds value."""
+        if value is None or not self._stops:
+            return set()
+        index = bisect.bisect_left(self._stops, value)
+        if index < len(self._stops) and self._stops[index] == value:
+            return set(self._at_stop[index])
+        if index == 0 or index == len(self._stops):
+            return set()
+        return set(self._in_gap[index - 1])
+
+    def find_items(self, **lookups):
+        """Positions of the items that match every lookup.
+
+        :param lookups: category, capacity, key_name or attribute values, and in_range for a capacity range
+        """
+        positions = None
+        for lookup, value in lookups.items():
+            if lookup == 'in_range':
+                matches = self.in_range(value)
+            else:
+                matches = getattr(self, 'by_' + lookup).get(value, set())
+            positions = matches if positions is None else positions & matches
+        return set(range(len(self.items))) if positions is None else positions
+
+    def find_price(self, category, positions=None, restriction_type=None, restriction_value=None):
+        """The first price without a location group in the category, in package order.
+
+        :param category: The price category code
+        :param positions: Only look at these items, every item if None
+        :param restriction_type: The capacityRestrictionType the price needs
+        :param restriction_value: A value the price's capacity restriction needs to allow
+        :return: Returns {'id': price id}, or None if not found
+        """
+        if positions is None:
+            entries = self.prices.get(category, [])
+        else:
+            entries = (entry for position in sorted(positions)
+                       for entry in self.item_prices.get((position, category), []))
+
+        restricted = restriction_type is not None and restriction_value is not None
+        for _, price_id, price_restriction, minimum, maximum in entries:
+            if restricted:
+                if price_restriction != restriction_type or minimum is None or maximum is None:
+                    continue
+                if restriction_value < minimum or restriction_value > maximum:
+                    continue
+            return {'id': price_id}
+        return None
+
+
+def _as_index(package):
+    """package as a StoragePackageIndex, the find_*_price functions take either."""
+    if isinstance(package, StoragePackageIndex):
+        return package
+    return StoragePackageIndex(package)
+
+
 def get_location_id(manager, location):
     """Returns location id
 
@@ -112,10 +260,9 @@ def find_price_by_category(package, price_category):
     :param price_category: The price category code to search for
     :return: Returns the price for the given category, or an error if not found
     """
-    for item in package['items']:
-        price_id = _find_price_id(item['prices'], price_category)
-        if price_id:
-            return price_id
+    price_id = _as_index(package).find_price(price_category)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price with the category, %s" % price_category)
 
@@ -138,12 +285,10 @@ def find_ent_space_price(package, category, size, tier_level):
 
     level = ENDURANCE_TIERS.get(tier_level)
 
-    for item in package['items']:
-        if int(item['capacity']) != size:
-            continue
-        price_id = _find_price_id(item['prices'], category_code, 'STORAGE_TIER_LEVEL', level)
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    price_id = index.find_price(category_code, index.find_items(capacity=size), 'STORAGE_TIER_LEVEL', level)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for %s storage space" % category)
 
@@ -155,16 +300,10 @@ def find_ent_endurance_tier_price(package, tier_level):
     :param tier_level: The endurance tier for which a price is desired
     :return: Returns the price for the given tier, or an error if not found
     """
-    for item in package['items']:
-        for attribute in item.get('attributes', []):
-            if int(attribute['value']) == ENDURANCE_TIERS.get(tier_level):
-                break
-        else:
-            continue
-
-        price_id = _find_price_id(item['prices'], 'storage_tier_level')
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    price_id = index.find_price('storage_tier_level', index.find_items(attribute=ENDURANCE_TIERS.get(tier_level)))
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for endurance tier level")
 
@@ -199,13 +338,10 @@ def find_perf_space_price(package, size):
     :param size: The storage space size for which a price is desired
     :return: Returns the price for the given size, or an error if not found
     """
-    for item in package['items']:
-        if int(item['capacity']) != size:
-            continue
-
-        price_id = _find_price_id(item['prices'], 'performance_storage_space')
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    price_id = index.find_price('performance_storage_space', index.find_items(capacity=size))
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find performance space price for this volume")
 
@@ -218,13 +354,10 @@ def find_perf_iops_price(package, size, iops):
     :param iops: The number of IOPS for which a price is desired
     :return: Returns the price for the size and IOPS, or an error if not found
     """
-    for item in package['items']:
-        if int(item['capacity']) != int(iops):
-            continue
-
-        price_id = _find_price_id(item['prices'], 'performance_storage_iops', 'STORAGE_SPACE', size)
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    price_id = index.find_price('performance_storage_iops', index.find_items(capacity=int(iops)), 'STORAGE_SPACE', size)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for iops for the given volume")
 
@@ -241,21 +374,12 @@ def find_saas_endurance_space_price(package, size, tier_level):
         tier_level = int(tier_level)
     key_name = f'STORAGE_SPACE_FOR_{tier_level}_IOPS_PER_GB'
     key_name = key_name.replace(".", "_")
-    for item in package['items']:
-        if key_name not in item['keyName']:
-            continue
-
-        if 'capacityMinimum' not in item or 'capacityMaximum' not in item:
-            continue
 
-        capacity_minimum = int(item['capacityMinimum'])
-        capacity_maximum = int(item['capacityMaximum'])
-        if size < capacity_minimum or size > capacity_maximum:
-            continue
-
-        price_id = _find_price_id(item['prices'], 'performance_storage_space')
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    positions = {position for position in index.in_range(size) if key_name in index.items[position]['keyName']}
+    price_id = index.find_price('performance_storage_space', positions)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for endurance storage space")
 
@@ -267,20 +391,11 @@ def find_saas_endurance_tier_price(package, tier_level):
     :param tier_level: The endurance tier for which a price is desired
     :return: Returns the price for the given tier, or an error if not found
     """
-    target_capacity = ENDURANCE_TIERS.get(tier_level)
-    for item in package['items']:
-        if 'itemCategory' not in item\
-                or 'categoryCode' not in item['itemCategory']\
-                or item['itemCategory']['categoryCode']\
-                != 'storage_tier_level':
-            continue
-
-        if int(item['capacity']) != target_capacity:
-            continue
-
-        price_id = _find_price_id(item['prices'], 'storage_tier_level')
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    positions = index.find_items(category='storage_tier_level', capacity=ENDURANCE_TIERS.get(tier_level))
+    price_id = index.find_price('storage_tier_level', positions)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for endurance tier level")
 
@@ -292,27 +407,15 @@ def find_saas_perform_space_price(package, size):
     :param size: The volume size for which a price is desired
     :return: Returns the price for the size and tier, or an error if not found
     """
-    for item in package['items']:
-        if 'itemCategory' not in item\
-                or 'categoryCode' not in item['itemCategory']\
-                or item['itemCategory']['categoryCode']\
-                != 'performance_storage_space':
-            continue
-
-        if 'capacityMinimum' not in item or 'capacityMaximum' not in item:
-            continue
-
-        capacity_minimum = int(item['capacityMinimum'])
-        capacity_maximum = int(item['capacityMaximum'])
-        if size < capacity_minimum or size > capacity_maximum:
-            continue
-
-        key_name = f'{capacity_minimum}_{capacity_maximum}_GBS'
-        if item['keyName'] != key_name:
-            continue
-        price_id = _find_price_id(item['prices'], 'performance_storage_space')
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    positions = set()
+    for position in index.find_items(category='performance_storage_space', in_range=size):
+        item = index.items[position]
+        if item['keyName'] == f"{int(item['capacityMinimum'])}_{int(item['capacityMaximum'])}_GBS":
+            positions.add(position)
+    price_id = index.find_price('performance_storage_space', positions)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for performance storage space")
 
@@ -325,24 +428,11 @@ def find_saas_perform_iops_price(package, size, iops):
     :param iops: The number of IOPS for which a price is desired
     :return: Returns the price for the size and IOPS, or an error if not found
     """
-    for item in package['items']:
-        if 'itemCategory' not in item\
-                or 'categoryCode' not in item['itemCategory']\
-                or item['itemCategory']['categoryCode']\
-                != 'performance_storage_iops':
-            continue
-
-        if 'capacityMinimum' not in item or 'capacityMaximum' not in item:
-            continue
-
-        capacity_minimum = int(item['capacityMinimum'])
-        capacity_maximum = int(item['capacityMaximum'])
-        if iops < capacity_minimum or iops > capacity_maximum:
-            continue
-
-        price_id = _find_price_id(item['prices'], 'performance_storage_iops', 'STORAGE_SPACE', size)
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    positions = index.find_items(category='performance_storage_iops', in_range=iops)
+    price_id = index.find_price('performance_storage_iops', positions, 'STORAGE_SPACE', size)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for iops for the given volume")
 
@@ -363,13 +453,11 @@ def find_saas_snapshot_space_price(package, size, tier=None, iops=None):
         target_value = iops
         target_restriction_type = 'IOPS'
 
-    for item in package['items']:
-        if int(item['capacity']) != size:
-            continue
-
-        price_id = _find_price_id(item['prices'], 'storage_snapshot_space', target_restriction_type, target_value)
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    positions = index.find_items(capacity=size)
+    price_id = index.find_price('storage_snapshot_space', positions, target_restriction_type, target_value)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for snapshot space")
 
@@ -391,18 +479,11 @@ def find_saas_replication_price(package, tier=None, iops=None):
         target_item_keyname = 'REPLICATION_FOR_IOPSBASED_PERFORMANCE'
         target_restriction_type = 'IOPS'
 
-    for item in package['items']:
-        if item['keyName'] != target_item_keyname:
-            continue
-
-        price_id = _find_price_id(
-            item['prices'],
-            'performance_storage_replication',
-            target_restriction_type,
-            target_value
-        )
-        if price_id:
-            return price_id
+    index = _as_index(package)
+    price_id = index.find_price('performance_storage_replication', index.find_items(key_name=target_item_keyname),
+                                target_restriction_type, target_value)
+    if price_id:
+        return price_id
 
     raise ValueError("Could not find price for replicant volume")
 
@@ -449,7 +530,8 @@ def prepare_snapshot_order_object(manager, volume, capacity, tier, upgrade, iops
             "billing item category code of '%s'" % billing_item_category_code)
 
     # Use the volume's billing item category code to get the product package
-    package = get_package(manager, billing_item_category_code)
+    index = get_package_index(manager, billing_item_category_code)
+    package = index.package
 
     # Find prices based on the volume's type and billing item category
     if order_type_is_saas:  # 'storage_as_a_service' package
@@ -458,7 +540,7 @@ def prepare_snapshot_order_object(manager, volume, capacity, tier, upgrade, iops
             if tier is None:
                 tier = find_endurance_tier_iops_per_gb(volume)
             prices = [find_saas_snapshot_space_price(
-                package, capacity, tier=tier)]
+                index, capacity, tier=tier)]
         elif 'PERFORMANCE' in volume_storage_type:
             if not _staas_version_is_v2_or_above(volume):
                 raise exceptions.SoftLayerError(
@@ -466,7 +548,7 @@ def prepare_snapshot_order_object(manager, volume, capacity, tier, upgrade, iops
                     "volume since it does not support Encryption at Rest.")
 
             prices = [find_saas_snapshot_space_price(
-                package, capacity, iops=iops)]
+                index, capacity, iops=iops)]
         else:
             raise exceptions.SoftLayerError(
                 "Storage volume does not have a valid storage type "
@@ -475,7 +557,7 @@ def prepare_snapshot_order_object(manager, volume, capacity, tier, upgrade, iops
     else:  # 'storage_service_enterprise' package
         if tier is None:
             tier = find_endurance_tier_iops_per_gb(volume)
-        prices = [find_ent_space_price(package, 'snapshot', capacity, tier)]
+        prices = [find_ent_space_price(index, 'snapshot', capacity, tier)]
 
     # Currently, these types are valid for snapshot space orders, whether
     # the base volume's order container was Enterprise or AsAService
@@ -543,7 +625,8 @@ def prepare_volume_order_object(manager, storage_type, location, size,
     )
 
     # Get the product package for the given category code
-    package = get_package(manager, order_category_code)
+    index = get_package_index(manager, order_category_code)
+    package = index.package
 
     # Based on the storage type and product package, build up the complex type
     # and array of price codes to include in the order object
@@ -552,24 +635,24 @@ def prepare_volume_order_object(manager, storage_type, location, size,
         complex_type = base_type_name + 'Storage_AsAService'
         if storage_type == 'performance':
             prices = [
-                find_price_by_category(package, order_category_code),
-                find_price_by_category(package, 'storage_' + volume_type),
-                find_saas_perform_space_price(package, size),
-                find_saas_perform_iops_price(package, size, iops)
+                find_price_by_category(index, order_category_code),
+                find_price_by_category(index, 'storage_' + volume_type),
+                find_saas_perform_space_price(index, size),
+                find_saas_perform_iops_price(index, size, iops)
             ]
             if snapshot_size is not None:
                 prices.append(find_saas_snapshot_space_price(
-                    package, snapshot_size, iops=iops))
+                    index, snapshot_size, iops=iops))
         else:  # storage_type == 'endurance'
             prices = [
-                find_price_by_category(package, order_category_code),
-                find_price_by_category(package, 'storage_' + volume_type),
-                find_saas_endurance_space_price(package, size, tier),
-                find_saas_endurance_tier_price(package, tier)
+                find_price_by_category(index, order_category_code),
+                find_price_by_category(index, 'storage_' + volume_type),
+                find_saas_endurance_space_price(index, size, tier),
+                find_saas_endurance_tier_price(index, tier)
             ]
             if snapshot_size is not None:
                 prices.append(find_saas_snapshot_space_price(
-                    package, snapshot_size, tier=tier))
+                    index, snapshot_size, tier=tier))
     else:  # offering package is enterprise or performance
         if storage_type == 'performance':
             if volume_type == 'block':
@@ -577,21 +660,21 @@ def prepare_volume_order_object(manager, storage_type, location, size,
             else:
                 complex_type = base_type_name + 'PerformanceStorage_Nfs'
             prices = [
-                find_price_by_category(package, order_category_code),
-                find_perf_space_price(package, size),
-                find_perf_iops_price(package, size, iops),
+                find_price_by_category(index, order_category_code),
+                find_perf_space_price(index, size),
+                find_perf_iops_price(index, size, iops),
             ]
         else:  # storage_type == 'endurance'
             complex_type = base_type_name + 'Storage_Enterprise'
             prices = [
-                find_price_by_category(package, order_category_code),
-                find_price_by_category(package, 'storage_' + volume_type),
-                find_ent_space_price(package, 'endurance', size, tier),
-                find_ent_endurance_tier_price(package, tier),
+                find_price_by_category(index, order_category_code),
+                find_price_by_category(index, 'storage_' + volume_type),
+                find_ent_space_price(index, 'endurance', size, tier),
+                find_ent_endurance_tier_price(index, tier),
             ]
             if snapshot_size is not None:
                 prices.append(find_ent_space_price(
-                    package, 'snapshot', snapshot_size, tier))
+                    index, 'snapshot', snapshot_size, tier))
 
     # Build and return the order object
     order = {
@@ -702,7 +785,8 @@ def prepare_replicant_order_object(manager, snapshot_schedule, location,
     )
 
     # Use the volume's billing item category code to get the product package
-    package = get_package(manager, billing_item_category_code)
+    index = get_package_index(manager, billing_item_category_code)
+    package = index.package
 
     # Find prices based on the primary volume's type and billing item category
     if order_type_is_saas:  # 'storage_as_a_service' package
@@ -714,13 +798,13 @@ def prepare_replicant_order_object(manager, snapshot_schedule, location,
             if tier is None:
                 tier = find_endurance_tier_iops_per_gb(volume)
             prices = [
-                find_price_by_category(package, billing_item_category_code),
-                find_price_by_category(package, 'storage_' + volume_type),
-                find_saas_endurance_space_price(package, volume_size, tier),
-                find_saas_endurance_tier_price(package, tier),
+                find_price_by_category(index, billing_item_category_code),
+                find_price_by_category(index, 'storage_' + volume_type),
+                find_saas_endurance_space_price(index, volume_size, tier),
+                find_saas_endurance_tier_price(index, tier),
                 find_saas_snapshot_space_price(
-                    package, snapshot_size, tier=tier),
-                find_saas_replication_price(package, tier=tier)
+                    index, snapshot_size, tier=tier),
+                find_saas_replication_price(index, tier=tier)
             ]
         elif 'PERFORMANCE' in volume_storage_type:
             if not _staas_version_is_v2_or_above(volume):
@@ -730,13 +814,13 @@ def prepare_replicant_order_object(manager, snapshot_schedule, location,
             volume_is_performance = True
 
             prices = [
-                find_price_by_category(package, billing_item_category_code),
-                find_price_by_category(package, 'storage_' + volume_type),
-                find_saas_perform_space_price(package, volume_size),
-                find_saas_perform_iops_price(package, volume_size, iops),
+                find_price_by_category(index, billing_item_category_code),
+                find_price_by_category(index, 'storage_' + volume_type),
+                find_saas_perform_space_price(index, volume_size),
+                find_saas_perform_iops_price(index, volume_size, iops),
                 find_saas_snapshot_space_price(
-                    package, snapshot_size, iops=iops),
-                find_saas_replication_price(package, iops=iops)
+                    index, snapshot_size, iops=iops),
+                find_saas_replication_price(index, iops=iops)
             ]
         else:
             raise exceptions.SoftLayerError(
@@ -750,12 +834,12 @@ def prepare_replicant_order_object(manager, snapshot_schedule, location,
         if tier is None:
             tier = find_endurance_tier_iops_per_gb(volume)
         prices = [
-            find_price_by_category(package, billing_item_category_code),
-            find_price_by_category(package, 'storage_' + volume_type),
-            find_ent_space_price(package, 'endurance', volume_size, tier),
-            find_ent_endurance_tier_price(package, tier),
-            find_ent_space_price(package, 'snapshot', snapshot_size, tier),
-            find_ent_space_price(package, 'replication', volume_size, tier)
+            find_price_by_category(index, billing_item_category_code),
+            find_price_by_category(index, 'storage_' + volume_type),
+            find_ent_space_price(index, 'endurance', volume_size, tier),
+            find_ent_endurance_tier_price(index, tier),
+            find_ent_space_price(index, 'snapshot', snapshot_size, tier),
+            find_ent_space_price(index, 'replication', volume_size, tier)
         ]
 
     # Determine if hourly billing should be used
@@ -843,7 +927,8 @@ def prepare_duplicate_order_object(manager, origin_volume, iops, tier,
 
     # Get the appropriate package for the order
     # ('storage_as_a_service' is currently used for duplicate volumes)
-    package = get_package(manager, 'storage_as_a_service')
+    index = get_package_index(manager, 'storage_as_a_service')
+    package = index.package
 
     # Determine the IOPS or tier level for the duplicate volume, along with
     # the type and prices for the order
@@ -856,15 +941,15 @@ def prepare_duplicate_order_object(manager, origin_volume, iops, tier,
                 raise exceptions.SoftLayerError("Cannot find origin volume's provisioned IOPS")
         # Set up the price array for the order
         prices = [
-            find_price_by_category(package, 'storage_as_a_service'),
-            find_price_by_category(package, 'storage_' + volume_type),
-            find_saas_perform_space_price(package, duplicate_size),
-            find_saas_perform_iops_price(package, duplicate_size, iops),
+            find_price_by_category(index, 'storage_as_a_service'),
+            find_price_by_category(index, 'storage_' + volume_type),
+            find_saas_perform_space_price(index, duplicate_size),
+            find_saas_perform_iops_price(index, duplicate_size, iops),
         ]
         # Add the price code for snapshot space as well, unless 0 GB was given
         if duplicate_snapshot_size > 0:
             prices.append(find_saas_snapshot_space_price(
-                package, duplicate_snapshot_size, iops=iops))
+                index, duplicate_snapshot_size, iops=iops))
 
     elif 'ENDURANCE' in origin_storage_type:
         volume_is_performance = False
@@ -872,15 +957,15 @@ def prepare_duplicate_order_object(manager, origin_volume, iops, tier,
             tier = find_endurance_tier_iops_per_gb(origin_volume)
         # Set up the price array for the order
         prices = [
-            find_price_by_category(package, 'storage_as_a_service'),
-            find_price_by_category(package, 'storage_' + volume_type),
-            find_saas_endurance_space_price(package, duplicate_size, tier),
-            find_saas_endurance_tier_price(package, tier),
+            find_price_by_category(index, 'storage_as_a_service'),
+            find_price_by_category(index, 'storage_' + volume_type),
+            find_saas_endurance_space_price(index, duplicate_size, tier),
+            find_saas_endurance_tier_price(index, tier),
         ]
         # Add the price code for snapshot space as well, unless 0 GB was given
         if duplicate_snapshot_size > 0:
             prices.append(find_saas_snapshot_space_price(
-                package, duplicate_snapshot_size, tier=tier))
+                index, duplicate_snapshot_size, tier=tier))
 
     else:
         raise exceptions.SoftLayerError(
@@ -929,7 +1014,8 @@ def prepare_modify_order_object(manager, volume, new_iops, new_tier, new_size):
         raise exceptions.SoftLayerError("This volume cannot be modified since it does not support Encryption at Rest.")
 
     # Get the appropriate package for the order ('storage_as_a_service' is currently used for modifying volumes)
-    package = get_package(manager, 'storage_as_a_service')
+    index = get_package_index(manager, 'storage_as_a_service')
+    package = index.package
 
     # Based on volume storage type, ensure at least one volume property is being modified,
     # use current values if some are not specified, and lookup price codes for the order
@@ -948,9 +1034,9 @@ def prepare_modify_order_object(manager, volume, new_iops, new_tier, new_size):
 
         # Set up the prices array for the order
         prices = [
-            find_price_by_category(package, 'storage_as_a_service'),
-            find_saas_perform_space_price(package, new_size),
-            find_saas_perform_iops_price(package, new_size, new_iops),
+            find_price_by_category(index, 'storage_as_a_service'),
+            find_saas_perform_space_price(index, new_size),
+            find_saas_perform_iops_price(index, new_size, new_iops),
         ]
 
     elif 'ENDURANCE' in volume_storage_type:
@@ -965,9 +1051,9 @@ def prepare_modify_order_object(manager, volume, new_iops, new_tier, new_size):
 
         # Set up the prices array for the order
         prices = [
-            find_price_by_category(package, 'storage_as_a_service'),
-            find_saas_endurance_space_price(package, new_size, new_tier),
-            find_saas_endurance_tier_price(package, new_tier),
+            find_price_by_category(index, 'storage_as_a_service'),
+            find_saas_endurance_space_price(index, new_size, new_tier),
+            find_saas_endurance_tier_price(index, new_tier),
         ]
 
     else:
@@ -997,32 +1083,5 @@ def block_or_file(storage_type_keyname):
     return 'block' if 'BLOCK_STORAGE' in storage_type_keyname else 'file'
 
 
-def _has_category(categories, category_code):
-    return any(
-        True
-        for category
-        in categories
-        if category['categoryCode'] == category_code
-    )
-
-
 def _staas_version_is_v2_or_above(volume):
     return int(volume['staasVersion']) > 1 and volume['hasEncryptionAtRest']
-
-
-def _find_price_id(prices, category, restriction_type=None, restriction_value=None):
-    for price in prices:
-        # Only collect prices from valid location groups.
-        if price['locationGroupId']:
-            continue
-
-        if restriction_type is not None and restriction_value is not None:
-            if restriction_type != price['capacityRestrictionType']\
-                    or restriction_value < int(price['capacityRestrictionMinimum'])\
-                    or restriction_value > int(price['capacityRestrictionMaximum']):
-                continue
-
-        if not _has_category(price['categories'], category):
-            continue
-
-        return {'id': price['id']}
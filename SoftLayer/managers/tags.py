@@ -119,6 +119,19 @@ def set_tags(self, tags, key_name, resource_id):
         """
         return self.client.call('SoftLayer_Tag', 'setTags', tags, key_name, resource_id)
 
+    def set_tags_many(self, tags, key_name, resource_ids):
+        """Calls SoftLayer_Tag::setTags() for each resource, all at once.
+
+        :param string tags: List of tags.
+        :param string key_name: Key name of a tag type.
+        :param list resource_ids: IDs of the objects being tagged.
+        :returns: the result of each call, or the SoftLayerAPIError it raised, in the order of resource_ids.
+        """
+        with self.client.batch() as batch:
+            for resource_id in resource_ids:
+                batch.call('SoftLayer_Tag', 'setTags', tags, key_name, resource_id)
+        return batch.results()
+
     def get_all_tag_types(self):
         """Calls SoftLayer_Tag::getAllTagTypes()"""
         types = self.client.call('SoftLayer_Tag', 'getAllTagTypes')
@@ -15,7 +15,6 @@
 from SoftLayer import exceptions
 from SoftLayer.exceptions import SoftLayerError
 from SoftLayer.managers.hardware import _get_preset_cost
-from SoftLayer.managers.hardware import get_item_price
 from SoftLayer.managers import ordering
 from SoftLayer import utils
 
@@ -27,8 +26,7 @@
                     'trusted_platform_module',
                     'software_guard_extensions']
 
-
-# pylint: disable=,too-many-lines
+# pylint: disable=too-many-lines,too-many-public-methods
 
 
 class VSManager(utils.IdentifierMixin, object):
@@ -72,7 +70,7 @@ def __init__(self, client, ordering_manager=None):
     def list_instances(self, hourly=True, monthly=True, tags=None, cpus=None,
                        memory=None, hostname=None, domain=None,
                        local_disk=None, datacenter=None, nic_speed=None,
-                       public_ip=None, private_ip=None, transient=None, **kwargs):
+                       public_ip=None, private_ip=None, transient=None, iterator=False, **kwargs):
         """Retrieve a list of all virtual servers on the account.
 
         Example::
@@ -100,6 +98,7 @@ def list_instances(self, hourly=True, monthly=True, tags=None, cpus=None,
         :param string public_ip: filter based on public ip address
         :param string private_ip: filter based on private ip address
         :param boolean transient: filter on transient or non-transient instances
+        :param bool iterator: return a generator that fetches a page at a time, instead of a list
         :param dict \\*\\*kwargs: response-level options (mask, limit, etc.)
         :returns: Returns a list of dictionaries representing the matching
                   virtual servers
@@ -176,6 +175,9 @@ def list_instances(self, hourly=True, monthly=True, tags=None, cpus=None,
             )
 
         kwargs['filter'] = _filter.to_dict()
+        if iterator:
+            # A generator, so callers can use each page as soon as it is fetched
+            return self.client.iter_call('Account', call, **kwargs)
         kwargs['iter'] = True
         return self.client.call('Account', call, **kwargs)
 
@@ -314,16 +316,18 @@ def get_create_options(self, vsi_type="PUBLIC_CLOUD_SERVER", datacenter=None):
         extras = []
         ram = []
 
+        catalog = ordering.Catalog(package['items'], package.get('keyName'))
         sizes = []
         for preset in package['activePresets'] + package['accountRestrictedActivePresets']:
             sizes.append({
                 'name': preset['description'],
                 'key': preset['keyName'],
-                'hourlyRecurringFee': _get_preset_cost(preset, package['items'], 'hourly', location_group_id),
-                'recurringFee': _get_preset_cost(preset, package['items'], 'monthly', location_group_id)
+                'hourlyRecurringFee': _get_preset_cost(preset, catalog, 'hourly', location_group_id),
+                'recurringFee': _get_preset_cost(preset, catalog, 'monthly', location_group_id)
             })
 
         for item in package['items']:
+            prices = catalog.get_item_prices(item, location_group_id)
             category = item['itemCategory']['categoryCode']
             # Operating systems
             if category == 'os':
@@ -331,14 +335,14 @@ def get_create_options(self, vsi_type="PUBLIC_CLOUD_SERVER", datacenter=None):
                     'name': item['softwareDescription']['longDescription'],
                     'key': item['keyName'],
                     'referenceCode': item['softwareDescription']['referenceCode'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
             # database
             elif category == 'database':
                 database.append({
                     'name': item['description'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
 
             elif category == 'port_speed':
@@ -346,7 +350,7 @@ def get_create_options(self, vsi_type="PUBLIC_CLOUD_SERVER", datacenter=None):
                     'name': item['description'],
                     'speed': item['capacity'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
 
             elif category == 'guest_core':
@@ -354,7 +358,7 @@ def get_create_options(self, vsi_type="PUBLIC_CLOUD_SERVER", datacenter=None):
                     'name': item['description'],
                     'capacity': item['capacity'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
 
             elif category == 'ram':
@@ -362,7 +366,7 @@ def get_create_options(self, vsi_type="PUBLIC_CLOUD_SERVER", datacenter=None):
                     'name': item['description'],
                     'capacity': item['capacity'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
 
             elif 'guest_disk' in category:
@@ -371,14 +375,14 @@ def get_create_options(self, vsi_type="PUBLIC_CLOUD_SERVER", datacenter=None):
                     'capacity': item['capacity'],
                     'key': item['keyName'],
                     'disk': category,
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
             # Extras
             elif category in EXTRA_CATEGORIES:
                 extras.append({
                     'name': item['description'],
                     'key': item['keyName'],
-                    'prices': get_item_price(item['prices'], location_group_id)
+                    'prices': prices
                 })
 
         return {
@@ -668,6 +672,31 @@ def wait_for_ready(self, instance_id, limit=3600, delay=10, pending=False):
         LOGGER.info("Waiting for %d expired.", instance_id)
         return False
 
+    def wait_for_ready_many(self, instance_ids, limit=3600, delay=10, pending=False, max_delay=60):
+        """Waits for many virtual servers at once, yielding each one as soon as it is ready.
+
+        Rather than polling each instance, every check is one account call for all the instances
+        still waiting. Checks get further apart while nothing changes, see utils.wait_for_ready_many().
+
+        :param list instance_ids: The instance IDs to wait for
+        :param int limit: The maximum amount of seconds to wait.
+        :param int delay: The number of seconds to sleep between the first checks. Defaults to 10.
+        :param bool pending: Wait for pending transactions not related to
+                             provisioning or reloads such as monitoring.
+        :param int max_delay: The most seconds to sleep between checks. Defaults to 60.
+        :returns: generator of instances as they become ready. Instances that weren't ready in time are left out.
+
+        Example::
+
+            waiting = {12345, 12346, 12347}
+            for instance in mgr.wait_for_ready_many(waiting, limit=1800):
+                waiting.discard(instance['id'])
+            # waiting now has the ones that weren't ready in 30 minutes
+        """
+        mask = "mask[id, hostname, lastOperatingSystemReload[id], activeTransaction, provisionDate]"
+        return utils.wait_for_ready_many(instance_ids, lambda ids: self._list_by_field('id', ids, mask=mask),
+                                         limit, delay, pending, max_delay)
+
     def verify_create_instance(self, **kwargs):
         """Verifies an instance creation command.
 
@@ -839,9 +868,14 @@ def create_instances(self, config_list):
         resp = self.guest.createObjects([self._generate_create_dict(**kwargs)
                                          for kwargs in config_list])
 
-        for instance, tag in zip(resp, tags):
-            if tag is not None:
-                self.set_tags(tag, guest_id=instance['id'])
+        to_tag = [(instance['id'], tag) for instance, tag in zip(resp, tags) if tag is not None]
+        with self.client.batch() as batch:
+            for guest_id, tag in to_tag:
+                batch['Virtual_Guest'].setTags(tag, id=guest_id)
+        # Anything that failed gets tried again, one at a time with set_tags' retries.
+        for (guest_id, tag), result in zip(to_tag, batch.results()):
+            if isinstance(result, exceptions.SoftLayerAPIError):
+                self.set_tags(tag, guest_id=guest_id)
 
         return resp
 
@@ -871,6 +905,20 @@ def change_port_speed(self, instance_id, public, speed):
             return self.client.call('Virtual_Guest', 'setPrivateNetworkInterfaceSpeed',
                                     speed, id=instance_id)
 
+    def resolve_ids_many(self, identifiers):
+        """Resolves many ids, hostnames and IP addresses with a few API calls, instead of a few for each one.
+
+        :param list identifiers: ids, hostnames or IP addresses
+        :returns dict: {identifier: list of matching ids}, the list is empty when nothing matched
+        """
+        return utils.resolve_ids_many(identifiers, self._list_by_field)
+
+    def _list_by_field(self, field, values, mask=None):
+        """Virtual servers with `field` set to any of `values`. The mask defaults to their id and that field."""
+        _filter = {'virtualGuests': {field: {'operation': 'in', 'options': [{'name': 'data', 'value': list(values)}]}}}
+        return self.client.call('Account', 'getVirtualGuests', mask=mask or "mask[id,%s]" % field, filter=_filter,
+                                iter=True)
+
     def _get_ids_from_hostname(self, hostname):
         """List VS ids which match the given hostname."""
         results = self.list_instances(hostname=hostname, mask="id")
@@ -1168,6 +1216,47 @@ def order_guest(self, guest_object, test=False):
             print vsi
         """
         tags = guest_object.pop('tags', None)
+        template = self._order_template(guest_object)
+
+        if test:
+            result = self.client.call('Product_Order', 'verifyOrder', template)
+        else:
+            result = self.client.call('Product_Order', 'placeOrder', template)
+            if tags is not None:
+                virtual_guests = utils.lookup(result, 'orderDetails', 'virtualGuests')
+                for guest in virtual_guests:
+                    self.set_tags(tags, guest_id=guest['id'])
+        return result
+
+    def order_guests(self, guest_objects, test=False, max_workers=10, rate=5):
+        """Orders many virtual guests at once, with Product_Order::placeOrder like order_guest().
+
+        Guests that only differ in their hostname, domain and tags share an order template, which is made
+        and verified once. Then each guest is ordered on its own, several at once, and tagged in one batch.
+        A guest that fails doesn't stop the others. See ordering.bulk_order for how it goes.
+
+        .. warning::
+
+            This will add charges to your account
+
+        Example::
+
+            guests = [dict(new_vsi, hostname='web%02d' % number) for number in range(1, 21)]
+            for result in mgr.order_guests(guests):
+                print(result['hostname'], result['status'], result['ids'], result['error'])
+
+        :param list guest_objects: guests, with the same options as order_guest()
+        :param bool test: only verify the orders
+        :param int max_workers: how many API calls to make at once
+        :param float rate: most orders to place each second, 0 or None for no limit
+        :returns list: a dict for each guest, in the same order: hostname, domain, status ('verified', 'ordered'
+            or 'failed'), order_id, ids, seconds, error and the receipt
+        """
+        return ordering.bulk_order(self.client, guest_objects, self._order_template, 'virtualGuests', test=test,
+                                   tag_service='Virtual_Guest', max_workers=max_workers, rate=rate)
+
+    def _order_template(self, guest_object):
+        """The Product_Order template for a guest, with the options generateOrderTemplate leaves out."""
         template = self.verify_create_instance(**guest_object)
 
         if guest_object.get('ipv6'):
@@ -1182,16 +1271,7 @@ def order_guest(self, guest_object, test=False):
             template['hostId'] = guest_object.get('host_id')
         if guest_object.get('placement_id'):
             template['virtualGuests'][0]['placementGroupId'] = guest_object.get('placement_id')
-
-        if test:
-            result = self.client.call('Product_Order', 'verifyOrder', template)
-        else:
-            result = self.client.call('Product_Order', 'placeOrder', template)
-            if tags is not None:
-                virtual_guests = utils.lookup(result, 'orderDetails', 'virtualGuests')
-                for guest in virtual_guests:
-                    self.set_tags(tags, guest_id=guest['id'])
-        return result
+        return template
 
     def _get_package_items(self):
         """Following Method gets all the item ids related to VS.
@@ -1499,8 +1579,25 @@ def add_notification(self, virtual_id, user_id):
         return self.client.call('SoftLayer_User_Customer_Notification_Virtual_Guest',
                                 'createObject', template, mask=mask)
 
+    def add_notifications(self, virtual_id, user_ids):
+        """Create a user virtual notification entry for each user, all at once.
+
+        :returns: the new notification, or the SoftLayerAPIError creating it raised, for each user.
+        """
+        with self.client.batch() as batch:
+            for user_id in user_ids:
+                template = {"guestId": virtual_id, "userId": user_id}
+                batch.call('SoftLayer_User_Customer_Notification_Virtual_Guest', 'createObject', template, mask='user')
+        return batch.results()
+
     def remove_notification(self, identifier):
         """Remove a user vs notification entry"""
 
         template = [{'id': identifier}]
         return self.client.call('SoftLayer_User_Customer_Notification_Virtual_Guest', 'deleteObjects', template)
+
+    def remove_notifications(self, identifiers):
+        """Remove many user vs notification entries with a single call"""
+
+        template = [{'id': identifier} for identifier in identifiers]
+        return self.client.call('SoftLayer_User_Customer_Notification_Virtual_Guest', 'deleteObjects', template)
@@ -20,12 +20,8 @@ def cli(ctx, env):
     formatter = formatting.HelpFormatter()
     commands = []
     shell_commands = []
-    for name in cli_core.cli.list_commands(ctx):
-        command = cli_core.cli.get_command(ctx, name)
-        if command.short_help is None:
-            command.short_help = command.help
-        details = (name, command.short_help)
-        if name in dict(routes.ALL_ROUTES):
+    for details in _short_help(ctx, env.vars.get('_command_index')):
+        if details[0] in dict(routes.ALL_ROUTES):
             shell_commands.append(details)
         else:
             commands.append(details)
@@ -36,5 +32,18 @@ def cli(ctx, env):
     with formatter.section('Commands'):
         formatter.write_dl(commands)
 
-    for line in formatter.buffer:
-        env.out(line, newline=False)
+    click.echo(formatter.getvalue(), nl=False)
+
+
+def _short_help(ctx, index):
+    """(name, short help) of every root command, from the shell's CommandIndex if there is one."""
+    if index is not None:
+        return [(name, index.get(name)['help']) for name in index.get('')['commands']]
+
+    details = []
+    for name in cli_core.cli.list_commands(ctx):
+        command = cli_core.cli.get_command(ctx, name)
+        if command.short_help is None:
+            command.short_help = command.help
+        details.append((name, command.short_help))
+    return details
@@ -13,17 +13,49 @@
 
 
 class ShellCompleter(completion.Completer):
-    """Completer for the shell."""
+    """Completer for the shell.
 
-    def __init__(self, click_root):
+    :param click_root: the root click command
+    :param index: a CommandIndex, to complete without loading any commands. Without one, every command
+        that is offered gets loaded.
+    """
+
+    def __init__(self, click_root, index=None):
         self.root = click_root
+        self.index = index
 
     def get_completions(self, document, complete_event):
         """Returns an iterator of completions for the shell."""
-
+        if self.index is not None:
+            return _index_autocomplete(self.index, document.text_before_cursor)
         return _click_autocomplete(self.root, document.text_before_cursor)
 
 
+def _index_autocomplete(index, text):
+    """Completer generator that uses a CommandIndex, it works like _click_autocomplete."""
+    try:
+        parts = shlex.split(text)
+    except ValueError:
+        return
+
+    path, incomplete = index.resolve(parts)
+
+    if not text.endswith(' ') and not incomplete and text:
+        return
+
+    command = index.get(path)
+    if incomplete and not incomplete[0:2].isalnum():
+        for option in command['options']:
+            for opt in option['opts']:
+                if opt.startswith(incomplete):
+                    yield completion.Completion(opt, -len(incomplete), display_meta=option['help'])
+
+    elif 'commands' in command:
+        for name in index.complete(path, incomplete):
+            sub_path = '%s:%s' % (path, name) if path else name
+            yield completion.Completion(name, -len(incomplete), display_meta=index.get(sub_path)['help'])
+
+
 def _click_autocomplete(root, text):
     """Completer generator for click applications."""
     try:
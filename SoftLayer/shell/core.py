@@ -18,6 +18,7 @@
 from SoftLayer.CLI import core
 from SoftLayer.CLI import environment
 from SoftLayer.shell import completer
+from SoftLayer.shell import index as command_index
 from SoftLayer.shell import routes
 
 # pylint: disable=broad-except
@@ -45,7 +46,9 @@ def cli(ctx, env):
     app_path = click.get_app_dir('softlayer_shell')
     if not os.path.exists(app_path):
         os.makedirs(app_path)
-    complete = completer.ShellCompleter(core.cli)
+    index = command_index.get_index(core.cli, env, os.path.join(app_path, 'commands.json'))
+    env.vars['_command_index'] = index
+    complete = completer.ShellCompleter(core.cli, index)
 
     session = PromptSession()
 
@@ -0,0 +1,157 @@
+"""
+    SoftLayer.shell.index
+    ~~~~~~~~~~~~~~~~~~~~~
+    Help text and options of every command, so the shell can complete them without importing command modules
+
+    :license: MIT, see LICENSE for more details.
+"""
+import bisect
+import hashlib
+import json
+import os
+import types
+
+import click
+
+from SoftLayer.CLI.command import CommandLoader
+from SoftLayer import consts
+
+#: Longest short help kept for a command
+SHORT_HELP_LIMIT = 80
+
+
+class CommandIndex(object):
+    """Short help, options and sub-commands of every command.
+
+    Commands are keyed by their path, like 'virtual:list', '' is slcli itself. Each one is a dict with
+    `help` (the short help), `options` (a list of {'opts': [...], 'help': ...}) and, for groups, `commands`
+    (the sorted names of its sub-commands).
+
+    Building one imports every command, so it is saved to disk and the next shells load it from there,
+    until slcli is upgraded or its commands change. See get_index().
+
+    :param dict commands: {path: command details}
+    :param dict aliases: aliases of root commands, like Environment.aliases
+    :param string key: identifies the commands this was built from, see index_key()
+    """
+
+    def __init__(self, commands, aliases=None, key=None):
+        self.commands = commands
+        self.aliases = aliases or {}
+        self.key = key
+
+    @classmethod
+    def build(cls, root, env):
+        """Builds the index by loading every command.
+
+        :param root: the root click command, SoftLayer.CLI.core.cli, for the global options
+        :param env: the Environment, with all its commands loaded
+        """
+        commands = {'': _details(root)}
+        commands['']['commands'] = env.list_commands()
+        for name in env.commands:
+            path = name.split(':')
+            command = env.get_command(*path)
+            if isinstance(command, types.ModuleType):
+                # Like CommandLoader.get_command(), modules are groups of the commands under them
+                commands[name] = _details(CommandLoader(*path, help=command.__doc__ or ''))
+                commands[name]['commands'] = env.list_commands(*path)
+            else:
+                commands.update(_walk(name, command, click.Context(command, obj=env)))
+        return cls(commands, dict(env.aliases), index_key(env))
+
+    @classmethod
+    def load(cls, filename, key=None):
+        """Loads an index saved with save(), None if there isn't one or it wasn't built for `key`."""
+        try:
+            with open(filename, encoding="utf-8") as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('key') != key:
+            return None
+        return cls(data.get('commands', {}), data.get('aliases', {}), data.get('key'))
+
+    def save(self, filename):
+        """Saves the index to filename, a file written next to it is renamed over it, so readers never see half."""
+        temp_name = '%s.%d.tmp' % (filename, os.getpid())
+        with open(temp_name, 'w', encoding="utf-8") as index_file:
+            json.dump({'key': self.key, 'aliases': self.aliases, 'commands': self.commands}, index_file)
+        os.replace(temp_name, filename)
+
+    def get(self, path):
+        """Details of the command at path, None if there is no such command."""
+        return self.commands.get(path)
+
+    def complete(self, path, prefix):
+        """Names of the sub-commands of the command at path that start with prefix."""
+        names = self.commands.get(path, {}).get('commands', [])
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+    def resolve(self, parts):
+        """Returns the path of the command that parts name, and the part left over that is being typed.
+
+        Works like the click based completer's _click_resolve_command.
+        """
+        path = ''
+        incomplete = ''
+        for part in parts:
+            incomplete = part
+            if not part[0:2].isalnum():
+                continue
+            if 'commands' not in self.commands.get(path, {}):
+                break
+            name = self.aliases.get(part, part) if not path else part
+            sub_path = '%s:%s' % (path, name) if path else name
+            if sub_path in self.commands:
+                path = sub_path
+                incomplete = ''
+        return path, incomplete
+
+
+def _walk(path, command, ctx):
+    """Index entries for a click command, and the commands under it if it is a group."""
+    commands = {path: _details(command)}
+    if isinstance(command, click.MultiCommand):
+        names = []
+        for name in command.list_commands(ctx):
+            sub_command = command.get_command(ctx, name)
+            if sub_command is not None:
+                names.append(name)
+                commands.update(_walk('%s:%s' % (path, name), sub_command, click.Context(sub_command, parent=ctx)))
+        commands[path]['commands'] = sorted(names)
+    return commands
+
+
+def _details(command):
+    """The index entry for a click command."""
+    options = []
+    for param in command.params:
+        if isinstance(param, click.Option):
+            options.append({'opts': list(param.opts) + list(param.secondary_opts), 'help': param.help})
+    return {'help': command.short_help or command.get_short_help_str(SHORT_HELP_LIMIT) or None, 'options': options}
+
+
+def index_key(env):
+    """Identifies a version of slcli and its commands, an index built for another key is out of date."""
+    routes = sorted((name, loader.import_path, loader.attr or '') for name, loader in env.commands.items())
+    data = json.dumps([consts.VERSION, routes, sorted(env.aliases.items())])
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def get_index(root, env, filename):
+    """Loads the index saved in filename, or builds and saves it if it is missing or out of date."""
+    key = index_key(env)
+    index = CommandIndex.load(filename, key)
+    if index is None:
+        index = CommandIndex.build(root, env)
+        try:
+            index.save(filename)
+        except OSError:
+            # Can't write to the app dir, the index will be built again next time
+            pass
+    return index
@@ -0,0 +1,597 @@
+"""
+    SoftLayer.testing.benchmark
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Benchmarks for the client: the XML-RPC decoders, and API calls against a local test server that can
+    return very large results, add latency and fail or throttle some calls.
+
+    Run with `python -m SoftLayer.testing.benchmark` for the decoders,
+    `python -m SoftLayer.testing.benchmark api --help` for the API calls, and
+    `python -m SoftLayer.testing.benchmark create-options --help` for pricing a large package.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import argparse
+import contextlib
+import gc
+import importlib
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import xmlrpc.client
+
+from urllib3.util.retry import Retry
+
+import SoftLayer
+from SoftLayer import consts
+from SoftLayer import exceptions
+from SoftLayer.managers.hardware import _get_preset_cost
+from SoftLayer.managers.hardware import get_item_price
+from SoftLayer.managers.ordering import Catalog
+from SoftLayer.testing import xmlrpc as xmlrpc_server
+from SoftLayer import transports
+from SoftLayer.transports import xmlrpc as xmlrpc_transport
+
+#: Large list results from SoftLayer/fixtures, as 'Service.method'
+DEFAULT_FIXTURES = [
+    'SoftLayer_Account.getVirtualGuests',
+    'SoftLayer_Account.getHardware',
+    'SoftLayer_Account.getNetworkVlans',
+    'SoftLayer_Product_Package.getItems',
+    'SoftLayer_Product_Package.getAllObjects',
+]
+
+#: Decoders to compare, the first one is the baseline
+DEFAULT_DECODERS = {
+    'stdlib': xmlrpc_transport.XmlRpcDecoder(),
+    'streaming': xmlrpc_transport.StreamingXmlRpcDecoder(),
+}
+
+
+def load_fixture(name):
+    """Loads a fixture by its 'Service.method' name."""
+    service, method = name.split('.')
+    module = importlib.import_module('SoftLayer.fixtures.%s' % service)
+    return getattr(module, method)
+
+
+def xmlrpc_body(result, copies=1):
+    """Builds an XML-RPC response body, with a list result repeated `copies` times."""
+    if isinstance(result, list):
+        result = result * copies
+    return xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True).encode()
+
+
+def _chunks(body):
+    """Reads a body a chunk at a time, the same way a streamed response is read."""
+    size = xmlrpc_transport.CHUNK_SIZE
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def benchmark_decoders(fixtures=None, decoders=None, copies=200, rounds=3):
+    """Times each decoder on each fixture, and measures how much memory decoding needs.
+
+    :param list fixtures: fixture names, as 'Service.method'
+    :param dict decoders: decoders to compare, by name
+    :param int copies: how many times to repeat each list fixture, so the body is close to a real large response
+    :param int rounds: decodes per fixture, the fastest one is kept
+    :returns: a list of dicts with fixture, decoder, bytes, seconds, peak_memory and speedup
+    """
+    decoders = decoders or DEFAULT_DECODERS
+    results = []
+    for fixture in fixtures or DEFAULT_FIXTURES:
+        body = xmlrpc_body(load_fixture(fixture), copies)
+        baseline = None
+        for name, decoder in decoders.items():
+            best = None
+            for _ in range(rounds):
+                gc.collect()
+                start = time.perf_counter()
+                decoder(_chunks(body))
+                duration = time.perf_counter() - start
+                best = duration if best is None else min(best, duration)
+
+            # Decoders that don't stream need the whole body joined together first, which counts here too
+            gc.collect()
+            tracemalloc.start()
+            decoder(_chunks(body))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            baseline = baseline or best
+            results.append({'fixture': fixture, 'decoder': name, 'bytes': len(body), 'seconds': best,
+                            'peak_memory': peak, 'speedup': baseline / best if best else 0})
+    return results
+
+
+#: Methods a load server answers with large results by default, and how many items they have
+DEFAULT_SIZES = {
+    'SoftLayer_Account.getVirtualGuests': 10000,
+    'SoftLayer_Account.getHardware': 10000,
+}
+
+
+class LoadTransport(object):  # pylint: disable=too-many-instance-attributes
+    """Transport for a test server that answers like a busy API: large results, latency, errors and throttling.
+
+    Methods in `sizes` return that many items, made from the method's fixture with a different id each,
+    a page at a time with the total in the SoftLayer-Total-Items header. Everything else is answered by
+    `transport`.
+
+    :param transport: answers the methods that aren't in sizes, a FixtureTransport by default
+    :param dict sizes: how many items a method has, by 'Service.method'
+    :param int max_page_size: most items in one page, 0 for no limit
+    :param float latency: seconds every call takes
+    :param float latency_per_item: more seconds for every item returned
+    :param float error_rate: fraction of calls answered with HTTP 503, after their latency
+    :param float throttle_rate: fraction of calls answered with HTTP 429
+    :param float retry_after: Retry-After header of throttled calls, in seconds
+    :param int seed: makes the failed and throttled calls the same on every run
+    """
+
+    def __init__(self, transport=None, sizes=None, max_page_size=0, latency=0, latency_per_item=0,
+                 error_rate=0, throttle_rate=0, retry_after=1, seed=None):
+        self.transport = transport or transports.FixtureTransport()
+        self.sizes = DEFAULT_SIZES if sizes is None else sizes
+        self.max_page_size = max_page_size
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, call):
+        """See Client.call for documentation."""
+        with self._lock:
+            self.calls += 1
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            raise xmlrpc_server.HTTPError(429, "Too many requests", {'Retry-After': str(self.retry_after)})
+
+        name = '%s.%s' % (call.service, call.method)
+        if name not in self.sizes:
+            time.sleep(self.latency)
+            result = self.transport(call)
+        else:
+            result = self.get_page(name, call.offset, call.limit)
+            time.sleep(self.latency + self.latency_per_item * len(result))
+
+        if roll < self.throttle_rate + self.error_rate:
+            raise xmlrpc_server.HTTPError(503, "Service unavailable, injected by the load server")
+        return result
+
+    def get_page(self, name, offset=None, limit=None):
+        """A page of the made up items of a method in sizes."""
+        total = self.sizes[name]
+        offset = offset or 0
+        limit = limit or total
+        if self.max_page_size:
+            limit = min(limit, self.max_page_size)
+        if name not in self._templates:
+            self._templates[name] = load_fixture(name)
+        template = self._templates[name]
+        items = [dict(template[i % len(template)], id=i + 1) for i in range(offset, min(offset + limit, total))]
+        return transports.SoftLayerListResult(items, total)
+
+
+def _serve(options, ports):
+    """Runs a load server in a child process, until the process is terminated."""
+    server = xmlrpc_server.create_test_server(LoadTransport(**options), '127.0.0.1')
+    ports.put(server.server_port)
+
+
+@contextlib.contextmanager
+def load_server(separate_process=True, **options):
+    """Runs a test server with a LoadTransport, and yields its endpoint url.
+
+    REST calls go to the endpoint url + /rest/v3.1. In a separate process the server's CPU time and memory
+    aren't counted as the client's.
+
+    :param bool separate_process: run the server in its own process, otherwise in a thread of this one
+    :param \\*\\*options: LoadTransport options
+    """
+    if not separate_process:
+        server = xmlrpc_server.create_test_server(LoadTransport(**options), '127.0.0.1')
+        try:
+            yield 'http://127.0.0.1:%d' % server.server_port
+        finally:
+            server.shutdown()
+            server.server_close()
+        return
+
+    context = multiprocessing.get_context('spawn')
+    ports = context.Queue()
+    process = context.Process(target=_serve, args=(options, ports), daemon=True)
+    process.start()
+    try:
+        yield 'http://127.0.0.1:%d' % ports.get(timeout=60)
+    finally:
+        process.terminate()
+        process.join()
+
+
+def _call(client, config):
+    """BaseClient.call, one page of guests at a time."""
+    items = 0
+    for _ in range(config['calls']):
+        items += len(client.call('Account', 'getVirtualGuests', limit=config['page_size']))
+    return items
+
+
+def _iter_call(client, config):
+    """BaseClient.iter_call, every guest one page after the other."""
+    return sum(1 for _ in client.iter_call('Account', 'getVirtualGuests', limit=config['page_size']))
+
+
+def _cf_call(client, config):
+    """BaseClient.cf_call, every guest with pages fetched at once."""
+    return len(client.cf_call('Account', 'getVirtualGuests', limit=config['page_size'],
+                              max_workers=config['workers']))
+
+
+def _vs_list(client, config):
+    """VSManager.list_instances, with its default mask."""
+    return len(SoftLayer.VSManager(client).list_instances(limit=config['page_size']))
+
+
+def _hw_list(client, config):
+    """HardwareManager.list_hardware, with its default mask."""
+    return len(SoftLayer.HardwareManager(client).list_hardware(limit=config['page_size']))
+
+
+#: API benchmarks, functions that take a client and the config and return how many items they got
+SCENARIOS = {
+    'call': _call,
+    'iter_call': _iter_call,
+    'cf_call': _cf_call,
+    'vs_list': _vs_list,
+    'hw_list': _hw_list,
+}
+
+#: Failed calls are only tried again by RateLimitingTransport, where they are counted
+SESSION_OPTIONS = {'retries': Retry(total=0, respect_retry_after_header=False)}
+
+#: Transports to compare, by name. They are given the load server's endpoint url
+TRANSPORTS = {
+    'xmlrpc': lambda url: transports.XmlRpcTransport(endpoint_url=url, session_options=SESSION_OPTIONS),
+    'rest': lambda url: transports.RestTransport(endpoint_url=url + '/rest/v3.1', session_options=SESSION_OPTIONS),
+}
+
+#: Defaults of benchmark_api()'s config
+DEFAULT_CONFIG = {
+    'items': 10000,
+    'page_size': 100,
+    'calls': 20,
+    'workers': 10,
+    'rounds': 3,
+    'max_page_size': 0,
+    'latency': 0,
+    'latency_per_item': 0,
+    'error_rate': 0,
+    'throttle_rate': 0,
+    'seed': 1,
+}
+
+
+def _run_scenario(scenario, transport, config):
+    """Runs a scenario once, returns how many items it got and its MetricsTransport."""
+    metrics = transports.MetricsTransport(transport)
+    wrapped = metrics
+    if config['error_rate'] or config['throttle_rate']:
+        # Failed and throttled calls are tried again, the way a real client copes with them
+        wrapped = transports.RateLimitingTransport(metrics, max_retries=10, backoff=0.01, max_backoff=0.1)
+    client = SoftLayer.BaseClient(transport=wrapped, auth=None)
+    return scenario(client, config), metrics
+
+
+def benchmark_api(scenarios=None, transport_names=None, separate_process=True, **config):
+    """Times API calls against a load server, with each transport.
+
+    Throughput is from the fastest round. Calls, errors and latencies are of the last round's API calls.
+    Peak memory is the client's, from one more round with tracemalloc on.
+
+    :param list scenarios: names from SCENARIOS, all of them by default
+    :param list transport_names: names from TRANSPORTS, all of them by default
+    :param bool separate_process: run the server in its own process
+    :param \\*\\*config: anything in DEFAULT_CONFIG. items is how many guests and hardware the account has
+    :returns: a list of dicts with scenario, transport, items, calls, errors, seconds, items_per_second,
+        calls_per_second, p50, p99 and peak_memory
+    """
+    config = dict(DEFAULT_CONFIG, **config)
+    options = {key: config[key] for key in ('max_page_size', 'latency', 'latency_per_item', 'error_rate',
+                                            'throttle_rate', 'seed')}
+    options['sizes'] = {name: config['items'] for name in DEFAULT_SIZES}
+    # Throttled calls are retried right away, the benchmark is of the client and not of waiting
+    options['retry_after'] = 0
+
+    results = []
+    with load_server(separate_process, **options) as url:
+        for scenario_name in scenarios or SCENARIOS:
+            for transport_name in transport_names or TRANSPORTS:
+                transport = TRANSPORTS[transport_name](url)
+                row = {'scenario': scenario_name, 'transport': transport_name, 'error': None}
+                try:
+                    row.update(_measure(SCENARIOS[scenario_name], transport, config))
+                except exceptions.SoftLayerAPIError as ex:
+                    row['error'] = str(ex)
+                results.append(row)
+    return results
+
+
+def _measure(scenario, transport, config):
+    """Runs a scenario for every round, and once more for its peak memory."""
+    best = None
+    for _ in range(config['rounds']):
+        gc.collect()
+        start = time.perf_counter()
+        items, metrics = _run_scenario(scenario, transport, config)
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    summary = metrics.get_summary()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _run_scenario(scenario, transport, config)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    calls = sum(row['calls'] for row in summary)
+    # Every scenario is mostly calls to one method, the one that took the most time
+    return {'items': items, 'calls': calls, 'errors': sum(row['errors'] for row in summary), 'seconds': best,
+            'items_per_second': items / best if best else 0, 'calls_per_second': calls / best if best else 0,
+            'p50': summary[0]['p50'] if summary else 0, 'p99': summary[0]['p99'] if summary else 0,
+            'peak_memory': peak}
+
+
+def save_results(path, results, config=None):
+    """Saves benchmark results to a JSON file, with the client and Python versions they were run with."""
+    with open(path, 'w', encoding='utf-8') as results_file:
+        json.dump({'version': consts.VERSION, 'python': platform.python_version(), 'timestamp': time.time(),
+                   'config': config or {}, 'results': results}, results_file, indent=2)
+
+
+def load_results(path):
+    """Loads benchmark results saved by save_results()."""
+    with open(path, encoding='utf-8') as results_file:
+        return json.load(results_file)
+
+
+#: Measures where a bigger number is worse
+COMPARED = ['seconds', 'p50', 'p99', 'peak_memory']
+
+
+def compare_results(baseline, results, threshold=0.1):
+    """Compares results with a baseline from load_results(), scenario by scenario.
+
+    :param dict baseline: saved results, from load_results()
+    :param list results: results of the same benchmark, from benchmark_api()
+    :param float threshold: how much slower or bigger a measure can get before it is a regression, 0.1 is 10%
+    :returns: a list of dicts with scenario, transport, measure, baseline, current, change and regression
+    """
+    before = {(row['scenario'], row['transport']): row for row in baseline['results']}
+    compared = []
+    for row in results:
+        old = before.get((row['scenario'], row['transport']))
+        if old is None or old.get('error') or row.get('error'):
+            continue
+        for measure in COMPARED:
+            change = row[measure] / old[measure] - 1 if old[measure] else 0
+            compared.append({'scenario': row['scenario'], 'transport': row['transport'], 'measure': measure,
+                             'baseline': old[measure], 'current': row[measure], 'change': change,
+                             'regression': change > threshold})
+    return compared
+
+
+#: Item categories of a made up package, the ones `vs create-options` lists
+PACKAGE_CATEGORIES = ['os', 'port_speed', 'guest_core', 'ram', 'guest_disk0', 'database', 'pri_ip_addresses']
+
+
+def synthetic_package(items=5000, presets=200, prices_per_item=10, location_groups=20, preset_size=8):
+    """Makes up a package like VSManager._get_package() returns, with location group prices for every item.
+
+    :param int items: items in the package
+    :param int presets: active presets, each with preset_size of the items' default prices
+    :param int prices_per_item: prices of each item, one of them without a location group
+    :param int location_groups: location groups the other prices are spread over, their ids start at 1
+    :param int preset_size: prices in each preset
+    """
+    package_items = []
+    for item_id in range(1, items + 1):
+        prices = [{'id': item_id * 1000, 'itemId': item_id, 'locationGroupId': '',
+                   'hourlyRecurringFee': '0.01', 'recurringFee': '7.30'}]
+        for number in range(1, prices_per_item):
+            prices.append({'id': item_id * 1000 + number, 'itemId': item_id,
+                           'locationGroupId': (number - 1) % location_groups + 1,
+                           'hourlyRecurringFee': '0.02', 'recurringFee': '14.60'})
+        package_items.append({
+            'id': item_id,
+            'keyName': 'ITEM_%d' % item_id,
+            'description': 'Item %d' % item_id,
+            'capacity': str(item_id % 64 + 1),
+            'itemCategory': {'categoryCode': PACKAGE_CATEGORIES[item_id % len(PACKAGE_CATEGORIES)]},
+            'softwareDescription': {'longDescription': 'OS %d' % item_id, 'referenceCode': 'OS_%d' % item_id},
+            'prices': prices,
+        })
+
+    active_presets = []
+    for preset_id in range(1, presets + 1):
+        chosen = [package_items[(preset_id * preset_size + number) % items] for number in range(preset_size)]
+        active_presets.append({'id': preset_id, 'keyName': 'PRESET_%d' % preset_id,
+                               'description': 'Preset %d' % preset_id,
+                               'prices': [item['prices'][0] for item in chosen]})
+
+    location = {'name': 'bench01', 'longName': 'Benchmark 1',
+                'priceGroups': [{'id': 1, 'description': 'Location Group 1'}]}
+    return {'items': package_items, 'activePresets': active_presets, 'accountRestrictedActivePresets': [],
+            'regions': [{'location': {'location': location}}]}
+
+
+def _scan_preset_cost(preset, items, cost_key, location_group_id=None):
+    """A preset's cost the way it was found before the Catalog, every preset price scans all the items."""
+    item_cost = 0.00
+    for price in preset.get('prices', []):
+        if not location_group_id:
+            item_cost += float(price.get(cost_key))
+            continue
+        item_cost = 0.00
+        for item in items:
+            if item.get('id') == price.get('itemId'):
+                for location_price in item.get('prices', []):
+                    if location_price.get('locationGroupId', 0) == location_group_id:
+                        item_cost += float(location_price.get(cost_key))
+    return item_cost
+
+
+def price_package(package, location_group_id=None, catalog=None):
+    """Prices every preset and item of a package the way get_create_options does.
+
+    Without a catalog this is how it was done before the Catalog: every preset price scans all the items.
+
+    :returns: (hourly, monthly) cost of each preset, and the prices of each item
+    """
+    presets = package['activePresets'] + package['accountRestrictedActivePresets']
+    if catalog is None:
+        sizes = [(_scan_preset_cost(preset, package['items'], 'hourlyRecurringFee', location_group_id),
+                  _scan_preset_cost(preset, package['items'], 'recurringFee', location_group_id))
+                 for preset in presets]
+        prices = [get_item_price(item['prices'], location_group_id) for item in package['items']]
+    else:
+        sizes = [(_get_preset_cost(preset, catalog, 'hourly', location_group_id),
+                  _get_preset_cost(preset, catalog, 'monthly', location_group_id))
+                 for preset in presets]
+        prices = [catalog.get_item_prices(item, location_group_id) for item in package['items']]
+    return sizes, prices
+
+
+def benchmark_create_options(items=5000, presets=200, prices_per_item=10, location_groups=20, rounds=3):
+    """Times pricing a large made up package for one location group, scanning the items and with a Catalog.
+
+    The catalog is built in every round, like get_create_options does.
+
+    :param int rounds: runs of each method, the fastest one is kept
+    :returns: a list of dicts with method, items, presets, seconds and speedup, the scan is the baseline
+    """
+    package = synthetic_package(items, presets, prices_per_item, location_groups)
+    methods = {
+        'scan': lambda: price_package(package, 1),
+        'catalog': lambda: price_package(package, 1, Catalog(package['items'])),
+    }
+    results = []
+    baseline = None
+    for name, method in methods.items():
+        best = None
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            method()
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        baseline = baseline or best
+        results.append({'method': name, 'items': items, 'presets': presets, 'seconds': best,
+                        'speedup': baseline / best if best else 0})
+    return results
+
+
+def print_decoders():
+    """Prints the decoder benchmark as a table."""
+    print("%-42s %-10s %10s %10s %12s %8s" % ('Fixture', 'Decoder', 'MB', 'Seconds', 'Peak MB', 'Speedup'))
+    for row in benchmark_decoders():
+        print("%-42s %-10s %10.2f %10.4f %12.2f %7.2fx" % (
+            row['fixture'], row['decoder'], row['bytes'] / 1e6, row['seconds'], row['peak_memory'] / 1e6,
+            row['speedup']))
+
+
+def print_create_options(results):
+    """Prints the create-options benchmark as a table."""
+    print("%-8s %8s %8s %10s %8s" % ('Method', 'Items', 'Presets', 'Seconds', 'Speedup'))
+    for row in results:
+        print("%-8s %8d %8d %10.4f %7.2fx" % (row['method'], row['items'], row['presets'], row['seconds'],
+                                              row['speedup']))
+
+
+def print_api(results):
+    """Prints API benchmark results as a table."""
+    print("%-10s %-7s %8s %7s %7s %9s %10s %9s %9s %9s" % (
+        'Scenario', 'Client', 'Items', 'Calls', 'Errors', 'Seconds', 'Items/s', 'p50 ms', 'p99 ms', 'Peak MB'))
+    for row in results:
+        if row['error']:
+            print("%-10s %-7s %s" % (row['scenario'], row['transport'], row['error']))
+            continue
+        print("%-10s %-7s %8d %7d %7d %9.3f %10.0f %9.2f %9.2f %9.2f" % (
+            row['scenario'], row['transport'], row['items'], row['calls'], row['errors'], row['seconds'],
+            row['items_per_second'], row['p50'] * 1000, row['p99'] * 1000, row['peak_memory'] / 1e6))
+
+
+def print_comparison(compared):
+    """Prints the measures that changed, returns True if any of them is a regression."""
+    regressions = [row for row in compared if row['regression']]
+    for row in compared:
+        print("%-10s %-7s %-12s %12.4g %12.4g %+7.1f%%%s" % (
+            row['scenario'], row['transport'], row['measure'], row['baseline'], row['current'],
+            row['change'] * 100, '  REGRESSION' if row['regression'] else ''))
+    print("%d regressions" % len(regressions))
+    return bool(regressions)
+
+
+def main(argv=None):
+    """Runs a benchmark from the command line, exits with 1 if a comparison finds a regression."""
+    parser = argparse.ArgumentParser(prog='python -m SoftLayer.testing.benchmark',
+                                     description="Benchmarks for the SoftLayer client")
+    commands = parser.add_subparsers(dest='command')
+    commands.add_parser('decoders', help="XML-RPC decoders on large fixtures (the default)")
+    api = commands.add_parser('api', help="API calls against a local load server")
+    api.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help="Only this scenario")
+    api.add_argument('--transport', action='append', choices=sorted(TRANSPORTS), help="Only this transport")
+    api.add_argument('--items', type=int, default=DEFAULT_CONFIG['items'], help="Guests and hardware on the account")
+    api.add_argument('--page-size', type=int, default=DEFAULT_CONFIG['page_size'], help="Items per API call")
+    api.add_argument('--calls', type=int, default=DEFAULT_CONFIG['calls'], help="API calls in the call scenario")
+    api.add_argument('--workers', type=int, default=DEFAULT_CONFIG['workers'], help="Threads for cf_call")
+    api.add_argument('--rounds', type=int, default=DEFAULT_CONFIG['rounds'], help="Runs of each scenario")
+    api.add_argument('--max-page-size', type=int, default=0, help="Most items the server returns in a page")
+    api.add_argument('--latency', type=float, default=0, help="Seconds the server takes for every call")
+    api.add_argument('--latency-per-item', type=float, default=0, help="More seconds for every item")
+    api.add_argument('--error-rate', type=float, default=0, help="Fraction of calls that fail")
+    api.add_argument('--throttle-rate', type=float, default=0, help="Fraction of calls that get HTTP 429")
+    api.add_argument('--in-process', action='store_true', help="Run the server in this process")
+    api.add_argument('--save', metavar='FILE', help="Save the results to a JSON file")
+    api.add_argument('--compare', metavar='FILE', help="Compare with results saved by --save")
+    api.add_argument('--threshold', type=float, default=0.1, help="Change that is a regression, 0.1 is 10%%")
+    options = commands.add_parser('create-options', help="Pricing a large package for create-options")
+    options.add_argument('--items', type=int, default=5000, help="Items in the package")
+    options.add_argument('--presets', type=int, default=200, help="Presets in the package")
+    options.add_argument('--prices-per-item', type=int, default=10, help="Prices of each item")
+    options.add_argument('--location-groups', type=int, default=20, help="Location groups of the prices")
+    options.add_argument('--rounds', type=int, default=3, help="Runs of each method")
+    args = parser.parse_args(argv)
+
+    if args.command == 'create-options':
+        print_create_options(benchmark_create_options(args.items, args.presets, args.prices_per_item,
+                                                      args.location_groups, args.rounds))
+        return 0
+    if args.command != 'api':
+        print_decoders()
+        return 0
+
+    config = {key: getattr(args, key) for key in DEFAULT_CONFIG if key != 'seed'}
+    results = benchmark_api(args.scenario, args.transport, separate_process=not args.in_process, **config)
+    print_api(results)
+    if args.save:
+        save_results(args.save, results, config)
+    if args.compare and print_comparison(compare_results(load_results(args.compare), results, args.threshold)):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """
     SoftLayer.testing.xmlrpc
     ~~~~~~~~~~~~~~~~~~~~~~~~
-    XMP-RPC server which can use a transport to proxy requests for testing.
+    XML-RPC and REST server which can use a transport to proxy requests for testing.
 
     If you want to spin up a test XML server to make fake API calls with, try this:
 
@@ -25,12 +25,15 @@
     :license: MIT, see LICENSE for more details.
 """
 import http.server
+import json
 import logging
 import threading
+import urllib.parse
 import xmlrpc.client
 
 import SoftLayer
 from SoftLayer import transports
+from SoftLayer.transports import codec
 from SoftLayer import utils
 
 # pylint: disable=invalid-name, broad-except, arguments-differ
@@ -39,19 +42,55 @@
 class TestServer(http.server.ThreadingHTTPServer):
     """Test HTTP server which holds a given transport."""
 
+    daemon_threads = True
+
     def __init__(self, transport, *args, **kw):
         http.server.ThreadingHTTPServer.__init__(self, *args, **kw)
         self.transport = transport
 
 
+class HTTPError(Exception):
+    """Raised by a test server's transport to answer with an HTTP error instead of a result.
+
+    :param int status: HTTP status, like 429 to throttle the client
+    :param string message: error message
+    :param dict headers: extra response headers, like {'Retry-After': '1'}
+    """
+
+    def __init__(self, status, message='', headers=None):
+        Exception.__init__(self, message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
 class TestHandler(http.server.BaseHTTPRequestHandler):
-    """Test XML-RPC Handler which converts XML-RPC to transport requests."""
+    """Test handler which converts XML-RPC and REST calls to transport requests.
+
+    Paths ending with .json are REST calls (/[prefix/]SoftLayer_Service[/id][/method].json), anything else
+    is XML-RPC (/SoftLayer_Service).
+    """
+
+    # Connections are kept open, so headers and body mustn't wait on each other's ACK
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        """Handle REST GETs."""
+        self.handle_rest()
+
+    def do_PUT(self):
+        """Handle REST PUTs."""
+        self.handle_rest()
 
     def do_POST(self):
-        """Handle XML-RPC POSTs."""
+        """Handle XML-RPC and REST POSTs."""
+        if self.path.split('?')[0].endswith('.json'):
+            self.handle_rest()
+            return
+
         try:
-            length = int(self.headers['Content-Length'])
-            data = self.rfile.read(length).decode('utf-8')
+            data = self.read_body().decode('utf-8')
             args, method = xmlrpc.client.loads(data)
             headers = args[0].get('headers', {})
 
@@ -72,47 +111,102 @@ def do_POST(self):
             response = self.server.transport(req)
 
             # Need to convert BACK to list, so xmlrpc can dump it out properly.
+            total_items = None
             if isinstance(response, SoftLayer.transports.transport.SoftLayerListResult):
+                total_items = response.total_count
                 response = list(response)
             response_body = xmlrpc.client.dumps((response,), allow_none=True, methodresponse=True)
 
-            self.send_response(200)
-            self.send_header("Content-type", "application/xml; charset=UTF-8")
-            self.end_headers()
-
-            try:
-                self.wfile.write(response_body.encode('utf-8'))
-            except UnicodeDecodeError:
-                self.wfile.write(response_body)
+            # Like the real API, so client.iter_call() knows when to stop
+            headers = {}
+            if total_items is not None:
+                headers['SoftLayer-Total-Items'] = str(total_items)
+            self.respond(200, response_body.encode('utf-8'), 'application/xml; charset=UTF-8', headers)
 
         except (NotImplementedError, NameError) as ex:
-            self.send_response(200)
-            self.end_headers()
             response = xmlrpc.client.Fault(404, str(ex))
             response_body = xmlrpc.client.dumps(response, allow_none=True, methodresponse=True)
-            self.wfile.write(response_body.encode('utf-8'))
+            self.respond(200, response_body.encode('utf-8'))
 
         except SoftLayer.SoftLayerAPIError as ex:
-            self.send_response(200)
-            self.end_headers()
             response = xmlrpc.client.Fault(ex.faultCode, str(ex.reason))
             response_body = xmlrpc.client.dumps(response, allow_none=True, methodresponse=True)
-            self.wfile.write(response_body.encode('utf-8'))
+            self.respond(200, response_body.encode('utf-8'))
+        except HTTPError as ex:
+            self.respond(ex.status, ex.message.encode('utf-8'), 'text/plain', ex.headers)
         except OverflowError as ex:
-            self.send_response(555)
-            self.send_header("Content-type", "application/xml; charset=UTF-8")
-            self.end_headers()
             response_body = '''<error>OverflowError in XML response.</error>'''
-            self.wfile.write(response_body.encode('utf-8'))
+            self.respond(555, response_body.encode('utf-8'), 'application/xml; charset=UTF-8')
             logging.exception("Error while handling request: %s", ex)
         except Exception as ex:
-            self.send_response(500)
+            self.respond(500, b'')
             logging.exception("Error while handling request: %s", ex)
 
+    def handle_rest(self):
+        """Handle a REST call, the result is sent back as JSON."""
+        try:
+            req = transports.Request()
+            url = urllib.parse.urlsplit(self.path)
+            req.service, req.identifier, req.method = _parse_rest_path(url.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            if 'objectMask' in query:
+                req.mask = query['objectMask']
+            if 'objectFilter' in query:
+                req.filter = json.loads(query['objectFilter'])
+            if 'resultLimit' in query:
+                req.offset, req.limit = (int(part) for part in query['resultLimit'].split(','))
+            body = self.read_body()
+            req.args = tuple(json.loads(body).get('parameters', ())) if body else ()
+            req.transport_headers = dict(((k.lower(), v) for k, v in self.headers.items()))
+
+            response = self.server.transport(req)
+
+            headers = {}
+            if isinstance(response, SoftLayer.transports.transport.SoftLayerListResult):
+                headers['SoftLayer-Total-Items'] = str(response.total_count)
+            self.respond(200, codec.dumps(response).encode('utf-8'), 'application/json', headers)
+        except (NotImplementedError, NameError) as ex:
+            self.respond(404, json.dumps({'error': str(ex), 'code': 404}).encode('utf-8'), 'application/json')
+        except SoftLayer.SoftLayerAPIError as ex:
+            body = json.dumps({'error': str(ex.reason), 'code': ex.faultCode}).encode('utf-8')
+            self.respond(500, body, 'application/json')
+        except HTTPError as ex:
+            self.respond(ex.status, json.dumps({'error': ex.message}).encode('utf-8'), 'application/json',
+                         ex.headers)
+        except Exception as ex:
+            self.respond(500, b'')
+            logging.exception("Error while handling request: %s", ex)
+
+    def read_body(self):
+        """Reads the request body."""
+        return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+    def respond(self, status, body, content_type=None, headers=None):
+        """Sends a response, the connection is kept open for the next request."""
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, fmt, *args):
         """Override log_message."""
 
 
+def _parse_rest_path(path):
+    """Service, id and method of a REST path, /[prefix/]SoftLayer_Service[/id][/method].json"""
+    parts = path[:-len('.json')].strip('/').split('/')
+    start = next((i for i, part in enumerate(parts) if part.startswith('SoftLayer_')), len(parts) - 1)
+    service, rest = parts[start], parts[start + 1:]
+    identifier = None
+    if rest and rest[0].isdigit():
+        identifier = int(rest.pop(0))
+    return service, identifier, rest[0] if rest else 'getObject'
+
+
 def _item_by_key_postfix(dictionary, key_prefix):
     """Get item from a dictionary which begins with the given prefix."""
     for key, value in dictionary.items():
@@ -123,7 +217,10 @@ def _item_by_key_postfix(dictionary, key_prefix):
 
 
 def create_test_server(transport, host='localhost', port=0):
-    """Create a test XML-RPC server in a new thread."""
+    """Create a test XML-RPC and REST server in a new thread.
+
+    REST calls go to the same address, http://host:port/rest/v3.1/ for instance.
+    """
     server = TestServer(transport, (host, port), TestHandler)
     thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01})
     thread.start()
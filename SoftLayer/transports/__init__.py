@@ -5,16 +5,68 @@
 
     :license: MIT, see LICENSE for more details.
 """
-# Required imports to not break existing code.
+import importlib
+import typing
 
+if typing.TYPE_CHECKING:
+    # For linters and IDEs, these aren't imported at runtime
+    from .aio import AsyncRestTransport
+    from .aio import AsyncXmlRpcTransport
+    from .cache import CachingTransport
+    from .debug import DebugTransport
+    from .fixture import FixtureTransport
+    from .metrics import MetricsTransport
+    from .ratelimit import RateLimitingTransport
+    from .replay import RecordingTransport
+    from .replay import ReplayTransport
+    from .rest import RestTransport
+    from .timing import TimingTransport
+    from .transport import Request
+    from .transport import SoftLayerListResult as SoftLayerListResult
+    from .transport import StreamingListResult
+    from .xmlrpc import XmlRpcTransport
+
+# Transports are only imported when they are first used, the asyncio ones need aiohttp which is slow to import.
+# name -> module.
+_TRANSPORTS = {
+    'AsyncRestTransport': 'aio',
+    'AsyncXmlRpcTransport': 'aio',
+    'CachingTransport': 'cache',
+    'DebugTransport': 'debug',
+    'FixtureTransport': 'fixture',
+    'MetricsTransport': 'metrics',
+    'RateLimitingTransport': 'ratelimit',
+    'RecordingTransport': 'replay',
+    'ReplayTransport': 'replay',
+    'RestTransport': 'rest',
+    'TimingTransport': 'timing',
+    'Request': 'transport',
+    'SoftLayerListResult': 'transport',
+    'StreamingListResult': 'transport',
+    'XmlRpcTransport': 'xmlrpc',
+}
+
+
+def __getattr__(name):
+    """Imports a transport, or a transport module (transports.xmlrpc...), the first time it is used."""
+    if name.startswith('__'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _TRANSPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_TRANSPORTS[name]}"), name)
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as ex:
+            if ex.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TRANSPORTS))
 
-from .debug import DebugTransport
-from .fixture import FixtureTransport
-from .rest import RestTransport
-from .timing import TimingTransport
-from .transport import Request
-from .transport import SoftLayerListResult as SoftLayerListResult
-from .xmlrpc import XmlRpcTransport
 
 # transports.Request does have a lot of instance attributes. :(
 # pylint: disable=too-many-instance-attributes
@@ -23,8 +75,16 @@
     'Request',
     'XmlRpcTransport',
     'RestTransport',
+    'AsyncXmlRpcTransport',
+    'AsyncRestTransport',
     'TimingTransport',
+    'CachingTransport',
+    'RateLimitingTransport',
+    'MetricsTransport',
+    'RecordingTransport',
+    'ReplayTransport',
     'DebugTransport',
     'FixtureTransport',
-    'SoftLayerListResult'
+    'SoftLayerListResult',
+    'StreamingListResult',
 ]
@@ -0,0 +1,159 @@
+"""
+    SoftLayer.transports.aio
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+    asyncio transports, built on aiohttp.
+
+    These reuse the request building and response decoding of the XML-RPC and REST
+    transports, only the HTTP call itself is different. aiohttp is an optional
+    dependency, install it with `pip install SoftLayer[async]`.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import asyncio
+import ssl
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from SoftLayer import exceptions
+
+from .rest import RestTransport
+from .transport import get_retry_after
+from .xmlrpc import decode_response
+from .xmlrpc import XmlRpcTransport
+
+#: Default number of connections an async transport will keep open at once.
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+def _ssl_option(verify, cert):
+    """Translates the requests style verify/cert options to something aiohttp understands.
+
+    :param verify: True, False, or a path to a CA bundle
+    :param cert: client certificate path, or a (cert, key) tuple
+    """
+    if verify is False and not cert:
+        return False
+    if isinstance(verify, str) or cert:
+        context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+        if verify is False:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
+    return None
+
+
+def _clean_headers(headers):
+    """aiohttp doesn't like None headers, requests just drops them."""
+    return {key: value for key, value in headers.items() if value is not None}
+
+
+class AsyncTransportMixin(object):
+    """Session handling shared by the async transports."""
+
+    max_connections = DEFAULT_MAX_CONNECTIONS
+
+    @property
+    def client(self):
+        """Returns the aiohttp session, needs to be called from inside a running event loop."""
+        if aiohttp is None:
+            raise exceptions.SoftLayerError("aiohttp is required for async transports. "
+                                            "Install it with `pip install SoftLayer[async]`")
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._client = aiohttp.ClientSession(connector=connector,
+                                                 headers={'User-Agent': self.user_agent})
+        return self._client
+
+    async def close(self):
+        """Closes the aiohttp session, and any connections it holds."""
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        self._client = None
+
+    async def _send(self, method, request, **kwargs):
+        """Sends the request, returns (status, reason, url, headers, body)"""
+        auth = None
+        if request.transport_user:
+            auth = aiohttp.BasicAuth(request.transport_user, request.transport_password)
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        try:
+            async with self.client.request(method, request.url,
+                                           auth=auth,
+                                           headers=_clean_headers(request.transport_headers),
+                                           timeout=timeout,
+                                           ssl=_ssl_option(request.verify, request.cert),
+                                           proxy=self.proxy,
+                                           **kwargs) as resp:
+                body = await resp.read()
+                return resp.status, resp.reason, str(resp.url), resp.headers, body
+        except aiohttp.ClientError as ex:
+            raise exceptions.TransportError(0, str(ex))
+        except asyncio.TimeoutError as ex:
+            raise exceptions.TransportError(0, "Timed out after %s seconds: %s" % (self.timeout, ex))
+
+
+class AsyncXmlRpcTransport(AsyncTransportMixin, XmlRpcTransport):
+    """XML-RPC transport for asyncio.
+
+    :param int max_connections: how many connections can be open at once, which is also
+        how many API calls can be in flight at once.
+    """
+
+    def __init__(self, endpoint_url=None, timeout=None, proxy=None, user_agent=None, verify=True,
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        super().__init__(endpoint_url=endpoint_url, timeout=timeout, proxy=proxy,
+                         user_agent=user_agent, verify=verify)
+        self.max_connections = max_connections
+
+    async def __call__(self, request):  # pylint: disable=invalid-overridden-method
+        """Makes a SoftLayer API call against the XML-RPC endpoint.
+
+        :param request request: Request object
+        """
+        self.prepare_request(request)
+        status, reason, url, headers, body = await self._send('POST', request, data=request.payload.encode())
+        if status >= 400:
+            err_message = f"{status} Error: {reason} for url: {url} :: {body}"
+            error = exceptions.TransportError(status, err_message)
+            error.retry_after = get_retry_after(headers)
+            raise error
+        return decode_response(body, headers, self.decoder)
+
+
+class AsyncRestTransport(AsyncTransportMixin, RestTransport):
+    """REST transport for asyncio.
+
+    :param int max_connections: how many connections can be open at once, which is also
+        how many API calls can be in flight at once.
+    """
+
+    def __init__(self, endpoint_url=None, timeout=None, proxy=None, user_agent=None, verify=True,
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        super().__init__(endpoint_url=endpoint_url, timeout=timeout, proxy=proxy,
+                         user_agent=user_agent, verify=verify)
+        self.max_connections = max_connections
+
+    async def __call__(self, request):  # pylint: disable=invalid-overridden-method
+        """Makes a SoftLayer API call against the REST endpoint.
+
+        :param request request: Request object
+        """
+        method = self.prepare_request(request)
+        status, _, url, headers, body = await self._send(method, request,
+                                                         params=request.params,
+                                                         data=request.payload)
+        request.url = url
+        text = body.decode('utf-8')
+        if status >= 400:
+            error = self.decode_error(status, text)
+            error.retry_after = get_retry_after(headers)
+            raise error
+        return self.decode_response(request, status, text, headers)
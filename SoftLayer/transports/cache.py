@@ -0,0 +1,244 @@
+"""
+    SoftLayer.transports.cache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Caching transport, used to avoid asking the API for the same read-only data over and over.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+
+from .transport import CHECKING_PREFIXES
+from .transport import MUTATING_PREFIXES
+from .transport import service_name
+from .transport import SoftLayerListResult
+
+
+def get_endpoint(transport):
+    """The endpoint_url of a transport, or of the transports it wraps. None if none of them has one."""
+    # Bounded, in case something answers every attribute (a mock)
+    for _ in range(10):
+        endpoint = getattr(transport, 'endpoint_url', None)
+        if isinstance(endpoint, str):
+            return endpoint
+        transport = getattr(transport, 'transport', None)
+        if transport is None:
+            break
+    return None
+
+
+class CachingTransport(object):  # pylint: disable=too-many-instance-attributes
+    """Transport that caches the results of read-only API calls.
+
+    Only ``get*`` methods are cached, by default only the ones with a rule. Methods that change something
+    (createObject, placeOrder, editObject, deleteObject...) are never cached, and calling one removes
+    everything cached, since one service's change shows up in others' results.
+
+    :param transport: the transport to wrap
+    :param int ttl: number of seconds to keep the results of the get methods without a rule. 0, the default,
+        only caches methods that have a rule
+    :param dict rules: ttl overrides, keyed by 'Service::method' or 'Service'. A ttl of 0 disables caching.
+        Example: {'Product_Package': 3600, 'Account::getVirtualGuests': 0}
+    :param int max_entries: most results to keep in memory
+    :param int max_bytes: most memory (size of the JSON encoded results) to use, least recently used
+        results are dropped first
+    :param string cache_dir: if set, results are also saved in this directory, so they can be used
+        by another process (like the next slcli command)
+    """
+
+    def __init__(self, transport, ttl=0, rules=None, max_entries=1024, max_bytes=64 * 1024 * 1024,
+                 cache_dir=None):
+        self.transport = transport
+        self.ttl = ttl
+        self.rules = {}
+        for name, rule_ttl in (rules or {}).items():
+            service, _, method = name.partition('::')
+            self.rules[(service_name(service), method or None)] = rule_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.endpoint = get_endpoint(transport)
+        if cache_dir:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+        # key -> (expires, service, encoded result)
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, call):
+        """See Client.call for documentation."""
+        ttl = self.get_ttl(call)
+        if (call.method and call.method.startswith(MUTATING_PREFIXES)
+                and not call.method.startswith(CHECKING_PREFIXES)):
+            self.invalidate()
+        if not ttl:
+            return self.transport(call)
+
+        # Streamed results can only be read once, so they can't be cached
+        call.stream = False
+        key = self.cache_key(call, self.endpoint)
+        cached = self._get(key, call.service)
+        if cached is not None:
+            self.hits += 1
+            return _decode(cached)
+
+        self.misses += 1
+        result = self.transport(call)
+        try:
+            encoded = _encode(result)
+        except (TypeError, ValueError):
+            # Not JSON-able, so just don't cache it.
+            return result
+        self._set(key, call.service, encoded, time.time() + ttl)
+        return result
+
+    def get_ttl(self, call):
+        """How long the result of this call should be cached for, 0 if it shouldn't be."""
+        if not call.method or call.method.startswith(MUTATING_PREFIXES):
+            return 0
+        service = service_name(call.service or '')
+        if (service, call.method) in self.rules:
+            return self.rules[(service, call.method)]
+        if not call.method.startswith('get'):
+            return 0
+        return self.rules.get((service, None), self.ttl)
+
+    @staticmethod
+    def call_key(call):
+        """Every part of a call's request that can change its result.
+
+        That is its service, method, id, args, mask, filter, limit and offset. Who made the call, and where
+        it went, aren't part of it, see cache_key().
+        """
+        key = json.dumps([call.service, call.method, call.identifier, call.args, call.mask, call.filter,
+                          call.limit, call.offset], sort_keys=True, default=str)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def cache_key(call, endpoint=None):
+        """call_key() plus the endpoint and credentials of the call.
+
+        So accounts, users and endpoints that share a cache_dir never get each other's results.
+
+        :param string endpoint: the endpoint the call goes to, call.url is used if not given
+        """
+        key = json.dumps([CachingTransport.call_key(call), endpoint or call.url, call.headers, call.transport_user,
+                          call.transport_password, call.transport_headers], sort_keys=True, default=str)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def invalidate(self, service=None):
+        """Removes cached results, for just one service if given."""
+        if service is not None:
+            service = service_name(service)
+        with self._lock:
+            for key in list(self._entries):
+                if service is None or self._entries[key][1] == service:
+                    self._remove(key)
+        if self.cache_dir:
+            # The service is in the file names, so they don't need to be read
+            for filename in os.listdir(self.cache_dir):
+                if not filename.endswith('.tmp') and (service is None or filename.startswith(service + '.')):
+                    _remove_file(os.path.join(self.cache_dir, filename))
+
+    clear = invalidate
+
+    def get_stats(self):
+        """Returns cache hits, misses, entries and bytes used."""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._size}
+
+    def get_last_calls(self):
+        """Returns the wrapped transport's last calls, if it keeps track of them."""
+        return self.transport.get_last_calls()
+
+    def print_reproduceable(self, call):
+        """Prints a reproduceable debugging output"""
+        return self.transport.print_reproduceable(call)
+
+    def _get(self, key, service):
+        """Gets an unexpired encoded result from memory, or the cache_dir."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._entries.move_to_end(key)
+                    return entry[2]
+                self._remove(key)
+
+        if self.cache_dir:
+            expires, service, encoded = _read_file(self._path(key, service))
+            if encoded is not None:
+                self._set(key, service, encoded, expires, save=False)
+                return encoded
+        return None
+
+    def _set(self, key, service, encoded, expires, save=True):
+        """Saves an encoded result, dropping the least recently used results if over the size limits."""
+        if len(encoded) > self.max_bytes:
+            return
+        service = service_name(service or '')
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, service, encoded)
+            self._size += len(encoded)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+        if save and self.cache_dir:
+            path = self._path(key, service)
+            tmp_path = "%s.%s.tmp" % (path, threading.get_ident())
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({'expires': expires, 'service': service, 'result': encoded}, cache_file)
+            os.replace(tmp_path, path)
+
+    def _path(self, key, service):
+        """The cache_dir file of a key, named after its service."""
+        return os.path.join(self.cache_dir, '%s.%s' % (service_name(service or ''), key))
+
+    def _remove(self, key):
+        """Removes a key from memory, the lock needs to be held."""
+        entry = self._entries.pop(key)
+        self._size -= len(entry[2])
+
+
+def _encode(result):
+    """Results are stored as JSON strings, so a cache hit is always a fresh copy."""
+    if isinstance(result, SoftLayerListResult):
+        return json.dumps({'items': result, 'total_count': result.total_count})
+    return json.dumps({'result': result})
+
+
+def _decode(encoded):
+    """Turns an _encode()'d string back into a result."""
+    decoded = json.loads(encoded)
+    if 'items' in decoded:
+        return SoftLayerListResult(decoded['items'], decoded['total_count'])
+    return decoded['result']
+
+
+def _read_file(path):
+    """Reads a cache file, returns (expires, service, encoded result) or (None, None, None)."""
+    try:
+        with open(path, encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None, None, None
+    if data.get('expires', 0) <= time.time():
+        _remove_file(path)
+        return None, None, None
+    return data.get('expires'), data.get('service'), data.get('result')
+
+
+def _remove_file(path):
+    """Removes a cache file, if it is still there."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,136 @@
+"""
+    SoftLayer.transports.codec
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+    JSON encoding and decoding for the REST transports.
+
+    orjson (or ujson, for decoding) is used when it is installed, which is a lot faster than the
+    json module on large results. Without either the json module is used.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import base64
+import codecs
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+from .transport import ComplexEncoder
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def _default(obj):
+    """Base64 encodes bytes, same as ComplexEncoder."""
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode('utf-8')
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+def dumps(obj):
+    """Encodes obj as a JSON string, bytes are base64 encoded.
+
+    ujson is not used here since it encodes bytes as plain strings.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS  # pylint: disable=no-member
+        return orjson.dumps(obj, default=_default, option=option).decode('utf-8')  # pylint: disable=no-member
+    return json.dumps(obj, cls=ComplexEncoder)
+
+
+def loads(data):
+    """Decodes a JSON str or bytes, raises ValueError if it isn't valid JSON."""
+    if orjson is not None:
+        return orjson.loads(data)  # pylint: disable=no-member
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def stream_loads(chunks):
+    """Decodes a JSON document while it is being read.
+
+    :param chunks: iterable of bytes, like requests.Response.iter_content()
+    :returns: (True, generator of the items) if the document is an array, or (False, the decoded document).
+        Items are decoded one at a time, so only one item needs to be in memory at once.
+    :raises ValueError: if the document isn't valid JSON, for arrays this happens while iterating.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    text_chunks = (decoder.decode(chunk) for chunk in chunks)
+    buf = ''
+    for chunk in text_chunks:
+        buf += chunk
+        pos = _WHITESPACE.match(buf).end()
+        if pos < len(buf):
+            if buf[pos] == '[':
+                return True, _iter_array(text_chunks, buf, pos + 1)
+            break
+    buf += ''.join(text_chunks) + decoder.decode(b'', final=True)
+    return False, loads(buf)
+
+
+def _iter_array(text_chunks, buf, pos):
+    """Yields the items of a JSON array, starting after its [
+
+    Each item is decoded with the json module's C scanner as soon as the buffer holds all of it.
+    When it doesn't, more text is read until the unread part of the buffer has doubled before trying again,
+    so large items aren't decoded over and over.
+    """
+    exhausted = False
+    expect_item = True
+    first = True
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos >= len(buf):
+            chunk = next(text_chunks, None)
+            if chunk is None:
+                raise ValueError("Unexpected end of JSON array")
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+
+        char = buf[pos]
+        if not expect_item or (first and char == ']'):
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError("Expecting ',' delimiter: char %d" % pos)
+            pos += 1
+            expect_item = True
+            continue
+
+        try:
+            item, end = _DECODER.raw_decode(buf, pos)
+            # A number at the end of the buffer might continue in the next chunk
+            complete = end < len(buf) or exhausted
+        except ValueError:
+            if exhausted:
+                raise
+            complete = False
+
+        if not complete:
+            wanted = 2 * (len(buf) - pos)
+            buf = buf[pos:]
+            pos = 0
+            while len(buf) < wanted:
+                chunk = next(text_chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                buf += chunk
+            continue
+
+        yield item
+        pos = end
+        first = False
+        expect_item = False
@@ -27,6 +27,8 @@ def __call__(self, call):
         call.start_time = time.time()
 
         self.pre_transport_log(call)
+        # The whole result gets logged, so there is no point in streaming it
+        call.stream = False
         try:
             call.result = self.transport(call)
         except (exceptions.SoftLayerAPIError, exceptions.TransportError) as ex:
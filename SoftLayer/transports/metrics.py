@@ -0,0 +1,334 @@
+"""
+    SoftLayer.transports.metrics
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Metrics transport, keeps latency histograms and error counts for every API method.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import bisect
+import collections
+import logging
+import socket
+import threading
+import time
+
+from .transport import new_span_id
+
+#: Latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+#: Request and response size histogram buckets, in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Histogram(object):
+    """Counts observations into fixed buckets, so it never grows no matter how many values it sees.
+
+    :param buckets: upper bounds of the buckets, values over the last one go into an overflow bucket
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        """Adds a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, fraction):
+        """Estimates a quantile (0.5 for the median, 0.99 for p99) from the buckets, None if there are no values."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else self.min
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def mean(self):
+        """Average of the values, None if there are none."""
+        return self.sum / self.count if self.count else None
+
+    def cumulative(self):
+        """(upper bound, count of values <= bound) pairs, ending with ('+Inf', count), like Prometheus buckets."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class MethodStats(object):
+    """Everything recorded for one API method."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.latency = Histogram(buckets)
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.errors = collections.Counter()
+        self.in_flight = 0
+
+
+class Span(object):
+    """Record of a single API call, or of all the pages of an iter_call.
+
+    Pages of an iter_call have the iter_call's span_id as their parent_id.
+    """
+
+    __slots__ = ('name', 'span_id', 'parent_id', 'start_time', 'duration', 'error', 'attributes')
+
+    def __init__(self, name, span_id, parent_id=None, start_time=None, duration=None, error=None, attributes=None):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_time = start_time
+        self.duration = duration
+        self.error = error
+        self.attributes = attributes or {}
+
+    def to_dict(self):
+        """The span as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return "<Span %s %s (%s)>" % (self.name, self.span_id, self.duration)
+
+
+class StatsdSink(object):
+    """Sends call metrics to a StatsD server over UDP.
+
+    For each call this sends ``<prefix>.<service>.<method>.calls:1|c``, ``...duration:<ms>|ms``,
+    ``...request_bytes``/``...response_bytes`` counters and ``...errors.<ErrorClass>:1|c`` for failed calls.
+
+    :param string host: StatsD host
+    :param int port: StatsD port
+    :param string prefix: prefix for every metric name
+    """
+
+    def __init__(self, host='localhost', port=8125, prefix='softlayer.api'):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def lines(self, span):
+        """The StatsD lines for a span."""
+        name = "%s.%s" % (self.prefix, span.name.replace('::', '.'))
+        lines = ["%s.calls:1|c" % name, "%s.duration:%.3f|ms" % (name, span.duration * 1000)]
+        for attribute in ('request_bytes', 'response_bytes'):
+            if span.attributes.get(attribute) is not None:
+                lines.append("%s.%s:%d|c" % (name, attribute, span.attributes[attribute]))
+        if span.error:
+            lines.append("%s.errors.%s:1|c" % (name, span.error))
+        return lines
+
+    def __call__(self, span):
+        self.socket.sendto("\n".join(self.lines(span)).encode('utf-8'), self.address)
+
+
+class MetricsTransport(object):  # pylint: disable=too-many-instance-attributes
+    """Transport that keeps metrics for every API method, in a fixed amount of memory.
+
+    For each service and method it keeps a latency histogram, request and response size histograms,
+    error counts by exception class and how many calls are in flight. The last `max_spans` calls are kept as
+    spans, pages fetched by client.iter_call() are children of a span for the whole iteration.
+
+    :param transport: the transport to wrap
+    :param sinks: callables that are given the Span of every call when it finishes, like a StatsdSink
+    :param int max_spans: how many spans to keep
+    :param buckets: latency histogram buckets, in seconds
+    """
+
+    def __init__(self, transport, sinks=None, max_spans=1000, buckets=LATENCY_BUCKETS):
+        self.transport = transport
+        self.sinks = list(sinks or [])
+        self.buckets = buckets
+        self.spans = collections.deque(maxlen=max_spans)
+        self.methods = {}
+        self.in_flight = 0
+        self._parents = collections.OrderedDict()
+        self._max_parents = max_spans
+        self._lock = threading.Lock()
+
+    def __call__(self, call):
+        """See Client.call for documentation."""
+        stats = self._get_stats(call)
+        with self._lock:
+            stats.in_flight += 1
+            self.in_flight += 1
+
+        error = None
+        start_time = time.time()
+        start = time.perf_counter()
+        try:
+            return self.transport(call)
+        except Exception as ex:
+            error = type(ex).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            span = self._record(call, stats, start_time, duration, error)
+            for sink in self.sinks:
+                try:
+                    sink(span)
+                except Exception as ex:  # pylint: disable=broad-except
+                    LOGGER.warning("Metrics sink %r failed: %s", sink, ex)
+
+    def _get_stats(self, call):
+        """The MethodStats for a call, created the first time a method is called."""
+        key = (call.service, call.method)
+        stats = self.methods.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self.methods.setdefault(key, MethodStats(self.buckets))
+        return stats
+
+    def _record(self, call, stats, start_time, duration, error):
+        """Updates the metrics for a finished call, returns its Span."""
+        request_bytes = _size(call.payload)
+        response_bytes = getattr(call, 'response_size', None)
+        name = "%s::%s" % (call.service, call.method)
+        span = Span(name, new_span_id(), getattr(call, 'parent_id', None), start_time, duration, error,
+                    {'id': call.identifier, 'limit': call.limit, 'offset': call.offset,
+                     'request_bytes': request_bytes, 'response_bytes': response_bytes})
+
+        with self._lock:
+            stats.in_flight -= 1
+            self.in_flight -= 1
+            stats.latency.observe(duration)
+            if request_bytes is not None:
+                stats.request_bytes.observe(request_bytes)
+            if response_bytes is not None:
+                stats.response_bytes.observe(response_bytes)
+            if error:
+                stats.errors[error] += 1
+            if span.parent_id:
+                self._add_to_parent(span)
+            self.spans.append(span)
+        return span
+
+    def _add_to_parent(self, span):
+        """Creates or extends the span of the iter_call a page belongs to, the lock needs to be held."""
+        parent = self._parents.get(span.parent_id)
+        if parent is None:
+            parent = Span(span.name, span.parent_id, start_time=span.start_time, attributes={'pages': 0})
+            self._parents[span.parent_id] = parent
+            if len(self._parents) > self._max_parents:
+                self._parents.popitem(last=False)
+            self.spans.append(parent)
+        parent.attributes['pages'] += 1
+        parent.duration = max(parent.duration or 0, span.start_time + span.duration - parent.start_time)
+        if span.error:
+            parent.error = span.error
+
+    def get_summary(self):
+        """Returns a dict for every method called, sorted by total time spent in it.
+
+        Each dict has service, method, calls, errors, mean, p50, p99, max and total (seconds),
+        request_bytes and response_bytes (totals).
+        """
+        summary = []
+        with self._lock:
+            for (service, method), stats in self.methods.items():
+                if not stats.latency.count:
+                    continue
+                summary.append({
+                    'service': service,
+                    'method': method,
+                    'calls': stats.latency.count,
+                    'errors': sum(stats.errors.values()),
+                    'mean': stats.latency.mean(),
+                    'p50': stats.latency.quantile(0.5),
+                    'p99': stats.latency.quantile(0.99),
+                    'max': stats.latency.max,
+                    'total': stats.latency.sum,
+                    'request_bytes': stats.request_bytes.sum,
+                    'response_bytes': stats.response_bytes.sum,
+                })
+        return sorted(summary, key=lambda row: row['total'], reverse=True)
+
+    def get_spans(self):
+        """Returns the kept spans, oldest first."""
+        with self._lock:
+            return list(self.spans)
+
+    def to_prometheus(self):
+        """Returns the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            methods = sorted(self.methods.items(), key=lambda item: (item[0][0] or '', item[0][1] or ''))
+            histograms = (
+                ('softlayer_api_request_duration_seconds', 'Time taken by API calls.', 'latency'),
+                ('softlayer_api_request_size_bytes', 'Size of API call requests.', 'request_bytes'),
+                ('softlayer_api_response_size_bytes', 'Size of API call responses.', 'response_bytes'),
+            )
+            for metric, description, attribute in histograms:
+                lines += ["# HELP %s %s" % (metric, description), "# TYPE %s histogram" % metric]
+                for key, stats in methods:
+                    histogram = getattr(stats, attribute)
+                    labels = _labels(key)
+                    for bound, count in histogram.cumulative():
+                        lines.append('%s_bucket{%s,le="%s"} %d' % (metric, labels, bound, count))
+                    lines.append('%s_sum{%s} %s' % (metric, labels, histogram.sum))
+                    lines.append('%s_count{%s} %d' % (metric, labels, histogram.count))
+
+            lines += ["# HELP softlayer_api_errors_total API calls that failed, by exception class.",
+                      "# TYPE softlayer_api_errors_total counter"]
+            for key, stats in methods:
+                for error, count in sorted(stats.errors.items()):
+                    lines.append('softlayer_api_errors_total{%s,error="%s"} %d' % (_labels(key), error, count))
+
+            lines += ["# HELP softlayer_api_in_flight API calls waiting for a response.",
+                      "# TYPE softlayer_api_in_flight gauge"]
+            for key, stats in methods:
+                lines.append('softlayer_api_in_flight{%s} %d' % (_labels(key), stats.in_flight))
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Forgets all metrics and spans."""
+        with self._lock:
+            self.methods = {}
+            self.spans.clear()
+            self._parents.clear()
+
+    def get_last_calls(self):
+        """Returns the wrapped transport's last calls, if it keeps track of them."""
+        return self.transport.get_last_calls()
+
+    def print_reproduceable(self, call):
+        """Prints a reproduceable debugging output"""
+        return self.transport.print_reproduceable(call)
+
+
+def _size(payload):
+    """Size of a request payload in bytes, None if there is no payload."""
+    if payload is None:
+        return None
+    if isinstance(payload, str):
+        return len(payload.encode('utf-8'))
+    return len(payload)
+
+
+def _labels(key):
+    """Prometheus labels for a (service, method) key."""
+    return 'service="%s",method="%s"' % (_escape(key[0]), _escape(key[1]))
+
+
+def _escape(value):
+    """Escapes a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
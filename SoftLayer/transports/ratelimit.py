@@ -0,0 +1,224 @@
+"""
+    SoftLayer.transports.ratelimit
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Rate limiting transport, used to make many API calls without getting throttled.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import random
+import threading
+import time
+
+from SoftLayer import exceptions
+
+from .transport import MUTATING_PREFIXES
+from .transport import service_name
+
+#: HTTP statuses that are worth trying again
+RETRIABLE_STATUSES = (429, 502, 503, 504)
+
+#: HTTP statuses that mean we are going too fast
+THROTTLED_STATUSES = (429, 503)
+
+
+class TokenBucket(object):
+    """Allows `rate` calls per second, with bursts of up to `burst` calls.
+
+    Callers that are over the rate are told how long to wait, in the order they asked, so
+    waiting callers start one after the other instead of all at once.
+
+    :param float rate: calls per second, None for no limit
+    :param int burst: how many calls can be made at once after being idle, defaults to the rate
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.capacity = float(burst or max(rate or 1, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token, returns how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate is None:
+                return max(self.updated - now, 0.0)
+            if now > self.updated:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+            self.tokens -= 1
+            return max(self.updated - now, 0.0) + max(-self.tokens, 0.0) / self.rate
+
+    def pause(self, seconds):
+        """Hands out no tokens for `seconds`, then starts filling up again from empty."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self.updated:
+                self.updated = until
+                self.tokens = min(self.tokens, 0.0)
+
+
+class AdaptiveConcurrency(object):
+    """Limits how many calls can be in flight, adjusted with AIMD.
+
+    Every successful call adds 1/limit to the limit (about +1 per round of calls), every throttled call halves it.
+    Calls that were already in flight when the limit was lowered don't lower it again.
+
+    :param int initial: starting limit
+    :param int minimum: lowest limit
+    :param int maximum: highest limit
+    :param float decrease: what the limit is multiplied by when throttled
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=32, decrease=0.5):
+        if minimum <= 0 or maximum < minimum:
+            raise ValueError("Concurrency limits need 0 < minimum <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self._last_decrease = float('-inf')
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Waits for a free slot, returns when the call started (for release)."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started, throttled=False):
+        """Frees the slot taken by acquire() and adjusts the limit."""
+        with self._condition:
+            if throttled:
+                if started >= self._last_decrease:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._last_decrease = time.monotonic()
+            elif self.in_flight >= int(self.limit):
+                # Only grow when the limit is what's holding calls back
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+
+class RateLimitingTransport(object):  # pylint: disable=too-many-instance-attributes
+    """Transport that spaces out API calls and retries the ones that were throttled.
+
+    Calls wait for a token from the endpoint's bucket (and the bucket of their service, if it has a limit),
+    then for a free concurrency slot. Calls that fail with HTTP 429, 502, 503, 504 or a connection error are tried
+    again after an exponential backoff with full jitter, or after the Retry-After the API asked for. A Retry-After
+    also pauses the buckets, so other threads wait instead of piling on.
+
+    Calls that change something (createObject, placeOrder...) are only retried when they were throttled (429),
+    since other errors don't say if the change was made.
+
+    All threads using the same client share one of these, so it works with client.cf_call() and client.batch().
+
+    :param transport: the transport to wrap
+    :param float rate: calls per second to the endpoint, None for no limit
+    :param int burst: calls that can be made at once after being idle, defaults to the rate
+    :param dict limits: calls per second for a service or method, keyed by 'Service::method' or 'Service'.
+        Example: {'Product_Order': 1, 'Virtual_Guest::getObject': 5}
+    :param int max_retries: how many times to try a failed call again
+    :param float backoff: longest wait before the first retry, doubles for each retry after that
+    :param float max_backoff: longest wait between retries
+    :param int concurrency: how many calls can be in flight at first
+    :param int min_concurrency: fewest calls in flight when throttled
+    :param int max_concurrency: most calls in flight
+    """
+
+    def __init__(self, transport, rate=None, burst=None, limits=None, max_retries=5, backoff=0.5, max_backoff=30,
+                 concurrency=4, min_concurrency=1, max_concurrency=32):
+        self.transport = transport
+        self.bucket = TokenBucket(rate, burst)
+        self.limits = {}
+        for name, limit in (limits or {}).items():
+            service, _, method = name.partition('::')
+            self.limits[(service_name(service), method or None)] = TokenBucket(limit)
+        self.concurrency = AdaptiveConcurrency(concurrency, min_concurrency, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, call):
+        """See Client.call for documentation."""
+        buckets = self.get_buckets(call)
+        attempt = 0
+        while True:
+            wait = max(bucket.reserve() for bucket in buckets)
+            if wait > 0:
+                time.sleep(wait)
+
+            started = self.concurrency.acquire()
+            throttled = False
+            self._count('calls')
+            try:
+                return self.transport(call)
+            except exceptions.SoftLayerAPIError as ex:
+                throttled = ex.faultCode in THROTTLED_STATUSES
+                if throttled:
+                    self._count('throttled')
+                if attempt >= self.max_retries or not self.is_retriable(call, ex):
+                    raise
+                delay = self.get_delay(attempt, ex)
+                if ex.retry_after:
+                    for bucket in buckets:
+                        bucket.pause(ex.retry_after)
+            finally:
+                self.concurrency.release(started, throttled)
+
+            self._count('retries')
+            attempt += 1
+            time.sleep(delay)
+
+    def _count(self, name):
+        """Adds one to the calls, retries or throttled counter, every thread using the client updates them."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get_buckets(self, call):
+        """The buckets a call needs a token from."""
+        service = service_name(call.service or '')
+        buckets = [self.bucket]
+        for key in ((service, call.method), (service, None)):
+            if key in self.limits:
+                buckets.append(self.limits[key])
+        return buckets
+
+    @staticmethod
+    def is_retriable(call, error):
+        """If a failed call should be tried again."""
+        if error.faultCode == 429:
+            return True
+        if call.method and call.method.startswith(MUTATING_PREFIXES):
+            return False
+        if isinstance(error, exceptions.TransportError) and error.faultCode == 0:
+            return True
+        return error.faultCode in RETRIABLE_STATUSES
+
+    def get_delay(self, attempt, error):
+        """Seconds to wait before trying again, Retry-After if the API sent one, otherwise full jitter backoff."""
+        if error.retry_after is not None:
+            return error.retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def get_stats(self):
+        """Returns how many calls were made, retried and throttled, and the current concurrency limit."""
+        with self._lock:
+            return {'calls': self.calls, 'retries': self.retries, 'throttled': self.throttled,
+                    'concurrency': int(self.concurrency.limit)}
+
+    def get_last_calls(self):
+        """Returns the wrapped transport's last calls, if it keeps track of them."""
+        return self.transport.get_last_calls()
+
+    def print_reproduceable(self, call):
+        """Prints a reproduceable debugging output"""
+        return self.transport.print_reproduceable(call)
@@ -0,0 +1,175 @@
+"""
+    SoftLayer.transports.replay
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Recording and replaying transports, to run the same API calls again without a network.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import collections
+import gzip
+import threading
+import time
+
+from SoftLayer import exceptions
+
+from . import codec
+from .cache import CachingTransport
+from .transport import SoftLayerListResult
+
+
+def _read(path):
+    """The complete lines of a recording, gzip compressed when its name ends with .gz.
+
+    A process killed while saving a call can leave half a line (or half a gzip member) at the end, that call
+    is skipped.
+    """
+    if path.endswith('.gz'):
+        recording = gzip.open(path, 'rb')
+    else:
+        recording = open(path, 'rb')  # pylint: disable=consider-using-with
+    with recording:
+        try:
+            for line in recording:
+                if line.endswith(b'\n'):
+                    yield line
+        except EOFError:
+            return
+
+
+class RecordingTransport(object):
+    """Transport that saves every call and its result (or error) to a file, for ReplayTransport.
+
+    Each call is a line of JSON, keyed by everything in the request that can change its result: service,
+    method, id, args, mask, filter, limit and offset (CachingTransport.call_key()). Who made the call isn't
+    part of the key, so a recording can be replayed without credentials. How long the call took is saved
+    too. Calls are added to the end of the file as they are made, so one file can hold several runs. In a .gz
+    file each call is a gzip member of its own, the calls saved before the process is killed can be replayed.
+
+    Recordings hold real account data, keep them somewhere private.
+
+    :param transport: the transport to wrap
+    :param string path: file to save calls in, gzip compressed if it ends with .gz
+    """
+
+    def __init__(self, transport, path):
+        self.transport = transport
+        self.path = path
+        self.recorded = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __call__(self, call):
+        """See Client.call for documentation."""
+        # A stream can only be read once, the result needs to be read here to be saved
+        call.stream = False
+        # Before the call, transports can change it (the mask, for one)
+        key = CachingTransport.call_key(call)
+        start = time.monotonic()
+        try:
+            result = self.transport(call)
+        except exceptions.SoftLayerAPIError as ex:
+            self.record(key, call, time.monotonic() - start, error=ex)
+            raise
+        self.record(key, call, time.monotonic() - start, result=result)
+        return result
+
+    def record(self, key, call, seconds, result=None, error=None):
+        """Adds a call to the recording, key is CachingTransport.call_key(call)."""
+        entry = {'key': key, 'service': call.service, 'method': call.method, 'id': call.identifier,
+                 'seconds': round(seconds, 6)}
+        if error is not None:
+            entry['error'] = {'type': type(error).__name__, 'code': error.faultCode, 'message': error.faultString}
+        elif isinstance(result, SoftLayerListResult):
+            entry['items'] = result
+            entry['total_count'] = result.total_count
+        else:
+            entry['result'] = result
+        line = codec.dumps(entry).encode('utf-8') + b'\n'
+        if self.path.endswith('.gz'):
+            line = gzip.compress(line)
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab')  # pylint: disable=consider-using-with
+            self._file.write(line)
+            # Only the call being saved is lost if the process is killed
+            self._file.flush()
+            self.recorded += 1
+
+    def close(self):
+        """Closes the recording file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def get_last_calls(self):
+        """Returns the wrapped transport's last calls, if it keeps track of them."""
+        return self.transport.get_last_calls()
+
+    def print_reproduceable(self, call):
+        """Prints a reproduceable debugging output"""
+        return self.transport.print_reproduceable(call)
+
+
+class ReplayTransport(object):
+    """Transport that answers calls from a RecordingTransport's file, without making any API calls.
+
+    A call made more than once while recording gets its answers back in the same order, then the last
+    answer over and over. A call that wasn't recorded raises a SoftLayerAPIError with a faultCode of 404,
+    like a FixtureTransport does for a missing fixture.
+
+    :param string path: a file saved by RecordingTransport
+    :param float latency: how much of each call's recorded time to wait before answering. 0 answers right
+        away, 1 takes as long as the real call did.
+    """
+
+    def __init__(self, path, latency=0):
+        self.path = path
+        self.latency = latency
+        # key -> recorded entries, and how many of them have been used
+        self.entries = collections.defaultdict(list)
+        self._served = collections.Counter()
+        self._lock = threading.Lock()
+        for line in _read(path):
+            if line.strip():
+                entry = codec.loads(line)
+                self.entries[entry['key']].append(entry)
+
+    def __call__(self, call):
+        """See Client.call for documentation."""
+        key = CachingTransport.call_key(call)
+        with self._lock:
+            entries = self.entries.get(key)
+            if not entries:
+                raise exceptions.SoftLayerAPIError(
+                    404, "%s::%s(id=%s) was not recorded in %s" % (call.service, call.method, call.identifier,
+                                                                   self.path))
+            entry = entries[min(self._served[key], len(entries) - 1)]
+            self._served[key] += 1
+
+        if self.latency:
+            time.sleep(entry['seconds'] * self.latency)
+        if 'error' in entry:
+            raise _error(entry['error'])
+        if 'items' in entry:
+            return SoftLayerListResult(entry['items'], entry['total_count'])
+        return entry['result']
+
+    def reset(self):
+        """Starts answering repeated calls from their first recorded answer again."""
+        with self._lock:
+            self._served.clear()
+
+    @staticmethod
+    def print_reproduceable(call):
+        """Not Implemented"""
+        return call.service
+
+
+def _error(recorded):
+    """The exception a recorded error was, SoftLayerAPIError if it isn't one of its subclasses."""
+    error_class = getattr(exceptions, recorded.get('type', ''), None)
+    if not (isinstance(error_class, type) and issubclass(error_class, exceptions.SoftLayerAPIError)):
+        error_class = exceptions.SoftLayerAPIError
+    return error_class(recorded['code'], recorded['message'])
@@ -13,11 +13,17 @@
 from SoftLayer import consts
 from SoftLayer import exceptions
 
+from . import codec
 from .transport import _format_object_mask
 from .transport import _proxies_dict
-from .transport import ComplexEncoder
+from .transport import get_connection_stats
+from .transport import get_retry_after
 from .transport import get_session
 from .transport import SoftLayerListResult
+from .transport import StreamingListResult
+
+#: How many bytes of the response body are read and decoded at a time when streaming
+CHUNK_SIZE = 64 * 1024
 
 REST_SPECIAL_METHODS = {
     # 'deleteObject': 'DELETE',
@@ -28,20 +34,28 @@
 }
 
 
-class RestTransport(object):
+class RestTransport(object):  # pylint: disable=too-many-instance-attributes
     """REST transport.
 
     REST calls should mostly work, but is not fully tested.
     XML-RPC should be used when in doubt
+
+    :param bool stream: decode list results while they are being downloaded, for callers that can
+        handle that (like iter_call). Their items can be used before the whole page has arrived,
+        and only one item is decoded in memory at a time.
     """
 
-    def __init__(self, endpoint_url=None, timeout=None, proxy=None, user_agent=None, verify=True):
+    def __init__(self, endpoint_url=None, timeout=None, proxy=None, user_agent=None, verify=True,
+                 session_options=None, stream=False):
 
         self.endpoint_url = (endpoint_url or consts.API_PUBLIC_ENDPOINT_REST).rstrip('/')
         self.timeout = timeout or None
         self.proxy = proxy
         self.user_agent = user_agent or consts.USER_AGENT
         self.verify = verify
+        #: Connection pool and retry settings, see transports.transport.get_session
+        self.session_options = session_options or {}
+        self.stream = stream
         self._client = None
         self.logger = logging.getLogger(__name__)
 
@@ -50,9 +64,13 @@ def client(self):
         """Returns client session object"""
 
         if self._client is None:
-            self._client = get_session(self.user_agent)
+            self._client = get_session(self.user_agent, self.endpoint_url, **self.session_options)
         return self._client
 
+    def get_connection_stats(self):
+        """Returns how many requests were made, and how many needed a new connection."""
+        return get_connection_stats(self.client)
+
     def __call__(self, request):
         """Makes a SoftLayer API call against the REST endpoint.
 
@@ -61,6 +79,56 @@ def __call__(self, request):
 
         :param request request: Request object
         """
+        method = self.prepare_request(request)
+
+        auth = None
+        if request.transport_user:
+            auth = requests.auth.HTTPBasicAuth(
+                request.transport_user,
+                request.transport_password,
+            )
+
+        stream = self.stream and request.stream
+        try:
+            resp = self.client.request(method, request.url,
+                                       auth=auth,
+                                       headers=request.transport_headers,
+                                       params=request.params,
+                                       data=request.payload,
+                                       timeout=self.timeout,
+                                       verify=request.verify,
+                                       cert=request.cert,
+                                       proxies=_proxies_dict(self.proxy),
+                                       **({'stream': True} if stream else {}))
+
+            request.url = resp.url
+
+            resp.raise_for_status()
+
+            if stream:
+                # Lists are still being read when this returns, so only the Content-Length is known
+                content_length = resp.headers.get('Content-Length')
+                request.response_size = int(content_length) if content_length else None
+                return self.decode_stream(request, resp)
+            request.response_size = len(resp.content)
+            return self.decode_response(request, resp.status_code, resp.text, resp.headers)
+        except requests.HTTPError as ex:
+            request.url = ex.response.url
+            error = self.decode_error(ex.response.status_code, ex.response.text)
+            error.retry_after = get_retry_after(ex.response.headers)
+            raise error from ex
+        except requests.RequestException as ex:
+            raise exceptions.TransportError(0, str(ex))
+
+    def prepare_request(self, request):
+        """Fills in the url, params and payload of a request.
+
+        This is everything needed to send a request except the HTTP call itself, so it
+        can be shared with transports that use a different HTTP library.
+
+        :param request request: Request object
+        :returns: the HTTP method to use for this request
+        """
         params = request.headers.copy()
         if request.mask:
             request.mask = _format_object_mask(request.mask)
@@ -79,13 +147,6 @@ def __call__(self, request):
         # This handles any edge cases on the REST api.
         request.special_rest_params()
 
-        auth = None
-        if request.transport_user:
-            auth = requests.auth.HTTPBasicAuth(
-                request.transport_user,
-                request.transport_password,
-            )
-
         method = REST_SPECIAL_METHODS.get(request.method)
 
         if method is None:
@@ -99,7 +160,7 @@ def __call__(self, request):
             body['parameters'] = request.args
 
         if body:
-            request.payload = json.dumps(body, cls=ComplexEncoder)
+            request.payload = codec.dumps(body)
 
         url_parts = [self.endpoint_url, request.service]
         if request.identifier is not None:
@@ -113,49 +174,73 @@ def __call__(self, request):
         # Prefer the request setting, if it's not None
         if request.verify is None:
             request.verify = self.verify
+        return method
+
+    def decode_response(self, request, status_code, text, headers):
+        """Turns the body of a successful REST response into a python result.
+
+        :param request request: Request object, its result property will be set
+        :param int status_code: HTTP status code of the response
+        :param string text: response body
+        :param headers: HTTP response headers, used to read softlayer-total-items
+        """
+        if text == "":
+            raise exceptions.SoftLayerAPIError(status_code, "Empty response.")
         try:
-            resp = self.client.request(method, request.url,
-                                       auth=auth,
-                                       headers=request.transport_headers,
-                                       params=request.params,
-                                       data=request.payload,
-                                       timeout=self.timeout,
-                                       verify=request.verify,
-                                       cert=request.cert,
-                                       proxies=_proxies_dict(self.proxy))
+            result = codec.loads(text)
+        except ValueError as json_ex:
+            self.logger.warning(json_ex)
+            raise exceptions.SoftLayerAPIError(status_code, str(text))
 
-            request.url = resp.url
+        request.result = result
 
-            resp.raise_for_status()
+        if isinstance(result, list):
+            return SoftLayerListResult(result, int(headers.get('softlayer-total-items', 0)))
+        return result
 
-            if resp.text != "":
-                try:
-                    result = json.loads(resp.text)
-                except ValueError as json_ex:
-                    self.logger.warning(json_ex)
-                    raise exceptions.SoftLayerAPIError(resp.status_code, str(resp.text))
-            else:
-                raise exceptions.SoftLayerAPIError(resp.status_code, "Empty response.")
+    def decode_stream(self, request, resp):
+        """Decodes a streamed response, list results are decoded while they are iterated over.
 
+        :param request request: Request object, its result property will be set for non list results
+        :param resp: the requests.Response, which must have been made with stream=True
+        """
+        try:
+            is_list, result = codec.stream_loads(resp.iter_content(CHUNK_SIZE))
+        except ValueError as json_ex:
+            resp.close()
+            self.logger.warning(json_ex)
+            raise exceptions.SoftLayerAPIError(resp.status_code, "Unable to decode response: %s" % json_ex)
+
+        if not is_list:
+            resp.close()
             request.result = result
+            return result
+        total = int(resp.headers.get('softlayer-total-items', 0))
+        return StreamingListResult(self._stream_items(result, resp.status_code), total, close=resp.close)
 
-            if isinstance(result, list):
-                return SoftLayerListResult(result, int(resp.headers.get('softlayer-total-items', 0)))
-            else:
-                return result
-        except requests.HTTPError as ex:
-            try:
-                message = json.loads(ex.response.text)['error']
-                request.url = ex.response.url
-            except ValueError as json_ex:
-                if ex.response.text == "":
-                    raise exceptions.SoftLayerAPIError(resp.status_code, "Empty response.")
-                self.logger.warning(json_ex)
-                raise exceptions.SoftLayerAPIError(resp.status_code, ex.response.text)
-
-            raise exceptions.SoftLayerAPIError(ex.response.status_code, message)
-        except requests.RequestException as ex:
-            raise exceptions.TransportError(0, str(ex))
+    def _stream_items(self, items, status_code):
+        """Turns JSON errors in the middle of a streamed list into SoftLayerAPIErrors."""
+        try:
+            yield from items
+        except ValueError as json_ex:
+            self.logger.warning(json_ex)
+            raise exceptions.SoftLayerAPIError(status_code, "Unable to decode response: %s" % json_ex) from json_ex
+
+    def decode_error(self, status_code, text):
+        """Builds the exception for a REST response with an HTTP error status.
+
+        :param int status_code: HTTP status code of the response
+        :param string text: response body
+        :returns: SoftLayerAPIError
+        """
+        try:
+            message = codec.loads(text)['error']
+        except ValueError as json_ex:
+            if text == "":
+                return exceptions.SoftLayerAPIError(status_code, "Empty response.")
+            self.logger.warning(json_ex)
+            return exceptions.SoftLayerAPIError(status_code, text)
+        return exceptions.SoftLayerAPIError(status_code, message)
 
     @staticmethod
     def print_reproduceable(request):
@@ -6,29 +6,170 @@
     :license: MIT, see LICENSE for more details.
 """
 import base64
+import datetime
+import email.utils
 import json
+import random
+import socket
+import threading
+
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
 
 from SoftLayer import utils
 
+#: Sessions shared between transports, keyed by endpoint and session options. See get_session()
+_SHARED_SESSIONS = {}
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+#: Methods that change something. The caching transport never caches them and clears the whole cache when
+#: one is called, a Virtual_Guest::createObject changes what Account::getVirtualGuests returns. The rate
+#: limiting transport only retries them when they were throttled.
+MUTATING_PREFIXES = (
+    'create', 'place', 'edit', 'delete', 'set', 'add', 'remove', 'cancel', 'update', 'reload', 'power',
+    'reboot', 'verify', 'attach', 'detach', 'assign', 'unassign', 'enable', 'disable', 'upgrade', 'restore',
+    'activate', 'deactivate', 'migrate', 'import', 'export', 'send', 'execute', 'rescue', 'authorize',
+    'deauthorize', 'allow', 'disallow', 'route', 'unroute', 'request', 'mark', 'toggle', 'save', 'resume',
+    'pause', 'refresh',
+)
+
+#: Mutating methods that only check a change without making it, they don't clear the cache
+CHECKING_PREFIXES = ('verify',)
 
-def get_session(user_agent):
-    """Sets up urllib sessions"""
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that turns on TCP keep-alive for its sockets.
+
+    This keeps idle pooled connections from being silently dropped by firewalls or NAT, which
+    would otherwise force a new TCP and TLS handshake on the next request.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', HTTPConnection.default_socket_options +
+                          [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        super().init_poolmanager(*args, **kwargs)
+
+
+def get_session(user_agent, endpoint_url=None, pool_connections=10, pool_maxsize=10, pool_block=False,
+                retries=None, backoff_factor=1, keep_alive=True, share_session=True):
+    """Sets up urllib sessions
+
+    :param string user_agent: User-Agent header for every request made with this session
+    :param string endpoint_url: When set (and share_session is True) every transport for this endpoint
+        with the same options gets the same session, and so the same connection pool.
+    :param int pool_connections: how many hosts to keep connection pools for
+    :param int pool_maxsize: how many connections to keep open to each host. If you make more concurrent
+        calls than this, the extra connections are closed after they are used.
+    :param bool pool_block: wait for a free connection instead of opening more than pool_maxsize connections
+    :param retries: number of retries, or a urllib3 Retry object. Defaults to Retry(total=3, connect=1)
+    :param float backoff_factor: backoff factor for the retries, if retries is not a Retry object
+    :param bool keep_alive: reuse connections between requests and turn on TCP keep-alive.
+        False will close the connection after every request.
+    :param bool share_session: see endpoint_url
+    """
+    options = (pool_connections, pool_maxsize, pool_block, retries, backoff_factor, keep_alive)
+    if endpoint_url and share_session:
+        key = (endpoint_url, user_agent) + options
+        with _SHARED_SESSIONS_LOCK:
+            if key not in _SHARED_SESSIONS:
+                _SHARED_SESSIONS[key] = get_session(user_agent, None, *options)
+            return _SHARED_SESSIONS[key]
 
     client = requests.Session()
     client.headers.update({
         'Content-Type': 'application/json',
         'User-Agent': user_agent,
     })
-    retry = Retry(total=3, connect=1, backoff_factor=1)
-    adapter = HTTPAdapter(max_retries=retry)
+    if retries is None:
+        retry = Retry(total=3, connect=1, backoff_factor=backoff_factor)
+    elif isinstance(retries, Retry):
+        retry = retries
+    else:
+        retry = Retry(total=retries, connect=min(retries, 1), backoff_factor=backoff_factor)
+
+    adapter_class = HTTPAdapter
+    if keep_alive:
+        adapter_class = KeepAliveAdapter
+    else:
+        client.headers['Connection'] = 'close'
+    adapter = adapter_class(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                            pool_block=pool_block, max_retries=retry)
     client.mount('https://', adapter)
+    client.mount('http://', adapter)
     return client
 
 
+def get_connection_stats(session):
+    """Counts how many requests a session made, and how many of those needed a new connection.
+
+    If 'reused' is low compared to 'new_connections' when making concurrent calls, pool_maxsize
+    is probably too small.
+
+    :param session: a requests.Session from get_session()
+    :returns: dict with requests, new_connections and reused counts
+    """
+    stats = {'requests': 0, 'new_connections': 0, 'reused': 0}
+    # The same adapter is mounted for http:// and https://, don't count it twice.
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        poolmanager = getattr(adapter, 'poolmanager', None)
+        if poolmanager is None:
+            continue
+        for pool_key in poolmanager.pools.keys():
+            pool = poolmanager.pools.get(pool_key)
+            if pool is None:
+                continue
+            stats['requests'] += pool.num_requests
+            stats['new_connections'] += pool.num_connections
+    stats['reused'] = max(stats['requests'] - stats['new_connections'], 0)
+    return stats
+
+
+def get_retry_after(headers):
+    """Reads the Retry-After header of an HTTP response.
+
+    :param headers: response headers
+    :returns: how many seconds to wait before trying again, or None if the header isn't there or can't be parsed
+    """
+    value = (headers or {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max((retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+
+
+def count_bytes(chunks, request):
+    """Yields the chunks of a response body, adding up their size in request.response_size."""
+    request.response_size = 0
+    for chunk in chunks:
+        request.response_size += len(chunk)
+        yield chunk
+
+
+def service_name(name):
+    """The full name of a service, services can be written with or without the SoftLayer_ prefix."""
+    if name.startswith('SoftLayer_'):
+        return name
+    return 'SoftLayer_' + name
+
+
+def new_span_id():
+    """A random 16 character hex id, the same size as OpenTelemetry span ids."""
+    return "%016x" % random.getrandbits(64)
+
+
 # transports.Request does have a lot of instance attributes. :(
 # pylint: disable=too-many-instance-attributes
 class Request(object):
@@ -100,6 +241,16 @@ def __init__(self):
         #: Exception any exceptions that got caught
         self.exception = None
 
+        #: True if the caller can handle a list result that is decoded while it is iterated over,
+        #: see StreamingListResult
+        self.stream = False
+
+        #: Integer size of the response body in bytes, if the transport knows it
+        self.response_size = None
+
+        #: Span id of what this call is part of, like the iter_call it fetches a page for. See MetricsTransport
+        self.parent_id = None
+
     def __repr__(self):
         """Prints out what this call is all about"""
         pretty_mask = utils.clean_string(self.mask)
@@ -143,6 +294,37 @@ def get_total_items(self):
         return self.total_count
 
 
+class StreamingListResult(object):
+    """A SoftLayer API list result, whose items are decoded while it is iterated over.
+
+    These are only returned to callers that ask for them (see Request.stream), since they can
+    only be iterated over once and len() is only the number of items read so far.
+    """
+
+    def __init__(self, items, total_count=0, close=None):
+        #: total count of items that exist on the server.
+        self.total_count = total_count
+        self.count = 0
+        self._items = items
+        self._close = close
+
+    def __iter__(self):
+        try:
+            for item in self._items:
+                self.count += 1
+                yield item
+        finally:
+            if self._close is not None:
+                self._close()
+
+    def __len__(self):
+        return self.count
+
+    def get_total_items(self):
+        """A simple getter to totalCount, but its called getTotalItems since that is the header returned"""
+        return self.total_count
+
+
 def _proxies_dict(proxy):
     """Makes a proxy dict appropriate to pass to requests."""
     if not proxy:
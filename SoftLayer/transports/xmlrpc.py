@@ -5,8 +5,11 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import base64
+import decimal
 import re
 from string import Template
+from xml.parsers import expat
 import xmlrpc.client
 
 import requests
@@ -16,20 +19,204 @@
 
 from .transport import _format_object_mask
 from .transport import _proxies_dict
+from .transport import count_bytes
+from .transport import get_connection_stats
+from .transport import get_retry_after
 from .transport import get_session
 from .transport import SoftLayerListResult
 
 
-class XmlRpcTransport(object):
-    """XML-RPC transport."""
+# These exceptions are formed from the XML-RPC spec
+# http://xmlrpc-epi.sourceforge.net/specs/rfc.fault_codes.php
+FAULT_MAPPING = {
+    '-32700': exceptions.NotWellFormed,
+    '-32701': exceptions.UnsupportedEncoding,
+    '-32702': exceptions.InvalidCharacter,
+    '-32600': exceptions.SpecViolation,
+    '-32601': exceptions.MethodNotFound,
+    '-32602': exceptions.InvalidMethodParameters,
+    '-32603': exceptions.InternalError,
+    '-32500': exceptions.ApplicationError,
+    '-32400': exceptions.RemoteSystemError,
+    '-32300': exceptions.TransportError,
+}
 
-    def __init__(self, endpoint_url=None, timeout=None, proxy=None, user_agent=None, verify=True):
+
+#: How many bytes of the response body are read and parsed at a time when streaming
+CHUNK_SIZE = 64 * 1024
+
+
+class XmlRpcDecoder(object):
+    """Decodes an XML-RPC response all at once with xmlrpc.client.loads."""
+
+    #: Whether the decoder can parse the response while it is being read
+    streaming = False
+
+    def __call__(self, content):
+        """Returns the result of an XML-RPC response, raises xmlrpc.client.Fault for faults.
+
+        :param content: the response body, as bytes or an iterable of bytes
+        """
+        if not isinstance(content, (bytes, str)):
+            content = b''.join(content)
+        return xmlrpc.client.loads(content)[0][0]
+
+
+class StreamingXmlRpcDecoder(object):
+    """Decodes an XML-RPC response as it is read, with the expat C parser.
+
+    The response is fed to the parser a chunk at a time, and values are built as soon as their
+    element closes, so the raw body is never held in memory all at once and list results are built
+    item by item. Results are the same as XmlRpcDecoder, with less work done for each element.
+    """
+
+    streaming = True
+
+    def __call__(self, content):
+        """Returns the result of an XML-RPC response, raises xmlrpc.client.Fault for faults.
+
+        :param content: the response body, as bytes or an iterable of bytes
+        """
+        if isinstance(content, (bytes, str)):
+            content = (content,)
+        parser, get_result = _expat_unmarshaller()
+        for chunk in content:
+            parser.Parse(chunk, False)
+        parser.Parse(b'', True)
+        return get_result()
+
+
+def _expat_unmarshaller():
+    """Returns an expat parser that builds XML-RPC values, and a function to get the result from it.
+
+    This does the same thing as xmlrpc.client.Unmarshaller, but with closures and text buffering,
+    since these handlers run for every element of the response.
+    """
+    stack = []
+    marks = []
+    text = []
+    # [in a value without a type element, is a fault]
+    state = [False, False]
+    push = stack.append
+
+    def start(tag, _):
+        if tag == 'value':
+            state[0] = True
+        elif tag in ('struct', 'array'):
+            marks.append(len(stack))
+        text.clear()
+
+    def end(tag):
+        if tag == 'value':
+            if state[0]:
+                push(''.join(text))
+            state[0] = False
+            return
+        if tag in ('string', 'name'):
+            push(''.join(text))
+        elif tag in ('member', 'data', 'param', 'params'):
+            return
+        elif tag in ('int', 'i4', 'i8'):
+            push(int(''.join(text)))
+        elif tag == 'struct':
+            mark = marks.pop()
+            items = stack[mark:]
+            del stack[mark:]
+            push(dict(zip(items[::2], items[1::2])))
+        elif tag == 'array':
+            mark = marks.pop()
+            items = stack[mark:]
+            del stack[mark:]
+            push(items)
+        elif tag == 'fault':
+            state[1] = True
+            return
+        elif tag in _SCALARS:
+            push(_SCALARS[tag](''.join(text)))
+        elif ':' in tag:
+            # Namespaced extension types, like ex:nil
+            end(tag.split(':')[-1])
+            return
+        else:
+            return
+        state[0] = False
+
+    def get_result():
+        if state[1]:
+            raise xmlrpc.client.Fault(**stack[0])
+        return stack[0] if stack else None
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.buffer_size = CHUNK_SIZE
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = text.append
+    return parser, get_result
+
+
+def _boolean(text):
+    """XML-RPC booleans are 0 or 1"""
+    if text not in ('0', '1'):
+        raise TypeError("bad boolean value")
+    return text == '1'
+
+
+# The less common types, with how to build them from the element's text
+_SCALARS = {
+    'boolean': _boolean,
+    'double': float,
+    'float': float,
+    'bigdecimal': decimal.Decimal,
+    'i1': int,
+    'i2': int,
+    'biginteger': int,
+    'nil': lambda _: None,
+    'dateTime.iso8601': lambda text: xmlrpc.client.DateTime(text.strip()),
+    'base64': lambda text: xmlrpc.client.Binary(base64.decodebytes(text.encode('ascii'))),
+}
+
+DEFAULT_DECODER = StreamingXmlRpcDecoder()
+
+
+def decode_response(content, headers, decoder=None):
+    """Turns the body of an XML-RPC response into a python result.
+
+    :param content: raw XML-RPC response body, as bytes or an iterable of bytes
+    :param headers: HTTP response headers, used to read softlayer-total-items
+    :param decoder: the decoder to use, defaults to the StreamingXmlRpcDecoder
+    :returns: the result, list results are returned as a SoftLayerListResult
+    :raises SoftLayerAPIError: (or a subclass) when the response is an XML-RPC fault
+    """
+    decoder = decoder or DEFAULT_DECODER
+    try:
+        result = decoder(content)
+    except xmlrpc.client.Fault as ex:
+        _ex = FAULT_MAPPING.get(ex.faultCode, exceptions.SoftLayerAPIError)
+        raise _ex(ex.faultCode, ex.faultString) from ex
+    if isinstance(result, list):
+        return SoftLayerListResult(result, int(headers.get('softlayer-total-items', 0)))
+    return result
+
+
+class XmlRpcTransport(object):  # pylint: disable=too-many-instance-attributes
+    """XML-RPC transport.
+
+    :param decoder: turns response bodies into results, defaults to the StreamingXmlRpcDecoder.
+        Use XmlRpcDecoder() to decode with xmlrpc.client.loads instead.
+    """
+
+    def __init__(self, endpoint_url=None, timeout=None, proxy=None, user_agent=None, verify=True,
+                 session_options=None, decoder=None):
 
         self.endpoint_url = (endpoint_url or consts.API_PUBLIC_ENDPOINT).rstrip('/')
         self.timeout = timeout or None
         self.proxy = proxy
         self.user_agent = user_agent or consts.USER_AGENT
         self.verify = verify
+        #: Connection pool and retry settings, see transports.transport.get_session
+        self.session_options = session_options or {}
+        self.decoder = decoder or DEFAULT_DECODER
         self._client = None
 
     @property
@@ -37,21 +224,62 @@ def client(self):
         """Returns client session object"""
 
         if self._client is None:
-            self._client = get_session(self.user_agent)
+            self._client = get_session(self.user_agent, self.endpoint_url, **self.session_options)
         return self._client
 
+    def get_connection_stats(self):
+        """Returns how many requests were made, and how many needed a new connection."""
+        return get_connection_stats(self.client)
+
     def __call__(self, request):
         """Makes a SoftLayer API call against the XML-RPC endpoint.
 
         :param request request: Request object
         """
-        largs = list(request.args)
-        headers = request.headers
-
         auth = None
         if request.transport_user:
             auth = requests.auth.HTTPBasicAuth(request.transport_user, request.transport_password)
 
+        self.prepare_request(request)
+
+        try:
+            resp = self.client.request('POST', request.url,
+                                       data=request.payload.encode(),
+                                       auth=auth,
+                                       headers=request.transport_headers,
+                                       timeout=self.timeout,
+                                       verify=request.verify,
+                                       cert=request.cert,
+                                       proxies=_proxies_dict(self.proxy),
+                                       stream=self.decoder.streaming)
+            resp.raise_for_status()
+            try:
+                if self.decoder.streaming:
+                    chunks = count_bytes(resp.iter_content(CHUNK_SIZE), request)
+                    return decode_response(chunks, resp.headers, self.decoder)
+                request.response_size = len(resp.content)
+                return decode_response(resp.content, resp.headers, self.decoder)
+            finally:
+                resp.close()
+        except requests.HTTPError as ex:
+            err_message = f"{str(ex)} :: {ex.response.content}"
+            error = exceptions.TransportError(ex.response.status_code, err_message)
+            error.retry_after = get_retry_after(ex.response.headers)
+            raise error from ex
+        except requests.RequestException as ex:
+            raise exceptions.TransportError(0, str(ex))
+
+    def prepare_request(self, request):
+        """Fills in the url, payload and transport headers of a request.
+
+        This is everything needed to send a request except the HTTP call itself, so it
+        can be shared with transports that use a different HTTP library.
+
+        :param request request: Request object
+        """
+        largs = list(request.args)
+        headers = request.headers
+
         if request.identifier is not None:
             header_name = request.service + 'InitParameters'
             headers[header_name] = {'id': request.identifier}
@@ -86,45 +314,7 @@ def __call__(self, request):
         # Prefer the request setting, if it's not None
         if request.verify is None:
             request.verify = self.verify
-
-        try:
-            resp = self.client.request('POST', request.url,
-                                       data=request.payload.encode(),
-                                       auth=auth,
-                                       headers=request.transport_headers,
-                                       timeout=self.timeout,
-                                       verify=request.verify,
-                                       cert=request.cert,
-                                       proxies=_proxies_dict(self.proxy))
-
-            resp.raise_for_status()
-            result = xmlrpc.client.loads(resp.content)[0][0]
-            if isinstance(result, list):
-                return SoftLayerListResult(result, int(resp.headers.get('softlayer-total-items', 0)))
-            else:
-                return result
-        except xmlrpc.client.Fault as ex:
-            # These exceptions are formed from the XML-RPC spec
-            # http://xmlrpc-epi.sourceforge.net/specs/rfc.fault_codes.php
-            error_mapping = {
-                '-32700': exceptions.NotWellFormed,
-                '-32701': exceptions.UnsupportedEncoding,
-                '-32702': exceptions.InvalidCharacter,
-                '-32600': exceptions.SpecViolation,
-                '-32601': exceptions.MethodNotFound,
-                '-32602': exceptions.InvalidMethodParameters,
-                '-32603': exceptions.InternalError,
-                '-32500': exceptions.ApplicationError,
-                '-32400': exceptions.RemoteSystemError,
-                '-32300': exceptions.TransportError,
-            }
-            _ex = error_mapping.get(ex.faultCode, exceptions.SoftLayerAPIError)
-            raise _ex(ex.faultCode, ex.faultString) from ex
-        except requests.HTTPError as ex:
-            err_message = f"{str(ex)} :: {ex.response.content}"
-            raise exceptions.TransportError(ex.response.status_code, err_message)
-        except requests.RequestException as ex:
-            raise exceptions.TransportError(0, str(ex))
+        return request
 
     def print_reproduceable(self, request):
         """Prints out the minimal python code to reproduce a specific request
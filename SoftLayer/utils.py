@@ -9,15 +9,18 @@
 import copy
 import datetime
 from json import JSONDecoder
+import logging
 import re
+import socket
 import time
 
-from rich.console import Console
-from rich.theme import Theme
 from SoftLayer.CLI import exceptions
+from SoftLayer.decoration import RETRIABLE
 
 # pylint: disable=no-member, invalid-name
 
+LOGGER = logging.getLogger(__name__)
+
 UUID_RE = re.compile(r'^[0-9A-F]{8}-[0-9A-F]{4}-4[0-9A-F]{3}-[89AB][0-9A-F]{3}-[0-9A-F]{12}$', re.I)
 KNOWN_OPERATIONS = ['<=', '>=', '<', '>', '~', '!~', '*=', '^=', '$=', '_=']
 
@@ -314,6 +317,54 @@ def resolve_ids(identifier, resolvers):
     return []
 
 
+def resolve_ids_many(identifiers, find):
+    """Resolves many identifiers at once, with one search for each kind of identifier instead of one per identifier.
+
+    Numbers and GUIDs resolve to themselves. IP addresses are looked up as public IPs, then the ones that didn't
+    match as private IPs, then anything left as hostnames, like the managers' resolvers do one at a time.
+
+    :param list identifiers: ids, hostnames or IP addresses
+    :param find: function(field, values) that returns the objects whose `field` is one of `values`, each with
+                   'id' and `field`. field is 'primaryIpAddress', 'primaryBackendIpAddress' or 'hostname'.
+    :returns dict: {identifier: list of ids}, the list is empty for identifiers that didn't match anything
+    """
+    resolved = {}
+    pending = []
+    for identifier in identifiers:
+        if isinstance(identifier, int) or identifier.isdigit():
+            resolved[identifier] = [int(identifier)]
+        elif len(identifier) == 36 and UUID_RE.match(identifier):
+            resolved[identifier] = [identifier]
+        elif identifier not in pending:
+            pending.append(identifier)
+
+    addresses = [identifier for identifier in pending if _is_ip_address(identifier)]
+    for field, candidates in (('primaryIpAddress', addresses), ('primaryBackendIpAddress', addresses),
+                              ('hostname', pending)):
+        candidates = [candidate for candidate in candidates if candidate not in resolved]
+        if not candidates:
+            continue
+        matches = collections.defaultdict(list)
+        for item in find(field, candidates):
+            matches[item.get(field)].append(item['id'])
+        for candidate in candidates:
+            if candidate in matches:
+                resolved[candidate] = matches[candidate]
+
+    for identifier in pending:
+        resolved.setdefault(identifier, [])
+    return resolved
+
+
+def _is_ip_address(value):
+    """If value looks like an IPv4 address."""
+    try:
+        socket.inet_aton(value)
+    except (socket.error, UnicodeError, ValueError):
+        return False
+    return True
+
+
 class UTC(datetime.tzinfo):
     """UTC timezone."""
 
@@ -351,6 +402,50 @@ def is_ready(instance, pending=False):
     return False
 
 
+def wait_for_ready_many(ids, find, limit=3600, delay=10, pending=False, max_delay=60):
+    """Waits for many instances at once, yielding each one as soon as it is ready.
+
+    Each check looks at every instance still waiting with a single call to find(). Checks start `delay`
+    seconds apart, and get further apart (up to `max_delay`) while nothing becomes ready, then go back to
+    `delay` once something does. A check that fails with an error decoration.retry would retry is logged,
+    and the next check tries again.
+
+    :param list ids: instance ids
+    :param find: function(ids) that returns the instances with those ids, with the fields is_ready() looks at
+    :param int limit: the most seconds to wait
+    :param int delay: seconds between the first checks
+    :param bool pending: wait for every transaction to finish, see is_ready()
+    :param int max_delay: the most seconds between checks
+    :returns: generator of instances, in the order they became ready. Instances that weren't ready
+              within `limit` are left out.
+    """
+    waiting = list(dict.fromkeys(ids))
+    until = time.time() + limit
+    snooze = delay
+    while waiting:
+        try:
+            instances = {instance['id']: instance for instance in find(waiting)}
+        except RETRIABLE as error:
+            LOGGER.warning("Checking %d instances failed: %s", len(waiting), error)
+            instances = {}
+        ready = [_id for _id in waiting if _id in instances and is_ready(instances[_id], pending)]
+        for _id in ready:
+            yield instances[_id]
+        waiting = [_id for _id in waiting if _id not in ready]
+
+        now = time.time()
+        if not waiting or now >= until:
+            break
+        if ready:
+            snooze = delay
+        LOGGER.info("%d instances not ready. Auto retry in %ds", len(waiting), min(snooze, until - now))
+        time.sleep(min(snooze, until - now))
+        snooze = min(snooze * 2, max(delay, max_delay))
+
+    if waiting:
+        LOGGER.info("Waiting for %s expired.", ', '.join(str(_id) for _id in waiting))
+
+
 def clean_string(string):
     """Returns a string with all newline and other whitespace garbage removed.
 
@@ -502,6 +597,9 @@ def decode_stacked(document, pos=0, decoder=JSONDecoder()):
 
 def console_color_themes(theme):
     """Colors in https://rich.readthedocs.io/en/stable/appendix/colors.html#standard-colors"""
+    # rich is slow to import, and only needed once there is something to print
+    from rich.console import Console  # pylint: disable=import-outside-toplevel
+    from rich.theme import Theme  # pylint: disable=import-outside-toplevel
 
     if theme == 'light':
         return Console(theme=Theme(
@@ -28,6 +28,7 @@
     entry_points={
         'console_scripts': [
             'slcli = SoftLayer.CLI.core:main',
+            'slclid = SoftLayer.daemon.client:main',
         ],
     },
     python_requires='>=3.10',
@@ -39,6 +40,10 @@
         'urllib3 >= 1.24',
         'rich == 15.0.0'
     ],
+    extras_require={
+        'async': ['aiohttp >= 3.8'],
+        'json': ['orjson'],
+    },
     keywords=['softlayer', 'cloud', 'slcli', 'ibmcloud'],
     classifiers=[
         'Environment :: Console',
@@ -6,6 +6,8 @@
 """
 import io
 import logging
+import os
+import tempfile
 
 import click
 from unittest import mock as mock
@@ -42,6 +44,18 @@ def test_build_client(self):
         self.assert_no_fail(result)
         self.assertIsNotNone(env.client)
 
+    def test_cache_ttl(self):
+        env = environment.Environment()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch('SoftLayer.CLI.core.CACHE_DIR', cache_dir):
+                result = self.run_command(['--cache-ttl=60', 'vs', 'list'], env=env)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        self.assert_no_fail(result)
+        caching = env.client.transport.transport
+        self.assertIsInstance(caching, SoftLayer.CachingTransport)
+        self.assertEqual(caching.ttl, 60)
+
     def test_diagnostics(self):
         result = self.run_command(['-v', 'vs', 'list'])
 
@@ -53,6 +67,18 @@ def test_diagnostics(self):
         self.assertIn('"python_version"', result.output)
         self.assertIn('"library_location"', result.output)
 
+    def test_diagnostics_summary(self):
+        env = environment.Environment()
+        result = self.run_command(['-vvv', '--summary', 'vs', 'list'], env=env)
+
+        self.assert_no_fail(result)
+        self.assertIsInstance(env.client.transport, SoftLayer.MetricsTransport)
+        self.assertIn('"api_calls"', result.output)
+        self.assertIn('SoftLayer_Account::getVirtualGuests', result.output)
+        self.assertIn('"p99"', result.output)
+        # Calls aren't printed one by one
+        self.assertNotIn('"mask"', result.output)
+
     @mock.patch('requests.get')
     def test_get_latest_version(self, request_get):
         response = Response()
@@ -37,6 +37,20 @@ def test_list_commands(self):
         self.assertIn('virtual', actions)
         self.assertIn('dns', actions)
 
+    def test_list_commands_index(self):
+        self.env.load_modules_from_python([('zoo', 'zoo'), ('zoo:lion', 'zoo.lion'), ('zoo:ant', 'zoo.ant'),
+                                           ('zoo:lion:cub', 'zoo.lion.cub'), ('zoo:lion', 'zoo.lion2')])
+        self.assertEqual(self.env.list_commands('zoo'), ['ant', 'lion'])
+        self.assertEqual(self.env.list_commands('zoo', 'lion'), ['cub'])
+        self.assertEqual(self.env.list_commands('zoo', 'ant'), [])
+        self.assertEqual(self.env.commands['zoo:lion'].import_path, 'zoo.lion2')
+
+    def test_complete_command(self):
+        self.env.load()
+        self.assertEqual(self.env.complete_command('cap', 'virtual'), ['capacity', 'capture'])
+        self.assertEqual(self.env.complete_command('zzz', 'virtual'), [])
+        self.assertIn('virtual', self.env.complete_command(''))
+
     def test_get_command_invalid(self):
         cmd = self.env.get_command('invalid', 'command')
         self.assertEqual(cmd, None)
@@ -82,6 +96,21 @@ def test_resolve_alias(self):
     def test_format_output_is_json(self):
         self.env.format = 'jsonraw'
         self.assertTrue(self.env.format_output_is_json())
+        self.env.format = 'jsonl'
+        self.assertTrue(self.env.format_output_is_json())
+
+    @mock.patch('click.echo')
+    def test_fout_streaming(self, echo):
+        self.env.format = 'jsonl'
+        table = formatting.StreamingTable(['id'], iter([[1], [2], [3]]), chunk_size=2)
+        self.env.fout(table)
+        echo.assert_has_calls([mock.call('{"id": 1}\n{"id": 2}\n', nl=False), mock.call('{"id": 3}\n', nl=False)])
+
+    @mock.patch('rich.console.Console.print')
+    def test_fout_streaming_table(self, console):
+        table = formatting.StreamingTable(['id'], iter([[1], [2], [3]]), chunk_size=2)
+        self.env.fout(table)
+        self.assertEqual(2, len(console.call_args_list))
 
     @mock.patch('rich.console.Console.print')
     def test_multiple_tables(self, console):
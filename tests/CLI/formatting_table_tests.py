@@ -86,6 +86,124 @@ def test_unrenderable_recovery_table(self):
         self.assertIn(expected, result)
 
 
+class ColumnTableTests(testing.TestCase):
+
+    def make_table(self):
+        table = formatting.Table(['id', 'hostname', 'memory'])
+        table.add_row([10, 'web2', formatting.mb_to_gb(4096)])
+        table.add_row(['9', 'db1', formatting.mb_to_gb(16384)])
+        table.add_row([100, 'web1', formatting.blank()])
+        table.add_row([2, 'app1', formatting.mb_to_gb(4096)])
+        return table
+
+    def test_rows(self):
+        table = formatting.Table(['id', 'name'])
+        table.add_row([1, 'a'])
+        table.add_row([2])
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.rows[0], [1, 'a'])
+        self.assertEqual(table.column('id'), [1, 2])
+        # Short rows are padded with blanks
+        self.assertIsNone(table.rows[1][1].original)
+        table.rows = [[3, 'c']]
+        self.assertEqual(table.rows, [[3, 'c']])
+        self.assertRaises(exceptions.CLIAbort, table.column, 'nope')
+
+    def test_long_row(self):
+        table = formatting.Table(['id', 'name'])
+        ex = self.assertRaises(ValueError, table.add_row, [1, 'a', 'lost'])
+        self.assertIn('3 values', str(ex))
+        self.assertEqual(len(table), 0)
+
+        streaming = formatting.StreamingTable(['id', 'name'], iter([[1, 'a'], [2, 'b', 'lost']]))
+        self.assertRaises(ValueError, list, formatting.format_streaming(streaming, 'csv'))
+
+    def test_sort_numbers(self):
+        table = self.make_table()
+        table.sort('id')
+        # '9' is a string but sorts as a number, like the rest
+        self.assertEqual(table.column('id'), [2, '9', 10, 100])
+
+    def test_sort_formatted_items(self):
+        table = self.make_table()
+        table.sort('-memory')
+        self.assertEqual(table.column('hostname'), ['db1', 'web2', 'app1', 'web1'])
+
+    def test_sort_multiple(self):
+        table = self.make_table()
+        table.sort('memory', '-hostname')
+        self.assertEqual(table.column('hostname'), ['web1', 'web2', 'app1', 'db1'])
+        table.sort('memory,hostname')
+        self.assertEqual(table.column('hostname'), ['web1', 'app1', 'web2', 'db1'])
+
+    def test_sort_mixed_types(self):
+        table = formatting.Table(['value'])
+        for value in ['b', 3, None, {'a': 1}, 'a', 1.5]:
+            table.add_row([value])
+        table.sort('value')
+        self.assertEqual(table.column('value'), [None, 1.5, 3, 'a', 'b', {'a': 1}])
+
+    def test_sort_missing_column(self):
+        self.assertRaises(exceptions.CLIAbort, self.make_table().sort, 'nope')
+
+    def test_sortby(self):
+        table = self.make_table()
+        table.sortby = '-id'
+        formatting.format_output(table)
+        self.assertEqual(table.column('id'), [100, 10, '9', 2])
+
+    def test_filter(self):
+        for expressions, expected in ((['memory>=4096'], ['web2', 'db1', 'app1']),
+                                      (['memory=4096', 'hostname~WEB'], ['web2']),
+                                      (['memory!=4096'], ['db1', 'web1']),
+                                      (['id<10'], ['db1', 'app1']),
+                                      (['hostname = db1'], ['db1']),
+                                      (['hostname>b'], ['web2', 'db1', 'web1'])):
+            table = self.make_table()
+            table.filter(*expressions)
+            self.assertEqual(table.column('hostname'), expected)
+
+    def test_filter_errors(self):
+        self.assertRaises(exceptions.CLIAbort, self.make_table().filter, 'nope=1')
+        self.assertRaises(exceptions.CLIAbort, self.make_table().filter, 'hostname')
+
+    def test_select(self):
+        table = self.make_table()
+        table.align['hostname'] = 'l'
+        selected = table.select(['hostname', 'id'])
+        self.assertEqual(selected.columns, ['hostname', 'id'])
+        self.assertEqual(selected.rows[0], ['web2', 10])
+        self.assertEqual(selected.align, {'hostname': 'l'})
+        self.assertEqual(len(table.columns), 3)
+        self.assertRaises(exceptions.CLIAbort, table.select, ['nope'])
+
+    def test_formatters(self):
+        formatted = []
+
+        def memory(value):
+            formatted.append(value)
+            return '%dM' % value
+
+        table = formatting.Table(['id', 'memory'], formatters={'memory': memory})
+        table.add_row([1, 1024])
+        table.add_row([2, 2048])
+        table.filter('memory>1024')
+        self.assertEqual(formatted, [])
+        self.assertEqual(table.to_python(), [{'id': 2, 'memory': 2048}])
+
+        console = Console()
+        with console.capture() as capture:
+            console.print(formatting.format_output(table))
+        self.assertIn('2048M', capture.get())
+        # Only the printed rows are formatted
+        self.assertEqual(formatted, [2048])
+
+    def test_streaming_filter(self):
+        table = formatting.StreamingTable(['id', 'name'], iter([[1, 'a'], [2, 'b'], [3, formatting.blank()]]))
+        table.filter('id>=2')
+        self.assertEqual(table.to_python(), [{'id': 2, 'name': 'b'}, {'id': 3, 'name': None}])
+
+
 class IterToTableTests(testing.TestCase):
 
     def test_format_api_dict(self):
@@ -124,3 +242,88 @@ def test_format_api_list_with_empty_array(self):
         # No good ways to test whats actually in a Rich.Table without going through the hassel of
         # printing it out. As long as this didn't throw and exception it should be fine.
         self.assertEqual(formatted.row_count, 1)
+
+
+class StreamingTableTests(testing.TestCase):
+
+    def test_chunks_are_lazy(self):
+        fetched = []
+
+        def rows():
+            for index in range(5):
+                fetched.append(index)
+                yield [index, 'host%d' % index]
+
+        table = formatting.StreamingTable(['id', 'hostname'], rows(), chunk_size=2)
+        chunks = table.chunks()
+        self.assertEqual(next(chunks), [[0, 'host0'], [1, 'host1']])
+        self.assertEqual(fetched, [0, 1])
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+    def test_json_matches_table(self):
+        rows = [[1, 'a', formatting.blank()], [2, {'nested': [1, 2]}, 'c'], [3, None, 'd']]
+        table = formatting.Table(['id', 'value', 'other'])
+        for row in rows:
+            table.add_row(row)
+
+        for fmt in ('json', 'jsonraw'):
+            streaming = formatting.StreamingTable(['id', 'value', 'other'], iter(rows), chunk_size=2)
+            self.assertEqual(''.join(formatting.format_streaming(streaming, fmt)),
+                             formatting.format_output(table, fmt) + '\n')
+
+    def test_empty(self):
+        for fmt, expected in (('json', '[]\n'), ('jsonraw', '[]\n'), ('jsonl', ''), ('csv', '"id"\r\n'),
+                              ('table', 'Nothing\n')):
+            table = formatting.StreamingTable(['id'], iter([]))
+            table.set_empty_message('Nothing')
+            self.assertEqual(''.join(formatting.format_streaming(table, fmt)), expected)
+
+    def test_jsonl(self):
+        table = formatting.StreamingTable(['id', 'name'], iter([[1, 'a'], [2, formatting.blank()]]), chunk_size=1)
+        chunks = list(formatting.format_streaming(table, 'jsonl'))
+        self.assertEqual(chunks, ['{"id": 1, "name": "a"}\n', '{"id": 2, "name": null}\n'])
+
+    def test_csv(self):
+        sub_table = formatting.Table(['a'])
+        sub_table.add_row([1])
+        rows = [[1, 'a'], [2, formatting.blank()], [3, sub_table]]
+        table = formatting.StreamingTable(['id', 'name'], iter(rows), chunk_size=2)
+        chunks = list(formatting.format_streaming(table, 'csv'))
+        self.assertEqual(chunks, ['"id","name"\r\n1,"a"\r\n2,"-"\r\n', '3,"[{""a"": 1}]"\r\n'])
+
+    def test_table_chunks_have_same_widths(self):
+        rows = [[1, 'short'], [2, 'a bit longer'], [3, 'x' * 100]]
+        table = formatting.StreamingTable(['id', 'name'], iter(rows), chunk_size=2)
+        console = Console(width=200)
+        with console.capture() as capture:
+            for chunk in formatting.format_streaming(table, 'table'):
+                console.print(chunk)
+        lines = capture.get().splitlines()
+        # Header, line under it, then the rows. The long value is cut short to the first chunk's width
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(len({len(line) for line in lines}), 1)
+        self.assertIn('…', lines[-1])
+
+    def test_format_output(self):
+        table = formatting.StreamingTable(['id'], iter([[1], [2]]))
+        self.assertEqual(formatting.format_output(table, 'python'), [{'id': 1}, {'id': 2}])
+
+    def test_iter_to_streaming_table(self):
+        items = iter([{'id': 1, 'name': 'a'}, None, {'id': 2, 'extra': True}, {'id': 3, 'late': 'x'}])
+        table = formatting.iter_to_streaming_table(items, chunk_size=3)
+        self.assertEqual(table.columns, ['extra', 'id', 'name'])
+        self.assertEqual(table.to_python(), [{'extra': None, 'id': 1, 'name': 'a'},
+                                             {'extra': True, 'id': 2, 'name': None},
+                                             {'extra': None, 'id': 3, 'name': None}])
+
+    def test_iter_to_streaming_table_values(self):
+        table = formatting.iter_to_streaming_table(iter(['a', 'b']))
+        self.assertEqual(table.columns, ['value'])
+        self.assertEqual(table.to_python(), [{'value': 'a'}, {'value': 'b'}])
+
+    def test_format_json_lines(self):
+        table = formatting.Table(['id'])
+        table.add_row([1])
+        table.add_row([2])
+        self.assertEqual(formatting.format_output(table, 'jsonl'), '{"id": 1}\n{"id": 2}')
+        self.assertEqual(formatting.format_output({'id': 1}, 'jsonl'), '{"id": 1}')
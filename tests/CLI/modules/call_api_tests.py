@@ -9,6 +9,7 @@
 from SoftLayer.CLI import call_api
 from SoftLayer.CLI import exceptions
 from SoftLayer import SoftLayerAPIError
+from SoftLayer import SoftLayerListResult
 from SoftLayer import testing
 
 import pytest
@@ -216,6 +217,26 @@ def test_list_table(self):
 └──────┴──────┴───────┴─────┴────────┘
 """)
 
+    def test_list_stream(self):
+        mock = self.set_mock('SoftLayer_Service', 'method')
+        mock.side_effect = [SoftLayerListResult([{'id': 1}, {'id': 2}], 3), SoftLayerListResult([{'id': 3}], 3)]
+
+        result = self.run_command(['--format=jsonl', 'call-api', 'Service', 'method', '--stream', '--limit=2'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(result.output, '{"id": 1}\n{"id": 2}\n{"id": 3}\n')
+        self.assert_called_with('SoftLayer_Service', 'method', limit=2, offset=2)
+
+    def test_list_stream_table(self):
+        mock = self.set_mock('SoftLayer_Service', 'method')
+        mock.return_value = [{'id': 1, 'name': 'one'}]
+
+        result = self.run_command(['call-api', 'Service', 'method', '--stream'], fmt='table')
+
+        self.assert_no_fail(result)
+        self.assertEqual([line.rstrip() for line in result.output.splitlines()],
+                         [' id │ name', '────┼──────', ' 1  │ one'])
+
     def test_parameters(self):
         mock = self.set_mock('SoftLayer_Service', 'method')
         mock.return_value = {}
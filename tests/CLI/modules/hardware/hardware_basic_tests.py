@@ -558,6 +558,13 @@ def test_going_ready(self, _sleep):
         self.assert_no_fail(result)
         self.assertEqual(result.output, '"READY"\n')
 
+    def test_ready_many(self):
+        result = self.run_command(['--format', 'csv', 'hw', 'ready', '1000', 'hardware-test2', '1003'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(result.exception.message, 'Not ready: 1003')
+        self.assertIn('1000,"hardware-test1","READY"\n1001,"hardware-test2","READY"\n', result.output)
+
     def test_toggle_ipmi_on(self):
         mock.return_value = True
         result = self.run_command(['server', 'toggle-ipmi', '--enable', '12345'])
@@ -945,6 +952,12 @@ def test_notification_delete(self):
         result = self.run_command(['hardware', 'notification-delete', '100'])
         self.assert_no_fail(result)
 
+    def test_notification_delete_many(self):
+        result = self.run_command(['hardware', 'notification-delete', '100', '200'])
+        self.assert_no_fail(result)
+        self.assert_called_with('SoftLayer_User_Customer_Notification_Hardware', 'deleteObjects',
+                                args=([{'id': '100'}, {'id': '200'}],))
+
     def test_create_credential(self):
         result = self.run_command(['hw', 'create-credential', '123456',
                                    '--username', 'testslcli', '--password', 'test-123456',
@@ -958,3 +971,43 @@ def test_hardware_cancel_no_force(self, confirm_mock):
 
         self.assertEqual(2, result.exit_code)
         self.assertEqual('Aborted', result.exception.message)
+
+    @mock.patch('SoftLayer.CLI.formatting.confirm')
+    def test_bulk_power_cycle(self, confirm_mock):
+        confirm_mock.return_value = True
+        result = self.run_command(['hw', 'bulk', 'power-cycle', 'hardware-test2', '172.16.1.100', '1000'])
+
+        self.assert_no_fail(result)
+        self.assertIn('2 succeeded, 0 failed', result.output)
+        self.assertEqual(len(self.calls('SoftLayer_Hardware_Server', 'powerCycle')), 2)
+        self.assert_called_with('SoftLayer_Hardware_Server', 'powerCycle', identifier=1001)
+
+    def test_bulk_cancel_failed(self):
+        # The fixture server has a transaction running, so it can't be cancelled
+        result = self.run_command(['-y', 'hw', 'bulk', 'cancel', '1000', '--immediate'])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('running transaction', result.output)
+        self.assertIn('0 succeeded, 1 failed', result.output)
+
+    def test_bulk_ambiguous(self):
+        result = self.run_command(['hw', 'bulk', 'power-on', 'hardware'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(self.calls('SoftLayer_Hardware_Server', 'powerOn'), [])
+
+    def test_bulk_tag(self):
+        result = self.run_command(['hw', 'bulk', 'tag', '--set-tags', 'db', '--tag', 'old', '--workers', '2'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(len(self.calls('SoftLayer_Hardware_Server', 'setTags')), 4)
+        self.assert_called_with('SoftLayer_Hardware_Server', 'setTags', identifier=1003, args=('db',))
+
+    def test_bulk_reload_typed(self):
+        result = self.run_command(['hw', 'bulk', 'reload', '1000', '1001'], stdin='reload 1\n')
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(self.calls('SoftLayer_Hardware_Server', 'reloadOperatingSystem'), [])
+
+        result = self.run_command(['hw', 'bulk', 'reload', '1000', '1001'], stdin='reload 2\n')
+        self.assert_no_fail(result)
+        self.assertEqual(len(self.calls('SoftLayer_Hardware_Server', 'reloadOperatingSystem')), 2)
@@ -56,6 +56,26 @@ def test_list_servers(self):
         self.assert_no_fail(result)
         self.assertEqual(expected, json.loads(result.output))
 
+    def test_list_servers_stream(self):
+        result = self.run_command(['--format=csv', 'hw', 'list', '--stream', '--columns=id,hostname'])
+
+        self.assert_no_fail(result)
+        lines = result.output.splitlines()
+        self.assertEqual(lines[0], '"id","hostname"')
+        self.assertEqual(lines[1], '1000,"hardware-test1"')
+        self.assertEqual(lines[-1], '1003,"-"')
+
+    def test_list_servers_where(self):
+        result = self.run_command(['hw', 'list', '--columns=id,hostname', '--where=id>1001', '--where=id!=1003'])
+
+        self.assert_no_fail(result)
+        self.assertEqual([row['id'] for row in json.loads(result.output)], [1002])
+
+    def test_list_servers_where_invalid(self):
+        result = self.run_command(['hw', 'list', '--where=nope=1'])
+
+        self.assertEqual(result.exit_code, 2)
+
     def test_list_hw_search_noargs(self):
         result = self.run_command(['hw', 'list', '--search'])
         self.assert_no_fail(result)
@@ -0,0 +1,78 @@
+"""
+    SoftLayer.tests.CLI.modules.inventory_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import json
+import os
+import tempfile
+from unittest import mock as mock
+
+from SoftLayer import testing
+
+
+class InventoryTests(testing.TestCase):
+
+    def set_up(self):
+        path = os.path.join(tempfile.mkdtemp(), 'inventory.db')
+        self.path_patch = mock.patch('SoftLayer.managers.inventory.DEFAULT_PATH', path)
+        self.path_patch.start()
+
+    def tear_down(self):
+        self.path_patch.stop()
+
+    def test_refresh(self):
+        result = self.run_command(['inventory', 'refresh', '--kind', 'virtual', '--kind', 'vlan'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(json.loads(result.output), [
+            {'kind': 'virtual', 'refresh': 'full', 'updated': 2, 'removed': 0, 'total': 2},
+            {'kind': 'vlan', 'refresh': 'full', 'updated': 3, 'removed': 0, 'total': 3},
+        ])
+        self.assertEqual(len(self.calls('SoftLayer_Account', 'getHardware')), 0)
+
+    def test_status(self):
+        self.run_command(['inventory', 'refresh', '--kind', 'vlan'])
+        result = self.run_command(['inventory', 'status'])
+
+        self.assert_no_fail(result)
+        status = {row['kind']: row for row in json.loads(result.output)}
+        self.assertEqual(status['vlan']['count'], 3)
+        self.assertIsNone(status['virtual']['refreshed'])
+
+    def test_find(self):
+        result = self.run_command(['inventory', 'find', '--datacenter', 'TEST00', '--kind', 'virtual'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(json.loads(result.output), [
+            {'kind': 'virtual', 'id': 100, 'name': 'vs-test1.test.sftlyr.ws', 'datacenter': 'TEST00'},
+            {'kind': 'virtual', 'id': 104, 'name': 'vs-test2.test.sftlyr.ws', 'datacenter': 'TEST00'},
+        ])
+
+        # Fresh enough, so the second find makes no API calls
+        calls = len(self.calls())
+        result = self.run_command(['inventory', 'find', '--ip', '10.45.19.37', '--kind', 'virtual'])
+        self.assert_no_fail(result)
+        self.assertEqual([row['id'] for row in json.loads(result.output)], [100])
+        self.assertEqual(len(self.calls()), calls)
+
+    def test_summary(self):
+        expected = json.loads(self.run_command(['summary']).output)
+
+        result = self.run_command(['summary', '--inventory', '3600'])
+        self.assert_no_fail(result)
+        self.assertEqual(json.loads(result.output), expected)
+
+        calls = len(self.calls())
+        result = self.run_command(['summary', '--inventory', '3600'])
+        self.assertEqual(json.loads(result.output), expected)
+        self.assertEqual(len(self.calls()), calls)
+
+    def test_billing_items(self):
+        expected = json.loads(self.run_command(['account', 'billing-items', '--category', 'server']).output)
+
+        result = self.run_command(['account', 'billing-items', '--category', 'server', '--inventory', '60'])
+        self.assert_no_fail(result)
+        self.assertEqual(json.loads(result.output), expected)
+        self.assert_called_with('SoftLayer_Account', 'getAllTopLevelBillingItems')
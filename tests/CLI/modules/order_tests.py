@@ -462,6 +462,29 @@ def test_empty_get_datacenter(self):
         self.assertIsInstance(result.exception, SoftLayerError)
         self.assertEqual(str(result.exception), "A complex type must be specified with the order")
 
+    def test_price_matrix(self):
+        result = self.run_command(['--format', 'csv', 'order', 'price-matrix', 'PUBLIC_CLOUD_SERVER'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(result.output.splitlines()[:2], ['"Name","Datacenter","Hourly","Monthly"',
+                                                          '"M1_64X512X25","wdc07",0.0,0.0'])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 1)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getRegions')), 1)
+
+    def test_price_matrix_items(self):
+        result = self.run_command(['order', 'price-matrix', 'PUBLIC_CLOUD_SERVER', '--datacenter', 'wdc07',
+                                   '--items', 'OS_UBUNTU_14_04_LTS_TRUSTY_TAHR_64_BIT,KeyName015'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(json.loads(result.output), [{'Name': 'OS_UBUNTU_14_04_LTS_TRUSTY_TAHR_64_BIT,KeyName015',
+                                                      'Datacenter': 'wdc07', 'Hourly': 0.2, 'Monthly': 0.2}])
+
+    def test_price_matrix_bad_datacenter(self):
+        result = self.run_command(['order', 'price-matrix', 'PUBLIC_CLOUD_SERVER', '--datacenter', 'nope01'])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(str(result.exception), "Package PUBLIC_CLOUD_SERVER can not be ordered in nope01")
+
 
 def _get_all_packages():
     package_type = {'keyName': 'BARE_METAL_CPU'}
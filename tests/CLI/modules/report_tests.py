@@ -15,7 +15,8 @@
 class ReportTests(testing.TestCase):
     def test_dc_closure_report(self):
         search_mock = self.set_mock('SoftLayer_Search', 'advancedSearch')
-        search_mock.side_effect = [_advanced_search(), [], [], []]
+        # The PODs are searched at once, so results are picked by the router in the query
+        search_mock.side_effect = lambda call: _advanced_search() if 'bcr01a.ams01' in call.args[0] else []
         result = self.run_command(['report', 'datacenter-closures'])
 
         self.assert_no_fail(result)
@@ -25,6 +26,7 @@ def test_dc_closure_report(self):
         pp(json_output)
         self.assertEqual(5, len(json_output))
         self.assertEqual('bcr01a.ams01', json_output[0]['POD'])
+        self.assertEqual(len(self.calls('SoftLayer_Search', 'advancedSearch')), 2)
 
 
 def _advanced_search():
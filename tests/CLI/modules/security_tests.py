@@ -148,7 +148,10 @@ def test_remove_certficate(self, confirm_mock):
         self.assert_no_fail(result)
         self.assertEqual(result.exit_code, 0)
 
-    def test_download_certficate(self):
+    @mock.patch('SoftLayer.CLI.security.cert_download.write_cert')
+    def test_download_certficate(self, write_cert):
         result = self.run_command(['security', 'cert-download', '123456'])
         self.assert_no_fail(result)
         self.assertEqual(result.exit_code, 0)
+        self.assertEqual([call[0][0] for call in write_cert.call_args_list],
+                         ['techbabble.xyz.crt', 'techbabble.xyz.key', 'techbabble.xyz.icc', 'techbabble.xyz.csr'])
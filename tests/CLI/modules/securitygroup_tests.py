@@ -156,6 +156,27 @@ def test_securitygroup_rule_add_fail(self):
 
         self.assertEqual(result.exit_code, 2)
 
+    def test_securitygroup_rule_add_many(self):
+        mock = self.set_mock('SoftLayer_Network_SecurityGroup', 'addRules')
+
+        def add_rules(call):
+            if call.identifier == '200':
+                raise SoftLayer.SoftLayerAPIError('SoftLayer_Exception', 'Group not found')
+            return {'requestId': 'addRules', 'rules': call.args[0]}
+        mock.side_effect = add_rules
+
+        result = self.run_command(['sg', 'rule-add', '100', '200', '--direction=ingress', '--protocol=tcp'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('to 200', result.exception.message)
+        calls = self.calls('SoftLayer_Network_SecurityGroup', 'addRules')
+        self.assertEqual(sorted(call.identifier for call in calls), ['100', '200'])
+        for call in calls:
+            self.assertEqual(call.args, ([{'direction': 'ingress', 'protocol': 'tcp'}],))
+        rows = json.loads(result.output)
+        self.assertEqual([row['securitygroupId'] for row in rows], ['100', '200'])
+        self.assertEqual(rows[0]['requestId'], 'addRules')
+
     def test_securitygroup_rule_edit(self):
         result = self.run_command(['sg', 'rule-edit', '100',
                                    '520', '--direction=ingress'])
@@ -6,6 +6,9 @@
 from SoftLayer import testing
 
 import json
+import os
+import shutil
+import tempfile
 from unittest import mock as mock
 
 
@@ -30,6 +33,14 @@ def test_remove(self, confirm_mock):
         self.assertEqual(result.exit_code, 0)
 
     def test_download(self):
+        # The files are written to the current directory
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory)
+
         result = self.run_command(['ssl', 'download', '123456'])
         self.assert_no_fail(result)
         self.assertEqual(result.exit_code, 0)
+        self.assertEqual(sorted(os.listdir(directory)),
+                         ['techbabble.xyz.crt', 'techbabble.xyz.csr', 'techbabble.xyz.icc', 'techbabble.xyz.key'])
@@ -55,6 +55,18 @@ def test_set_tags_failure(self, click):
         self.assert_no_fail(result)
         self.assert_called_with('SoftLayer_Tag', 'setTags', args=("tag1,tag2", "GUEST", 100), )
 
+    @mock.patch('SoftLayer.CLI.tags.set.click')
+    def test_set_tags_many(self, click):
+        def set_tags(call):
+            if call.args[2] == 200:
+                raise SoftLayerAPIError('SoftLayer_Exception', 'Not found')
+            return True
+        self.set_mock('SoftLayer_Tag', 'setTags').side_effect = set_tags
+        result = self.run_command(['tags', 'set', '--tags=tag1', '--key-name=GUEST', '-r', '100', '-r', '200'])
+        click.secho.assert_called_with('Failed to set tags on 200', fg='red')
+        self.assert_no_fail(result)
+        self.assertEqual(len(self.calls('SoftLayer_Tag', 'setTags')), 2)
+
     def test_details_by_name(self):
         tag_name = 'bs_test_instance'
         result = self.run_command(['tags', 'details', tag_name])
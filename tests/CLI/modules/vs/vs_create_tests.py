@@ -4,11 +4,13 @@
 
     :license: MIT, see LICENSE for more details.
 """
-
+import json
+import os
 import sys
 import tempfile
 from unittest import mock as mock
 
+import SoftLayer
 from SoftLayer.fixtures import SoftLayer_Product_Package as SoftLayer_Product_Package
 from SoftLayer import testing
 
@@ -746,3 +748,71 @@ def test_check_for_closing(self, confirm_mock):
                                    '--flavor', 'B1_2X8X25', '--datacenter', 'mex01', '--os', 'UBUNTU_LATEST'])
         self.assert_no_fail(result)
         self.assertNotIn('Warning: Closed soon: mex01', result.output)
+
+    def write_servers(self, servers):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as servers_file:
+            json.dump(servers, servers_file)
+        self.addCleanup(os.remove, servers_file.name)
+        return servers_file.name
+
+    @mock.patch('SoftLayer.CLI.formatting.confirm')
+    def test_create_from_file(self, confirm_mock):
+        confirm_mock.return_value = True
+        path = self.write_servers([{'hostname': 'web1', 'tag': 'web'},
+                                   {'hostname': 'web2', 'tag': ['web', 'green']},
+                                   {'hostname': 'db1', 'memory': '4', 'datacenter': 'ams01'}])
+        result = self.run_command(['vs', 'create', '--from-file', path, '--cpu=2', '--memory=1', '--os=UBUNTU_LATEST',
+                                   '--domain=example.com', '--datacenter=dal05', '--rate=0'])
+
+        self.assert_no_fail(result)
+        self.assertIn('This action will order 3 virtual servers', confirm_mock.call_args[0][0])
+        self.assertIn('Warning: Closed soon: ams01', result.output)
+        output = json.JSONDecoder().raw_decode(result.output[result.output.index('['):])[0]
+        self.assertEqual([(row['hostname'], row['status'], row['ids']) for row in output],
+                         [('web1', 'ordered', [1234567]), ('web2', 'ordered', [1234567]),
+                          ('db1', 'ordered', [1234567])])
+        # web1 and web2 share a template
+        templates = [call.args[0] for call in self.calls('SoftLayer_Virtual_Guest', 'generateOrderTemplate')]
+        self.assertEqual(sorted((args['maxMemory'], args['datacenter']['name']) for args in templates),
+                         [(1024, 'dal05'), (4096, 'ams01')])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Order', 'placeOrder')), 3)
+        self.assertEqual(sorted(call.args[0] for call in self.calls('SoftLayer_Virtual_Guest', 'setTags')),
+                         ['web', 'web,green'])
+
+    def test_create_from_file_test(self):
+        path = self.write_servers([{'hostname': 'web1'}, {'hostname': 'web2'}])
+        result = self.run_command(['vs', 'create', '--from-file', path, '--test', '--flavor=B1_2X8X25',
+                                   '--os=UBUNTU_LATEST', '--domain=example.com', '--datacenter=dal05'])
+
+        self.assert_no_fail(result)
+        output = json.JSONDecoder().raw_decode(result.output)[0]
+        self.assertEqual([row['status'] for row in output], ['verified', 'verified'])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Order', 'verifyOrder')), 1)
+        self.assertEqual(self.calls('SoftLayer_Product_Order', 'placeOrder'), [])
+
+    def test_create_from_file_failed(self):
+        self.set_mock('SoftLayer_Product_Order', 'placeOrder').side_effect = SoftLayer.SoftLayerAPIError(
+            'SoftLayer_Exception_Order', 'Out of stock')
+        path = self.write_servers([{'hostname': 'web1'}])
+        result = self.run_command(['-y', 'vs', 'create', '--from-file', path, '--flavor=B1_2X8X25',
+                                   '--os=UBUNTU_LATEST', '--domain=example.com', '--datacenter=dal05'])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Out of stock', result.output)
+
+    def test_create_from_file_bad(self):
+        for servers, error in (([{'hostname': 'web1', 'color': 'blue'}], 'Server 1 has an unknown option: color'),
+                               ([{'hostname': 'web1'}, {'flavor': 'B1_2X8X25'}], 'Server 2 is missing: hostname'),
+                               ([{'hostname': 'web1', 'cpu': 'many'}], 'Server 1: cpu:'),
+                               ({'hostname': 'web1'}, 'has to be a JSON list of servers')):
+            result = self.run_command(['vs', 'create', '--from-file', self.write_servers(servers),
+                                       '--domain=example.com', '--datacenter=dal05', '--os=UBUNTU_LATEST'])
+            self.assertEqual(result.exit_code, 2)
+            self.assertIn(error, result.exception.message)
+
+    def test_create_help_required(self):
+        result = self.run_command(['vs', 'create', '--help'])
+        self.assert_no_fail(result)
+        for option in ('--hostname ', '--domain ', '--datacenter '):
+            line = next(line for line in result.output.splitlines() if option in line)
+            self.assertIn('[required unless', line)
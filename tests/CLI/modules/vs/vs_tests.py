@@ -145,6 +145,41 @@ def test_list_vs(self):
 
         self.assert_no_fail(result)
 
+    def test_list_vs_stream(self):
+        result = self.run_command(['--format=jsonl', 'vs', 'list', '--stream', '--columns=id,hostname'])
+
+        self.assert_no_fail(result)
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        self.assertEqual(rows[0], {'id': 100, 'hostname': 'vs-test1'})
+        self.assertEqual(len(rows), 2)
+        self.assert_called_with('SoftLayer_Account', 'getVirtualGuests', limit=100, offset=0)
+
+    def test_list_vs_where(self):
+        result = self.run_command(['vs', 'list', '--columns=id,hostname', '--where=hostname~TEST2'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(json.loads(result.output), [{'id': 104, 'hostname': 'vs-test2'}])
+
+    def test_list_vs_where_stream(self):
+        result = self.run_command(['--format=jsonl', 'vs', 'list', '--stream', '--columns=id,hostname',
+                                   '--where=id<104'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(result.output, '{"id": 100, "hostname": "vs-test1"}\n')
+
+    def test_list_vs_sortby_multiple(self):
+        result = self.run_command(['--format=table', 'vs', 'list', '--columns=id,datacenter',
+                                   '--sortby=datacenter,-id'])
+
+        self.assert_no_fail(result)
+        self.assertLess(result.output.index('104'), result.output.index('100'))
+
+    def test_list_vs_stream_table(self):
+        result = self.run_command(['vs', 'list', '--stream'])
+
+        self.assert_no_fail(result)
+        self.assertIn('vs-test1', result.output)
+
     def test_list_vs_search_noargs(self):
         result = self.run_command(['vs', 'list', '--search'])
         self.assert_no_fail(result)
@@ -724,6 +759,43 @@ def test_going_ready(self, _sleep):
         self.assert_no_fail(result)
         self.assertEqual(result.output, '"READY"\n')
 
+    @mock.patch('time.sleep')
+    def test_ready_many(self, _sleep):
+        guests = self.set_mock('SoftLayer_Account', 'getVirtualGuests')
+        guests.side_effect = [
+            [{'id': 100, 'hostname': 'vs-test1', 'provisionDate': '2017-10-17T11:21:53-07:00'},
+             {'id': 104, 'hostname': 'vs-test2', 'provisionDate': ''}],
+            [{'id': 104, 'hostname': 'vs-test2', 'provisionDate': '2017-10-17T11:21:53-07:00'}],
+        ]
+        result = self.run_command(['--format', 'csv', 'vs', 'ready', '100', '104', '--wait=100'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(result.output.splitlines(),
+                         ['"id","hostname","status"', '100,"vs-test1","READY"', '104,"vs-test2","READY"'])
+
+    def test_ready_many_not_ready(self):
+        guests = self.set_mock('SoftLayer_Account', 'getVirtualGuests')
+        guests.return_value = [{'id': 100, 'hostname': 'vs-test1', 'provisionDate': '2017-10-17T11:21:53-07:00'},
+                               {'id': 104, 'hostname': 'vs-test2', 'provisionDate': ''}]
+        result = self.run_command(['vs', 'ready', '100', '104'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(result.exception.message, 'Not ready: 104')
+
+    @mock.patch('time.sleep')
+    def test_ready_many_failed_check(self, _sleep):
+        guests = self.set_mock('SoftLayer_Account', 'getVirtualGuests')
+        guests.side_effect = [
+            [{'id': 100, 'hostname': 'vs-test1', 'provisionDate': '2017-10-17T11:21:53-07:00'},
+             {'id': 104, 'hostname': 'vs-test2', 'provisionDate': ''}],
+            SoftLayerAPIError('SoftLayer_Exception_Permission', 'Not allowed'),
+        ]
+        result = self.run_command(['--format', 'csv', 'vs', 'ready', '100', '104', '--wait=100'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('100,"vs-test1","READY"', result.output)
+        self.assertEqual(result.exception.message, 'Not ready: 104 (Not allowed)')
+
     @mock.patch('SoftLayer.CLI.formatting.no_going_back')
     def test_reload(self, confirm_mock):
         mock = self.set_mock('SoftLayer_Virtual_Guest', 'reloadCurrentOperatingSystemConfguration')
@@ -1005,12 +1077,95 @@ def test_add_notification(self):
         result = self.run_command(['vs', 'notification-add', '100', '--users', '123456'])
         self.assert_no_fail(result)
 
+    def test_add_notification_failed(self):
+        mock = self.set_mock('SoftLayer_User_Customer_Notification_Virtual_Guest', 'createObject')
+        mock.side_effect = SoftLayerAPIError('SoftLayer_Exception', 'User not found')
+        result = self.run_command(['vs', 'notification-add', '100', '--users', '123456'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('123456: User not found', result.exception.message)
+
     def test_notification_delete(self):
         result = self.run_command(['vs', 'notification-delete', '100'])
         self.assert_no_fail(result)
 
+    def test_notification_delete_many(self):
+        result = self.run_command(['vs', 'notification-delete', '100', '200'])
+        self.assert_no_fail(result)
+        self.assert_called_with('SoftLayer_User_Customer_Notification_Virtual_Guest', 'deleteObjects',
+                                args=([{'id': '100'}, {'id': '200'}],))
+
     def test_os_available(self):
         _mock = self.set_mock('SoftLayer_Product_Package', 'getItems')
         _mock.return_value = SoftLayer_Product_Package.getItemsOS
         result = self.run_command(['vs', 'os-available'])
         self.assert_no_fail(result)
+
+    def test_bulk_power_on(self):
+        result = self.run_command(['vs', 'bulk', 'power-on', 'vs-test1', '172.16.240.7', '100'])
+
+        self.assert_no_fail(result)
+        self.assertIn('2 succeeded, 0 failed', result.output)
+        self.assertEqual(len(self.calls('SoftLayer_Virtual_Guest', 'powerOn')), 2)
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'powerOn', identifier=104)
+
+    @mock.patch('SoftLayer.CLI.formatting.confirm')
+    def test_bulk_reboot_tag(self, confirm_mock):
+        confirm_mock.return_value = True
+        result = self.run_command(['vs', 'bulk', 'reboot', '--soft', '--tag', 'web', '--rate', '0'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(len(self.calls('SoftLayer_Virtual_Guest', 'rebootSoft')), 2)
+        self.assert_called_with('SoftLayer_Account', 'getVirtualGuests', mask='mask[id]')
+
+    @mock.patch('SoftLayer.CLI.formatting.confirm')
+    def test_bulk_no_confirm(self, confirm_mock):
+        confirm_mock.return_value = False
+        result = self.run_command(['vs', 'bulk', 'power-off', '100', '104'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(self.calls('SoftLayer_Virtual_Guest', 'powerOffSoft'), [])
+
+    def test_bulk_cancel_typed(self):
+        # Cancelling can't be undone, a y isn't enough
+        result = self.run_command(['vs', 'bulk', 'cancel', '100', '104'], stdin='y\n')
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(self.calls('SoftLayer_Virtual_Guest', 'deleteObject'), [])
+
+        result = self.run_command(['vs', 'bulk', 'cancel', '100', '104'], stdin='cancel 2\n')
+        self.assert_no_fail(result)
+        self.assertIn("Type 'cancel 2'", result.output)
+        self.assertEqual(len(self.calls('SoftLayer_Virtual_Guest', 'deleteObject')), 2)
+
+    def test_bulk_file(self):
+        result = self.run_command(['vs', 'bulk', 'pause', '--file', '-'], stdin='# paused\nvs-test2\n\n100\n')
+
+        self.assert_no_fail(result)
+        self.assertEqual(len(self.calls('SoftLayer_Virtual_Guest', 'pause')), 2)
+
+    def test_bulk_failures(self):
+        resume_mock = self.set_mock('SoftLayer_Virtual_Guest', 'resume')
+        resume_mock.side_effect = [True, SoftLayerAPIError('SoftLayer_Exception', 'Not paused')]
+        result = self.run_command(['--format', 'table', 'vs', 'bulk', 'resume', '100', '104', '--workers', '1'])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Not paused', result.output)
+        self.assertEqual(len(self.calls('SoftLayer_Virtual_Guest', 'resume')), 2)
+
+    def test_bulk_not_found(self):
+        result = self.run_command(['vs', 'bulk', 'power-on', 'vs-test1', 'nope'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('nope', result.exception.message)
+        self.assertEqual(self.calls('SoftLayer_Virtual_Guest', 'powerOn'), [])
+
+    def test_bulk_no_targets(self):
+        result = self.run_command(['vs', 'bulk', 'power-on'])
+        self.assertEqual(result.exit_code, 2)
+
+    def test_bulk_tag_needs_tags(self):
+        result = self.run_command(['vs', 'bulk', 'tag', '100'])
+        self.assertEqual(result.exit_code, 2)
+
+        result = self.run_command(['vs', 'bulk', 'tag', '100', '--set-tags', 'web,prod'])
+        self.assert_no_fail(result)
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'setTags', identifier=100, args=('web,prod',))
@@ -4,10 +4,15 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import asyncio
+import concurrent.futures as cf
 import io
 import math
 import os
 import requests
+import shutil
+import tempfile
+import time
 from unittest import mock as mock
 
 import SoftLayer
@@ -47,6 +52,15 @@ def test_init_with_rest_url(self):
                          'http://example.com/v3/rest')
         self.assertEqual(client.transport.timeout, 10)
 
+    @mock.patch('SoftLayer.config.get_client_settings')
+    def test_session_options(self, get_client_settings):
+        get_client_settings.return_value = {
+            'endpoint_url': 'http://endpoint_url/',
+            'session_options': {'pool_maxsize': 20, 'retries': 1},
+        }
+        client = SoftLayer.Client(session_options={'pool_maxsize': 50, 'pool_block': True})
+        self.assertEqual(client.transport.session_options, {'pool_maxsize': 50, 'retries': 1, 'pool_block': True})
+
     @mock.patch('SoftLayer.config.get_client_settings')
     def test_env(self, get_client_settings):
         auth = mock.Mock()
@@ -170,8 +184,10 @@ def test_iter_call(self, _call):
 
         self.assertEqual(list(range(125)), result)
         _call.assert_has_calls([
-            mock.call('SERVICE', 'METHOD', limit=100, iter=False, offset=0, filter=mock.ANY),
-            mock.call('SERVICE', 'METHOD', limit=100, iter=False, offset=100, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', limit=100, iter=False, stream=True,
+                      parent_id=mock.ANY, offset=0, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', limit=100, iter=False, stream=True,
+                      parent_id=mock.ANY, offset=100, filter=mock.ANY),
         ])
         _call.reset_mock()
 
@@ -184,9 +200,12 @@ def test_iter_call(self, _call):
         result = list(self.client.iter_call('SERVICE', 'METHOD', iter=True))
         self.assertEqual(list(range(200)), result)
         _call.assert_has_calls([
-            mock.call('SERVICE', 'METHOD', limit=100, iter=False, offset=0, filter=mock.ANY),
-            mock.call('SERVICE', 'METHOD', limit=100, iter=False, offset=100, filter=mock.ANY),
-            mock.call('SERVICE', 'METHOD', limit=100, iter=False, offset=200, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', limit=100, iter=False, stream=True,
+                      parent_id=mock.ANY, offset=0, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', limit=100, iter=False, stream=True,
+                      parent_id=mock.ANY, offset=100, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', limit=100, iter=False, stream=True,
+                      parent_id=mock.ANY, offset=200, filter=mock.ANY),
         ])
         _call.reset_mock()
 
@@ -198,8 +217,10 @@ def test_iter_call(self, _call):
         result = list(self.client.iter_call('SERVICE', 'METHOD', iter=True, limit=25))
         self.assertEqual(list(range(30)), result)
         _call.assert_has_calls([
-            mock.call('SERVICE', 'METHOD', iter=False, limit=25, offset=0, filter=mock.ANY),
-            mock.call('SERVICE', 'METHOD', iter=False, limit=25, offset=25, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', iter=False, stream=True,
+                      parent_id=mock.ANY, limit=25, offset=0, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', iter=False, stream=True,
+                      parent_id=mock.ANY, limit=25, offset=25, filter=mock.ANY),
         ])
         _call.reset_mock()
 
@@ -208,7 +229,8 @@ def test_iter_call(self, _call):
         result = list(self.client.iter_call('SERVICE', 'METHOD', iter=True))
         self.assertEqual(["test"], result)
         _call.assert_has_calls([
-            mock.call('SERVICE', 'METHOD', iter=False, limit=100, offset=0, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', iter=False, stream=True,
+                      parent_id=mock.ANY, limit=100, offset=0, filter=mock.ANY),
         ])
         _call.reset_mock()
 
@@ -221,8 +243,10 @@ def test_iter_call(self, _call):
         )
         self.assertEqual(list(range(30)), result)
         _call.assert_has_calls([
-            mock.call('SERVICE', 'METHOD', 'ARG', iter=False, limit=25, offset=12, filter=mock.ANY),
-            mock.call('SERVICE', 'METHOD', 'ARG', iter=False, limit=25, offset=37, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', 'ARG', iter=False, stream=True,
+                      parent_id=mock.ANY, limit=25, offset=12, filter=mock.ANY),
+            mock.call('SERVICE', 'METHOD', 'ARG', iter=False, stream=True,
+                      parent_id=mock.ANY, limit=25, offset=37, filter=mock.ANY),
         ])
 
         # Chunk size of 0 is invalid
@@ -329,7 +353,10 @@ def setup_response(filename, status_code=200, total_items=1):
         return response
 
     def set_up(self):
-        self.client = SoftLayer.API.EmployeeClient(config_file='./tests/testconfig')
+        # Logging in writes the user id and token to the config file
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.client = SoftLayer.API.EmployeeClient(config_file=os.path.join(directory, 'testconfig'))
 
     @mock.patch('SoftLayer.transports.xmlrpc.requests.Session.request')
     def test_auth_with_pass_failure(self, api_response):
@@ -584,3 +611,307 @@ def mock_call(*args, **kwargs):
         # Should make 3 calls total (1 initial + 2 threaded)
         self.assertEqual(call_count, 3)
         self.assertEqual(len(result), 300)
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_cf_call_max_workers(self, _call):
+        _call.side_effect = [
+            transports.SoftLayerListResult(range(0, 10), 20),
+            transports.SoftLayerListResult(range(10, 20), 20)
+        ]
+
+        with mock.patch('SoftLayer.API.cf.ThreadPoolExecutor', wraps=cf.ThreadPoolExecutor) as executor:
+            result = self.client.cf_call('SERVICE', 'METHOD', limit=10, max_workers=3)
+
+        executor.assert_called_with(max_workers=3)
+        self.assertEqual(list(result), list(range(20)))
+        self.assertEqual(result.total_count, 20)
+
+
+class CfIterCallTests(testing.TestCase):
+    """Tests for cf_iter_call, which fetches pages in parallel but yields them in order"""
+
+    @staticmethod
+    def paged_call(total, delays=None):
+        """Fake BaseClient.call that returns pages of range(total), later pages returning first"""
+        def fake_call(*_, **kwargs):
+            offset = kwargs.get('offset', 0)
+            limit = kwargs.get('limit', 100)
+            if delays:
+                time.sleep(delays.get(offset, 0))
+            return transports.SoftLayerListResult(range(offset, min(offset + limit, total)), total)
+        return fake_call
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_in_order(self, _call):
+        # The second page takes the longest, items should still come back in order
+        _call.side_effect = self.paged_call(50, delays={10: 0.2, 20: 0.1})
+
+        result = list(self.client.cf_iter_call('SERVICE', 'METHOD', limit=10, max_workers=4))
+
+        self.assertEqual(result, list(range(50)))
+        self.assertEqual(_call.call_count, 5)
+        offsets = sorted(call.kwargs['offset'] for call in _call.call_args_list)
+        self.assertEqual(offsets, [0, 10, 20, 30, 40])
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_with_offset(self, _call):
+        _call.side_effect = self.paged_call(100)
+
+        result = list(self.client.cf_iter_call('SERVICE', 'METHOD', 'ARG', limit=25, offset=50, mask='id'))
+
+        self.assertEqual(result, list(range(50, 100)))
+        _call.assert_any_call('SERVICE', 'METHOD', 'ARG', offset=50, limit=25, mask='id', iter=False,
+                              parent_id=mock.ANY, filter=mock.ANY)
+        _call.assert_any_call('SERVICE', 'METHOD', 'ARG', offset=75, limit=25, mask='id', iter=False,
+                              parent_id=mock.ANY, filter=mock.ANY)
+        self.assertEqual(_call.call_count, 2)
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_single_page(self, _call):
+        _call.side_effect = self.paged_call(5)
+
+        result = list(self.client.cf_iter_call('SERVICE', 'METHOD', limit=10))
+
+        self.assertEqual(result, list(range(5)))
+        self.assertEqual(_call.call_count, 1)
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_non_list(self, _call):
+        _call.return_value = {'id': 1}
+        result = list(self.client['SERVICE'].cf_iter_call('METHOD'))
+        self.assertEqual(result, [{'id': 1}])
+
+        _call.return_value = [1, 2]
+        result = list(self.client['SERVICE'].cf_iter_call('METHOD'))
+        self.assertEqual(result, [1, 2])
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_max_pages(self, _call):
+        _call.side_effect = self.paged_call(1000)
+
+        results = self.client.cf_iter_call('SERVICE', 'METHOD', limit=10, max_workers=2, max_pages=3)
+        # Reading the first page should only have requested the first page + 3 more
+        for _ in range(10):
+            next(results)
+        time.sleep(0.05)
+        self.assertEqual(_call.call_count, 4)
+
+        # Each page that gets used up lets one more page be requested
+        for _ in range(10):
+            next(results)
+        time.sleep(0.05)
+        self.assertEqual(_call.call_count, 5)
+        results.close()
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_stop_early(self, _call):
+        _call.side_effect = self.paged_call(10000, delays={offset: 0.01 for offset in range(0, 10000, 10)})
+
+        for item in self.client.cf_iter_call('SERVICE', 'METHOD', limit=10, max_workers=2):
+            if item == 25:
+                break
+        time.sleep(0.1)
+        # 1 first page + (2 * max_workers) prefetched pages + the 2 pages that were used up
+        self.assertLessEqual(_call.call_count, 7)
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_error(self, _call):
+        def fake_call(*_, **kwargs):
+            if kwargs['offset'] == 20:
+                raise exceptions.SoftLayerAPIError('SoftLayer_Exception', 'Page failed')
+            return transports.SoftLayerListResult(range(kwargs['offset'], kwargs['offset'] + 10), 50)
+        _call.side_effect = fake_call
+
+        results = self.client.cf_iter_call('SERVICE', 'METHOD', limit=10)
+        self.assertEqual([next(results) for _ in range(20)], list(range(20)))
+        self.assertRaises(exceptions.SoftLayerAPIError, next, results)
+
+    def test_invalid_limits(self):
+        self.assertRaises(AttributeError, list, self.client.cf_iter_call('SERVICE', 'METHOD', limit=0))
+        self.assertRaises(AttributeError, list, self.client.cf_iter_call('SERVICE', 'METHOD', max_workers=0))
+
+
+class BatchTests(testing.TestCase):
+    """Tests for client.batch(), which makes many API calls at once"""
+
+    def test_batch(self):
+        with self.client.batch() as batch:
+            first = batch.call('SoftLayer_Virtual_Guest', 'setTags', 'tag1', id=100)
+            second = batch['Virtual_Guest'].getObject(id=200, mask='id')
+            # Nothing is sent until the block ends
+            self.assertFalse(first.done())
+            self.assertEqual(self.calls(), [])
+
+        self.assertTrue(first.result())
+        self.assertEqual(second.result()['id'], 100)
+        self.assertEqual(len(batch), 2)
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'setTags', identifier=100, args=('tag1',))
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'getObject', identifier=200, mask='mask[id]')
+
+    @mock.patch('SoftLayer.API.BaseClient.call')
+    def test_results_in_order(self, _call):
+        # Earlier calls take the longest, results should still be in the order the calls were added
+        def fake_call(_, __, number):
+            time.sleep((5 - number) * 0.02)
+            return number
+        _call.side_effect = fake_call
+
+        with self.client.batch(max_workers=5) as batch:
+            for number in range(5):
+                batch.call('SERVICE', 'METHOD', number)
+
+        self.assertEqual(batch.results(), [0, 1, 2, 3, 4])
+        self.assertEqual([future.result() for future in batch.futures], [0, 1, 2, 3, 4])
+
+    def test_error(self):
+        mock = self.set_mock('SoftLayer_Virtual_Guest', 'setTags')
+        mock.side_effect = [True, exceptions.SoftLayerAPIError('SoftLayer_Exception', 'Tag failed'), True]
+
+        with self.client.batch(max_workers=1) as batch:
+            for guest_id in (1, 2, 3):
+                batch['Virtual_Guest'].setTags('tag1', id=guest_id)
+
+        results = batch.results()
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], exceptions.SoftLayerAPIError)
+        self.assertEqual(results[1].faultString, 'Tag failed')
+        self.assertTrue(results[2])
+        self.assertRaises(exceptions.SoftLayerAPIError, batch.futures[1].result)
+
+    def test_dispatch(self):
+        batch = self.client.batch()
+        future = batch.call('SoftLayer_Account', 'getObject')
+        self.assertEqual(batch.dispatch(), [future])
+        self.assertEqual(future.result()['accountId'], 1234)
+        # Calls that were already made are not made again
+        batch.dispatch()
+        self.assertEqual(len(self.calls('SoftLayer_Account', 'getObject')), 1)
+
+    def test_exception_in_block(self):
+        def run():
+            with self.client.batch() as batch:
+                future = batch.call('SoftLayer_Account', 'getObject')
+                raise ValueError(future)
+
+        ex = self.assertRaises(ValueError, run)
+        self.assertTrue(ex.args[0].cancelled())
+        self.assertEqual(self.calls(), [])
+
+    def test_invalid_kwargs(self):
+        with self.client.batch() as batch:
+            future = batch.call('SoftLayer_Account', 'getObject', invalid=True)
+        self.assertRaises(TypeError, future.result)
+
+    def test_invalid_workers(self):
+        self.assertRaises(AttributeError, self.client.batch, max_workers=0)
+
+
+class AsyncClientTests(testing.TestCase):
+
+    def set_up(self):
+        self.async_client = SoftLayer.AsyncClient(
+            transport=transports.AsyncXmlRpcTransport(endpoint_url=self.endpoint_url))
+
+    def _run(self, coro_func):
+        async def run():
+            async with self.async_client:
+                return await coro_func()
+        return asyncio.run(run())
+
+    def test_init(self):
+        client = SoftLayer.create_async_client_from_env(username='doesnotexist',
+                                                        api_key='issurelywrong',
+                                                        timeout=10,
+                                                        endpoint_url='http://example.com/v3/rest/')
+        self.assertIsInstance(client, SoftLayer.AsyncClient)
+        self.assertIsInstance(client.auth, SoftLayer.BasicHTTPAuthentication)
+        self.assertIsInstance(client.transport, transports.AsyncRestTransport)
+        self.assertEqual(client.transport.timeout, 10)
+
+    def test_init_xmlrpc(self):
+        client = SoftLayer.create_async_client_from_env(username='doesnotexist',
+                                                        api_key='issurelywrong',
+                                                        endpoint_url='http://example.com/v3/xmlrpc/')
+        self.assertIsInstance(client.auth, SoftLayer.BasicAuthentication)
+        self.assertIsInstance(client.transport, transports.AsyncXmlRpcTransport)
+        self.assertIn("AsyncClient", repr(client))
+
+    def test_call(self):
+        mock = self.set_mock('SoftLayer_SERVICE', 'METHOD')
+        mock.return_value = {"test": "result"}
+
+        resp = self._run(lambda: self.async_client.call('SERVICE', 'METHOD', id=5678, mask='id'))
+
+        self.assertEqual(resp, {"test": "result"})
+        self.assert_called_with('SoftLayer_SERVICE', 'METHOD', identifier=5678, mask='mask[id]')
+
+    def test_service_call(self):
+        mock = self.set_mock('SoftLayer_SERVICE', 'METHOD')
+        mock.return_value = {"test": "result"}
+
+        resp = self._run(lambda: self.async_client['SERVICE'].METHOD('arg1', limit=5))
+
+        self.assertEqual(resp, {"test": "result"})
+        self.assert_called_with('SoftLayer_SERVICE', 'METHOD', args=('arg1',), limit=5)
+        self.assertIn("AsyncService", repr(self.async_client['SERVICE']))
+
+    def test_call_auth(self):
+        self.async_client.auth = slauth.BasicAuthentication('user', 'key')
+        self.set_mock('SoftLayer_SERVICE', 'METHOD').return_value = {}
+
+        self._run(lambda: self.async_client.call('SERVICE', 'METHOD'))
+
+        call = self.calls('SoftLayer_SERVICE', 'METHOD')[0]
+        self.assertEqual(call.headers['authenticate'], {'username': 'user', 'apiKey': 'key'})
+
+    def test_call_invalid_arguments(self):
+        self.assertRaises(TypeError, self._run, lambda: self.async_client.call('SERVICE', 'METHOD', invalid_kwarg='x'))
+
+    def test_concurrent_calls(self):
+        mock = self.set_mock('SoftLayer_SERVICE', 'METHOD')
+        mock.side_effect = lambda call: {'id': call.identifier}
+
+        async def run():
+            return await asyncio.gather(*[self.async_client.call('SERVICE', 'METHOD', id=x) for x in range(20)])
+
+        resp = self._run(run)
+        self.assertEqual(resp, [{'id': x} for x in range(20)])
+
+    @mock.patch('SoftLayer.API.AsyncClient.call', new_callable=mock.AsyncMock)
+    def test_iter_call(self, _call):
+        _call.side_effect = [
+            transports.SoftLayerListResult(range(0, 10), 25),
+            transports.SoftLayerListResult(range(10, 20), 25),
+            transports.SoftLayerListResult(range(20, 25), 25),
+        ]
+
+        async def run():
+            return [item async for item in self.async_client.iter_call('SERVICE', 'METHOD', limit=10)]
+
+        self.assertEqual(self._run(run), list(range(25)))
+        self.assertEqual([call.kwargs['offset'] for call in _call.call_args_list], [0, 10, 20])
+
+    @mock.patch('SoftLayer.API.AsyncClient.iter_call')
+    def test_call_iter(self, _iter_call):
+        async def fake_iter(*_, **__):
+            for item in range(15):
+                yield item
+        _iter_call.side_effect = fake_iter
+
+        resp = self._run(lambda: self.async_client.call('SERVICE', 'METHOD', iter=True, limit=10))
+        self.assertEqual(resp, list(range(15)))
+        _iter_call.assert_called_with('SERVICE', 'METHOD', limit=10)
+
+    def test_iter_call_not_a_list(self):
+        self.set_mock('SoftLayer_SERVICE', 'METHOD').return_value = {'id': 1}
+
+        async def run():
+            return [item async for item in self.async_client['SERVICE'].iter_call('METHOD')]
+
+        self.assertEqual(self._run(run), [{'id': 1}])
+
+    def test_iter_call_invalid_limit(self):
+        async def run():
+            return [item async for item in self.async_client.iter_call('SERVICE', 'METHOD', limit=0)]
+
+        self.assertRaises(AttributeError, self._run, run)
@@ -4,6 +4,7 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import configparser
 from unittest import mock as mock
 
 from SoftLayer import config
@@ -87,6 +88,25 @@ def test_no_section(self, config_parser):
         self.assertIsNone(result)
 
 
+class TestGetSessionOptions(testing.TestCase):
+
+    def test_session_options(self):
+        parser = configparser.ConfigParser()
+        parser.read_string("""[softlayer]
+username = test
+pool_maxsize = 50
+pool_block = true
+backoff_factor = 0.5
+keep_alive = no
+retries =
+""")
+        result = config.get_session_options(parser)
+        self.assertEqual(result, {'pool_maxsize': 50, 'pool_block': True, 'backoff_factor': 0.5, 'keep_alive': False})
+
+    def test_no_section(self):
+        self.assertEqual(config.get_session_options(configparser.ConfigParser()), {})
+
+
 @mock.patch('configparser.RawConfigParser')
 def test_config_file(config_parser):
     config.get_client_settings_config_file(config_file='path/to/config')
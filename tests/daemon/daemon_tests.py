@@ -0,0 +1,277 @@
+"""
+    SoftLayer.tests.daemon.daemon_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock as mock
+
+from SoftLayer.CLI import exceptions
+from SoftLayer import consts
+from SoftLayer.daemon import client
+from SoftLayer.daemon import server
+from SoftLayer import testing
+
+
+class ProtocolTests(testing.TestCase):
+
+    def test_round_trip(self):
+        left, right = socket.socketpair()
+        with left, right:
+            client.send_message(left, {'command': 'ping', 'text': 'café'})
+            client.send_message(left, {'second': True})
+            self.assertEqual(client.recv_message(right), ({'command': 'ping', 'text': 'café'}, []))
+            self.assertEqual(client.recv_message(right)[0], {'second': True})
+            left.close()
+            self.assertEqual(client.recv_message(right), (None, []))
+
+    def test_fds(self):
+        read_fd, write_fd = os.pipe()
+        left, right = socket.socketpair()
+        with left, right:
+            client.send_message(left, {'command': 'run'}, fds=[write_fd])
+            message, fds = client.recv_message(right, max_fds=3)
+        os.close(write_fd)
+        self.assertEqual(message, {'command': 'run'})
+        self.assertEqual(len(fds), 1)
+        os.write(fds[0], b'hello')
+        os.close(fds[0])
+        self.assertEqual(os.read(read_fd, 10), b'hello')
+        os.close(read_fd)
+
+    def test_too_big(self):
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(client.HEADER.pack(client.MAX_MESSAGE + 1))
+            self.assertRaises(client.DaemonError, client.recv_message, right)
+
+    @mock.patch.dict(os.environ, {'SLCLI_SOCKET': '/tmp/test.sock'})
+    def test_socket_path(self):
+        self.assertEqual(client.socket_path(), '/tmp/test.sock')
+
+    @mock.patch.dict(os.environ, {'XDG_RUNTIME_DIR': '/run/user/1000'}, clear=True)
+    def test_socket_path_default(self):
+        self.assertEqual(client.socket_path(), '/run/user/1000/slcli-%d/daemon.sock' % os.getuid())
+
+    def test_private_directory(self):
+        directory = os.path.join(tempfile.mkdtemp(), 'slcli')
+        client.make_private_directory(directory)
+        client.make_private_directory(directory)
+        self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+
+        os.chmod(directory, 0o777)
+        self.assertRaises(client.DaemonError, client.make_private_directory, directory)
+
+    def test_not_a_socket(self):
+        path = os.path.join(tempfile.mkdtemp(), 'fake.sock')
+        with open(path, 'w', encoding='utf-8'):
+            pass
+        self.assertRaises(client.DaemonError, client.request, {'command': 'ping'}, path)
+
+    def test_other_users_socket(self):
+        path = os.path.join(tempfile.mkdtemp(), 'other.sock')
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(1)
+        with listener, mock.patch('os.getuid', return_value=os.getuid() + 1):
+            ex = self.assertRaises(client.DaemonError, client.connect, path)
+        self.assertIn("isn't a socket owned by you", str(ex))
+
+    @unittest.skipUnless(hasattr(socket, 'SO_PEERCRED'), "Needs SO_PEERCRED")
+    @mock.patch('socket.socket.getsockopt')
+    def test_other_users_peer(self, getsockopt):
+        getsockopt.return_value = struct.pack('3i', 1, os.getuid() + 1, 1)
+        left, right = socket.socketpair()
+        with left, right:
+            self.assertRaises(client.DaemonError, client.check_peer, left)
+
+    def test_not_running(self):
+        path = os.path.join(tempfile.mkdtemp(), 'missing.sock')
+        self.assertRaises(client.DaemonNotRunning, client.request, {'command': 'ping'}, path)
+
+
+class ServerTests(testing.TestCase):
+
+    def set_up(self):
+        self.server = server.DaemonServer(os.path.join(tempfile.mkdtemp(), 'slcli.sock'))
+
+    def handle(self, message, fds=None):
+        left, right = socket.socketpair()
+        with left, right:
+            client.send_message(left, message, fds=fds)
+            left.shutdown(socket.SHUT_WR)
+            self.server.handle(right)
+            return client.recv_message(left)[0]
+
+    def run_command(self, args, env=None):
+        """Runs a command through handle(), returns (answer, stdout, stderr)"""
+        stdin = os.open(os.devnull, os.O_RDONLY)
+        out_read, out_write = os.pipe()
+        err_read, err_write = os.pipe()
+        message = {'command': 'run', 'version': consts.VERSION, 'args': args, 'env': env or {}, 'cwd': '/'}
+        answer = self.handle(message, fds=[stdin, out_write, err_write])
+        for fd in (stdin, out_write, err_write):
+            os.close(fd)
+        with os.fdopen(out_read) as stdout, os.fdopen(err_read) as stderr:
+            return answer, stdout.read(), stderr.read()
+
+    def test_ping(self):
+        answer = self.handle({'command': 'ping'})
+        self.assertEqual(answer['pid'], os.getpid())
+        self.assertEqual(answer['version'], consts.VERSION)
+        self.assertEqual(answer['commands_run'], 0)
+
+    def test_unknown(self):
+        self.assertIn('error', self.handle({'command': 'explode'}))
+
+    def test_version_mismatch(self):
+        answer = self.handle({'command': 'run', 'version': 'v0.0.0', 'args': []})
+        self.assertIn('v0.0.0', answer['error'])
+
+    def test_missing_fds(self):
+        answer = self.handle({'command': 'run', 'version': consts.VERSION, 'args': []})
+        self.assertIn('error', answer)
+
+    def test_run(self):
+        stdout, environ, cwd = sys.stdout, dict(os.environ), os.getcwd()
+        answer, output, _ = self.run_command(['--demo', '--format', 'json', 'vs', 'list'], {'SLCLI_TEST': '1'})
+
+        self.assertEqual(answer, {'exit_code': 0})
+        self.assertEqual(len(json.loads(output)), 2)
+        # Everything the command changed is put back
+        self.assertIs(sys.stdout, stdout)
+        self.assertEqual(dict(os.environ), environ)
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertEqual(self.server.commands_run, 1)
+
+    def test_run_environment(self):
+        answer, output, _ = self.run_command(['--format', 'json', 'config', 'show'],
+                                             {'SL_USERNAME': 'daemon-user', 'SL_API_KEY': 'x' * 64})
+        self.assertEqual(answer, {'exit_code': 0})
+        self.assertEqual(json.loads(output)['Username'], 'daemon-user')
+
+    def test_run_exit_code(self):
+        answer, _, stderr = self.run_command(['--demo', 'vs', 'detail'])
+        self.assertEqual(answer, {'exit_code': 2})
+        self.assertIn('Missing argument', stderr)
+
+    def test_exit_with_message(self):
+        with mock.patch('SoftLayer.CLI.core.main', side_effect=SystemExit("Broken")):
+            answer, _, stderr = self.run_command(['vs', 'list'])
+        self.assertEqual(answer, {'exit_code': 1})
+        self.assertEqual(stderr, 'Broken\n')
+
+    def test_serve(self):
+        thread = threading.Thread(target=self.server.serve_forever)
+        self.server.bind()
+        thread.start()
+        try:
+            self.assertEqual(client.request({'command': 'ping'}, self.server.path)['commands_run'], 0)
+            # Only one daemon per socket
+            self.assertRaises(client.DaemonError, server.DaemonServer(self.server.path).bind)
+        finally:
+            self.assertEqual(client.request({'command': 'stop'}, self.server.path), {'stopping': True})
+            thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(self.server.path))
+
+    def test_stale_socket(self):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.server.path)
+        stale.close()
+        self.server.bind()
+        self.assertEqual(os.stat(self.server.path).st_mode & 0o777, 0o600)
+        self.server.close()
+
+    def test_not_a_stale_socket(self):
+        with open(self.server.path, 'w', encoding='utf-8') as other:
+            other.write('keep me')
+        self.assertRaises(client.DaemonError, self.server.bind)
+        self.assertTrue(os.path.isfile(self.server.path))
+
+    @mock.patch.dict(os.environ, clear=True)
+    def test_default_directory(self):
+        os.environ['XDG_RUNTIME_DIR'] = tempfile.mkdtemp()
+        daemon = server.DaemonServer()
+        daemon.bind()
+        daemon.close()
+        self.assertEqual(os.stat(client.socket_directory()).st_mode & 0o777, 0o700)
+
+    def test_idle_timeout(self):
+        self.server.idle_timeout = 0.01
+        self.server.serve_forever()
+        self.assertFalse(os.path.exists(self.server.path))
+
+
+class ClientTests(testing.TestCase):
+
+    @mock.patch('SoftLayer.CLI.core.main')
+    @mock.patch('SoftLayer.daemon.client.run')
+    def test_main_not_running(self, run_mock, main_mock):
+        run_mock.side_effect = client.DaemonNotRunning("Not running")
+        with mock.patch.object(sys, 'argv', ['slclid', 'vs', 'list']):
+            client.main()
+        run_mock.assert_called_once_with(['vs', 'list'])
+        main_mock.assert_called_once_with()
+
+    @mock.patch('SoftLayer.daemon.client.run')
+    def test_main(self, run_mock):
+        run_mock.return_value = 3
+        with mock.patch.object(sys, 'argv', ['slclid', 'vs', 'list']):
+            self.assertRaises(SystemExit, client.main)
+
+    @mock.patch('SoftLayer.CLI.core.main')
+    @mock.patch('SoftLayer.daemon.client.run')
+    def test_main_daemon_commands(self, run_mock, main_mock):
+        with mock.patch.object(sys, 'argv', ['slclid', 'daemon', 'stop']):
+            client.main()
+        run_mock.assert_not_called()
+        main_mock.assert_called_once_with()
+
+
+class DaemonCommandTests(testing.TestCase):
+
+    def test_status_not_running(self):
+        result = self.run_command(['daemon', 'status', '--socket', '/nonexistent/slcli.sock'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIsInstance(result.exception, exceptions.CLIAbort)
+
+    def test_status(self):
+        answer = {'pid': 42, 'version': consts.VERSION, 'path': '/tmp/slcli.sock', 'uptime': 3725,
+                  'commands_run': 7, 'idle_timeout': 3600}
+        with mock.patch('SoftLayer.daemon.client.request', return_value=answer):
+            result = self.run_command(['daemon', 'status'])
+        self.assert_no_fail(result)
+        output = json.loads(result.output)
+        self.assertEqual(output['PID'], 42)
+        self.assertEqual(output['Uptime'], '1:02:05')
+
+    @mock.patch('SoftLayer.daemon.client.request')
+    def test_stop(self, request_mock):
+        request_mock.return_value = {'stopping': True}
+        result = self.run_command(['daemon', 'stop'])
+        self.assert_no_fail(result)
+        request_mock.assert_called_once_with({'command': 'stop'}, None)
+
+    @mock.patch('SoftLayer.daemon.server.DaemonServer')
+    def test_start_foreground(self, server_mock):
+        server_mock.return_value.path = '/tmp/slcli.sock'
+        result = self.run_command(['daemon', 'start', '--foreground', '--idle-timeout', '60'])
+        self.assert_no_fail(result)
+        server_mock.assert_called_once_with(None, 60)
+        server_mock.return_value.serve_forever.assert_called_once_with()
+
+    @mock.patch('SoftLayer.daemon.server.DaemonServer')
+    def test_start_running(self, server_mock):
+        server_mock.return_value.bind.side_effect = client.DaemonError("Already running")
+        result = self.run_command(['daemon', 'start'])
+        self.assertEqual(result.exit_code, 2)
+        server_mock.return_value.serve_forever.assert_not_called()
@@ -0,0 +1,93 @@
+"""
+    SoftLayer.tests.import_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    slcli is run by cron jobs a lot, so importing it has to stay fast.
+
+    :license: MIT, see LICENSE for more details.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+import SoftLayer
+from SoftLayer import managers
+from SoftLayer import testing
+from SoftLayer import transports
+
+#: Most time importing SoftLayer.CLI.core can take, in seconds. It takes around 0.06s, eagerly importing
+#: everything took around 0.6s. Only checked with SL_IMPORT_BENCHMARK set, timings are too noisy on shared CI.
+IMPORT_BUDGET = 0.3
+
+#: Modules that shouldn't be imported just to start slcli
+LAZY_MODULES = ('aiohttp', 'rich', 'requests', 'prompt_toolkit', 'SoftLayer.API', 'SoftLayer.managers.vs',
+                'SoftLayer.transports.xmlrpc')
+
+
+def import_times(module):
+    """Imports a module in a new python with -X importtime, returns {module: cumulative seconds}"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1]) / 1000000
+    return times
+
+
+class ImportTimeTests(testing.TestCase):
+
+    @unittest.skipUnless(os.environ.get('SL_IMPORT_BENCHMARK'), "Set SL_IMPORT_BENCHMARK to time imports")
+    def test_cli_budget(self):
+        # Best of 3, so a busy machine doesn't fail the test
+        best = min(import_times('SoftLayer.CLI.core')['SoftLayer.CLI.core'] for _ in range(3))
+        self.assertLess(best, IMPORT_BUDGET)
+
+    def test_lazy_modules(self):
+        times = import_times('SoftLayer.CLI.core')
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, times)
+
+
+class LazyAttributeTests(testing.TestCase):
+
+    def test_softlayer(self):
+        from SoftLayer.managers.vs import VSManager
+        self.assertIs(SoftLayer.VSManager, VSManager)
+        self.assertIs(SoftLayer.BaseClient, SoftLayer.API.BaseClient)
+        self.assertIs(SoftLayer.BasicAuthentication, SoftLayer.auth.BasicAuthentication)
+        self.assertIs(SoftLayer.SoftLayerListResult, transports.SoftLayerListResult)
+        self.assertIn('VSManager', dir(SoftLayer))
+        for name in SoftLayer.__all__:
+            self.assertIsNotNone(getattr(SoftLayer, name))
+
+    def test_submodules(self):
+        self.assertEqual(SoftLayer.utils.lookup({'a': 1}, 'a'), 1)
+        self.assertTrue(hasattr(SoftLayer.transports.xmlrpc, 'XmlRpcDecoder'))
+
+    def test_managers(self):
+        for name in managers.__all__:
+            self.assertEqual(getattr(managers, name).__name__, name)
+        self.assertEqual(sorted(managers.__all__), sorted(name for name in dir(managers) if name.endswith('Manager')))
+
+    def test_manager_submodules(self):
+        # In a new python, so nothing has imported them yet
+        code = ("import SoftLayer; from SoftLayer import managers; "
+                "print(managers.storage.StorageManager.__name__, managers.hardware.HardwareManager.__name__, "
+                "SoftLayer.managers.storage_utils.__name__, hasattr(managers, 'not_a_module'))")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(),
+                         ['StorageManager', 'HardwareManager', 'SoftLayer.managers.storage_utils', 'False'])
+
+    def test_transports(self):
+        for name in transports.__all__:
+            self.assertEqual(getattr(transports, name).__name__, name)
+
+    def test_missing(self):
+        self.assertRaises(AttributeError, getattr, SoftLayer, 'NotAManager')
+        self.assertRaises(AttributeError, getattr, managers, 'NotAManager')
+        self.assertRaises(AttributeError, getattr, transports, 'NotATransport')
+        self.assertFalse(hasattr(SoftLayer, '__wrapped__'))
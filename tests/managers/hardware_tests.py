@@ -10,6 +10,7 @@
 
 import SoftLayer
 from SoftLayer import fixtures
+from SoftLayer.fixtures import SoftLayer_Product_Order
 from SoftLayer import managers
 from SoftLayer import testing
 
@@ -95,6 +96,25 @@ def test_resolve_ids_hostname(self):
         _id = self.hardware._get_ids_from_hostname('hardware-test1')
         self.assertEqual(_id, [1000, 1001, 1002, 1003])
 
+    def test_resolve_ids_many(self):
+        result = self.hardware.resolve_ids_many(['hardware-test2', '172.16.1.100', 'nope'])
+
+        self.assertEqual(result, {'hardware-test2': [1001], '172.16.1.100': [1000], 'nope': []})
+        call = self.calls('SoftLayer_Account', 'getHardware')[0]
+        self.assertEqual(call.mask, 'mask[id,primaryIpAddress]')
+        self.assertEqual(call.filter['hardware']['primaryIpAddress'],
+                         {'operation': 'in', 'options': [{'name': 'data', 'value': ['172.16.1.100']}]})
+        # The address matched a public IP, so it isn't looked up as a private one
+        self.assertEqual(len(self.calls('SoftLayer_Account', 'getHardware')), 2)
+
+    def test_wait_for_ready_many(self):
+        result = self.hardware.wait_for_ready_many([1000, 1001, 1003], limit=0)
+
+        self.assertEqual([server['id'] for server in result], [1000, 1001])
+        call = self.calls('SoftLayer_Account', 'getHardware')[0]
+        self.assertEqual(call.filter['hardware']['id'],
+                         {'operation': 'in', 'options': [{'name': 'data', 'value': [1000, 1001, 1003]}]})
+
     def test_get_hardware(self):
         result = self.hardware.get_hardware(1000)
 
@@ -415,6 +435,27 @@ def test_place_order(self, create_dict, place_order):
         create_dict.assert_called_once_with(test=1, verify=1)
         place_order.assert_called_once_with(test=1, verify=1)
 
+    @mock.patch('SoftLayer.managers.ordering.OrderingManager.generate_order')
+    def test_place_orders(self, generate_order):
+        def generate(item_keynames, extras, **_):
+            if 'NOPE' in item_keynames:
+                raise SoftLayer.SoftLayerError('Item NOPE does not exist for package BARE_METAL_SERVER')
+            return {'orderContainers': [dict(extras, prices=[])]}
+        generate_order.side_effect = generate
+        place_order = self.set_mock('SoftLayer_Product_Order', 'placeOrder')
+        place_order.return_value = SoftLayer_Product_Order.hardware_placeOrder
+        args = dict(MINIMAL_TEST_CREATE_ARGS, location='wdc07', os='OS_UBUNTU_14_04_LTS_TRUSTY_TAHR_64_BIT')
+        servers = [dict(args, hostname='hw1'), dict(args, hostname='hw2'), dict(args, hostname='hw3', extras=['NOPE'])]
+
+        results = self.hardware.place_orders(servers, rate=0)
+
+        self.assertEqual([result['status'] for result in results], ['ordered', 'ordered', 'failed'])
+        self.assertEqual(results[0]['order_id'], 78332111)
+        self.assertIn('NOPE', results[2]['error'])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Order', 'verifyOrder')), 1)
+        placed = [call.args[0]['orderContainers'][0] for call in self.calls('SoftLayer_Product_Order', 'placeOrder')]
+        self.assertEqual(sorted(order['hardware'][0]['hostname'] for order in placed), ['hw1', 'hw2'])
+
     def test_cancel_hardware_without_reason(self):
         mock = self.set_mock('SoftLayer_Hardware_Server', 'getObject')
         mock.return_value = {'id': 987, 'billingItem': {'id': 1234}, 'openCancellationTicket': {'id': 1234}}
@@ -515,6 +556,16 @@ def test_edit_meta(self):
 
         self.assert_called_with('SoftLayer_Hardware_Server', 'setUserMetadata', args=(['my data'],), identifier=100)
 
+    @mock.patch('SoftLayer.decoration.sleep')
+    def test_set_tags(self, _sleep):
+        set_tags = self.set_mock('SoftLayer_Hardware_Server', 'setTags')
+        set_tags.side_effect = [SoftLayer.exceptions.ApplicationError('-32500', 'Try again'), True]
+
+        self.hardware.set_tags('db,prod', 100)
+
+        self.assertEqual(len(self.calls('SoftLayer_Hardware_Server', 'setTags')), 2)
+        self.assert_called_with('SoftLayer_Hardware_Server', 'setTags', identifier=100, args=('db,prod',))
+
     def test_edit_blank(self):
         # Now test a blank edit
         self.assertTrue(self.hardware.edit, 100)
@@ -843,6 +894,23 @@ def test_notification_del(self):
         self.hardware.remove_notification(100)
         self.assert_called_with('SoftLayer_User_Customer_Notification_Hardware', 'deleteObjects')
 
+    def test_add_notifications(self):
+        mock = self.set_mock('SoftLayer_User_Customer_Notification_Hardware', 'createObject')
+
+        def create_notification(call):
+            if call.args[0]['userId'] == 654321:
+                raise SoftLayer.SoftLayerAPIError('SoftLayer_Exception', 'No user')
+            return {'id': 1}
+        mock.side_effect = create_notification
+        result = self.hardware.add_notifications(100, [123456, 654321])
+        self.assertEqual(result[0], {'id': 1})
+        self.assertIsInstance(result[1], SoftLayer.SoftLayerAPIError)
+
+    def test_notifications_del(self):
+        self.hardware.remove_notifications([100, 200])
+        self.assert_called_with('SoftLayer_User_Customer_Notification_Hardware', 'deleteObjects',
+                                args=([{'id': 100}, {'id': 200}],))
+
     def test_get_software_component(self):
         self.hardware.get_software_components(123456)
         self.assert_called_with('SoftLayer_Hardware', 'getSoftwareComponents')
@@ -1005,3 +1073,27 @@ def test_is_private(self):
         item_public = {'attributes': [{'attributeTypeKeyName': 'NOT_PRIVATE_NETWORK_ONLY'}]}
         self.assertTrue(managers.hardware._is_private_port_speed_item(item_private))
         self.assertFalse(managers.hardware._is_private_port_speed_item(item_public))
+
+    def test_catalog_prices(self):
+        items = [
+            {'id': 1, 'prices': [{'id': 10, 'itemId': 1, 'locationGroupId': '', 'recurringFee': '1.0'},
+                                 {'id': 11, 'itemId': 1, 'locationGroupId': 503, 'recurringFee': '2.0'}]},
+            {'id': 2, 'prices': [{'id': 20, 'itemId': 2, 'locationGroupId': None, 'recurringFee': '3.0'}]},
+        ]
+        catalog = managers.ordering.Catalog(items)
+
+        self.assertEqual([price['id'] for price in catalog.get_item_prices(items[0])], [10])
+        self.assertEqual([price['id'] for price in catalog.get_item_prices(items[0], 503)], [11])
+        self.assertEqual([price['id'] for price in catalog.get_item_prices(items[1], 503)], [20])
+        self.assertEqual(catalog.get_group_prices({'id': 3}, 503), [])
+        self.assertEqual(managers.hardware.get_item_price(items[0]['prices'], 503), [items[0]['prices'][1]])
+        self.assertEqual(managers.hardware.get_item_price(items[0]['prices'], 509), [items[0]['prices'][0]])
+
+        preset = {'prices': [items[1]['prices'][0], items[0]['prices'][0]]}
+        for group in [None, 503]:
+            self.assertEqual(managers.hardware._get_preset_cost(preset, catalog, 'monthly', group),
+                             managers.hardware._get_preset_cost(preset, items, 'monthly', group))
+        self.assertEqual(managers.hardware.find_item_in_package('recurringFee', catalog, 503, items[0]['prices'][0]),
+                         2.0)
+        self.assertEqual(managers.hardware.find_item_in_package('recurringFee', items, 503, items[0]['prices'][0]),
+                         2.0)
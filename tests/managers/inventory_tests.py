@@ -0,0 +1,193 @@
+"""
+    SoftLayer.tests.managers.inventory_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import os
+import sqlite3
+import tempfile
+from unittest import mock as mock
+
+import SoftLayer
+from SoftLayer import fixtures
+from SoftLayer.managers import inventory
+from SoftLayer import testing
+
+GUESTS = [
+    {'id': 1, 'hostname': 'web1', 'modifyDate': '2024-01-01T10:00:00-06:00'},
+    {'id': 2, 'hostname': 'web2', 'modifyDate': '2024-01-02T10:00:00-06:00'},
+    {'id': 3, 'hostname': 'db1', 'modifyDate': '2024-01-03T10:00:00-06:00'},
+]
+
+
+class InventoryTests(testing.TestCase):
+
+    def set_up(self):
+        self.inventory = inventory.InventoryManager(self.client, path=':memory:')
+
+    def tear_down(self):
+        self.inventory.close()
+
+    def mock_guests(self, guests, changed=None):
+        """Answers getVirtualGuests like the API would, from a list of guests."""
+        def get_guests(call):
+            _filter = call.filter.get('virtualGuests', {})
+            if 'modifyDate' in _filter:
+                return changed if changed is not None else guests
+            if 'operation' in _filter.get('id', {}) and _filter['id']['operation'] == 'in':
+                ids = _filter['id']['options'][0]['value']
+                return [guest for guest in guests if guest['id'] in ids]
+            if call.mask == 'mask[id]':
+                return [{'id': guest['id']} for guest in guests]
+            return guests
+        self.set_mock('SoftLayer_Account', 'getVirtualGuests').side_effect = get_guests
+
+    def test_refresh(self):
+        results = self.inventory.refresh()
+
+        self.assertEqual(sorted(results), sorted(inventory.KINDS))
+        self.assertTrue(all(result['full'] for result in results.values()))
+        self.assertEqual(results['virtual']['total'], len(fixtures.SoftLayer_Account.getVirtualGuests))
+        self.assertEqual(results['vlan']['total'], len(fixtures.SoftLayer_Account.getNetworkVlans))
+        self.assertEqual(self.inventory.get('virtual', 100)['hostname'], 'vs-test1')
+        self.assertIsNone(self.inventory.get('virtual', 12345))
+        call = self.calls('SoftLayer_Account', 'getAllTopLevelBillingItems')[0]
+        self.assertEqual(call.filter['allTopLevelBillingItems']['cancellationDate'], {'operation': 'is null'})
+
+    def test_find(self):
+        self.inventory.refresh()
+
+        def ids(kind=None, **lookups):
+            return [item['id'] for item in self.inventory.find(kind, **lookups)]
+
+        self.assertEqual(ids('virtual', hostname='VS-TEST1'), [100])
+        self.assertEqual(ids('virtual', hostname='vs-test2.test.sftlyr.ws'), [104])
+        self.assertEqual(ids(ip='10.45.19.37'), [100])
+        self.assertEqual(ids('virtual', datacenter='test00'), [100, 104])
+        self.assertEqual(ids('vlan', datacenter='dal00'), [1, 2, 3])
+        self.assertEqual(ids(tag='test_tag'), [1000])
+        self.assertEqual(ids(vlan=9653), [1000, 1001, 1002])
+        self.assertEqual(ids('subnet', vlan=123), ['100'])
+        self.assertEqual(ids('hardware', tag='test_tag', datacenter='nope'), [])
+        self.assertRaises(ValueError, self.inventory.find, 'virtual', color='blue')
+
+    def test_incremental(self):
+        self.mock_guests(GUESTS)
+        self.assertTrue(self.inventory.refresh(['virtual'])['virtual']['full'])
+
+        # web2 was deleted, db1 changed, app1 is new
+        guests = [GUESTS[0], dict(GUESTS[2], hostname='db2', modifyDate='2024-02-01T10:00:00-06:00'),
+                  {'id': 4, 'hostname': 'app1', 'modifyDate': '2024-03-01T10:00:00-06:00'}]
+        self.mock_guests(guests, changed=guests[1:])
+        result = self.inventory.refresh(['virtual'])['virtual']
+
+        self.assertEqual(result, {'full': False, 'updated': 2, 'removed': 1, 'total': 3})
+        self.assertEqual([guest['hostname'] for guest in self.inventory.find('virtual')], ['web1', 'db2', 'app1'])
+        self.assertEqual(self.inventory.find(hostname='db1'), [])
+        date_filter = self.calls('SoftLayer_Account', 'getVirtualGuests')[-1].filter['virtualGuests']['modifyDate']
+        self.assertEqual(date_filter['operation'], 'greaterThanDate')
+        self.assertEqual(date_filter['options'][0]['value'], ['2024-01-03T10:00:00-06:00'])
+
+        # The next refresh starts from the latest date it has seen
+        self.inventory.refresh(['virtual'])
+        date_filter = self.calls('SoftLayer_Account', 'getVirtualGuests')[-1].filter['virtualGuests']['modifyDate']
+        self.assertEqual(date_filter['options'][0]['value'], ['2024-03-01T10:00:00-06:00'])
+
+    def test_incremental_missing(self):
+        self.mock_guests(GUESTS[:2])
+        self.inventory.refresh(['virtual'])
+
+        # A new guest that the date filter doesn't find is fetched by its id
+        self.mock_guests(GUESTS[:2] + [{'id': 9, 'hostname': 'new'}], changed=[])
+        result = self.inventory.refresh(['virtual'])['virtual']
+
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(self.inventory.get('virtual', 9)['hostname'], 'new')
+        id_filter = self.calls('SoftLayer_Account', 'getVirtualGuests')[-1].filter['virtualGuests']['id']
+        self.assertEqual(id_filter['options'][0]['value'], [9])
+
+    def test_full_refresh_age(self):
+        self.mock_guests(GUESTS)
+        self.inventory.refresh(['virtual'])
+
+        self.inventory.full_refresh_age = -1
+        self.assertTrue(self.inventory.refresh(['virtual'])['virtual']['full'])
+        self.inventory.full_refresh_age = 3600
+        self.assertFalse(self.inventory.refresh(['virtual'])['virtual']['full'])
+        self.assertTrue(self.inventory.refresh(['virtual'], full=True)['virtual']['full'])
+
+    def test_not_incremental(self):
+        self.inventory.refresh(['vlan', 'hardware', 'storage'])
+        results = self.inventory.refresh(['vlan', 'hardware', 'storage'])
+
+        self.assertTrue(all(result['full'] for result in results.values()))
+        for call in self.calls('SoftLayer_Account', 'getNetworkVlans'):
+            self.assertNotIn('modifyDate', call.filter.get('networkVlans', {}))
+
+    def test_ensure_fresh(self):
+        self.assertEqual(sorted(self.inventory.ensure_fresh(60, ['virtual', 'vlan'])), ['virtual', 'vlan'])
+        calls = len(self.calls())
+
+        self.assertEqual(self.inventory.ensure_fresh(60, ['virtual', 'vlan']), {})
+        self.assertEqual(len(self.calls()), calls)
+        self.assertLess(self.inventory.get_age('virtual'), 60)
+        self.assertIsNone(self.inventory.get_age('hardware'))
+
+        with mock.patch('time.time', return_value=self.inventory.get_age('virtual') + 1e10):
+            self.assertEqual(sorted(self.inventory.ensure_fresh(60, ['virtual'])), ['virtual'])
+
+    def test_status(self):
+        self.inventory.refresh(['vlan'])
+        status = self.inventory.get_status()
+
+        self.assertEqual(status['vlan']['count'], 3)
+        self.assertIsNotNone(status['vlan']['refreshed'])
+        self.assertEqual(status['virtual'], {'count': 0, 'refreshed': None, 'full_refreshed': None})
+
+    def test_other_user(self):
+        self.client.auth = SoftLayer.BasicAuthentication('first', 'key')
+        self.inventory.refresh(['vlan'])
+        self.inventory.refresh(['virtual'])
+        self.assertEqual(self.inventory.get_status()['vlan']['count'], 3)
+
+        self.client.auth = SoftLayer.BasicAuthentication('second', 'key')
+        self.inventory.refresh(['virtual'])
+        self.assertEqual(self.inventory.get_status()['vlan']['count'], 0)
+
+    def test_other_endpoint(self):
+        self.inventory.refresh(['vlan'])
+        self.inventory.refresh(['virtual'])
+        self.assertEqual(self.inventory.get_status()['vlan']['count'], 3)
+
+        with mock.patch('SoftLayer.managers.inventory.get_endpoint', return_value='https://somewhere.else/'):
+            self.inventory.refresh(['virtual'])
+        self.assertEqual(self.inventory.get_status()['vlan']['count'], 0)
+
+    def test_summary_by_datacenter(self):
+        self.inventory.refresh(['vlan'])
+        expected = SoftLayer.NetworkManager(self.client).summary_by_datacenter()
+        calls = len(self.calls())
+
+        self.assertEqual(self.inventory.summary_by_datacenter(), expected)
+        self.assertEqual(len(self.calls()), calls)
+
+    def test_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'inventory', 'inventory.db')
+        first = inventory.InventoryManager(self.client, path=path)
+        first.refresh(['vlan'])
+        first.close()
+
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+        self.assertEqual(os.stat(os.path.dirname(path)).st_mode & 0o777, 0o700)
+
+        second = inventory.InventoryManager(self.client, path=path)
+        self.assertEqual(len(second.find('vlan')), 3)
+        second.close()
+
+        # A snapshot from another version of the tables is thrown away
+        with sqlite3.connect(path) as db:
+            db.execute('PRAGMA user_version = 0')
+        third = inventory.InventoryManager(self.client, path=path)
+        self.assertEqual(third.find('vlan'), [])
+        third.close()
@@ -78,6 +78,24 @@ def test_add_securitygroup_rules_with_dict_error(self):
         self.assertRaises(TypeError, self.network.add_securitygroup_rules,
                           rule)
 
+    def test_add_securitygroup_rules_many(self):
+        rule = {'remoteIp': '10.0.0.0/24', 'direction': 'ingress'}
+        mock = self.set_mock('SoftLayer_Network_SecurityGroup', 'addRules')
+
+        def add_rules(call):
+            if call.identifier == 200:
+                raise SoftLayer.SoftLayerAPIError('SoftLayer_Exception', 'Group not found')
+            return True
+        mock.side_effect = add_rules
+
+        result = self.network.add_securitygroup_rules_many([100, 200], [rule])
+
+        self.assertTrue(result[0])
+        self.assertEqual(result[1].faultString, 'Group not found')
+        calls = self.calls('SoftLayer_Network_SecurityGroup', 'addRules')
+        self.assertEqual(sorted(call.identifier for call in calls), [100, 200])
+        self.assertRaises(TypeError, self.network.add_securitygroup_rules_many, [100], rule)
+
     def test_add_subnet_for_ipv4(self):
         # Test a four public address IPv4 order
         result = self.network.add_subnet('public',
@@ -4,11 +4,13 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import threading
 from unittest import mock as mock
 
 import SoftLayer
 from SoftLayer import exceptions
 from SoftLayer import fixtures
+from SoftLayer.managers import ordering
 from SoftLayer import testing
 
 
@@ -897,6 +899,94 @@ def test_issues1425_nonzeroterm(self):
         price_id = self.ordering.get_item_price_id("8", [price2, price1], 37)
         self.assertEqual(None, price_id)
 
+    def test_get_catalog_once(self):
+        items = self.set_mock('SoftLayer_Product_Package', 'getItems')
+        items.return_value = [
+            {'id': 1, 'keyName': 'GUEST_CORE_2', 'capacity': '2', 'itemCategory': {'categoryCode': 'guest_core'},
+             'prices': [{'id': 11, 'locationGroupId': '', 'categories': [{'categoryCode': 'guest_core'}]}]},
+            {'id': 2, 'keyName': 'OS_UBUNTU_22_04', 'itemCategory': {'categoryCode': 'os'},
+             'softwareDescription': {'referenceCode': 'UBUNTU_22_64'},
+             'prices': [{'id': 21, 'locationGroupId': 503, 'categories': [{'categoryCode': 'os'}]},
+                        {'id': 22, 'locationGroupId': None, 'categories': [{'categoryCode': 'os'}]}]},
+        ]
+
+        for _ in range(3):
+            prices = self.ordering.get_price_id_list('PACKAGE_KEYNAME', ['GUEST_CORE_2', 'UBUNTU_22_64'])
+            self.assertEqual(prices, [11, 22])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 1)
+
+        self.ordering.get_catalog('PACKAGE_KEYNAME', refresh=True)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 2)
+
+    def test_catalog(self):
+        prices = [{'id': 1, 'locationGroupId': '', 'termLength': 36, 'categories': [{'categoryCode': 'gpu1'}]},
+                  {'id': 2, 'locationGroupId': '', 'termLength': '', 'categories': [{'categoryCode': 'gpu0'}]},
+                  {'id': 3, 'locationGroupId': 509, 'categories': [{'categoryCode': 'gpu0'}]},
+                  {'id': 4, 'locationGroupId': None, "capacityRestrictionMaximum": "16",
+                   "capacityRestrictionMinimum": "1", "capacityRestrictionType": "CORE",
+                   'categories': [{'categoryCode': 'gpu0'}]}]
+        item = {'id': 10, 'keyName': 'GPU', 'itemCategory': {'categoryCode': 'gpu0'}, 'prices': prices}
+        other = {'id': 11, 'keyName': 'GPU', 'itemCategory': {'categoryCode': 'gpu0'}, 'prices': []}
+        catalog = ordering.Catalog([item, other], 'PACKAGE_KEYNAME')
+
+        self.assertIs(catalog.get_item('GPU'), item)
+        self.assertEqual(catalog.by_category['gpu0'], [item, other])
+        self.assertEqual(catalog.by_id[11], other)
+        self.assertEqual([price['id'] for price in catalog.get_prices(item)], [2, 4])
+        self.assertEqual([price['id'] for price in catalog.get_prices(item, term=36)], [1, 2])
+        self.assertEqual([price['id'] for price in catalog.get_prices(item, 509)], [3])
+        for core, term in [(None, 0), ("8", 0), ("32", 0), ("32", 36), ("8", 37)]:
+            self.assertEqual(catalog.get_price_id(item, core, term),
+                             self.ordering.get_item_price_id(core, prices, term))
+        self.assertEqual(catalog.get_category_price_id(item, 'gpu1'), 1)
+        self.assertEqual(catalog.get_category_price_id(item, 'gpu0'), 2)
+        self.assertRaises(exceptions.SoftLayerError, catalog.get_category_price_id, other, 'gpu0')
+        exc = self.assertRaises(exceptions.SoftLayerError, catalog.get_item, 'NOPE')
+        self.assertEqual("Item NOPE does not exist for package PACKAGE_KEYNAME", str(exc))
+
+    def test_get_price_matrix(self):
+        items = self.set_mock('SoftLayer_Product_Package', 'getItems')
+        items.return_value = [
+            {'id': 1, 'keyName': 'GUEST_CORE_2', 'capacity': '2', 'itemCategory': {'categoryCode': 'guest_core'},
+             'prices': [{'id': 11, 'locationGroupId': '', 'hourlyRecurringFee': '.05', 'recurringFee': '30'},
+                        {'id': 12, 'locationGroupId': 509, 'hourlyRecurringFee': '.06', 'recurringFee': '36'}]},
+            {'id': 2, 'keyName': 'RAM_4_GB', 'itemCategory': {'categoryCode': 'ram'},
+             'prices': [{'id': 21, 'locationGroupId': '', 'recurringFee': '10'},
+                        {'id': 22, 'locationGroupId': 509, 'recurringFee': '12'}]},
+        ]
+        presets = self.set_mock('SoftLayer_Product_Package', 'getActivePresets')
+        presets.return_value = [
+            {'id': 5, 'keyName': 'B1_2X4', 'prices': [{'id': 11, 'itemId': 1, 'hourlyRecurringFee': '.05',
+                                                       'recurringFee': '30'}]},
+            {'id': 6, 'keyName': 'B1_4X8', 'prices': [{'id': 99, 'itemId': 9, 'hourlyRecurringFee': '.2',
+                                                       'recurringFee': '100'}]},
+        ]
+        regions = self.set_mock('SoftLayer_Product_Package', 'getRegions')
+        regions.return_value = [
+            {'location': {'location': {'name': 'dal13', 'priceGroups': []}}},
+            {'location': {'location': {'name': 'fra02', 'priceGroups': [{'id': 509}]}}},
+        ]
+
+        matrix = self.ordering.get_price_matrix('PACKAGE_KEYNAME', presets=['B1_2X4', 'B1_4X8'],
+                                                item_sets={'custom': ['GUEST_CORE_2', 'RAM_4_GB']})
+
+        self.assertEqual(matrix, [
+            {'name': 'B1_2X4', 'datacenter': 'dal13', 'hourly': 0.05, 'monthly': 30.0},
+            {'name': 'B1_2X4', 'datacenter': 'fra02', 'hourly': 0.06, 'monthly': 36.0},
+            {'name': 'B1_4X8', 'datacenter': 'dal13', 'hourly': 0.2, 'monthly': 100.0},
+            {'name': 'B1_4X8', 'datacenter': 'fra02', 'hourly': 0.2, 'monthly': 100.0},
+            {'name': 'custom', 'datacenter': 'dal13', 'hourly': None, 'monthly': 40.0},
+            {'name': 'custom', 'datacenter': 'fra02', 'hourly': None, 'monthly': 48.0},
+        ])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 1)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getRegions')), 1)
+
+        matrix = self.ordering.get_price_matrix('PACKAGE_KEYNAME', datacenters=['fra02'])
+        self.assertEqual([row['name'] for row in matrix], ['B1_2X4', 'B1_4X8'])
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 1)
+        self.assertRaises(exceptions.SoftLayerError, self.ordering.get_price_matrix, 'PACKAGE_KEYNAME',
+                          presets=['NOPE'])
+
     def test_get_items(self):
         self.ordering.get_items(123)
         self.assert_called_with('SoftLayer_Product_Package', 'getItems')
@@ -912,3 +1002,78 @@ def test_delete_quote(self):
     def test_get_all_cancelations(self):
         self.ordering.get_all_cancelation()
         self.assert_called_with('SoftLayer_Billing_Item_Cancellation_Request', 'getAllCancellationRequests')
+
+    def test_bulk_order(self):
+        def verify(call):
+            if call.args[0]['size'] == 'BAD':
+                raise SoftLayer.SoftLayerAPIError('SoftLayer_Exception_Order', 'No such size')
+            return {'orderId': None}
+
+        def place(call):
+            guest = call.args[0]['virtualGuests'][0]
+            if guest['hostname'] == 'web3':
+                raise SoftLayer.SoftLayerAPIError('SoftLayer_Exception_Order', 'Out of stock')
+            return {'orderId': 5, 'orderDetails': {'virtualGuests': [{'id': len(guest['hostname'])}]}}
+
+        self.set_mock('SoftLayer_Product_Order', 'verifyOrder').side_effect = verify
+        self.set_mock('SoftLayer_Product_Order', 'placeOrder').side_effect = place
+        build = mock.Mock(side_effect=lambda config: {'size': config['size'], 'virtualGuests': [dict(config)]})
+        configs = [{'hostname': 'web1', 'domain': 'a.com', 'size': 'S', 'tags': 'web'},
+                   {'hostname': 'db1', 'domain': 'a.com', 'size': 'L'},
+                   {'hostname': 'web3', 'domain': 'b.com', 'size': 'S', 'tags': 'web'},
+                   {'hostname': 'x', 'domain': 'a.com', 'size': 'BAD'}]
+
+        results = ordering.bulk_order(self.client, configs, build, 'virtualGuests', tag_service='Virtual_Guest',
+                                      rate=0)
+
+        self.assertEqual([(result['hostname'], result['status'], result['ids']) for result in results],
+                         [('web1', 'ordered', [4]), ('db1', 'ordered', [3]), ('web3', 'failed', []),
+                          ('x', 'failed', [])])
+        self.assertEqual(results[2]['error'], 'SoftLayerAPIError(SoftLayer_Exception_Order): Out of stock')
+        self.assertIn('No such size', results[3]['error'])
+        # One template and verifyOrder for each size, one placeOrder for each server that verified
+        self.assertEqual(build.call_count, 3)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Order', 'verifyOrder')), 3)
+        placed = [call.args[0]['virtualGuests'][0] for call in self.calls('SoftLayer_Product_Order', 'placeOrder')]
+        self.assertEqual(sorted((guest['hostname'], guest['domain']) for guest in placed),
+                         [('db1', 'a.com'), ('web1', 'a.com'), ('web3', 'b.com')])
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'setTags', args=('web',), identifier=4)
+        self.assertEqual(len(self.calls('SoftLayer_Virtual_Guest', 'setTags')), 1)
+        self.assertEqual(configs[0]['tags'], 'web')
+
+    def test_bulk_order_places_while_verifying(self):
+        placed = threading.Event()
+        waited = []
+
+        def verify(call):
+            # The second group is still verifying when the first one's order is placed
+            if call.args[0]['size'] == 'L':
+                waited.append(placed.wait(5))
+            return {}
+
+        def place(call):
+            placed.set()
+            return {'orderId': 5}
+
+        self.set_mock('SoftLayer_Product_Order', 'verifyOrder').side_effect = verify
+        self.set_mock('SoftLayer_Product_Order', 'placeOrder').side_effect = place
+        configs = [{'hostname': 'web1', 'domain': 'a.com', 'size': 'S'},
+                   {'hostname': 'db1', 'domain': 'a.com', 'size': 'L'}]
+
+        build = lambda config: {'size': config['size'], 'virtualGuests': [dict(config)]}  # noqa: E731
+        results = ordering.bulk_order(self.client, configs, build, 'virtualGuests', max_workers=1, rate=0)
+
+        self.assertEqual([result['status'] for result in results], ['ordered', 'ordered'])
+        self.assertEqual(waited, [True])
+
+    def test_bulk_order_test(self):
+        build = mock.Mock(side_effect=lambda config: {'orderContainers': [{'hardware': [dict(config)]}]})
+        configs = [{'hostname': 'hw%d' % number, 'domain': 'a.com'} for number in range(3)]
+
+        results = ordering.bulk_order(self.client, configs, build, 'hardware', test=True)
+
+        self.assertEqual([result['status'] for result in results], ['verified'] * 3)
+        self.assertEqual(results[0]['receipt'], fixtures.SoftLayer_Product_Order.verifyOrder)
+        build.assert_called_once_with({'hostname': 'hw0', 'domain': 'a.com'})
+        self.assertEqual(self.calls('SoftLayer_Product_Order', 'placeOrder'), [])
+        self.assertEqual(ordering.bulk_order(self.client, [], build, 'hardware'), [])
@@ -5,8 +5,10 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import SoftLayer
 from SoftLayer.managers.search import SearchManager
 from SoftLayer import testing
+from SoftLayer import transports
 
 
 class SearchTests(testing.TestCase):
@@ -26,6 +28,49 @@ def test_search_advanced(self):
         self.search.advanced('SoftLayer_Hardware')
         self.assert_called_with('SoftLayer_Search', 'advancedSearch')
 
+    def test_search_advanced_pages(self):
+        mock = self.set_mock('SoftLayer_Search', 'advancedSearch')
+        mock.side_effect = lambda call: transports.SoftLayerListResult(
+            [_result(i) for i in range(call.offset, min(call.offset + call.limit, 5))], 5)
+
+        results = self.search.advanced('_objectType:SoftLayer_Hardware', limit=2)
+        self.assertEqual([result['resource']['id'] for result in results], [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.calls('SoftLayer_Search', 'advancedSearch')), 3)
+
+    def test_advanced_many(self):
+        mock = self.set_mock('SoftLayer_Search', 'advancedSearch')
+        found = {'a': [_result(1), _result(2)], 'b': [_result(2), _result(3), _result(3, 'SoftLayer_Hardware')]}
+        mock.side_effect = lambda call: found[call.args[0]]
+
+        results = list(self.search.advanced_many(['a', 'b', 'a'], mask='mask[resource]'))
+        ids = sorted((result['resourceType'], result['resource']['id']) for _, result in results)
+        self.assertEqual(ids, [('SoftLayer_Hardware', 3), ('SoftLayer_Network_Vlan', 1),
+                               ('SoftLayer_Network_Vlan', 2), ('SoftLayer_Network_Vlan', 3)])
+        # 2 was found by both, by whichever query got to it first
+        self.assertEqual({(query, result['resource']['id']) for query, result in results} - {('a', 2), ('b', 2)},
+                         {('a', 1), ('b', 3)})
+        self.assertEqual(len(self.calls('SoftLayer_Search', 'advancedSearch')), 2)
+        self.assert_called_with('SoftLayer_Search', 'advancedSearch', mask='mask[resource]')
+
+    def test_advanced_many_error(self):
+        mock = self.set_mock('SoftLayer_Search', 'advancedSearch')
+        mock.side_effect = SoftLayer.SoftLayerAPIError('SoftLayer_Exception_Public', 'Bad query')
+        self.assertRaises(SoftLayer.SoftLayerAPIError, list, self.search.advanced_many(['a', 'b']))
+
+    def test_advanced_many_stop(self):
+        mock = self.set_mock('SoftLayer_Search', 'advancedSearch')
+        mock.side_effect = lambda call: transports.SoftLayerListResult(
+            [_result(i) for i in range(call.offset, call.offset + call.limit)], 1000)
+
+        results = self.search.advanced_many(['a'], limit=10, max_workers=1)
+        self.assertEqual(next(results)[1]['resource']['id'], 0)
+        results.close()
+        # Only the pages that fit on the queue were fetched
+        self.assertLess(len(self.calls('SoftLayer_Search', 'advancedSearch')), 10)
+
+    def test_advanced_many_nothing(self):
+        self.assertEqual(list(self.search.advanced_many([])), [])
+
     def test_search_instances_basic(self):
         search_string = "TEST_STRING"
         expected = f"_objectType:SoftLayer_Virtual_Guest *{search_string}*"
@@ -44,3 +89,7 @@ def test_search_instances_basic(self):
         self.search.search_instances(search_string, tags=["thisTag"])
         self.assert_called_with('SoftLayer_Search', 'advancedSearch',
                                 args=(f"{expected} tagReferences.tag.name: \"thisTag\"",))
+
+
+def _result(resource_id, resource_type='SoftLayer_Network_Vlan'):
+    return {'resourceType': resource_type, 'resource': {'id': resource_id}}
@@ -114,6 +114,64 @@ def test_get_package(self):
             mask='mask[id,name,items[prices[categories],attributes]]'
         )
 
+    def test_get_package_cached(self):
+        mock = self.set_mock('SoftLayer_Product_Package', 'getAllObjects')
+        mock.return_value = [SoftLayer_Product_Package.SAAS_PACKAGE]
+        self.set_mock('SoftLayer_Location_Datacenter', 'getDatacenters').return_value = [{'id': 29, 'name': 'dal09'}]
+
+        for _ in range(3):
+            storage_utils.prepare_volume_order_object(self.file, 'performance', 'dal09', 1000, 800, None, None,
+                                                      'storage_as_a_service', 'file')
+        index = storage_utils.get_package_index(self.file, 'storage_as_a_service')
+
+        self.assertIsInstance(index, storage_utils.StoragePackageIndex)
+        self.assertIs(storage_utils.get_package(self.file, 'storage_as_a_service'), index.package)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getAllObjects')), 1)
+
+    def test_package_index(self):
+        package = {'items': [
+            {'keyName': 'A', 'capacity': '20', 'capacityMinimum': '1', 'capacityMaximum': '100',
+             'itemCategory': {'categoryCode': 'performance_storage_iops'},
+             'prices': [{'id': 1, 'locationGroupId': 503, 'categories': [{'categoryCode': 'performance_storage_iops'}]},
+                        {'id': 2, 'locationGroupId': '', 'capacityRestrictionType': 'STORAGE_SPACE',
+                         'capacityRestrictionMinimum': '1', 'capacityRestrictionMaximum': '10',
+                         'categories': [{'categoryCode': 'performance_storage_iops'}]},
+                        {'id': 3, 'locationGroupId': '', 'capacityRestrictionType': 'STORAGE_SPACE',
+                         'capacityRestrictionMinimum': '11', 'capacityRestrictionMaximum': '2000',
+                         'categories': [{'categoryCode': 'performance_storage_iops'}]}]},
+            {'keyName': 'B', 'capacity': 'not a number', 'capacityMinimum': '50', 'capacityMaximum': '500',
+             'itemCategory': {'categoryCode': 'performance_storage_iops'}, 'attributes': [{'value': '300'}],
+             'prices': [{'id': 4, 'locationGroupId': None,
+                         'categories': [{'categoryCode': 'performance_storage_iops'}]}]},
+        ]}
+        index = storage_utils.StoragePackageIndex(package)
+
+        self.assertEqual(index.in_range(0), set())
+        self.assertEqual(index.in_range(50), {0, 1})
+        self.assertEqual(index.in_range(200), {1})
+        self.assertEqual(index.find_items(capacity=20), {0})
+        self.assertEqual(index.find_items(attribute=300, in_range=60), {1})
+        self.assertEqual(index.find_items(capacity=None), set())
+        self.assertEqual(index.find_price('performance_storage_iops'), {'id': 2})
+        self.assertEqual(index.find_price('performance_storage_iops', {1, 0}, 'STORAGE_SPACE', 500), {'id': 3})
+        self.assertEqual(index.find_price('performance_storage_iops', {1}), {'id': 4})
+        self.assertIsNone(index.find_price('performance_storage_iops', {1}, 'STORAGE_SPACE', 500))
+        self.assertEqual(storage_utils.find_saas_perform_iops_price(index, 5, 60),
+                         storage_utils.find_saas_perform_iops_price(package, 5, 60))
+
+    def test_package_index_ranges(self):
+        ranges = [(1, 100), (50, 500), (100, 100), (200, 300), (1, 1000), ('bad', 10), (None, 5)]
+        package = {'items': [{'capacityMinimum': minimum, 'capacityMaximum': maximum} for minimum, maximum in ranges]}
+        index = storage_utils.StoragePackageIndex(package)
+
+        # A range that doesn't parse is left out, instead of breaking the whole index
+        self.assertEqual(len(index.ranges), 5)
+        for value in [0, 1, 2, 49, 50, 99, 100, 101, 250, 300, 301, 999, 1000, 1001]:
+            expected = {position for position, (minimum, maximum) in enumerate(ranges[:5])
+                        if minimum <= value <= maximum}
+            self.assertEqual(index.in_range(value), expected, value)
+        self.assertEqual(storage_utils.StoragePackageIndex({'items': []}).in_range(10), set())
+
     # ---------------------------------------------------------------------
     # Tests for get_location_id()
     # ---------------------------------------------------------------------
@@ -112,6 +112,14 @@ def test_set_tags(self):
         self.tag_manager.set_tags(tags, key_name, resource_id)
         self.assert_called_with('SoftLayer_Tag', 'setTags')
 
+    def test_set_tags_many(self):
+        mock = self.set_mock('SoftLayer_Tag', 'setTags')
+        mock.side_effect = lambda *args, **kwargs: True
+        result = self.tag_manager.set_tags_many("tag1,tag2", "GUEST", [100, 200])
+        self.assertEqual(result, [True, True])
+        self.assertEqual(len(self.calls('SoftLayer_Tag', 'setTags')), 2)
+        self.assert_called_with('SoftLayer_Tag', 'setTags', args=("tag1,tag2", "GUEST", 200))
+
     def test_get_tag(self):
         tag_id = 1286571
         result = self.tag_manager.get_tag(tag_id)
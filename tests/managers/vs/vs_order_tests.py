@@ -217,6 +217,23 @@ def test_order_guest_placement_group(self, create_dict):
         self.assert_called_with('SoftLayer_Virtual_Guest', 'generateOrderTemplate')
         self.assert_called_with('SoftLayer_Product_Order', 'verifyOrder')
 
+    @mock.patch('SoftLayer.managers.vs.VSManager._generate_create_dict')
+    def test_order_guests(self, create_dict):
+        create_dict.return_value = {'test': 1}
+        guests = [{'hostname': 'web1', 'domain': 'a.com', 'tags': 'web', 'placement_id': 5},
+                  {'hostname': 'web2', 'domain': 'a.com', 'placement_id': 5}]
+
+        results = self.vs.order_guests(guests, rate=0)
+
+        self.assertEqual([(result['status'], result['order_id'], result['ids']) for result in results],
+                         [('ordered', 1234, [1234567])] * 2)
+        create_dict.assert_called_once_with(hostname='web1', domain='a.com', placement_id=5)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Order', 'verifyOrder')), 1)
+        placed = [call.args[0]['virtualGuests'][0] for call in self.calls('SoftLayer_Product_Order', 'placeOrder')]
+        self.assertEqual(sorted(guest['hostname'] for guest in placed), ['web1', 'web2'])
+        self.assertEqual({guest['placementGroupId'] for guest in placed}, {5})
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'setTags', args=('web',), identifier=1234567)
+
     def test_get_price_id_empty(self):
         upgrade_prices = [
             {'categories': None, 'item': None},
@@ -108,6 +108,33 @@ def test_resolve_ids_hostname(self):
         _id = self.vs._get_ids_from_hostname('vs-test1')
         self.assertEqual(_id, [100, 104])
 
+    def test_resolve_ids_many(self):
+        result = self.vs.resolve_ids_many(['vs-test2', '10.45.19.37', '55', 'nope'])
+
+        self.assertEqual(result, {'vs-test2': [104], '10.45.19.37': [100], '55': [55], 'nope': []})
+        call = self.calls('SoftLayer_Account', 'getVirtualGuests')[-1]
+        self.assertEqual(call.mask, 'mask[id,hostname]')
+        self.assertEqual(call.filter['virtualGuests']['hostname'],
+                         {'operation': 'in', 'options': [{'name': 'data', 'value': ['vs-test2', 'nope']}]})
+        self.assertEqual(len(self.calls('SoftLayer_Account', 'getVirtualGuests')), 3)
+
+    @mock.patch('time.sleep')
+    def test_wait_for_ready_many(self, _sleep):
+        guests = self.set_mock('SoftLayer_Account', 'getVirtualGuests')
+        guests.side_effect = [
+            [{'id': 100, 'provisionDate': 'aaa'}, {'id': 104, 'provisionDate': None}],
+            [{'id': 104, 'provisionDate': None}],
+            [{'id': 104, 'provisionDate': 'aaa'}],
+        ]
+
+        result = self.vs.wait_for_ready_many([100, 104], limit=100, delay=5)
+
+        self.assertEqual([guest['id'] for guest in result], [100, 104])
+        _sleep.assert_has_calls([mock.call(5), mock.call(10)])
+        calls = self.calls('SoftLayer_Account', 'getVirtualGuests')
+        self.assertEqual([call.filter['virtualGuests']['id']['options'][0]['value'] for call in calls],
+                         [[100, 104], [104], [104]])
+
     def test_get_instance(self):
         result = self.vs.get_instance(100)
 
@@ -1310,3 +1337,15 @@ def test_add_notification(self):
     def test_notification_del(self):
         self.vs.remove_notification(100)
         self.assert_called_with('SoftLayer_User_Customer_Notification_Virtual_Guest', 'deleteObjects')
+
+    def test_add_notifications(self):
+        result = self.vs.add_notifications(100, [123456, 654321])
+        self.assertEqual(len(result), 2)
+        self.assert_called_with('SoftLayer_User_Customer_Notification_Virtual_Guest', 'createObject',
+                                args=({'guestId': 100, 'userId': 654321},), mask='mask[user]')
+        self.assertEqual(len(self.calls('SoftLayer_User_Customer_Notification_Virtual_Guest', 'createObject')), 2)
+
+    def test_notifications_del(self):
+        self.vs.remove_notifications([100, 200])
+        self.assert_called_with('SoftLayer_User_Customer_Notification_Virtual_Guest', 'deleteObjects',
+                                args=([{'id': 100}, {'id': 200}],))
@@ -0,0 +1,158 @@
+"""
+    SoftLayer.tests.shell.index_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import os
+import tempfile
+from unittest import mock as mock
+
+from click.testing import CliRunner
+from prompt_toolkit import document
+
+from SoftLayer.CLI import core
+from SoftLayer.CLI import environment
+from SoftLayer.shell import cmd_help
+from SoftLayer.shell import completer
+from SoftLayer.shell import index
+from SoftLayer.shell import routes
+from SoftLayer import testing
+
+_INDEX = {}
+
+
+def shell_env():
+    env = environment.Environment()
+    env.load()
+    env.load_modules_from_python(routes.ALL_ROUTES)
+    env.aliases.update(routes.ALL_ALIASES)
+    return env
+
+
+def get_index():
+    # Building one loads every command, so only do that once
+    if 'index' not in _INDEX:
+        _INDEX['index'] = index.CommandIndex.build(core.cli, shell_env())
+    return _INDEX['index']
+
+
+def complete(command_index, text):
+    doc = document.Document(text)
+    return [(item.text, item.start_position) for item in
+            completer.ShellCompleter(core.cli, command_index).get_completions(doc, None)]
+
+
+class CommandIndexTests(testing.TestCase):
+
+    def set_up(self):
+        self.index = get_index()
+
+    def test_build(self):
+        root = self.index.get('')
+        self.assertIn('virtual', root['commands'])
+        self.assertIn('shell-help', root['commands'])
+        self.assertIn('--format', [opt for option in root['options'] for opt in option['opts']])
+
+        self.assertEqual(self.index.get('virtual:list')['help'], 'List virtual servers.')
+        self.assertNotIn('commands', self.index.get('virtual:list'))
+        # Groups a level deeper than the routes
+        self.assertIn('list', self.index.get('virtual:placementgroup')['commands'])
+        self.assertIsNone(self.index.get('virtual:nope'))
+
+    def test_complete(self):
+        self.assertEqual(self.index.complete('virtual', 'cap'), ['capacity', 'capture'])
+        self.assertEqual(self.index.complete('virtual', 'zzz'), [])
+        self.assertEqual(self.index.complete('virtual:list', ''), [])
+
+    def test_resolve(self):
+        self.assertEqual(self.index.resolve(['vs', 'list', '--c']), ('virtual:list', '--c'))
+        self.assertEqual(self.index.resolve(['virtual', 'li']), ('virtual', 'li'))
+        self.assertEqual(self.index.resolve(['virtual', 'list', 'extra']), ('virtual:list', 'extra'))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'commands.json')
+            self.index.save(filename)
+            loaded = index.CommandIndex.load(filename, self.index.key)
+            self.assertEqual(loaded.commands, self.index.commands)
+            self.assertEqual(loaded.aliases, self.index.aliases)
+            self.assertIsNone(index.CommandIndex.load(filename, 'another key'))
+            self.assertEqual(os.listdir(tmp), ['commands.json'])
+
+            with open(filename, 'w', encoding="utf-8") as index_file:
+                index_file.write('{"key": ')
+            self.assertIsNone(index.CommandIndex.load(filename, self.index.key))
+        self.assertIsNone(index.CommandIndex.load(filename, self.index.key))
+
+    def test_index_key(self):
+        env = shell_env()
+        key = index.index_key(env)
+        self.assertEqual(key, self.index.key)
+        env.load_modules_from_python([('virtual:new', 'SoftLayer.CLI.virt.new:cli')])
+        self.assertNotEqual(index.index_key(env), key)
+
+    @mock.patch('SoftLayer.shell.index.CommandIndex.build')
+    def test_get_index(self, build):
+        build.return_value = self.index
+        env = shell_env()
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'commands.json')
+            self.assertIs(index.get_index(core.cli, env, filename), self.index)
+            loaded = index.get_index(core.cli, env, filename)
+            self.assertEqual(loaded.commands, self.index.commands)
+        build.assert_called_once()
+
+    @mock.patch('SoftLayer.shell.index.CommandIndex.save', side_effect=PermissionError)
+    @mock.patch('SoftLayer.shell.index.CommandIndex.build')
+    def test_get_index_read_only(self, build, save):
+        build.return_value = self.index
+        self.assertIs(index.get_index(core.cli, shell_env(), '/nope/commands.json'), self.index)
+        save.assert_called_once()
+
+
+class IndexCompleterTests(testing.TestCase):
+
+    def set_up(self):
+        self.index = get_index()
+
+    @mock.patch('SoftLayer.CLI.environment.ModuleLoader.load')
+    def test_commands(self, load):
+        self.assertEqual(complete(self.index, 'vs cap'), [('capacity', -3), ('capture', -3)])
+        self.assertIn(('virtual', 0), complete(self.index, ''))
+        self.assertIn(('list', 0), complete(self.index, 'vs placementgroup '))
+        load.assert_not_called()
+
+    @mock.patch('SoftLayer.CLI.environment.ModuleLoader.load')
+    def test_options(self, load):
+        self.assertIn(('--cpu', -4), complete(self.index, 'vs list --cp'))
+        self.assertIn(('--format', -4), complete(self.index, '--fo'))
+        load.assert_not_called()
+
+    def test_nothing_to_complete(self):
+        self.assertEqual(complete(self.index, 'vs list'), [])
+        self.assertEqual(complete(self.index, 'vs "list'), [])
+
+    def test_same_as_click(self):
+        for text in ('vs ', 'vs cre', 'vs list --d', 'hardware ', 'block volume-', 'vs placementgroup '):
+            doc = document.Document(text)
+            from_click = list(completer.ShellCompleter(core.cli).get_completions(doc, None))
+            from_index = list(completer.ShellCompleter(core.cli, self.index).get_completions(doc, None))
+            self.assertEqual([item.text for item in from_index], [item.text for item in from_click], text)
+            for item, click_item in zip(from_index, from_click):
+                # Groups don't have a short help in click, the index uses the first line of their help
+                if click_item.display_meta_text:
+                    self.assertEqual(item.display_meta_text, click_item.display_meta_text, text)
+
+
+class ShellHelpTests(testing.TestCase):
+
+    @mock.patch('SoftLayer.CLI.environment.ModuleLoader.load')
+    def test_help_from_index(self, load):
+        env = shell_env()
+        env.vars['_command_index'] = get_index()
+        result = CliRunner().invoke(cmd_help.cli, obj=env)
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Shell Commands', result.output)
+        self.assertRegex(result.output, r'virtual +Virtual Servers.')
+        load.assert_not_called()
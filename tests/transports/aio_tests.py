@@ -0,0 +1,163 @@
+"""
+    SoftLayer.tests.transports.aio_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import asyncio
+import json
+
+from aiohttp import test_utils
+from aiohttp import web
+
+import SoftLayer
+from SoftLayer import testing
+from SoftLayer import transports
+
+
+class TestAsyncXmlRpcTransport(testing.TestCase):
+
+    def set_up(self):
+        self.transport = transports.AsyncXmlRpcTransport(endpoint_url=self.endpoint_url)
+
+    def _call(self, req):
+        async def run():
+            try:
+                return await self.transport(req)
+            finally:
+                await self.transport.close()
+        return asyncio.run(run())
+
+    def test_call(self):
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getObject'
+        resp = self._call(req)
+        self.assertEqual(resp['accountId'], 1234)
+        self.assert_called_with('SoftLayer_Account', 'getObject')
+
+    def test_list_result(self):
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getVirtualGuests'
+        req.limit = 10
+        resp = self._call(req)
+        self.assertIsInstance(resp, transports.SoftLayerListResult)
+        self.assert_called_with('SoftLayer_Account', 'getVirtualGuests', limit=10, offset=0)
+
+    def test_identifier_mask_filter(self):
+        req = transports.Request()
+        req.service = 'SoftLayer_Virtual_Guest'
+        req.method = 'getObject'
+        req.identifier = 100
+        req.mask = 'id,hostname'
+        req.filter = {'id': {'operation': 100}}
+        self._call(req)
+        self.assert_called_with('SoftLayer_Virtual_Guest', 'getObject', identifier=100,
+                                mask='mask[id,hostname]', filter={'id': {'operation': 100}})
+
+    def test_fault(self):
+        mock = self.set_mock('SoftLayer_Account', 'getObject')
+        mock.side_effect = SoftLayer.SoftLayerAPIError('SoftLayer_Exception_Public', 'Oops')
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getObject'
+        ex = self.assertRaises(SoftLayer.SoftLayerAPIError, self._call, req)
+        self.assertEqual(ex.faultCode, 'SoftLayer_Exception_Public')
+        self.assertEqual(ex.faultString, 'Oops')
+
+    def test_fault_mapping(self):
+        mock = self.set_mock('SoftLayer_Account', 'getObject')
+        mock.side_effect = SoftLayer.SoftLayerAPIError('-32601', 'No method')
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getObject'
+        self.assertRaises(SoftLayer.MethodNotFound, self._call, req)
+
+    def test_connection_error(self):
+        self.transport = transports.AsyncXmlRpcTransport(endpoint_url='http://127.0.0.1:1')
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getObject'
+        ex = self.assertRaises(SoftLayer.TransportError, self._call, req)
+        self.assertEqual(ex.faultCode, 0)
+
+    def test_is_xmlrpc_transport(self):
+        self.assertIsInstance(self.transport, transports.XmlRpcTransport)
+        self.assertEqual(self.transport.max_connections, 100)
+
+
+class TestAsyncRestTransport(testing.TestCase):
+
+    def set_up(self):
+        self.received = []
+
+    def _run(self, handler, req, status=200):
+        async def handle(request):
+            self.received.append(request)
+            body = await request.text()
+            return handler(request, body)
+
+        async def run():
+            app = web.Application()
+            app.router.add_route('*', '/{tail:.*}', handle)
+            async with test_utils.TestServer(app) as server:
+                transport = transports.AsyncRestTransport(endpoint_url=str(server.make_url('/rest/v3.1')))
+                try:
+                    return await transport(req)
+                finally:
+                    await transport.close()
+        return asyncio.run(run())
+
+    def test_basic(self):
+        def handler(_, __):
+            return web.json_response([{'id': 1}, {'id': 2}], headers={'softlayer-total-items': '10'})
+
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getVirtualGuests'
+        req.mask = 'id'
+        req.limit = 2
+        resp = self._run(handler, req)
+        self.assertEqual(resp, [{'id': 1}, {'id': 2}])
+        self.assertEqual(resp.total_count, 10)
+        self.assertEqual(self.received[0].method, 'GET')
+        self.assertEqual(self.received[0].path, '/rest/v3.1/SoftLayer_Account/getVirtualGuests.json')
+        self.assertEqual(self.received[0].query['objectMask'], 'mask[id]')
+        self.assertEqual(self.received[0].query['resultLimit'], '0,2')
+
+    def test_with_args(self):
+        def handler(_, body):
+            return web.json_response(json.loads(body))
+
+        req = transports.Request()
+        req.service = 'SoftLayer_Virtual_Guest'
+        req.method = 'setTags'
+        req.identifier = 1234
+        req.args = ('tag1,tag2',)
+        resp = self._run(handler, req)
+        self.assertEqual(resp, {'parameters': ['tag1,tag2']})
+        self.assertEqual(self.received[0].method, 'POST')
+        self.assertEqual(self.received[0].path, '/rest/v3.1/SoftLayer_Virtual_Guest/1234/setTags.json')
+
+    def test_http_error(self):
+        def handler(_, __):
+            return web.json_response({'error': 'Object not found', 'code': 'SoftLayer_Exception'}, status=404)
+
+        req = transports.Request()
+        req.service = 'SoftLayer_Virtual_Guest'
+        req.method = 'getObject'
+        req.identifier = 1
+        ex = self.assertRaises(SoftLayer.SoftLayerAPIError, self._run, handler, req)
+        self.assertEqual(ex.faultCode, 404)
+        self.assertEqual(ex.faultString, 'Object not found')
+
+    def test_empty_response(self):
+        def handler(_, __):
+            return web.Response(text='')
+
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getObject'
+        ex = self.assertRaises(SoftLayer.SoftLayerAPIError, self._run, handler, req)
+        self.assertEqual(ex.faultString, 'Empty response.')
@@ -0,0 +1,171 @@
+"""
+    SoftLayer.tests.transports.benchmark_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import io
+import os
+import tempfile
+from unittest import mock as mock
+
+import SoftLayer
+from SoftLayer.managers.ordering import Catalog
+from SoftLayer import testing
+from SoftLayer.testing import benchmark
+from SoftLayer.testing import xmlrpc as xmlrpc_server
+from SoftLayer import transports
+
+
+def make_request(service='SoftLayer_Account', method='getVirtualGuests', **props):
+    req = transports.Request()
+    req.service = service
+    req.method = method
+    for prop, value in props.items():
+        setattr(req, prop, value)
+    return req
+
+
+class TestLoadTransport(testing.TestCase):
+
+    def test_pages(self):
+        transport = benchmark.LoadTransport(sizes={'SoftLayer_Account.getVirtualGuests': 25})
+
+        page = transport(make_request(offset=20, limit=10))
+        self.assertEqual([guest['id'] for guest in page], [21, 22, 23, 24, 25])
+        self.assertEqual(page.total_count, 25)
+        self.assertIn('hostname', page[0])
+        self.assertEqual(len(transport(make_request())), 25)
+
+    def test_max_page_size(self):
+        transport = benchmark.LoadTransport(sizes={'SoftLayer_Account.getVirtualGuests': 25}, max_page_size=10)
+        self.assertEqual(len(transport(make_request(limit=100))), 10)
+
+    def test_other_methods(self):
+        transport = benchmark.LoadTransport(sizes={})
+        self.assertEqual(transport(make_request('SoftLayer_Account', 'getObject')),
+                         benchmark.load_fixture('SoftLayer_Account.getObject'))
+
+    def test_throttle(self):
+        transport = benchmark.LoadTransport(throttle_rate=1, retry_after=2)
+        ex = self.assertRaises(xmlrpc_server.HTTPError, transport, make_request())
+        self.assertEqual(ex.status, 429)
+        self.assertEqual(ex.headers, {'Retry-After': '2'})
+
+    def test_errors(self):
+        transport = benchmark.LoadTransport(error_rate=1)
+        ex = self.assertRaises(xmlrpc_server.HTTPError, transport, make_request('SoftLayer_Account', 'getObject'))
+        self.assertEqual(ex.status, 503)
+
+    def test_seed(self):
+        first = benchmark.LoadTransport(sizes={}, error_rate=0.5, seed=3)
+        second = benchmark.LoadTransport(sizes={}, error_rate=0.5, seed=3)
+
+        def failures(transport):
+            failed = []
+            for _ in range(20):
+                try:
+                    transport(make_request('SoftLayer_Account', 'getObject'))
+                    failed.append(False)
+                except xmlrpc_server.HTTPError:
+                    failed.append(True)
+            return failed
+        self.assertEqual(failures(first), failures(second))
+        self.assertIn(True, failures(first))
+
+    @mock.patch('time.sleep')
+    def test_latency(self, _sleep):
+        transport = benchmark.LoadTransport(sizes={'SoftLayer_Account.getVirtualGuests': 10}, latency=0.5,
+                                            latency_per_item=0.1)
+        transport(make_request())
+        _sleep.assert_called_once_with(1.5)
+
+
+class TestLoadServer(testing.TestCase):
+
+    def test_rest(self):
+        with benchmark.load_server(False, sizes={'SoftLayer_Account.getVirtualGuests': 250}) as url:
+            client = SoftLayer.BaseClient(transport=transports.RestTransport(endpoint_url=url + '/rest/v3.1'),
+                                          auth=None)
+            guests = list(client.iter_call('Account', 'getVirtualGuests', limit=100))
+            self.assertEqual([guest['id'] for guest in guests], list(range(1, 251)))
+            self.assertEqual(client.call('Virtual_Guest', 'getObject', id=100)['id'], 100)
+            ex = self.assertRaises(SoftLayer.SoftLayerAPIError, client.call, 'Account', 'notAMethod')
+            self.assertEqual(ex.faultCode, 404)
+
+    def test_throttled(self):
+        with benchmark.load_server(False, throttle_rate=1, retry_after=3) as url:
+            for transport in (transport(url) for transport in benchmark.TRANSPORTS.values()):
+                client = SoftLayer.BaseClient(transport=transport, auth=None)
+                ex = self.assertRaises(SoftLayer.SoftLayerAPIError, client.call, 'Account', 'getObject')
+                self.assertEqual(ex.faultCode, 429)
+                self.assertEqual(ex.retry_after, 3)
+
+
+class TestBenchmarkApi(testing.TestCase):
+
+    def run_benchmark(self, **config):
+        return benchmark.benchmark_api(['iter_call', 'vs_list'], separate_process=False, items=50, page_size=10,
+                                       rounds=1, **config)
+
+    def test_benchmark_api(self):
+        results = self.run_benchmark()
+
+        self.assertEqual([(row['scenario'], row['transport']) for row in results],
+                         [('iter_call', 'xmlrpc'), ('iter_call', 'rest'), ('vs_list', 'xmlrpc'), ('vs_list', 'rest')])
+        for row in results:
+            self.assertIsNone(row['error'])
+            self.assertEqual(row['items'], 50)
+            self.assertEqual(row['calls'], 5)
+            self.assertGreater(row['p99'], 0)
+            self.assertGreater(row['peak_memory'], 0)
+
+    def test_retries(self):
+        results = self.run_benchmark(error_rate=0.2, throttle_rate=0.2)
+        for row in results:
+            self.assertIsNone(row['error'])
+            self.assertEqual(row['items'], 50)
+            self.assertEqual(row['calls'] - row['errors'], 5)
+
+    def test_compare(self):
+        path = os.path.join(tempfile.mkdtemp(), 'results.json')
+        baseline = [{'scenario': 'call', 'transport': 'rest', 'error': None, 'seconds': 1.0, 'p50': 0.01,
+                     'p99': 0.02, 'peak_memory': 1000}]
+        benchmark.save_results(path, baseline, {'items': 10})
+        saved = benchmark.load_results(path)
+        self.assertEqual(saved['results'], baseline)
+        self.assertEqual(saved['version'], SoftLayer.__version__)
+
+        current = [dict(baseline[0], seconds=1.5, peak_memory=1050)]
+        compared = {row['measure']: row for row in benchmark.compare_results(saved, current)}
+        self.assertTrue(compared['seconds']['regression'])
+        self.assertAlmostEqual(compared['seconds']['change'], 0.5)
+        self.assertFalse(compared['peak_memory']['regression'])
+        self.assertFalse(compared['p99']['regression'])
+
+    def test_main(self):
+        path = os.path.join(tempfile.mkdtemp(), 'results.json')
+        argv = ['api', '--in-process', '--scenario', 'call', '--transport', 'rest', '--items', '20', '--calls', '2',
+                '--rounds', '1', '--save', path]
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(benchmark.main(argv), 0)
+            self.assertEqual(benchmark.main(argv[:-2] + ['--compare', path, '--threshold', '1000']), 0)
+        self.assertIn('0 regressions', stdout.getvalue())
+        self.assertEqual(len(benchmark.load_results(path)['results']), 1)
+
+
+class TestBenchmarkCreateOptions(testing.TestCase):
+
+    def test_price_package(self):
+        package = benchmark.synthetic_package(items=50, presets=10, prices_per_item=4, location_groups=3)
+        self.assertEqual(len(package['items'][0]['prices']), 4)
+
+        for group in [None, 1, 3]:
+            self.assertEqual(benchmark.price_package(package, group),
+                             benchmark.price_package(package, group, Catalog(package['items'])))
+
+    def test_main(self):
+        argv = ['create-options', '--items', '20', '--presets', '4', '--rounds', '1']
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(benchmark.main(argv), 0)
+        self.assertIn('catalog', stdout.getvalue())
@@ -0,0 +1,214 @@
+"""
+    SoftLayer.tests.transports.cache_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import os
+import tempfile
+import time
+from unittest import mock as mock
+
+from SoftLayer import testing
+from SoftLayer import transports
+
+
+def make_request(service='SoftLayer_Product_Package', method='getItems', **props):
+    req = transports.Request()
+    req.service = service
+    req.method = method
+    for prop, value in props.items():
+        setattr(req, prop, value)
+    return req
+
+
+class TestCachingTransport(testing.TestCase):
+
+    def set_up(self):
+        self.fixtures = mock.MagicMock(wraps=transports.FixtureTransport())
+        self.transport = transports.CachingTransport(self.fixtures, ttl=300)
+
+    def test_cached(self):
+        first = self.transport(make_request(identifier=200))
+        second = self.transport(make_request(identifier=200))
+
+        self.assertEqual(first, second)
+        self.assertIsInstance(second, transports.SoftLayerListResult)
+        self.assertEqual(second.total_count, first.total_count)
+        self.assertEqual(self.fixtures.call_count, 1)
+        self.assertEqual(self.transport.get_stats()['hits'], 1)
+        self.assertEqual(self.transport.get_stats()['misses'], 1)
+
+    def test_hits_are_copies(self):
+        self.transport(make_request('SoftLayer_Account', 'getObject'))
+        second = self.transport(make_request('SoftLayer_Account', 'getObject'))
+        second['accountId'] = 'changed'
+        third = self.transport(make_request('SoftLayer_Account', 'getObject'))
+        self.assertEqual(third['accountId'], 1234)
+
+    def test_key_includes_request_options(self):
+        self.transport(make_request(identifier=200))
+        self.transport(make_request(identifier=201))
+        self.transport(make_request(identifier=200, mask='mask[id]'))
+        self.transport(make_request(identifier=200, filter={'items': {'id': {'operation': 1}}}))
+        self.transport(make_request(identifier=200, limit=10, offset=0))
+        self.transport(make_request(identifier=200, limit=10, offset=10))
+        self.transport(make_request(identifier=200, args=('arg',)))
+        self.assertEqual(self.fixtures.call_count, 7)
+
+        self.transport(make_request(identifier=200, limit=10, offset=10))
+        self.assertEqual(self.fixtures.call_count, 7)
+
+    def test_key_includes_who_and_where(self):
+        self.transport(make_request(headers={'authenticate': {'username': 'first', 'apiKey': 'a'}}))
+        self.transport(make_request(headers={'authenticate': {'username': 'second', 'apiKey': 'b'}}))
+        self.transport(make_request(transport_user='apikey', transport_password='c'))
+        self.transport(make_request(transport_user='apikey', transport_password='d'))
+        self.transport(make_request(transport_headers={'Authorization': 'Bearer e'}))
+        self.assertEqual(self.fixtures.call_count, 5)
+
+        self.transport(make_request(headers={'authenticate': {'username': 'first', 'apiKey': 'a'}}))
+        self.assertEqual(self.fixtures.call_count, 5)
+
+        request = make_request()
+        self.assertNotEqual(transports.CachingTransport.cache_key(request, 'https://api.softlayer.com/xmlrpc/v3.1'),
+                            transports.CachingTransport.cache_key(request, 'https://api.service.softlayer.com/'))
+        self.assertEqual(transports.CachingTransport.call_key(make_request(headers={'authenticate': {}})),
+                         transports.CachingTransport.call_key(request))
+
+    def test_disk_cache_endpoints(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            public = transports.XmlRpcTransport(endpoint_url='https://api.softlayer.com/xmlrpc/v3.1')
+            private = transports.XmlRpcTransport(endpoint_url='https://api.service.softlayer.com/xmlrpc/v3.1')
+            with mock.patch.object(transports.XmlRpcTransport, '__call__', return_value=[1]) as call:
+                transports.CachingTransport(public, ttl=300, cache_dir=cache_dir)(make_request())
+                transports.CachingTransport(private, ttl=300, cache_dir=cache_dir)(make_request())
+                transports.CachingTransport(transports.DebugTransport(public), ttl=300,
+                                            cache_dir=cache_dir)(make_request())
+            self.assertEqual(call.call_count, 2)
+
+    def test_mutating_never_cached(self):
+        for method in ['createObject', 'placeOrder', 'editObject', 'deleteObject', 'verifyOrder']:
+            self.assertEqual(self.transport.get_ttl(make_request('SoftLayer_Product_Order', method)), 0)
+
+        self.transport(make_request('SoftLayer_Product_Order', 'placeOrder'))
+        self.transport(make_request('SoftLayer_Product_Order', 'placeOrder'))
+        self.assertEqual(self.fixtures.call_count, 2)
+
+    def test_mutating_invalidates(self):
+        self.transport(make_request('SoftLayer_Virtual_Guest', 'getObject', identifier=100))
+        self.transport(make_request('SoftLayer_Account', 'getVirtualGuests'))
+        # Verifying an order doesn't change anything
+        self.transport(make_request('SoftLayer_Product_Order', 'verifyOrder', args=({},)))
+        self.assertEqual(self.transport.get_stats()['entries'], 2)
+
+        # A new guest changes the account's list of guests too
+        self.transport(make_request('SoftLayer_Virtual_Guest', 'createObject', args=({},)))
+        self.assertEqual(self.transport.get_stats()['entries'], 0)
+        self.transport(make_request('SoftLayer_Account', 'getVirtualGuests'))
+        self.assertEqual(self.fixtures.call_count, 5)
+
+    def test_default_ttl(self):
+        transport = transports.CachingTransport(self.fixtures, rules={'Product_Package': 3600})
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Product_Package', 'getItems')), 3600)
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Account', 'getVirtualGuests')), 0)
+
+    def test_rules(self):
+        transport = transports.CachingTransport(self.fixtures, ttl=0, rules={
+            'Product_Package': 3600,
+            'SoftLayer_Product_Package::getItemPrices': 0,
+            'Account::getObject': 10,
+            'Product_Order::placeOrder': 100,
+        })
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Product_Package', 'getItems')), 3600)
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Product_Package', 'getItemPrices')), 0)
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Account', 'getObject')), 10)
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Account', 'getHardware')), 0)
+        # Mutating methods can't be turned on with a rule
+        self.assertEqual(transport.get_ttl(make_request('SoftLayer_Product_Order', 'placeOrder')), 0)
+
+    def test_expired(self):
+        with mock.patch('SoftLayer.transports.cache.time.time') as fake_time:
+            fake_time.return_value = 1000
+            self.transport(make_request())
+            fake_time.return_value = 1000 + 299
+            self.transport(make_request())
+            self.assertEqual(self.fixtures.call_count, 1)
+            fake_time.return_value = 1000 + 301
+            self.transport(make_request())
+            self.assertEqual(self.fixtures.call_count, 2)
+
+    def test_lru_max_entries(self):
+        transport = transports.CachingTransport(self.fixtures, ttl=300, max_entries=2)
+        transport(make_request(identifier=1))
+        transport(make_request(identifier=2))
+        transport(make_request(identifier=1))
+        transport(make_request(identifier=3))
+        self.assertEqual(transport.get_stats()['entries'], 2)
+        self.assertEqual(self.fixtures.call_count, 3)
+
+        # 2 was the least recently used, so it is gone, 1 is still there.
+        transport(make_request(identifier=1))
+        self.assertEqual(self.fixtures.call_count, 3)
+        transport(make_request(identifier=2))
+        self.assertEqual(self.fixtures.call_count, 4)
+
+    def test_lru_max_bytes(self):
+        transport = transports.CachingTransport(self.fixtures, ttl=300)
+        transport(make_request('SoftLayer_Account', 'getObject'))
+        size = transport.get_stats()['bytes']
+        self.assertGreater(size, 0)
+
+        transport = transports.CachingTransport(self.fixtures, ttl=300, max_bytes=size)
+        transport(make_request('SoftLayer_Account', 'getObject'))
+        transport(make_request('SoftLayer_Account', 'getObject', identifier=1))
+        self.assertEqual(transport.get_stats()['entries'], 1)
+        self.assertLessEqual(transport.get_stats()['bytes'], size)
+
+    def test_not_json(self):
+        self.fixtures = mock.MagicMock(return_value={'value': object()})
+        transport = transports.CachingTransport(self.fixtures, ttl=300)
+        transport(make_request())
+        transport(make_request())
+        self.assertEqual(self.fixtures.call_count, 2)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = transports.CachingTransport(self.fixtures, ttl=300, cache_dir=cache_dir)
+            first(make_request(identifier=200))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # A new transport, like the next slcli command, can use the saved result.
+            second = transports.CachingTransport(self.fixtures, ttl=300, cache_dir=cache_dir)
+            result = second(make_request(identifier=200))
+            self.assertEqual(self.fixtures.call_count, 1)
+            self.assertIsInstance(result, transports.SoftLayerListResult)
+
+            second(make_request('SoftLayer_Account', 'getObject'))
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            # Without reading the files
+            with mock.patch('SoftLayer.transports.cache._read_file') as read_file:
+                second.invalidate('Product_Package')
+            read_file.assert_not_called()
+            self.assertEqual([name.split('.')[0] for name in os.listdir(cache_dir)], ['SoftLayer_Account'])
+
+            # The next process sees what a mutating call cleared
+            second(make_request('SoftLayer_Virtual_Guest', 'deleteObject', identifier=100))
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_disk_cache_expired(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            transport = transports.CachingTransport(self.fixtures, ttl=1, cache_dir=cache_dir)
+            transport(make_request())
+            transport.invalidate()
+            with mock.patch('SoftLayer.transports.cache.time.time', return_value=time.time() + 2):
+                transport(make_request())
+            self.assertEqual(self.fixtures.call_count, 2)
+
+    def test_real_transport(self):
+        # create_client_from_env looks for the 'real' transport with the transport property.
+        self.assertIs(self.transport.transport, self.fixtures)
+
+    def test_print_reproduceable(self):
+        output_text = self.transport.print_reproduceable(make_request('SoftLayer_Account', 'getObject'))
+        self.assertEqual('SoftLayer_Account', output_text)
@@ -0,0 +1,86 @@
+"""
+    SoftLayer.tests.transports.codec_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import json
+from unittest import mock as mock
+
+from SoftLayer import testing
+from SoftLayer.transports import codec
+
+
+def chunked(text, size=3):
+    """Splits text into tiny byte chunks, to break up tokens and multi-byte characters between reads"""
+    data = text.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestCodec(testing.TestCase):
+
+    def test_dumps(self):
+        payload = {'parameters': ['test', b'asdf', 1, None, True], 2: 'int key'}
+        self.assertEqual(json.loads(codec.dumps(payload)),
+                         {'parameters': ['test', 'YXNkZg==', 1, None, True], '2': 'int key'})
+
+    def test_dumps_no_orjson(self):
+        with mock.patch.object(codec, 'orjson', None):
+            self.assertEqual(codec.dumps({'parameters': [b'asdf']}), '{"parameters": ["YXNkZg=="]}')
+
+    def test_dumps_error(self):
+        self.assertRaises(TypeError, codec.dumps, {'parameters': [object()]})
+
+    def test_loads(self):
+        for orjson, ujson in ((codec.orjson, codec.ujson), (None, codec.ujson), (None, None)):
+            with mock.patch.multiple(codec, orjson=orjson, ujson=ujson):
+                self.assertEqual(codec.loads('{"id": 1, "name": "é"}'), {'id': 1, 'name': 'é'})
+                self.assertEqual(codec.loads(b'[1, 2]'), [1, 2])
+                self.assertRaises(ValueError, codec.loads, 'Not JSON')
+
+
+class TestStreamLoads(testing.TestCase):
+
+    def test_array(self):
+        items = [{'id': 1, 'hostname': 'a[b]c', 'notes': 'quote \\" and , comma'}, 12345678, -1.5e10,
+                 'é and 日本', [[], {}], None, True, False, {'nested': [{'deep': ['x']}]}]
+        text = json.dumps(items)
+        for size in (1, 2, 3, 7, 64, 100000):
+            is_list, result = codec.stream_loads(chunked(text, size))
+            self.assertTrue(is_list)
+            self.assertEqual(list(result), items)
+
+    def test_whitespace(self):
+        is_list, result = codec.stream_loads(chunked(' \n [ 1 ,\n 2 , {"a" : 3} ] \n'))
+        self.assertTrue(is_list)
+        self.assertEqual(list(result), [1, 2, {'a': 3}])
+
+    def test_empty_array(self):
+        is_list, result = codec.stream_loads(chunked('[ ]'))
+        self.assertTrue(is_list)
+        self.assertEqual(list(result), [])
+
+    def test_not_array(self):
+        self.assertEqual(codec.stream_loads(chunked('{"id": [1, 2]}')), (False, {'id': [1, 2]}))
+        self.assertEqual(codec.stream_loads(chunked('true')), (False, True))
+        self.assertRaises(ValueError, codec.stream_loads, [])
+
+    def test_items_before_end(self):
+        # Items can be used before the rest of the array has been read
+        def chunks():
+            yield b'[{"id": 1}, {"id": 2}, '
+            raise AssertionError("Read too far")
+
+        _, result = codec.stream_loads(chunks())
+        self.assertEqual(next(result), {'id': 1})
+        self.assertEqual(next(result), {'id': 2})
+
+    def test_large_item(self):
+        item = {'description': 'x' * 100000, 'list': list(range(1000))}
+        _, result = codec.stream_loads(chunked(json.dumps([item, item]), 100))
+        self.assertEqual(list(result), [item, item])
+
+    def test_invalid(self):
+        for text in ('[1, 2', '[1 2]', '[1, }', '[1,]', '[{"id": 1'):
+            _, result = codec.stream_loads(chunked(text))
+            self.assertRaises(ValueError, list, result)
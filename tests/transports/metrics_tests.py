@@ -0,0 +1,201 @@
+"""
+    SoftLayer.tests.transports.metrics_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+from unittest import mock as mock
+
+import SoftLayer
+from SoftLayer import exceptions
+from SoftLayer import testing
+from SoftLayer import transports
+from SoftLayer.transports import metrics
+
+
+def make_request(service='SoftLayer_Account', method='getObject', **props):
+    req = transports.Request()
+    req.service = service
+    req.method = method
+    for prop, value in props.items():
+        setattr(req, prop, value)
+    return req
+
+
+class TestHistogram(testing.TestCase):
+
+    def test_observe(self):
+        histogram = metrics.Histogram([1, 2, 4])
+        for value in (0.5, 1, 1.5, 3, 10):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.sum, 16)
+        self.assertEqual((histogram.min, histogram.max), (0.5, 10))
+        self.assertEqual(histogram.mean(), 3.2)
+        self.assertEqual(histogram.cumulative(), [(1, 2), (2, 3), (4, 4), ('+Inf', 5)])
+
+    def test_quantile(self):
+        histogram = metrics.Histogram([1, 2, 4])
+        self.assertIsNone(histogram.quantile(0.5))
+        for _ in range(98):
+            histogram.observe(1.5)
+        histogram.observe(3)
+        histogram.observe(10)
+        self.assertTrue(1 <= histogram.quantile(0.5) <= 2)
+        self.assertTrue(2 <= histogram.quantile(0.99) <= 4)
+        self.assertEqual(histogram.quantile(1), 10)
+
+    def test_quantile_clamped(self):
+        histogram = metrics.Histogram([1, 2, 4])
+        histogram.observe(1.25)
+        histogram.observe(1.5)
+        self.assertTrue(1.25 <= histogram.quantile(0.5) <= 1.5)
+
+
+class TestMetricsTransport(testing.TestCase):
+
+    def set_up(self):
+        self.fixtures = mock.MagicMock(wraps=transports.FixtureTransport())
+        self.transport = transports.MetricsTransport(self.fixtures, max_spans=10)
+
+    def test_call(self):
+        result = self.transport(make_request(payload='x' * 100, response_size=2000))
+        self.assertEqual(result['accountId'], 1234)
+
+        stats = self.transport.methods[('SoftLayer_Account', 'getObject')]
+        self.assertEqual(stats.latency.count, 1)
+        self.assertEqual(stats.request_bytes.sum, 100)
+        self.assertEqual(stats.response_bytes.sum, 2000)
+        self.assertEqual(stats.in_flight, 0)
+        self.assertEqual(self.transport.in_flight, 0)
+
+        span = self.transport.get_spans()[0]
+        self.assertEqual(span.name, 'SoftLayer_Account::getObject')
+        self.assertEqual(len(span.span_id), 16)
+        self.assertIsNone(span.parent_id)
+        self.assertIsNone(span.error)
+        self.assertEqual(span.to_dict()['attributes']['request_bytes'], 100)
+
+    def test_in_flight(self):
+        def check(call):
+            self.assertEqual(self.transport.in_flight, 1)
+            self.assertEqual(self.transport.methods[('SoftLayer_Account', 'getObject')].in_flight, 1)
+            self.assertIn('softlayer_api_in_flight{service="SoftLayer_Account",method="getObject"} 1',
+                          self.transport.to_prometheus())
+            return {}
+
+        self.fixtures.side_effect = check
+        self.transport(make_request())
+        self.assertEqual(self.transport.in_flight, 0)
+
+    def test_errors(self):
+        self.fixtures.side_effect = [exceptions.SoftLayerAPIError('SoftLayer_Exception', 'Nope'),
+                                     exceptions.TransportError(0, 'Timed out'), {}]
+        for _ in range(2):
+            self.assertRaises(exceptions.SoftLayerAPIError, self.transport, make_request())
+        self.transport(make_request())
+
+        stats = self.transport.methods[('SoftLayer_Account', 'getObject')]
+        self.assertEqual(stats.errors, {'SoftLayerAPIError': 1, 'TransportError': 1})
+        self.assertEqual([span.error for span in self.transport.get_spans()],
+                         ['SoftLayerAPIError', 'TransportError', None])
+        self.assertEqual(self.transport.get_summary()[0]['errors'], 2)
+
+    def test_bounded_spans(self):
+        for _ in range(50):
+            self.transport(make_request())
+        self.assertEqual(len(self.transport.get_spans()), 10)
+        self.assertEqual(self.transport.get_summary()[0]['calls'], 50)
+
+    def test_iter_call_spans(self):
+        parent_id = transports.transport.new_span_id()
+        for offset in (0, 100, 200):
+            self.transport(make_request(method='getHardware', parent_id=parent_id, offset=offset, limit=100))
+        self.transport(make_request())
+
+        spans = self.transport.get_spans()
+        parent = spans[0]
+        pages = [span for span in spans if span.parent_id == parent_id]
+        self.assertEqual(parent.span_id, parent_id)
+        self.assertIsNone(parent.parent_id)
+        self.assertEqual(parent.attributes['pages'], 3)
+        self.assertEqual([page.attributes['offset'] for page in pages], [0, 100, 200])
+        self.assertGreaterEqual(parent.duration, sum(page.duration for page in pages))
+        self.assertIsNone(spans[-1].parent_id)
+
+    def test_client_iter_call(self):
+        client = SoftLayer.BaseClient(transport=self.transport)
+        list(client.iter_call('Account', 'getHardware'))
+        list(client.iter_call('Account', 'getHardware'))
+
+        spans = self.transport.get_spans()
+        self.assertEqual(len(spans), 4)
+        self.assertEqual(spans[1].parent_id, spans[0].span_id)
+        self.assertEqual(spans[3].parent_id, spans[2].span_id)
+        self.assertNotEqual(spans[0].span_id, spans[2].span_id)
+
+    def test_summary(self):
+        self.transport(make_request())
+        self.transport(make_request(method='getHardware'))
+        self.transport(make_request(method='getHardware'))
+        summary = self.transport.get_summary()
+        self.assertEqual({(row['method'], row['calls']) for row in summary}, {('getObject', 1), ('getHardware', 2)})
+        for row in summary:
+            self.assertLessEqual(row['p50'], row['max'])
+            self.assertLessEqual(row['p99'], row['max'])
+
+    def test_prometheus(self):
+        self.transport(make_request(payload='x' * 10))
+        text = self.transport.to_prometheus()
+        self.assertIn('# TYPE softlayer_api_request_duration_seconds histogram', text)
+        self.assertIn('softlayer_api_request_duration_seconds_bucket{service="SoftLayer_Account",'
+                      'method="getObject",le="+Inf"} 1', text)
+        self.assertIn('softlayer_api_request_size_bytes_sum{service="SoftLayer_Account",method="getObject"} 10', text)
+        self.assertIn('softlayer_api_request_duration_seconds_count{service="SoftLayer_Account",method="getObject"} 1',
+                      text)
+        self.assertTrue(text.endswith('\n'))
+
+        self.transport.reset()
+        self.assertNotIn('getObject', self.transport.to_prometheus())
+        self.assertEqual(self.transport.get_spans(), [])
+
+    def test_sinks(self):
+        spans = []
+        broken = mock.MagicMock(side_effect=ValueError("broken sink"))
+        self.transport.sinks = [broken, spans.append]
+        self.transport(make_request())
+        # A broken sink doesn't break the call, or the other sinks
+        broken.assert_called_once()
+        self.assertEqual(spans, self.transport.get_spans())
+
+    def test_passthrough(self):
+        debug = transports.DebugTransport(transports.FixtureTransport())
+        self.transport = transports.MetricsTransport(debug)
+        request = make_request()
+        self.transport(request)
+        self.assertEqual(self.transport.get_last_calls(), [request])
+        self.assertIn('SoftLayer_Account', self.transport.print_reproduceable(request))
+
+
+class TestStatsdSink(testing.TestCase):
+
+    def test_lines(self):
+        sink = metrics.StatsdSink(prefix='sl')
+        span = metrics.Span('SoftLayer_Account::getObject', 'abc', duration=0.25, error='TransportError',
+                            attributes={'request_bytes': 100, 'response_bytes': None})
+        self.assertEqual(sink.lines(span), [
+            'sl.SoftLayer_Account.getObject.calls:1|c',
+            'sl.SoftLayer_Account.getObject.duration:250.000|ms',
+            'sl.SoftLayer_Account.getObject.request_bytes:100|c',
+            'sl.SoftLayer_Account.getObject.errors.TransportError:1|c',
+        ])
+
+    def test_send(self):
+        sink = metrics.StatsdSink('statsd.example.com', 9125)
+        sink.socket = mock.MagicMock()
+        sink(metrics.Span('SoftLayer_Account::getObject', 'abc', duration=0.1))
+        sink.socket.sendto.assert_called_once_with(
+            b'softlayer.api.SoftLayer_Account.getObject.calls:1|c\n'
+            b'softlayer.api.SoftLayer_Account.getObject.duration:100.000|ms',
+            ('statsd.example.com', 9125))
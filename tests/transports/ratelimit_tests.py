@@ -0,0 +1,231 @@
+"""
+    SoftLayer.tests.transports.ratelimit_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+from unittest import mock as mock
+
+from SoftLayer import exceptions
+from SoftLayer import testing
+from SoftLayer import transports
+from SoftLayer.transports import ratelimit
+
+
+class FakeTime(object):
+    """Stands in for the time module, sleeping just moves the clock forward."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_request(service='SoftLayer_Account', method='getObject'):
+    req = transports.Request()
+    req.service = service
+    req.method = method
+    return req
+
+
+def api_error(code, retry_after=None, cls=exceptions.SoftLayerAPIError):
+    error = cls(code, 'Error %s' % code)
+    error.retry_after = retry_after
+    return error
+
+
+class TestTokenBucket(testing.TestCase):
+
+    def set_up(self):
+        self.time = FakeTime()
+        patcher = mock.patch.object(ratelimit, 'time', self.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        bucket = ratelimit.TokenBucket(rate=2, burst=3)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        # Callers over the rate are spaced out, in order
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.5, 1.0, 1.5])
+
+    def test_refill(self):
+        bucket = ratelimit.TokenBucket(rate=2, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        self.time.now += 10
+        # Never more than the burst
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0.5])
+
+    def test_no_limit(self):
+        bucket = ratelimit.TokenBucket()
+        self.assertEqual([bucket.reserve() for _ in range(100)], [0] * 100)
+
+    def test_pause(self):
+        bucket = ratelimit.TokenBucket(rate=2, burst=10)
+        bucket.pause(5)
+        # Nobody goes before the pause is over, then they go one after the other
+        self.assertEqual([bucket.reserve() for _ in range(3)], [5.5, 6.0, 6.5])
+
+    def test_pause_no_limit(self):
+        bucket = ratelimit.TokenBucket()
+        bucket.pause(5)
+        self.assertEqual(bucket.reserve(), 5)
+        self.time.now += 5
+        self.assertEqual(bucket.reserve(), 0)
+
+
+class TestAdaptiveConcurrency(testing.TestCase):
+
+    def test_additive_increase(self):
+        limiter = ratelimit.AdaptiveConcurrency(initial=2, maximum=3)
+        for _ in range(10):
+            started = [limiter.acquire(), limiter.acquire()]
+            for start in started:
+                limiter.release(start)
+        self.assertEqual(limiter.limit, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_no_increase_when_idle(self):
+        limiter = ratelimit.AdaptiveConcurrency(initial=4)
+        for _ in range(10):
+            limiter.release(limiter.acquire())
+        self.assertEqual(limiter.limit, 4)
+
+    def test_multiplicative_decrease(self):
+        limiter = ratelimit.AdaptiveConcurrency(initial=8, minimum=2)
+        started = [limiter.acquire() for _ in range(4)]
+        # Calls that were in flight together only lower the limit once
+        for start in started:
+            limiter.release(start, throttled=True)
+        self.assertEqual(limiter.limit, 4)
+
+        limiter.release(limiter.acquire(), throttled=True)
+        limiter.release(limiter.acquire(), throttled=True)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_waits_for_slot(self):
+        limiter = ratelimit.AdaptiveConcurrency(initial=1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.release(limiter.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(started)
+        thread.join(5)
+        self.assertTrue(acquired.is_set())
+
+    def test_bad_limits(self):
+        self.assertRaises(ValueError, ratelimit.AdaptiveConcurrency, minimum=0)
+        self.assertRaises(ValueError, ratelimit.AdaptiveConcurrency, minimum=4, maximum=2)
+
+
+class TestRateLimitingTransport(testing.TestCase):
+
+    def set_up(self):
+        self.time = FakeTime()
+        patcher = mock.patch.object(ratelimit, 'time', self.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fixtures = mock.MagicMock(wraps=transports.FixtureTransport())
+        self.transport = transports.RateLimitingTransport(self.fixtures, max_retries=3, backoff=1, max_backoff=3)
+
+    def test_call(self):
+        result = self.transport(make_request())
+        self.assertEqual(result['accountId'], 1234)
+        self.assertEqual(self.time.sleeps, [])
+        self.assertEqual(self.transport.get_stats(), {'calls': 1, 'retries': 0, 'throttled': 0, 'concurrency': 4})
+
+    def test_rate(self):
+        self.transport = transports.RateLimitingTransport(self.fixtures, rate=10, burst=1)
+        for _ in range(3):
+            self.transport(make_request())
+        self.assertEqual(len(self.time.sleeps), 2)
+        for seconds in self.time.sleeps:
+            self.assertAlmostEqual(seconds, 0.1)
+
+    def test_service_limits(self):
+        limits = {'Account::getObject': 1, 'SoftLayer_Product_Order': 2}
+        self.transport = transports.RateLimitingTransport(self.fixtures, limits=limits)
+        self.assertEqual(len(self.transport.get_buckets(make_request())), 2)
+        self.assertEqual(len(self.transport.get_buckets(make_request(method='getHardware'))), 1)
+        self.assertEqual(len(self.transport.get_buckets(make_request('SoftLayer_Product_Order', 'verifyOrder'))), 2)
+
+        self.transport(make_request())
+        self.transport(make_request())
+        self.assertEqual(self.time.sleeps, [1.0])
+
+    @mock.patch('SoftLayer.transports.ratelimit.random.uniform', side_effect=lambda low, high: high)
+    def test_retry_backoff(self, uniform):
+        self.fixtures.side_effect = [api_error(503), api_error(502), api_error(504), {'id': 1}]
+        self.assertEqual(self.transport(make_request()), {'id': 1})
+        # Full jitter, up to backoff * 2 ** attempt, capped at max_backoff
+        uniform.assert_has_calls([mock.call(0, 1), mock.call(0, 2), mock.call(0, 3)])
+        self.assertEqual(self.time.sleeps, [1, 2, 3])
+        self.assertEqual(self.transport.get_stats()['retries'], 3)
+        self.assertEqual(self.transport.get_stats()['throttled'], 1)
+
+    def test_retry_after(self):
+        self.fixtures.side_effect = [api_error(429, retry_after=7), {'id': 1}]
+        self.assertEqual(self.transport(make_request()), {'id': 1})
+        self.assertEqual(self.time.sleeps, [7])
+        # Other callers wait for the pause as well
+        self.time.now -= 2
+        self.assertEqual(self.transport.bucket.reserve(), 2)
+
+    def test_throttled_lowers_concurrency(self):
+        self.fixtures.side_effect = [api_error(429, retry_after=0), {'id': 1}]
+        self.transport(make_request())
+        self.assertEqual(self.transport.get_stats()['concurrency'], 2)
+
+    def test_gives_up(self):
+        self.fixtures.side_effect = api_error(503, retry_after=1)
+        ex = self.assertRaises(exceptions.SoftLayerAPIError, self.transport, make_request())
+        self.assertEqual(ex.faultCode, 503)
+        self.assertEqual(self.fixtures.call_count, 4)
+        self.assertEqual(self.transport.concurrency.in_flight, 0)
+
+    def test_not_retriable(self):
+        self.fixtures.side_effect = api_error('SoftLayer_Exception_ObjectNotFound')
+        self.assertRaises(exceptions.SoftLayerAPIError, self.transport, make_request())
+        self.assertEqual(self.fixtures.call_count, 1)
+
+    def test_is_retriable(self):
+        get = make_request()
+        create = make_request('SoftLayer_Virtual_Guest', 'createObject')
+        self.assertTrue(self.transport.is_retriable(get, api_error(0, cls=exceptions.TransportError)))
+        self.assertTrue(self.transport.is_retriable(get, api_error(504)))
+        self.assertFalse(self.transport.is_retriable(get, api_error(500)))
+        self.assertFalse(self.transport.is_retriable(get, api_error(0)))
+        # Changes are only tried again if the API said it didn't make them
+        self.assertTrue(self.transport.is_retriable(create, api_error(429)))
+        self.assertFalse(self.transport.is_retriable(create, api_error(503)))
+        self.assertFalse(self.transport.is_retriable(create, api_error(0, cls=exceptions.TransportError)))
+
+    def test_stats_threads(self):
+        threads = [threading.Thread(target=lambda: [self.transport(make_request()) for _ in range(50)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.transport.get_stats()['calls'], 400)
+
+    def test_passthrough(self):
+        debug = transports.DebugTransport(transports.FixtureTransport())
+        self.transport = transports.RateLimitingTransport(debug)
+        request = make_request()
+        self.transport(request)
+        self.assertEqual(self.transport.get_last_calls(), [request])
+        self.assertIn('SoftLayer_Account', self.transport.print_reproduceable(request))
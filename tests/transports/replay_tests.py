@@ -0,0 +1,141 @@
+"""
+    SoftLayer.tests.transports.replay_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import gzip
+import json
+import os
+import tempfile
+from unittest import mock as mock
+
+import SoftLayer
+from SoftLayer import testing
+from SoftLayer import transports
+
+
+def make_request(service='SoftLayer_Account', method='getVirtualGuests', **props):
+    req = transports.Request()
+    req.service = service
+    req.method = method
+    for prop, value in props.items():
+        setattr(req, prop, value)
+    return req
+
+
+class TestRecordAndReplay(testing.TestCase):
+
+    def set_up(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'calls.jsonl')
+        self.fixtures = mock.MagicMock(wraps=transports.FixtureTransport())
+
+    def record(self, *requests):
+        recorder = transports.RecordingTransport(self.fixtures, self.path)
+        results = [recorder(request) for request in requests]
+        recorder.close()
+        return results
+
+    def test_replay(self):
+        recorded = self.record(make_request(mask='mask[id]', limit=10, offset=0),
+                               make_request('SoftLayer_Virtual_Guest', 'getObject', identifier=100))
+        replay = transports.ReplayTransport(self.path)
+
+        guests = replay(make_request(mask='mask[id]', limit=10, offset=0))
+        self.assertEqual(guests, recorded[0])
+        self.assertIsInstance(guests, transports.SoftLayerListResult)
+        self.assertEqual(guests.total_count, recorded[0].total_count)
+        self.assertEqual(replay(make_request('SoftLayer_Virtual_Guest', 'getObject', identifier=100)), recorded[1])
+
+    def test_not_recorded(self):
+        self.record(make_request(limit=10, offset=0))
+        replay = transports.ReplayTransport(self.path)
+
+        # Any difference in the call is a different call
+        ex = self.assertRaises(SoftLayer.SoftLayerAPIError, replay, make_request(limit=10, offset=10))
+        self.assertEqual(ex.faultCode, 404)
+
+    def test_errors(self):
+        self.fixtures.side_effect = SoftLayer.SoftLayerAPIError('SoftLayer_Exception_NotFound', 'Gone')
+        self.assertRaises(SoftLayer.SoftLayerAPIError, self.record, make_request())
+
+        ex = self.assertRaises(SoftLayer.SoftLayerAPIError, transports.ReplayTransport(self.path), make_request())
+        self.assertEqual(ex.faultCode, 'SoftLayer_Exception_NotFound')
+        self.assertEqual(ex.faultString, 'Gone')
+
+    def test_repeated_calls(self):
+        self.fixtures.side_effect = [{'status': 'building'}, {'status': 'ready'}]
+        request = make_request('SoftLayer_Virtual_Guest', 'getObject', identifier=100)
+        self.record(request, request)
+        replay = transports.ReplayTransport(self.path)
+
+        answers = [replay(request)['status'] for _ in range(3)]
+        self.assertEqual(answers, ['building', 'ready', 'ready'])
+        replay.reset()
+        self.assertEqual(replay(request)['status'], 'building')
+
+    def test_appends(self):
+        self.record(make_request())
+        self.record(make_request('SoftLayer_Account', 'getObject'))
+
+        with open(self.path, encoding='utf-8') as recording:
+            entries = [json.loads(line) for line in recording]
+        self.assertEqual([entry['method'] for entry in entries], ['getVirtualGuests', 'getObject'])
+        self.assertIn('seconds', entries[0])
+
+    @mock.patch('time.sleep')
+    def test_latency(self, _sleep):
+        with open(self.path, 'w', encoding='utf-8') as recording:
+            key = transports.CachingTransport.call_key(make_request())
+            recording.write(json.dumps({'key': key, 'seconds': 0.5, 'result': True}) + '\n')
+
+        self.assertTrue(transports.ReplayTransport(self.path)(make_request()))
+        _sleep.assert_not_called()
+        self.assertTrue(transports.ReplayTransport(self.path, latency=2)(make_request()))
+        _sleep.assert_called_once_with(1.0)
+
+    def test_gzip(self):
+        self.path += '.gz'
+        recorded = self.record(make_request())
+
+        with gzip.open(self.path, 'rt', encoding='utf-8') as recording:
+            self.assertEqual(len(recording.readlines()), 1)
+        self.assertEqual(transports.ReplayTransport(self.path)(make_request()), recorded[0])
+
+    def test_killed(self):
+        for suffix in ('', '.gz'):
+            self.path += suffix
+            recorder = transports.RecordingTransport(self.fixtures, self.path)
+            recorded = recorder(make_request())
+            recorder(make_request('SoftLayer_Account', 'getObject'))
+            # Killed while saving the second call, without closing the file
+            recorder._file.truncate(recorder._file.tell() - 20)
+
+            replay = transports.ReplayTransport(self.path)
+            self.assertEqual(replay(make_request()), recorded)
+            self.assertRaises(SoftLayer.SoftLayerAPIError, replay, make_request('SoftLayer_Account', 'getObject'))
+            recorder.close()
+
+    def test_client(self):
+        recorder = transports.RecordingTransport(transports.FixtureTransport(), self.path)
+        client = SoftLayer.BaseClient(transport=recorder, auth=None)
+        recorded = list(client.iter_call('Account', 'getVirtualGuests', limit=1))
+        recorder.close()
+
+        client = SoftLayer.BaseClient(transport=transports.ReplayTransport(self.path), auth=None)
+        self.assertEqual(list(client.iter_call('Account', 'getVirtualGuests', limit=1)), recorded)
+
+
+class TestReplayCommand(testing.TestCase):
+
+    def test_record_and_replay(self):
+        path = os.path.join(tempfile.mkdtemp(), 'vs-list.jsonl')
+        recorded = self.run_command(['--record', path, 'vs', 'list'])
+        self.assert_no_fail(recorded)
+
+        env = SoftLayer.CLI.environment.Environment()
+        replayed = self.run_command(['--replay', path, 'vs', 'list'], env=env, fixtures=False)
+        self.assert_no_fail(replayed)
+        self.assertEqual(json.JSONDecoder().raw_decode(replayed.output)[0],
+                         json.JSONDecoder().raw_decode(recorded.output)[0])
+        self.assertIsInstance(env.client.transport.transport, transports.ReplayTransport)
@@ -4,6 +4,7 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import io
 import json
 import requests
 from unittest import mock as mock
@@ -79,6 +80,23 @@ def test_http_and_empty_error(self, request):
         req.method = 'Resource'
         self.assertRaises(SoftLayer.SoftLayerAPIError, self.transport, req)
 
+    @mock.patch('SoftLayer.transports.rest.requests.Session.request')
+    def test_http_error_retry_after(self, request):
+        e = requests.HTTPError('error')
+        e.response = mock.MagicMock()
+        e.response.status_code = 429
+        e.response.text = '{"error": "Too many requests", "code": "SoftLayer_Exception"}'
+        e.response.headers = {'Retry-After': '5'}
+        request().raise_for_status.side_effect = e
+
+        req = transports.Request()
+        req.service = 'SoftLayer_Service'
+        req.method = 'Resource'
+        ex = self.assertRaises(SoftLayer.SoftLayerAPIError, self.transport, req)
+        self.assertEqual(ex.faultCode, 429)
+        self.assertEqual(ex.faultString, 'Too many requests')
+        self.assertEqual(ex.retry_after, 5.0)
+
     @mock.patch('SoftLayer.transports.rest.requests.Session.request')
     def test_empty_error(self, request):
         # Test empty response error.
@@ -163,12 +181,14 @@ def test_with_args(self, request):
             'http://something9999999999999999999999.com/SoftLayer_Service/getObject.json',
             headers=mock.ANY,
             auth=None,
-            data='{"parameters": ["test", 1]}',
+            data=mock.ANY,
             params={},
             verify=True,
             cert=None,
             proxies=None,
             timeout=None)
+        # orjson doesn't add spaces, so compare the decoded payload
+        self.assertEqual(json.loads(request.call_args.kwargs['data']), {"parameters": ["test", 1]})
 
     @mock.patch('SoftLayer.transports.rest.requests.Session.request')
     def test_with_args_bytes(self, request):
@@ -187,12 +207,14 @@ def test_with_args_bytes(self, request):
             'http://something9999999999999999999999.com/SoftLayer_Service/getObject.json',
             headers=mock.ANY,
             auth=None,
-            data='{"parameters": ["test", "YXNkZg=="]}',
+            data=mock.ANY,
             params={},
             verify=True,
             cert=None,
             proxies=None,
             timeout=None)
+        # orjson doesn't add spaces, so compare the decoded payload
+        self.assertEqual(json.loads(request.call_args.kwargs['data']), {"parameters": ["test", "YXNkZg=="]})
 
     @mock.patch('SoftLayer.transports.rest.requests.Session.request')
     def test_with_filter(self, request):
@@ -350,3 +372,82 @@ def test_complex_encoder_bytes(self):
         # result = '{"test": ["array", 0, 1, false], "bytes": "QVNEQVNEQVNE"}'
         # encode doesn't always encode in the same order, so testing exact match SOMETIMES breaks.
         self.assertIn("QVNEQVNEQVNE", result)
+
+
+class TestRestStreaming(testing.TestCase):
+
+    def set_up(self):
+        self.transport = transports.RestTransport(endpoint_url='http://something9999999999999999999999.com',
+                                                  stream=True)
+
+    @staticmethod
+    def response(body, total=None):
+        response = requests.Response()
+        response.raw = io.BytesIO(body)
+        response.status_code = 200
+        response.url = 'http://something9999999999999999999999.com/SoftLayer_Account/getVirtualGuests.json'
+        if total is not None:
+            response.headers['SoftLayer-Total-Items'] = total
+        return response
+
+    @staticmethod
+    def request(stream=True):
+        req = transports.Request()
+        req.service = 'SoftLayer_Account'
+        req.method = 'getVirtualGuests'
+        req.stream = stream
+        return req
+
+    @mock.patch('SoftLayer.transports.rest.requests.Session.request')
+    def test_stream_list(self, request):
+        request.return_value = self.response(b'[{"id": 1}, {"id": 2}]', total='10')
+
+        resp = self.transport(self.request())
+
+        self.assertIsInstance(resp, transports.StreamingListResult)
+        self.assertEqual(resp.total_count, 10)
+        self.assertEqual(list(resp), [{'id': 1}, {'id': 2}])
+        self.assertEqual(len(resp), 2)
+        self.assertTrue(request.call_args.kwargs['stream'])
+
+    @mock.patch('SoftLayer.transports.rest.requests.Session.request')
+    def test_stream_not_list(self, request):
+        request.return_value = self.response(b'{"id": 1}')
+        req = self.request()
+        self.assertEqual(self.transport(req), {'id': 1})
+        self.assertEqual(req.result, {'id': 1})
+
+    @mock.patch('SoftLayer.transports.rest.requests.Session.request')
+    def test_stream_invalid(self, request):
+        request.return_value = self.response(b'[{"id": 1}, {"id": ')
+        resp = self.transport(self.request())
+        self.assertRaises(SoftLayer.SoftLayerAPIError, list, resp)
+
+        request.return_value = self.response(b'Not JSON')
+        self.assertRaises(SoftLayer.SoftLayerAPIError, self.transport, self.request())
+
+    @mock.patch('SoftLayer.transports.rest.requests.Session.request')
+    def test_not_requested(self, request):
+        request.return_value = self.response(b'[{"id": 1}]')
+
+        # Only callers that ask for a stream get one
+        resp = self.transport(self.request(stream=False))
+        self.assertIsInstance(resp, transports.SoftLayerListResult)
+        self.assertNotIn('stream', request.call_args.kwargs)
+
+        # The debug transport logs the whole result, so it never streams
+        request.return_value = self.response(b'[{"id": 1}]')
+        resp = transports.DebugTransport(self.transport)(self.request())
+        self.assertIsInstance(resp, transports.SoftLayerListResult)
+
+    @mock.patch('SoftLayer.transports.rest.requests.Session.request')
+    def test_iter_call(self, request):
+        pages = [b'[{"id": 1}, {"id": 2}]', b'[{"id": 3}]']
+        request.side_effect = [self.response(page, total='3') for page in pages]
+        client = SoftLayer.BaseClient(transport=self.transport)
+
+        result = list(client.iter_call('Account', 'getVirtualGuests', limit=2))
+
+        self.assertEqual(result, [{'id': 1}, {'id': 2}, {'id': 3}])
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(request.call_args.kwargs['params']['resultLimit'], '2,2')
@@ -4,8 +4,14 @@
 
     :license: MIT, see LICENSE for more details.
 """
+import datetime
+import email.utils
+
+from urllib3.util.retry import Retry
+
 from SoftLayer import testing
 from SoftLayer import transports
+from SoftLayer.transports import transport
 
 
 class TestFixtureTransport(testing.TestCase):
@@ -68,3 +74,104 @@ def test_print_reproduceable(self):
         req.method = 'getObject'
         output_text = self.transport.print_reproduceable(req)
         self.assertEqual('SoftLayer_Account', output_text)
+
+
+class TestGetSession(testing.TestCase):
+
+    def test_defaults(self):
+        session = transport.get_session('test-agent')
+        adapter = session.get_adapter('https://api.softlayer.com')
+        self.assertIsInstance(adapter, transport.KeepAliveAdapter)
+        self.assertEqual(adapter._pool_maxsize, 10)
+        self.assertFalse(adapter._pool_block)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertEqual(adapter.max_retries.connect, 1)
+        self.assertEqual(session.headers['User-Agent'], 'test-agent')
+        self.assertEqual(session.headers['Connection'], 'keep-alive')
+
+    def test_pool_options(self):
+        session = transport.get_session('test-agent', pool_connections=2, pool_maxsize=50, pool_block=True,
+                                        retries=5, backoff_factor=0.5)
+        adapter = session.get_adapter('https://api.softlayer.com')
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 50)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.backoff_factor, 0.5)
+
+    def test_retry_object(self):
+        retry = Retry(total=10, status_forcelist=[503])
+        session = transport.get_session('test-agent', retries=retry)
+        self.assertIs(session.get_adapter('https://api.softlayer.com').max_retries, retry)
+
+    def test_no_keep_alive(self):
+        session = transport.get_session('test-agent', keep_alive=False)
+        self.assertEqual(session.headers['Connection'], 'close')
+        self.assertNotIsInstance(session.get_adapter('https://api.softlayer.com'), transport.KeepAliveAdapter)
+
+    def test_shared_session(self):
+        session = transport.get_session('test-agent', 'https://shared.example.com')
+        self.assertIs(session, transport.get_session('test-agent', 'https://shared.example.com'))
+        self.assertIsNot(session, transport.get_session('test-agent', 'https://other.example.com'))
+        self.assertIsNot(session, transport.get_session('test-agent', 'https://shared.example.com', pool_maxsize=20))
+        self.assertIsNot(session, transport.get_session('test-agent', 'https://shared.example.com',
+                                                        share_session=False))
+        self.assertIsNot(transport.get_session('test-agent'), transport.get_session('test-agent'))
+
+    def test_transports_share_session(self):
+        xmlrpc_one = transports.XmlRpcTransport(endpoint_url='https://sharing.example.com')
+        xmlrpc_two = transports.XmlRpcTransport(endpoint_url='https://sharing.example.com')
+        self.assertIs(xmlrpc_one.client, xmlrpc_two.client)
+
+        private = transports.XmlRpcTransport(endpoint_url='https://sharing.example.com',
+                                             session_options={'share_session': False})
+        self.assertIsNot(xmlrpc_one.client, private.client)
+
+    def test_connection_stats(self):
+        xmlrpc = transports.XmlRpcTransport(endpoint_url=self.endpoint_url, session_options={'share_session': False})
+        for _ in range(3):
+            req = transports.Request()
+            req.service = 'SoftLayer_Account'
+            req.method = 'getObject'
+            xmlrpc(req)
+
+        stats = xmlrpc.get_connection_stats()
+        self.assertEqual(stats, {'requests': 3, 'new_connections': 1, 'reused': 2})
+
+    def test_response_size(self):
+        for decoder in (None, transports.xmlrpc.XmlRpcDecoder()):
+            xmlrpc = transports.XmlRpcTransport(endpoint_url=self.endpoint_url, decoder=decoder)
+            req = transports.Request()
+            req.service = 'SoftLayer_Account'
+            req.method = 'getObject'
+            xmlrpc(req)
+            self.assertGreater(req.response_size, 100)
+
+    def test_connection_stats_no_requests(self):
+        stats = transport.get_connection_stats(transport.get_session('test-agent'))
+        self.assertEqual(stats, {'requests': 0, 'new_connections': 0, 'reused': 0})
+
+
+class TestGetRetryAfter(testing.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(transport.get_retry_after({'Retry-After': '120'}), 120.0)
+        self.assertEqual(transport.get_retry_after({'Retry-After': '-5'}), 0.0)
+
+    def test_http_date(self):
+        self.assertEqual(transport.get_retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}), 0.0)
+        future = email.utils.format_datetime(datetime.datetime.now(datetime.timezone.utc)
+                                             + datetime.timedelta(seconds=60), usegmt=True)
+        self.assertAlmostEqual(transport.get_retry_after({'Retry-After': future}), 60, delta=2)
+
+    def test_missing(self):
+        self.assertIsNone(transport.get_retry_after({}))
+        self.assertIsNone(transport.get_retry_after(None))
+        self.assertIsNone(transport.get_retry_after({'Retry-After': 'soon'}))
+
+
+class TestServiceName(testing.TestCase):
+
+    def test_service_name(self):
+        self.assertEqual(transport.service_name('Account'), 'SoftLayer_Account')
+        self.assertEqual(transport.service_name('SoftLayer_Account'), 'SoftLayer_Account')
@@ -6,6 +6,7 @@
 """
 import io
 from unittest import mock as mock
+import xmlrpc.client
 
 import pytest
 import requests
@@ -13,7 +14,9 @@
 import SoftLayer
 from SoftLayer import consts
 from SoftLayer import testing
+from SoftLayer.testing import benchmark
 from SoftLayer import transports
+from SoftLayer.transports import xmlrpc as xmlrpc_transport
 
 
 def get_xmlrpc_response():
@@ -77,7 +80,8 @@ def test_call(self, request):
                                    timeout=None,
                                    cert=None,
                                    verify=True,
-                                   auth=None)
+                                   auth=None,
+                                   stream=True)
         self.assertEqual(resp, [])
         self.assertIsInstance(resp, transports.SoftLayerListResult)
         self.assertEqual(resp.total_count, 10)
@@ -102,7 +106,8 @@ def test_valid_proxy(self, request):
             timeout=None,
             cert=None,
             verify=True,
-            auth=None)
+            auth=None,
+            stream=True)
 
     @mock.patch('SoftLayer.transports.xmlrpc.requests.Session.request')
     def test_identifier(self, request):
@@ -260,6 +265,23 @@ def test_request_exception(self, request):
 
         self.assertRaises(SoftLayer.TransportError, self.transport, req)
 
+    @mock.patch('SoftLayer.transports.xmlrpc.requests.Session.request')
+    def test_request_exception_retry_after(self, request):
+        e = requests.HTTPError('error')
+        e.response = mock.MagicMock()
+        e.response.status_code = 429
+        e.response.content = 'Too Many Requests'
+        e.response.headers = {'Retry-After': '30'}
+        request().raise_for_status.side_effect = e
+
+        req = transports.Request()
+        req.service = 'SoftLayer_Service'
+        req.method = 'getObject'
+
+        ex = self.assertRaises(SoftLayer.TransportError, self.transport, req)
+        self.assertEqual(ex.faultCode, 429)
+        self.assertEqual(ex.retry_after, 30.0)
+
     def test_print_reproduceable(self):
         req = transports.Request()
         req.url = "https://test.com"
@@ -307,7 +329,8 @@ def test_ibm_id_call(self, auth, request):
                                    timeout=None,
                                    cert=None,
                                    verify=True,
-                                   auth=mock.ANY)
+                                   auth=mock.ANY,
+                                   stream=True)
         self.assertEqual(resp, [])
         self.assertIsInstance(resp, transports.SoftLayerListResult)
         self.assertEqual(resp.total_count, 10)
@@ -392,7 +415,8 @@ def test_nonascii_characters(self, request):
                                    timeout=None,
                                    cert=None,
                                    verify=True,
-                                   auth=mock.ANY)
+                                   auth=mock.ANY,
+                                   stream=True)
         self.assertEqual(resp, [])
         self.assertIsInstance(resp, transports.SoftLayerListResult)
         self.assertEqual(resp.total_count, 10)
@@ -446,4 +470,90 @@ def test_verify(request,
                                proxies=mock.ANY,
                                timeout=mock.ANY,
                                verify=expected,
-                               auth=None)
+                               auth=None,
+                               stream=True)
+
+
+class TestXmlRpcDecoders(testing.TestCase):
+
+    def set_up(self):
+        self.stdlib = xmlrpc_transport.XmlRpcDecoder()
+        self.streaming = xmlrpc_transport.StreamingXmlRpcDecoder()
+
+    def assert_same(self, body):
+        expected = xmlrpc.client.loads(body)[0][0]
+        self.assertEqual(self.stdlib(body), expected)
+        self.assertEqual(self.streaming(body), expected)
+        # Split into tiny chunks, so elements and text are broken up between reads
+        chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+        self.assertEqual(self.streaming(chunks), expected)
+        return expected
+
+    def test_fixtures(self):
+        for name in benchmark.DEFAULT_FIXTURES:
+            self.assert_same(benchmark.xmlrpc_body(benchmark.load_fixture(name), copies=2))
+
+    def test_types(self):
+        result = {
+            'string': 'hello & <world> é',
+            'empty': '',
+            'int': 12,
+            'true': True,
+            'false': False,
+            'double': 1.5,
+            'none': None,
+            'date': xmlrpc.client.DateTime('20240101T10:00:00'),
+            'binary': xmlrpc.client.Binary(b'\x00\x01binary'),
+            'list': [1, 'two', {'three': [3]}, []],
+            'dict': {},
+        }
+        self.assertEqual(self.assert_same(xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+                                          .encode()), result)
+
+    def test_untyped_values(self):
+        body = b'''<?xml version="1.0"?>
+<methodResponse><params><param><value><struct>
+<member><name>a</name><value>plain text</value></member>
+<member><name>b</name><value></value></member>
+<member><name>c</name><value><ex:nil/></value></member>
+<member><name>d</name><value><ex:i8>64</ex:i8></value></member>
+</struct></value></param></params></methodResponse>'''
+        self.assertEqual(self.assert_same(body), {'a': 'plain text', 'b': '', 'c': None, 'd': 64})
+
+    def test_fault(self):
+        body = xmlrpc.client.dumps(xmlrpc.client.Fault('SoftLayer_Exception', 'Oops')).encode()
+        for decoder in (self.stdlib, self.streaming):
+            ex = self.assertRaises(xmlrpc.client.Fault, decoder, body)
+            self.assertEqual(ex.faultCode, 'SoftLayer_Exception')
+            self.assertEqual(ex.faultString, 'Oops')
+
+    def test_fault_mapping(self):
+        body = xmlrpc.client.dumps(xmlrpc.client.Fault('-32601', 'No method')).encode()
+        ex = self.assertRaises(SoftLayer.MethodNotFound, xmlrpc_transport.decode_response, [body], {})
+        self.assertEqual(ex.faultString, 'No method')
+
+    def test_bad_boolean(self):
+        body = b'<params><param><value><boolean>2</boolean></value></param></params>'
+        self.assertRaises(TypeError, self.streaming, body)
+
+    def test_list_result(self):
+        result = xmlrpc_transport.decode_response(get_xmlrpc_response().raw, {'softlayer-total-items': '10'})
+        self.assertIsInstance(result, transports.SoftLayerListResult)
+        self.assertEqual(result.total_count, 10)
+
+    @mock.patch('SoftLayer.transports.xmlrpc.requests.Session.request')
+    def test_stdlib_decoder_transport(self, request):
+        request.return_value = get_xmlrpc_response()
+        transport = transports.XmlRpcTransport(endpoint_url='http://something9999999999999999999999.com',
+                                               decoder=xmlrpc_transport.XmlRpcDecoder())
+        req = transports.Request()
+        req.service = 'SoftLayer_Service'
+        req.method = 'getObject'
+        self.assertEqual(transport(req), [])
+        self.assertFalse(request.call_args.kwargs['stream'])
+
+    def test_benchmark(self):
+        results = benchmark.benchmark_decoders(fixtures=['SoftLayer_Account.getVirtualGuests'], copies=1, rounds=1)
+        self.assertEqual([row['decoder'] for row in results], ['stdlib', 'streaming'])
+        self.assertEqual(results[0]['speedup'], 1)
+        self.assertGreater(results[1]['peak_memory'], 0)
@@ -5,6 +5,9 @@
 
     :license: MIT, see LICENSE for more details.
 """
+from unittest import mock as mock
+
+from SoftLayer import exceptions
 from SoftLayer import testing
 from SoftLayer import utils
 
@@ -82,3 +85,104 @@ def test_billing_filter(self):
         self.assertEqual(len(fixed_filter), 1)
         self.assertEqual(len(fixed_filter.get('allTopLevelBillingItems')), 2)
         self.assertDictEqual(fixed_filter, billing_filter)
+
+
+class TestResolveIdsMany(testing.TestCase):
+
+    def set_up(self):
+        self.servers = [
+            {'id': 1, 'hostname': 'web1', 'primaryIpAddress': '1.2.3.4', 'primaryBackendIpAddress': '10.0.0.1'},
+            {'id': 2, 'hostname': 'web2', 'primaryIpAddress': '1.2.3.5', 'primaryBackendIpAddress': '10.0.0.2'},
+            {'id': 3, 'hostname': 'web2', 'primaryIpAddress': '1.2.3.6', 'primaryBackendIpAddress': '10.0.0.3'},
+        ]
+        self.calls = []
+
+    def lookup(self, field, values):
+        self.calls.append((field, values))
+        return [server for server in self.servers if server[field] in values]
+
+    def test_ids(self):
+        guid = '9d888bc2-7c9a-4dba-bbd8-6bd688687bae'
+        result = utils.resolve_ids_many([7, '8', guid], self.lookup)
+        self.assertEqual(result, {7: [7], '8': [8], guid: [guid]})
+        self.assertEqual(self.calls, [])
+
+    def test_mixed(self):
+        result = utils.resolve_ids_many(['web1', '1.2.3.5', '10.0.0.3', 'web2', 'nope', 'web1'], self.lookup)
+        self.assertEqual(result, {'web1': [1], '1.2.3.5': [2], '10.0.0.3': [3], 'web2': [2, 3], 'nope': []})
+        # One call for each field, only with what is still unresolved
+        self.assertEqual(self.calls, [
+            ('primaryIpAddress', ['1.2.3.5', '10.0.0.3']),
+            ('primaryBackendIpAddress', ['10.0.0.3']),
+            ('hostname', ['web1', 'web2', 'nope']),
+        ])
+
+
+class TestWaitForReadyMany(testing.TestCase):
+
+    def set_up(self):
+        self.ready = {'provisionDate': '2023-01-01'}
+        self.not_ready = {'provisionDate': None, 'activeTransaction': {'id': 5}}
+        self.calls = []
+
+    def find(self, states):
+        """Returns instances from states, a list of {id: instance fields} for each check"""
+        states = iter(states)
+
+        def find(ids):
+            self.calls.append(list(ids))
+            state = next(states)
+            if isinstance(state, Exception):
+                raise state
+            return [dict(state[_id], id=_id) for _id in ids if _id in state]
+        return find
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.time')
+    def test_yields_as_ready(self, _now, _sleep):
+        _now.return_value = 0
+        states = [
+            {1: self.not_ready, 2: self.ready, 3: self.not_ready},
+            {1: self.not_ready, 3: self.not_ready},
+            {1: self.not_ready, 3: self.not_ready},
+            {1: self.ready, 3: self.not_ready},
+            {3: self.ready},
+        ]
+        result = utils.wait_for_ready_many([1, 2, 3, 2], self.find(states), limit=100, delay=10, max_delay=30)
+
+        self.assertEqual([instance['id'] for instance in result], [2, 1, 3])
+        self.assertEqual(self.calls, [[1, 2, 3], [1, 3], [1, 3], [1, 3], [3]])
+        # Back to the first delay each time something becomes ready, doubling up to max_delay otherwise
+        _sleep.assert_has_calls([mock.call(10), mock.call(20), mock.call(30), mock.call(10)])
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.time')
+    def test_limit(self, _now, _sleep):
+        clock = [0]
+        _now.side_effect = lambda: clock[0]
+        _sleep.side_effect = lambda seconds: clock.append(clock.pop() + seconds)
+        states = [{1: self.not_ready, 2: self.not_ready}, {1: self.not_ready, 2: self.ready},
+                  {1: self.not_ready}, {1: self.not_ready}]
+        result = utils.wait_for_ready_many([1, 2], self.find(states), limit=25, delay=10)
+
+        self.assertEqual([instance['id'] for instance in result], [2])
+        # The last sleep is cut short to end at the limit, with a last check then
+        self.assertEqual(_sleep.call_args_list, [mock.call(10), mock.call(10), mock.call(5)])
+        self.assertEqual(len(self.calls), 4)
+
+    def test_missing(self):
+        # Instances the account doesn't return aren't ready
+        result = utils.wait_for_ready_many([1, 2], self.find([{1: self.ready}]), limit=0)
+        self.assertEqual([instance['id'] for instance in result], [1])
+
+    @mock.patch('time.sleep')
+    def test_failed_check(self, _sleep):
+        # A check that fails is tried again, a failure that won't go away isn't
+        states = [{1: self.not_ready, 2: self.ready}, exceptions.ServerError(500, 'Try again'), {1: self.ready}]
+        result = utils.wait_for_ready_many([1, 2], self.find(states), limit=100, delay=10)
+        self.assertEqual([instance['id'] for instance in result], [2, 1])
+        self.assertEqual(self.calls, [[1, 2], [1], [1]])
+
+        states = [exceptions.SoftLayerAPIError('SoftLayer_Exception_Permission', 'No')]
+        result = utils.wait_for_ready_many([1], self.find(states), limit=100, delay=10)
+        self.assertRaises(exceptions.SoftLayerAPIError, list, result)